@@ -134,11 +134,13 @@ export default function TitanForgeHUD() {
   ]);
 
   // --- 4. AUDIO PIPELINE ---
-  const audioQueue = useRef<string[]>([]);
+  const audioQueue = useRef<ArrayBuffer[]>([]);
+  const audioStreams = useRef<Map<string, Uint8Array[]>>(new Map());
   const isAudioPlaying = useRef(false);
   const audioCtx = useRef<AudioContext | null>(null);
   const [audioUnlocked, setAudioUnlocked] = useState(false);
   const ws = useRef<WebSocket | null>(null);
+  const activeMission = useRef<string | null>(null);
 
   // --- 5. AUDIO ACTIVATION ---
   const unlockAudio = async (): Promise<void> => {
@@ -175,19 +177,11 @@ export default function TitanForgeHUD() {
     }
 
     isAudioPlaying.current = true;
-    const base64Str = audioQueue.current.shift();
-    if (!base64Str) return;
+    const mp3 = audioQueue.current.shift();
+    if (!mp3) return;
 
     try {
-      const cleanBase64 = base64Str.includes(",")
-        ? base64Str.split(",")[1]
-        : base64Str;
-
-      const bytes = Uint8Array.from(window.atob(cleanBase64), (c) =>
-        c.charCodeAt(0)
-      );
-
-      const buffer = await audioCtx.current.decodeAudioData(bytes.buffer);
+      const buffer = await audioCtx.current.decodeAudioData(mp3);
       const source = audioCtx.current.createBufferSource();
 
       source.buffer = buffer;
@@ -206,6 +200,41 @@ export default function TitanForgeHUD() {
     }
   }, [audioUnlocked]);
 
+  // Binary audio frame: "RA" | ver | flags | msg_seq | chunk_seq | id_len | mission_id | mp3
+  // (see src/system/audio_frames.py). Chunks are gathered per utterance until FINAL.
+  const handleAudioFrame = useCallback(
+    (buf: ArrayBuffer) => {
+      const view = new DataView(buf);
+      if (buf.byteLength < 13 || view.getUint8(0) !== 0x52 || view.getUint8(1) !== 0x41) return;
+
+      const final = (view.getUint8(3) & 0x01) === 0x01;
+      const msgSeq = view.getUint32(4);
+      const idLen = view.getUint8(12);
+      const missionId = new TextDecoder().decode(new Uint8Array(buf, 13, idLen));
+      const key = `${missionId}:${msgSeq}`;
+
+      const parts = audioStreams.current.get(key) ?? [];
+      const payload = new Uint8Array(buf, 13 + idLen);
+      if (payload.byteLength) parts.push(payload);
+      audioStreams.current.set(key, parts);
+      if (!final) return;
+
+      audioStreams.current.delete(key);
+      const total = parts.reduce((n, p) => n + p.byteLength, 0);
+      if (!total || !audioUnlocked) return;
+
+      const mp3 = new Uint8Array(total);
+      let offset = 0;
+      for (const p of parts) {
+        mp3.set(p, offset);
+        offset += p.byteLength;
+      }
+      audioQueue.current.push(mp3.buffer);
+      if (!isAudioPlaying.current) playNextAudio();
+    },
+    [audioUnlocked, playNextAudio]
+  );
+
   // --- 6. MISSION ENGINE ---
   const executeDirective = useCallback(
     async (text: string) => {
@@ -309,8 +338,8 @@ export default function TitanForgeHUD() {
 
   // --- 8. SWARM TELEMETRY ---
   const connectToSwarm = useCallback(
-    (url: string) => {
-      if (typeof window === "undefined" || !url) return;
+    (url: string, key: string) => {
+      if (typeof window === "undefined" || !url || !key) return;
 
       if (ws.current) ws.current.close();
 
@@ -318,14 +347,35 @@ export default function TitanForgeHUD() {
       const protocol = url.startsWith("https") ? "wss" : "ws";
 
       try {
-        const socket = new WebSocket(`${protocol}://${base}/ws/telemetry`);
+        // The license key scopes the socket to this user's missions
+        const socket = new WebSocket(
+          `${protocol}://${base}/ws/telemetry?key=${encodeURIComponent(key)}`
+        );
+        socket.binaryType = "arraybuffer";
         ws.current = socket;
 
         socket.onopen = () => setStatus("NOMINAL");
 
         socket.onmessage = (e: MessageEvent) => {
+          if (e.data instanceof ArrayBuffer) {
+            handleAudioFrame(e.data);
+            return;
+          }
           const data = JSON.parse(e.data as string);
 
+          // Follow the mission we just launched (its id arrives before the HTTP reply)
+          if (data.type === "mission_started" && data.mission_id) {
+            if (activeMission.current && activeMission.current !== data.mission_id) {
+              socket.send(
+                JSON.stringify({ action: "unsubscribe", mission_id: activeMission.current })
+              );
+            }
+            activeMission.current = data.mission_id as string;
+            socket.send(
+              JSON.stringify({ action: "subscribe", mission_id: data.mission_id })
+            );
+          }
+
           if (data.vitals) {
             setVitals(data.vitals as TelemetryVitals);
           }
@@ -368,11 +418,6 @@ export default function TitanForgeHUD() {
                 dept: data.dept
               }
             ]);
-
-            if (data.audio_base64 && audioUnlocked) {
-              audioQueue.current.push(data.audio_base64);
-              if (!isAudioPlaying.current) playNextAudio();
-            }
           }
 
           if (data.type === "mission_complete") {
@@ -387,7 +432,7 @@ export default function TitanForgeHUD() {
         console.error("Socket Connection Fault", err);
       }
     },
-    [audioUnlocked, playNextAudio]
+    [handleAudioFrame]
   );
 
   // --- 9. INITIALIZATION ---
@@ -411,7 +456,7 @@ export default function TitanForgeHUD() {
       }));
 
       setIsGitHubLinked(savedAuth);
-      connectToSwarm(savedUrl);
+      connectToSwarm(savedUrl, savedKey);
 
       const urlParams = new URLSearchParams(window.location.search);
       const code = urlParams.get("code");
@@ -71,6 +71,10 @@ export default function NeuralLattice() {
   const containerRef = useRef<HTMLDivElement>(null);
   const graphRef = useRef<any>(null); // any used here to bypass complex Generic mismatch in Dynamic Import
   const [dimensions, setDimensions] = useState({ width: 800, height: 600 });
+  // Last lattice version seen: polls send ?since= / If-None-Match and merge the returned diff
+  const latticeRef = useRef<{ version: number | null; etag: string | null; nodes: Map<string, any>; links: Map<string, any> }>({
+    version: null, etag: null, nodes: new Map(), links: new Map()
+  });
 
   const COLORS = {
     CYAN: "#00f2ff",
@@ -106,12 +110,35 @@ export default function NeuralLattice() {
 
     setLoading(true);
     try {
+      const lattice = latticeRef.current;
       const res = await axios.get(`${url.replace(/\/$/, "")}/api/v1/graph`, {
-        headers: { "X-API-Key": key, "ngrok-skip-browser-warning": "69420" },
+        params: lattice.version !== null ? { since: lattice.version } : undefined,
+        headers: {
+          "X-API-Key": key,
+          "ngrok-skip-browser-warning": "69420",
+          ...(lattice.etag ? { "If-None-Match": lattice.etag } : {}),
+        },
+        validateStatus: (status) => status === 200 || status === 304,
       });
+      if (res.status === 304) return; // Lattice unchanged since last poll
+
+      const linkKey = (l: any) => `${l.source}|${l.target}|${l.key ?? ""}`;
+      const payload = res.data;
+      if (payload.full === false) {
+        (payload.removed_nodes || []).forEach((id: string) => lattice.nodes.delete(id));
+        (payload.added_nodes || []).forEach((n: any) => lattice.nodes.set(n.id, n));
+        (payload.removed_links || []).forEach((l: any) => lattice.links.delete(linkKey(l)));
+        (payload.added_links || []).forEach((l: any) => lattice.links.set(linkKey(l), l));
+      } else {
+        lattice.nodes = new Map((payload.nodes || []).filter((n: any) => n?.id).map((n: any) => [n.id, n]));
+        lattice.links = new Map((payload.links || []).map((l: any) => [linkKey(l), l]));
+      }
+      lattice.version = typeof payload.version === "number" ? payload.version : null;
+      lattice.etag = res.headers["etag"] || null;
 
-      const rawNodes = res.data.nodes || [];
-      const rawLinks = res.data.links || [];
+      const rawNodes = Array.from(lattice.nodes.values());
+      // Copies: the force layout replaces source/target with node objects in place
+      const rawLinks = Array.from(lattice.links.values()).map((l: any) => ({ ...l }));
 
       const cleanNodes: LatticeNode[] = rawNodes
         .filter((n: any) => n?.id)
@@ -43,11 +43,22 @@ from src.system.agents.loader import discover_agents, get_random_agent
 from src.system.arsenal.foundation import BASE_PROJECT_PATH, ROOT_DIR, DATA_DIR, STATIC_DIR, WORKSPACE_ROOT
 
 from langgraph.graph import StateGraph, END
+from langgraph.checkpoint.memory import MemorySaver
 
 # --- REALM FORGE INTERNAL IMPORTS ---
 from src.system.state import RealmForgeState, get_initial_state
-from src.system.arsenal.registry import ALL_TOOLS_LIST, DEPARTMENT_TOOL_MAP, get_tools_for_dept, get_swarm_roster, prepare_vocal_response, generate_neural_audio, read_file, write_file, update_knowledge_graph, calculate_file_hash, get_file_metadata
+from src.system.state_codec import StateSerde
+from src.system.arsenal.registry import ALL_TOOLS_LIST, DEPARTMENT_TOOL_MAP, get_tools_for_dept, get_swarm_roster, prepare_vocal_response, generate_neural_audio, read_file, write_file, get_file_metadata
 from src.memory.engine import MemoryManager
+from src.memory.artifact_store import artifact_store
+from src.system.artifact_extraction import extract_artifacts, sanitize_args
+from src.system.context_window import planner_window, latest_directive
+from src.system.arsenal.tool_catalog import arender_catalog
+from src.system.handoff_stats import handoff_stats
+from src.system.handoff_protocol import fail_and_handoff, handoff_update
+from src.utils.token_counter import count_tokens
+from src.system.llm_metering import llm_meter
+from src.system.metrics import is_tool_error, observe_tool, timed_node
 
 # --- 1. ARSENAL LINKAGE (SHARDED v50.8 ALIGNMENT) ---
 try:
@@ -60,8 +71,6 @@ try:
         generate_neural_audio,
         read_file,
         write_file,
-        update_knowledge_graph,
-        calculate_file_hash,
         get_file_metadata,
     )
     print("âœ… [BRAIN] Neural Mastermind Aligned to Sharded Foundation.")
@@ -97,7 +106,7 @@ def get_llm():
                     "torch_dtype": torch.bfloat16 if torch.cuda.is_available() else torch.float32
                 },
             )
-            llm_instance = HuggingFacePipeline(pipeline=pipe)
+            llm_instance = HuggingFacePipeline(pipeline=pipe, callbacks=[llm_meter])
             print("âœ… [NVIDIA_NEMOTRON] Local Brain Online.")
         except Exception as e:
             print(f"âš ï¸ [MODEL_FAULT] Nemotron local failed: {e}. Defaulting to Groq.")
@@ -108,6 +117,7 @@ def get_llm():
             temperature=0.1,
             model_name="llama-3.3-70b-versatile",
             api_key=os.getenv("GROQ_API_KEY"),
+            callbacks=[llm_meter],  # Token/latency metering per mission, node and silo
         )
         print("ðŸš€ [GROQ] Cloud Mastermind Online.")
     return llm_instance
@@ -119,6 +129,26 @@ AGENT_DIR = Path("F:/agentic_workforce/data/agents")
 # Renormalized lattice artifact
 LATTICE_MAP = Path("F:/agentic_workforce/master_departmental_lattice.json")
 TOOLS = {t.name: t for t in ALL_TOOLS_LIST if hasattr(t, "name")}
+# Draft the fallback silo's plan alongside the primary for handoff-prone silos
+SPECULATIVE_HANDOFF = os.getenv("REALM_SPECULATIVE_HANDOFF", "true").lower() == "true"
+
+# Official 13 canonical silos (rendered once, reused by every supervisor prompt)
+CANONICAL_SILOS = [
+    "Architect",
+    "Data_Intelligence",
+    "Software_Engineering",
+    "DevOps_Infrastructure",
+    "Cybersecurity",
+    "Financial_Ops",
+    "Legal_Compliance",
+    "Research_Development",
+    "Executive_Board",
+    "Marketing_PR",
+    "Human_Capital",
+    "Quality_Assurance",
+    "Facility_Management",
+]
+SILO_PROMPT_LIST = ", ".join(CANONICAL_SILOS)
 
 
 # --- HELPERS ---
@@ -184,28 +214,11 @@ async def supervisor_node(state: RealmForgeState):
 
     mission = state["messages"][-1].content
 
-    # Official 13 canonical silos
-    silo_list = [
-        "Architect",
-        "Data_Intelligence",
-        "Software_Engineering",
-        "DevOps_Infrastructure",
-        "Cybersecurity",
-        "Financial_Ops",
-        "Legal_Compliance",
-        "Research_Development",
-        "Executive_Board",
-        "Marketing_PR",
-        "Human_Capital",
-        "Quality_Assurance",
-        "Facility_Management",
-    ]
-
     prompt = f"""
     SYSTEM: Realm Forge Industrial Mastermind v31.11
     CONTEXT: Managing 13,472 nodes and 1,113 Renormalized agents.
     MISSION: "{mission}"
-    INDUSTRIAL_SILOS: {silo_list}
+    INDUSTRIAL_SILOS: {SILO_PROMPT_LIST}
     
     TASK:
     1. Parse the Natural Language Command.
@@ -293,122 +306,150 @@ async def planner_node(state: RealmForgeState):
         content="âš™ï¸ [PLANNING]: Analyzing neural lattice and drafting maneuvers..."
     )
 
-    mission = state["messages"][-1].content
+    # Directive = latest human turn (the tail is usually HUD telemetry after a re-trace)
+    mission = latest_directive(state["messages"]) or state["messages"][-1].content
     agent_name = (state or {}).get("active_agent", "ForgeMaster")
     dept = (state or {}).get("active_department", "Architect")
+    fallback = (state or {}).get("fallback_department")
     params = (state or {}).get("semantic_params", {})
 
-    # v31.11 SUTURE: Passing ALL_TOOLS_LIST to satisfy registry signature and fix 500 error
-    available_tools = get_tools_for_dept(dept, ALL_TOOLS_LIST)
-    if not available_tools:
-        available_tools = [t.name for t in ALL_TOOLS_LIST[:50]]
+    # SPECULATIVE REDUNDANCY: Handoff-prone silos draft the fallback plan concurrently
+    speculative = {}
+    if (
+        SPECULATIVE_HANDOFF
+        and fallback
+        and fallback != dept
+        and not (state or {}).get("handoff_history")
+        and handoff_stats.is_handoff_prone(dept)
+    ):
+        fallback_specialist = get_industrial_specialist(fallback)
+        fallback_agent = fallback_specialist["name"] if fallback_specialist else "ForgeMaster"
+        sub_tasks, fallback_tasks = await asyncio.gather(
+            draft_plan(agent_name, dept, mission, params, state["messages"]),
+            draft_plan(fallback_agent, fallback, mission, params, state["messages"]),
+        )
+        if fallback_tasks:
+            speculative = {"department": fallback, "agent": fallback_agent, "task_queue": fallback_tasks}
+    else:
+        sub_tasks = await draft_plan(agent_name, dept, mission, params, state["messages"])
+
+    return {
+        "task_queue": sub_tasks,
+        "speculative_plan": speculative,
+        "next_node": "executor",
+        "messages": [
+            heartbeat,
+            AIMessage(
+                content=f"ðŸ“‹ [PLAN_LOCKED]: Orchestrating kinetic strike with {len(sub_tasks)} tasks."
+            ),
+        ],
+    }
+
+
+async def draft_plan(agent_name: str, dept: str, mission: str, params: Dict[str, Any], messages: List[BaseMessage]) -> List[Dict[str, Any]]:
+    """Single planner LLM round-trip for one silo. Returns the drafted sub_tasks."""
+    # PRECOMPILED CATALOG: Mission-ranked department tools with argument schemas (token-budgeted)
+    available_tools = await arender_catalog(dept, mission)
 
     prompt = f"""
     IDENTITY: {agent_name} (Industrial Silo: {dept})
     MISSION: {mission}
     SEMANTIC_ENTITIES: {json.dumps(params)}
-    AVAILABLE TOOLS: {available_tools}
+    AVAILABLE TOOLS (name(arg:type=default): purpose):
+{available_tools}
     
     PROTOCOL: 
     1. Use SEMANTIC_ENTITIES to fill tool arguments accurately.
-    2. Every file path MUST be F:/agentic_workforce/...
+    2. Only use the tools listed above, with exactly the listed argument names.
+    3. Every file path MUST be F:/agentic_workforce/...
     
     JSON SCHEMA:
     {{ "sub_tasks": [ {{"tool": "TOOL_NAME", "args": {{ "param": "value" }} }} ] }}
     """
+    # ROLLING CONTEXT: Token-budgeted history (telemetry stripped, older turns digested)
+    history = planner_window.compact(messages, reserved_tokens=count_tokens(prompt))
+
     model = get_llm()
-    res = await model.ainvoke([SystemMessage(content=prompt)] + state["messages"])
+    res = await model.ainvoke([SystemMessage(content=prompt)] + history, config={"metadata": {"silo": dept}})
     data = extract_json(res.content if hasattr(res, "content") else str(res))
-
-    return {
-        "task_queue": (data or {}).get("sub_tasks", []),
-        "next_node": "executor",
-        "messages": [
-            heartbeat,
-            AIMessage(
-                content=f"ðŸ“‹ [PLAN_LOCKED]: Orchestrating kinetic strike with {len((data or {}).get('sub_tasks', []))} tasks."
-            ),
-        ],
-    }
+    sub_tasks = (data or {}).get("sub_tasks", [])
+    return [t for t in sub_tasks if isinstance(t, dict)] if isinstance(sub_tasks, list) else []
 
 
 async def execution_node(state: RealmForgeState):
     """FORCE-KINETIC EXECUTOR: Physically triggers tools and logs artifact paths."""
     agent = (state or {}).get("active_agent")
-    tasks = list((state or {}).get("task_queue", []))
-    messages = list(state["messages"])
-    found_artifacts = list((state or {}).get("artifacts", []))
+    # Only OPEN tasks run; finished ones stay in the queue as DONE/FAILED records
+    tasks = [t for t in (state or {}).get("task_queue", []) if (t or {}).get("status", "OPEN") == "OPEN"]
+    new_messages = []
+    found_artifacts = []  # Delta only; the artifacts reducer unions it into the registry
+    settled = []  # Status updates merged back into task_queue by id
 
     if not tasks:
         return {"next_node": "validator"}
 
-    for task in tasks:
+    for index, task in enumerate(tasks):
         tool_name = (task or {}).get("tool")
 
-        # REDUNDANCY HANDOFF PROTOCOL
+        # REDUNDANCY HANDOFF PROTOCOL (the rest of the abandoned plan is SKIPPED)
         if tool_name == "HANDOFF":
-            new_silo = (state or {}).get("fallback_department", "Architect")
-            specialist = get_industrial_specialist(new_silo)
-            handoff = {"from": state["active_department"], "to": new_silo}
-            return {
-                "active_agent": specialist["name"] if specialist else "ForgeMaster",
-                "active_department": new_silo,
-                "handoff_history": (state or {}).get("handoff_history", []) + [handoff],
-                "next_node": "planner",
-                "messages": [
-                    AIMessage(
-                        content=f"ðŸ”„ [REDUNDANCY]: Escalating to {new_silo} Silo."
-                    )
-                ],
-            }
+            update = handoff_update(state, task, tasks[index + 1:], settled, get_industrial_specialist)
+            engaged = " (speculative plan engaged)" if update["next_node"] == "executor" else ""
+            update["messages"] = new_messages + [
+                AIMessage(
+                    content=f"ðŸ”„ [REDUNDANCY]: Escalating to {update['active_department']} Silo{engaged}."
+                )
+            ]
+            return update
 
         if tool_name in TOOLS:
             try:
-                args = (task or {}).get("args", {})
-                # Production Path Sanitization
-                for k, v in args.items():
-                    if isinstance(v, str) and "F:/" in v:
-                        args[k] = v.replace("\\", "/")
-
-                # PRE-EXECUTION SNIFFING
-                path_mentions = re.findall(r"[Ff]:/[^ \"^\n\t,)]+", str(args))
-                found_artifacts.extend(path_mentions)
-
-                # Tool Execution
-                result = await TOOLS[tool_name].ainvoke(args)
-
-                # POST-EXECUTION SNIFFING (Case-insensitive path matching)
-                path_matches = re.findall(r"[Ff]:/[^ \"^\n\t,)]+", str(result))
-                found_artifacts.extend(path_matches)
+                # Production Path Sanitization (path-valued args only; contents untouched)
+                args, arg_paths = sanitize_args((task or {}).get("args", {}))
+
+                # Tool Execution (timed for /metrics)
+                started = time.perf_counter()
+                try:
+                    result = await TOOLS[tool_name].ainvoke(args)
+                except Exception:
+                    observe_tool(tool_name, time.perf_counter() - started, ok=False)
+                    raise
+                text = result if isinstance(result, str) else str(result)
+                tool_failed = is_tool_error(text)
+                observe_tool(tool_name, time.perf_counter() - started, ok=not tool_failed)
+
+                # ARTIFACT REPORTING: the tool's own list, else path args + a capped scan
+                found_artifacts.extend(extract_artifacts(result, arg_paths))
 
                 # REDUNDANCY TRIGGER
-                if any(
-                    err in str(result)
-                    for err in ["Throttled", "Error", "None found", "failed"]
-                ):
+                if tool_failed:
                     return {
                         "next_node": "executor",
-                        "task_queue": [{"tool": "HANDOFF"}],
-                        "messages": messages,
+                        "task_queue": fail_and_handoff(task, tasks[index + 1:], settled),
+                        "messages": new_messages,
                     }
 
-                messages.append(
+                new_messages.append(
                     ToolMessage(
-                        tool_call_id=str(uuid.uuid4()), content=str(result)
+                        tool_call_id=str(uuid.uuid4()), content=str(text)
                     )
                 )
+                settled.append({"id": task.get("id"), "status": "DONE"})
             except Exception as e:
                 print(f"ðŸ’¥ [TOOL_CRASH]: {tool_name} failed: {e}")
                 return {
                     "next_node": "executor",
-                    "task_queue": [{"tool": "HANDOFF"}],
-                    "messages": messages,
+                    "task_queue": fail_and_handoff(task, tasks[index + 1:], settled),
+                    "messages": new_messages,
                 }
+        else:
+            settled.append({"id": task.get("id"), "status": "SKIPPED"})
 
     return {
-        "messages": messages[-15:],
+        "messages": new_messages[-15:],
         "active_agent": agent,
-        "artifacts": list(set(found_artifacts)),
+        "task_queue": settled,
+        "artifacts": list(dict.fromkeys(found_artifacts)),
         "next_node": "validator",
     }
 
@@ -418,27 +459,26 @@ async def validator_node(state: RealmForgeState):
     artifacts = (state or {}).get("artifacts", [])
     agent = "IronClad"
     v_logs = []
-    clean_artifacts = [str(a).replace("\\", "/") for a in artifacts if "F:/" in str(a)]
-
-    for path in list(set(clean_artifacts)):
-        try:
-            # Physical verification via registry tools
-            res = await calculate_file_hash.ainvoke({"file_path": path})
-            if "ERROR" not in res:
-                current_hash = res.split(": ")[-1].strip()
-                # Anchor the hash to the Knowledge Graph
-                await update_knowledge_graph.ainvoke(
-                    {
-                        "subject": path,
-                        "relation": "CURRENT_HASH",
-                        "target": current_hash,
-                    }
-                )
-                v_logs.append(f"âœ… {path}: Verified. ({current_hash[:8]})")
-            else:
-                v_logs.append(f"âŒ {path}: Physical file missing from drive.")
-        except Exception:
-            continue
+    # Already normalized and de-duplicated by the executor's artifact extraction
+    paths = list(artifacts)
+    # One batch through the hash cache: unchanged files are a stat and a lookup,
+    # new content is hashed in parallel and filed in the content-addressed store
+    try:
+        digests = await artifact_store.aput_many(paths)
+    except Exception as e:
+        print(f"âš ï¸ [IRONCLAD] Batch hashing failed: {e}")
+        digests = {}
+    for path in paths:
+        current_hash = digests.get(path)
+        if current_hash:
+            v_logs.append(f"âœ… {path}: Verified. ({current_hash[:8]})")
+        else:
+            v_logs.append(f"âŒ {path}: Physical file missing from drive.")
+    try:
+        # Anchor the hashes to the Knowledge Graph (written only when one changed)
+        await memory_kernel.anchor_artifact_hashes({p: d for p, d in digests.items() if d})
+    except Exception as e:
+        print(f"âš ï¸ [IRONCLAD] Lattice anchoring failed: {e}")
 
     return {
         "active_agent": agent,
@@ -490,6 +530,12 @@ async def synthesizer_node(state: RealmForgeState):
     except Exception:
         pass
 
+    # Feed the per-silo handoff rates that drive speculative planning
+    if (state or {}).get("intent") == "INDUSTRIAL_STRIKE":
+        await handoff_stats.arecord_mission(
+            (state or {}).get("handoff_history", []), (state or {}).get("active_department")
+        )
+
     # Persist the completion to the Memory Engine
     await memory_kernel.commit_mission_event(
         mission_id=mid,
@@ -508,13 +554,13 @@ async def synthesizer_node(state: RealmForgeState):
 
 builder = StateGraph(RealmForgeState)
 
-# Add Core Nodes
-builder.add_node("supervisor", supervisor_node)
-builder.add_node("planner", planner_node)
-builder.add_node("executor", execution_node)
-builder.add_node("validator", validator_node)
-builder.add_node("auditor", auditor_node)
-builder.add_node("synthesizer", synthesizer_node)
+# Add Core Nodes (latency histograms per node: see /metrics)
+builder.add_node("supervisor", timed_node("supervisor", supervisor_node))
+builder.add_node("planner", timed_node("planner", planner_node))
+builder.add_node("executor", timed_node("executor", execution_node))
+builder.add_node("validator", timed_node("validator", validator_node))
+builder.add_node("auditor", timed_node("auditor", auditor_node))
+builder.add_node("synthesizer", timed_node("synthesizer", synthesizer_node))
 
 # Set Entry Point
 builder.set_entry_point("supervisor")
@@ -530,7 +576,7 @@ builder.add_conditional_edges(
 builder.add_conditional_edges(
     "executor",
     lambda x: x["next_node"],
-    {"planner": "planner", "validator": "validator"},
+    {"planner": "planner", "executor": "executor", "validator": "validator"},
 )
 
 # Standard Transitions
@@ -539,5 +585,7 @@ builder.add_edge("validator", "auditor")
 builder.add_edge("auditor", "synthesizer")
 builder.add_edge("synthesizer", END)
 
-# Compile Sovereign Brain
-app = builder.compile()
+# Compile Sovereign Brain. Checkpoints (one thread per mission) store messages and
+# task queues through the compact state codec
+checkpointer = MemorySaver(serde=StateSerde())
+app = builder.compile(checkpointer=checkpointer)
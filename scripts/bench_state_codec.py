@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+REALM FORGE: STATE CODEC BENCHMARK v1.0
+PURPOSE: Checkpoint cost of the stock LangGraph JsonPlusSerializer vs. StateSerde
+         (src/system/state_codec.py) for the channels that grow with a mission:
+         the message list and the task queue. Reports bytes per checkpoint and
+         microseconds per dumps/loads. The stock serializer cannot encode a
+         TaskQueue at all, so it is given the equivalent plain list.
+USAGE: python scripts/bench_state_codec.py [--turns 10 100 1000] [--rounds 50]
+PATH: F:/agentic_workforce/scripts/bench_state_codec.py
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from langchain_core.messages import AIMessage, HumanMessage, ToolMessage  # noqa: E402
+from langgraph.checkpoint.serde.jsonplus import JsonPlusSerializer  # noqa: E402
+
+from src.system.state import merge_tasks  # noqa: E402
+from src.system.state_codec import StateSerde, snapshot  # noqa: E402
+
+
+def _channels(turns):
+    messages = [HumanMessage(content="Audit the cybersecurity logs and patch the findings")]
+    for i in range(turns):
+        messages.append(AIMessage(content="⚙️ [PLANNING]: Analyzing neural lattice and drafting maneuvers..."))
+        messages.append(AIMessage(content="", tool_calls=[{"name": "grep_files", "args": {"q": f"CVE-{i}"}, "id": f"call-{i}"}]))
+        messages.append(ToolMessage(tool_call_id=f"call-{i}", content=f"🛠️ [TOOL_RESULT]: scan {i % 7} clean"))
+    tasks = merge_tasks([], [{"id": f"task_{i:05d}", "tool": "grep_files", "args": {"q": f"CVE-{i}"},
+                               "status": "DONE" if i % 2 else "OPEN"} for i in range(turns)])
+    return {"messages": messages, "task_queue": tasks}
+
+
+def _time(fn, rounds):
+    start = time.perf_counter()
+    for _ in range(rounds):
+        fn()
+    return (time.perf_counter() - start) / rounds * 1e6
+
+
+def bench(turns, rounds):
+    rows = []
+    for label, serde in (("jsonplus", JsonPlusSerializer()), ("state_codec", StateSerde())):
+        for channel, value in _channels(turns).items():
+            if label == "jsonplus" and channel == "task_queue":
+                value = [dict(t) for t in value]
+            blob = serde.dumps_typed(value)
+            rows.append((label, channel, len(blob[1]),
+                         _time(lambda: serde.dumps_typed(value), rounds),
+                         _time(lambda: serde.loads_typed(blob), rounds)))
+    state = _channels(turns)
+    rows.append(("snapshot", "hud_view", 0, _time(lambda: snapshot(state, max_messages=10), rounds), 0.0))
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Checkpoint serializer micro-benchmark")
+    parser.add_argument("--turns", type=int, nargs="+", default=[10, 100, 1000])
+    parser.add_argument("--rounds", type=int, default=50)
+    args = parser.parse_args()
+
+    print(f"{'serde':<14}{'channel':<12}{'turns':>7}{'bytes':>12}{'dumps us':>12}{'loads us':>12}")
+    for turns in args.turns:
+        for label, channel, size, dump_us, load_us in bench(turns, args.rounds):
+            print(f"{label:<14}{channel:<12}{turns:>7}{size:>12}{dump_us:>12.1f}{load_us:>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
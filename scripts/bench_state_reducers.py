@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+REALM FORGE: STATE REDUCER BENCHMARK v1.0
+PURPOSE: Cost per merge of the legacy list reducers vs. the incremental structures
+         in src/system/state.py for large task queues (a node typically settles a
+         handful of tasks per transition).
+USAGE: python scripts/bench_state_reducers.py [--sizes 1000 10000 50000] [--delta 5]
+PATH: F:/agentic_workforce/scripts/bench_state_reducers.py
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from src.system.state import buffer_diagnostics, deduplicate_artifacts, merge_tasks  # noqa: E402
+
+
+# --- Legacy reducers (pre-rewrite), kept here as the comparison baseline ---
+
+def legacy_merge_tasks(existing, new):
+    task_map = {(t or {}).get('id'): t for t in existing if (t or {}).get('id')}
+    for t in new:
+        tid = t['id']
+        task_map[tid] = {**task_map[tid], **t} if tid in task_map else t
+    return sorted(
+        list(task_map.values()),
+        key=lambda x: ((x or {}).get('status', 'OPEN') != 'OPEN', (x or {}).get('priority', 'MEDIUM'), (x or {}).get('id', ''))
+    )
+
+
+def legacy_deduplicate_artifacts(existing, new):
+    return list(set((existing or []) + (new or [])))
+
+
+def legacy_buffer_diagnostics(existing, new):
+    return (existing + new)[-100:]
+
+
+def _tasks(n):
+    return [{"id": f"task_{i:06d}", "tool": "scan", "priority": ("HIGH", "MEDIUM", "LOW")[i % 3]} for i in range(n)]
+
+
+def _time(fn, rounds):
+    start = time.perf_counter()
+    for r in range(rounds):
+        fn(r)
+    return (time.perf_counter() - start) / rounds * 1e6
+
+
+def bench(size, delta, rounds):
+    rows = []
+
+    legacy = legacy_merge_tasks([], _tasks(size))
+    queue = merge_tasks([], _tasks(size))
+
+    def legacy_step(r):
+        nonlocal legacy
+        legacy = legacy_merge_tasks(legacy, [{"id": f"task_{(r * delta + k) % size:06d}", "status": "DONE"} for k in range(delta)])
+
+    def queue_step(r):
+        merge_tasks(queue, [{"id": f"task_{(r * delta + k) % size:06d}", "status": "DONE"} for k in range(delta)])
+
+    rows.append(("merge_tasks", _time(legacy_step, rounds), _time(queue_step, rounds)))
+
+    paths = [f"F:/agentic_workforce/data/artifacts/file_{i}.txt" for i in range(size)]
+    legacy_art = legacy_deduplicate_artifacts([], paths)
+    art = deduplicate_artifacts([], paths)
+
+    def legacy_art_step(r):
+        nonlocal legacy_art
+        legacy_art = legacy_deduplicate_artifacts(legacy_art, [f"F:/new/{r}_{k}" for k in range(delta)])
+
+    def art_step(r):
+        deduplicate_artifacts(art, [f"F:/new/{r}_{k}" for k in range(delta)])
+
+    rows.append(("deduplicate_artifacts", _time(legacy_art_step, rounds), _time(art_step, rounds)))
+
+    legacy_diag = [f"line {i}" for i in range(100)]
+    diag = buffer_diagnostics([], list(legacy_diag))
+
+    def legacy_diag_step(r):
+        nonlocal legacy_diag
+        legacy_diag = legacy_buffer_diagnostics(legacy_diag, [f"line {r}_{k}" for k in range(delta)])
+
+    def diag_step(r):
+        buffer_diagnostics(diag, [f"line {r}_{k}" for k in range(delta)])
+
+    rows.append(("buffer_diagnostics", _time(legacy_diag_step, rounds), _time(diag_step, rounds)))
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description="RealmForgeState reducer micro-benchmark")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 50000])
+    parser.add_argument("--delta", type=int, default=5, help="tasks/artifacts merged per transition")
+    parser.add_argument("--rounds", type=int, default=200)
+    args = parser.parse_args()
+
+    print(f"{'reducer':<24}{'size':>8}{'legacy us/merge':>18}{'incremental us/merge':>24}{'speedup':>10}")
+    for size in args.sizes:
+        for name, legacy_us, new_us in bench(size, args.delta, args.rounds):
+            print(f"{name:<24}{size:>8}{legacy_us:>18.1f}{new_us:>24.1f}{legacy_us / (new_us or 1e-9):>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -8,7 +8,7 @@ This module provides:
 - API key header definition
 - get_license() dependency for FastAPI routes
 - Master key override
-- Gatekeeper validation integration
+- Gatekeeper validation integration (short-TTL license cache in front)
 """
 
 import os
@@ -17,6 +17,8 @@ from fastapi import HTTPException, Security
 from fastapi.security.api_key import APIKeyHeader
 
 from src.auth import gatekeeper
+from src.auth.license_cache import MISS, license_cache
+from src.system.config import logger
 
 
 # ==============================================================================
@@ -33,13 +35,13 @@ api_key_header = APIKeyHeader(
 # 2. LICENSE VALIDATION DEPENDENCY
 # ==============================================================================
 
-async def get_license(key: str = Security(api_key_header)):
+async def resolve_license(key: str):
     """
     Validates a RealmForge API key using the Sovereign Gatekeeper.
 
     - Supports MASTER override key
-    - Returns a gatekeeper.License object
-    - Raises HTTPException(403) on failure
+    - Returns a gatekeeper.License object, or None for an invalid key
+    - Raises if the license database cannot be read (never cached as invalid)
     """
 
     master = os.getenv("REALM_MASTER_KEY", "sk-realm-god-mode-888")
@@ -55,8 +57,29 @@ async def get_license(key: str = Security(api_key_header)):
             status="ACTIVE"
         )
 
-    # NORMAL LICENSE VALIDATION
-    lic = await gatekeeper.validate_key(key)
+    # NORMAL LICENSE VALIDATION (cache first; invalid keys are negatively cached)
+    lic = license_cache.get(key)
+    if lic is MISS:
+        lic = await gatekeeper.lookup_key(key)  # A DB fault raises before reaching the cache
+        license_cache.put(key, lic)
+
+    return lic or None
+
+
+async def get_license(key: str = Security(api_key_header)):
+    """
+    FastAPI dependency around resolve_license().
+    Raises HTTPException(403) on failure, 503 if the license database is down.
+    """
+
+    try:
+        lic = await resolve_license(key)
+    except Exception as e:
+        logger.error(f"[ERROR] [LICENSE_LOOKUP_FAULT]: {e}")
+        raise HTTPException(
+            status_code=503,
+            detail="License registry unavailable. Retry shortly."
+        )
 
     if not lic:
         raise HTTPException(
@@ -5,14 +5,19 @@ Agent Roster Routes
 Extracted from server.py (v29.2 INDUSTRIAL ULTIMATE).
 
 Provides:
-- /api/v1/agents  â†’ full roster of all agents in the Master Lattice
+- /api/v1/agents  â†’ roster of all agents in the Master Lattice
+  (served from the shared RosterIndex: department / role / status filters,
+   cursor pagination, field projection, ETag / 304)
 """
 
-import json
-from fastapi import APIRouter, Depends
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
 
 from src.api.dependencies.security import get_license
+from src.system.agents.roster_index import roster_index
 from src.system.config import LATTICE_PATH, logger
+from src.utils.http_cache import conditional_response
 
 
 router = APIRouter(tags=["agents"])
@@ -23,16 +28,27 @@ router = APIRouter(tags=["agents"])
 # ==============================================================================
 
 @(router or {}).get("/agents")
-async def list_agents(lic = Depends(get_license)):
+async def list_agents(
+    request: Request,
+    department: Optional[str] = None,
+    role: Optional[str] = Query(None, description="Case-insensitive role substring"),
+    status: Optional[str] = None,
+    cursor: Optional[str] = None,
+    limit: Optional[int] = Query(None, ge=1, le=2000, description="Page size (default: everything)"),
+    fields: Optional[str] = Query(None, description="Comma-separated subset of name,role,department,status,path"),
+    lic = Depends(get_license),
+):
     """
-    Pulls all agents from the Master Departmental Lattice.
+    Pulls agents from the Master Departmental Lattice.
 
-    Returns:
+    Returns (per agent, or the `fields` subset):
     - name
     - role
     - department
     - status
     - path
+
+    Plus `version`, `total` (matching agents) and `next_cursor` (null on the last page).
     """
 
     try:
@@ -42,23 +58,19 @@ async def list_agents(lic = Depends(get_license)):
                 "warn": "Lattice file missing."
             }
 
-        with open(LATTICE_PATH, "r", encoding="utf-8") as f:
-            lattice = json.load(f)
-
-        ui_roster = []
-
-        for department, data in lattice.items():
-            for agent in (data or {}).get("agents", []):
-                ui_roster.append({
-                    "name": (agent or {}).get("name"),
-                    "role": (agent or {}).get("role"),
-                    "department": department,
-                    "status": "ONLINE",
-                    "path": (agent or {}).get("path"),
-                })
-
-        return {"roster": ui_roster}
-
+        await roster_index.arefresh()
+        projection = [f.strip() for f in fields.split(",") if f.strip()] if fields else None
+        try:
+            etag, body = roster_index.page(
+                department=department, role=role, status=status,
+                cursor=cursor, limit=limit, fields=projection,
+            )
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        return conditional_response(request, etag, encoded=body.encoded)
+
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"âŒ [AGENT_ROSTER_FAULT]: {e}")
         return {"roster": [], "error": str(e)}
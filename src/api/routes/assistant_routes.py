@@ -5,19 +5,19 @@ Assistant Chat Routes
 Extracted from server.py (v29.2 INDUSTRIAL ULTIMATE).
 
 Provides:
-- Chat endpoint using Groq LLM
+- Chat endpoint using the shared (metered) LLM
 - Memory recall integration
 - License validation
 """
 
-import os
 from fastapi import APIRouter, Depends
+from langchain_core.messages import HumanMessage, SystemMessage
 from pydantic import BaseModel
-from groq import Groq
 
 from src.api.dependencies.security import get_license
 from src.memory.engine import MemoryManager
 from src.system.config import logger
+from src.system.llm_metering import metering_scope
 
 
 router = APIRouter(tags=["assistant"])
@@ -44,7 +44,7 @@ async def assistant_chat(
     Chat endpoint for the ForgeMaster Consultant.
 
     - Recalls memory context
-    - Sends prompt to Groq LLM
+    - Sends prompt to the shared LLM (metered and billed to the caller's key)
     - Returns assistant response
     """
 
@@ -54,24 +54,20 @@ async def assistant_chat(
         # Retrieve contextual memory
         context = await mem.recall(req.message, n_results=5)
 
-        groq_client = Groq(api_key=os.getenv("GROQ_API_KEY"))
-
-        res = groq_client.chat.completions.create(
-            model="llama-3.3-70b-versatile",
-            messages=[
-                {
-                    "role": "system",
-                    "content": f"You are the ForgeMaster Consultant. Context: {context}"
-                },
-                {
-                    "role": "user",
-                    "content": req.message
-                }
-            ]
-        )
+        # Lazy import: the brain module (and its model factory) loads on first use
+        from realm_core import get_llm
+
+        with metering_scope(api_key=lic.key, user_id=lic.user_id):
+            res = await get_llm().ainvoke(
+                [
+                    SystemMessage(content=f"You are the ForgeMaster Consultant. Context: {context}"),
+                    HumanMessage(content=req.message),
+                ],
+                config={"metadata": {"node": "assistant"}},
+            )
 
         return {
-            "response": res.getattr(getattr(getattr(res, 'choices', [None])[0], 'message', None), 'content', '')
+            "response": getattr(res, "content", str(res))
         }
 
     except Exception as e:
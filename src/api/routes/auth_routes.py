@@ -8,15 +8,19 @@ Provides:
 - GitHub OAuth redirect
 - GitHub OAuth callback
 - GitHub token exchange
+- Account usage report (time-ranged, served from usage rollups)
 """
 
 import os
+from typing import Optional
+
 import httpx
-from fastapi import APIRouter, HTTPException, Depends
+from fastapi import APIRouter, HTTPException, Depends, Query
 from fastapi.responses import RedirectResponse
 
 from src.api.dependencies.security import get_license
 from src.auth import gatekeeper
+from src.system.billing.ledger import IndustrialLedger
 from src.system.config import logger
 
 
@@ -100,3 +104,33 @@ async def github_exchange(
         )
 
         return res.json()
+
+
+# ==============================================================================
+# 4. ACCOUNT USAGE REPORT
+# ==============================================================================
+
+@router.get("/usage")
+async def usage_report(
+    start: Optional[float] = Query(None, description="Epoch seconds, inclusive"),
+    end: Optional[float] = Query(None, description="Epoch seconds, exclusive"),
+    granularity: Optional[str] = Query(None, pattern="^(hour|day)$"),
+    lic: gatekeeper.License = Depends(get_license)
+):
+    """
+    Per-silo credit consumption for the caller's key over [start, end)
+    (all-time when omitted), plus an hourly/daily timeline when requested.
+    """
+    if start is not None and end is not None and end <= start:
+        raise HTTPException(status_code=400, detail="end must be after start")
+
+    report = {
+        "start": start,
+        "end": end,
+        "silo_consumption": await IndustrialLedger.get_silo_usage_report(lic.key, start, end),
+    }
+    if granularity:
+        if start is None or end is None:
+            raise HTTPException(status_code=400, detail="A timeline needs both start and end")
+        report["timeline"] = await IndustrialLedger.get_usage_timeline(lic.key, start, end, granularity)
+    return report
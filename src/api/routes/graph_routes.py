@@ -6,26 +6,60 @@ Extracted from server.py (v29.2 INDUSTRIAL ULTIMATE).
 
 Provides:
 - /api/v1/graph â†’ returns the neural lattice graph JSON
+  (served from an in-memory LatticeStore: ETag / 304, ?since=<version> diffs,
+   gzip/brotli per Accept-Encoding)
+- /api/v1/graph/neighborhood â†’ k-hop ego network around one node
+- /api/v1/graph/nodes â†’ cursor-paginated nodes (optionally by type)
+- /api/v1/graph/lod â†’ level-of-detail view (communities as CLUSTER supernodes)
+- /api/v1/graph/clusters/{cluster_id} â†’ paginated members of one supernode
 """
 
-import json
-from fastapi import APIRouter, Depends
+import asyncio
+import zlib
+from typing import List, Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
 
 from src.api.dependencies.security import get_license
+from src.memory.lattice_query import LatticeIndex
+from src.memory.lattice_store import LatticeStore
 from src.system.config import GRAPH_PATH, logger
+from src.utils.http_cache import conditional_response, dumps
 
 
 router = APIRouter(tags=["graph"])
 
+lattice_store = LatticeStore(GRAPH_PATH)
+lattice_index = LatticeIndex(lattice_store)
+
+def _parse_types(types: Optional[str]) -> Optional[List[str]]:
+    return [t.strip().upper() for t in types.split(",") if t.strip()] if types else None
+
+
+async def _index() -> LatticeIndex:
+    if not GRAPH_PATH.exists():
+        raise HTTPException(status_code=503, detail="Lattice offline")
+    return await lattice_index.arefresh()
+
+
+def _query_response(request: Request, result: dict) -> Response:
+    # Same version + same query = same body, so repeat polls get a 304
+    etag = f'"lattice-{result["version"]}-{zlib.crc32(str(request.url.query).encode()):08x}"'
+    return conditional_response(request, etag, raw=dumps(result))
+
 
 # ==============================================================================
 # 1. GET LATTICE GRAPH
 # ==============================================================================
 
 @(router or {}).get("/graph")
-async def get_lattice_data(lic = Depends(get_license)):
+async def get_lattice_data(request: Request, since: Optional[int] = None, lic = Depends(get_license)):
     """
     Returns the neural lattice graph used by the HUD visualization.
+    The file is only re-parsed when it changes on disk. Clients send back the
+    ETag (If-None-Match -> 304) or the last seen `version` as ?since= to get
+    only the nodes/links added or removed since then ("full": false). An
+    unknown or expired `since` falls back to the full graph ("full": true).
     """
 
     try:
@@ -35,8 +69,14 @@ async def get_lattice_data(lic = Depends(get_license)):
                 "links": []
             }
 
-        with open(GRAPH_PATH, "r", encoding="utf-8-sig") as f:
-            return json.load(f)
+        snap = await lattice_store.arefresh()
+
+        if since is not None:
+            diff = lattice_store.diff_since(since)
+            if diff is not None:
+                return conditional_response(request, lattice_store.etag(since), raw=dumps(diff))
+
+        return conditional_response(request, lattice_store.etag(), encoded=snap.encoded)
 
     except Exception as e:
         logger.error(f"âŒ [GRAPH_FAULT]: {e}")
@@ -45,3 +85,83 @@ async def get_lattice_data(lic = Depends(get_license)):
             "links": [],
             "error": str(e)
         }
+
+
+# ==============================================================================
+# 2. VIEWPORT QUERIES
+# ==============================================================================
+
+@(router or {}).get("/graph/neighborhood")
+async def get_lattice_neighborhood(
+    request: Request,
+    node: str = Query(..., description="Centre node id"),
+    hops: int = Query(1, ge=1, le=4),
+    types: Optional[str] = Query(None, description="Comma-separated node types, e.g. AGENT,MISSION"),
+    limit: int = Query(500, ge=1, le=5000),
+    lic = Depends(get_license),
+):
+    """
+    k-hop ego network around `node`. With `types`, only nodes of those types are
+    traversed; `truncated` is set when `limit` cut the neighbourhood short.
+    """
+    index = await _index()
+    result = index.ego(node, hops=hops, types=_parse_types(types), limit=limit)
+    if result is None:
+        raise HTTPException(status_code=404, detail=f"Node not found: {node}")
+    return _query_response(request, result)
+
+
+@(router or {}).get("/graph/nodes")
+async def get_lattice_nodes(
+    request: Request,
+    types: Optional[str] = Query(None, description="Comma-separated node types, e.g. AGENT,MISSION"),
+    cursor: Optional[str] = None,
+    limit: int = Query(200, ge=1, le=2000),
+    lic = Depends(get_license),
+):
+    """
+    Nodes ordered by id, one page at a time, with the links among them.
+    Pass `next_cursor` back as `cursor`; it is null on the last page.
+    """
+    index = await _index()
+    try:
+        result = index.page(types=_parse_types(types), cursor=cursor, limit=limit)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return _query_response(request, result)
+
+
+@(router or {}).get("/graph/lod")
+async def get_lattice_lod(
+    request: Request,
+    min_cluster: Optional[int] = Query(None, ge=2, description="Smallest community collapsed into a supernode"),
+    limit: int = Query(500, ge=1, le=5000),
+    lic = Depends(get_license),
+):
+    """
+    Level-of-detail view: dense communities collapsed into CLUSTER supernodes
+    (size, type histogram, anchor node) joined by weighted links.
+    """
+    index = await _index()
+    # Community detection / incremental patching is CPU work: keep it off the loop
+    result = await asyncio.to_thread(index.lod, min_cluster, limit)
+    return _query_response(request, result)
+
+
+@(router or {}).get("/graph/clusters/{cluster_id}")
+async def get_lattice_cluster(
+    request: Request,
+    cluster_id: str,
+    cursor: Optional[str] = None,
+    limit: int = Query(200, ge=1, le=2000),
+    lic = Depends(get_license),
+):
+    """Drill-down into one LOD supernode: its member nodes, paginated like /graph/nodes."""
+    index = await _index()
+    try:
+        result = await asyncio.to_thread(index.cluster, cluster_id, cursor, limit)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    if result is None:
+        raise HTTPException(status_code=404, detail=f"Cluster not found: {cluster_id}")
+    return _query_response(request, result)
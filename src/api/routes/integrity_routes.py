@@ -0,0 +1,55 @@
+"""
+Artifact Integrity Routes
+-------------------------
+
+Provides:
+- POST   /api/v1/integrity/sweep → start a background audit of every ARTIFACT node
+- GET    /api/v1/integrity/sweep → progress counters and drift / missing findings
+- DELETE /api/v1/integrity/sweep → cancel the running audit
+"""
+
+from fastapi import APIRouter, Depends, Query
+from fastapi.responses import JSONResponse
+
+from src.api.dependencies.security import get_license
+from src.memory.integrity_sweeper import integrity_sweeper
+from src.system.config import logger
+
+
+router = APIRouter(tags=["integrity"])
+
+
+def _memory():
+    # The brain owns the live lattice; sweeping a second copy would be overwritten
+    from realm_core import memory_kernel
+    return memory_kernel
+
+
+@(router or {}).post("/integrity/sweep")
+async def start_integrity_sweep(lic = Depends(get_license)):
+    """
+    Starts a full-lattice integrity sweep in the background (202). If one is
+    already running, its current status is returned instead of starting another.
+    """
+    already_running = integrity_sweeper.running
+    try:
+        status = integrity_sweeper.start(_memory())
+    except Exception as e:
+        logger.error(f"❌ [INTEGRITY_FAULT]: {e}")
+        return JSONResponse(status_code=503, content={"error": str(e)})
+    return JSONResponse(status_code=200 if already_running else 202, content=status)
+
+
+@(router or {}).get("/integrity/sweep")
+async def get_integrity_sweep(
+    findings: int = Query(100, ge=0, le=1000, description="Max drift/missing findings returned"),
+    lic = Depends(get_license),
+):
+    """Progress of the current (or last) sweep: counters plus the first `findings` findings."""
+    return integrity_sweeper.status(findings_limit=findings)
+
+
+@(router or {}).delete("/integrity/sweep")
+async def cancel_integrity_sweep(lic = Depends(get_license)):
+    """Cancels the running sweep; verdicts recorded so far are kept."""
+    return await integrity_sweeper.cancel()
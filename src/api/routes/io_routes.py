@@ -7,18 +7,67 @@ Extracted from server.py (v29.2 INDUSTRIAL ULTIMATE).
 Provides:
 - /api/v1/io/read  â†’ read files from PROD or Workspace
 - /api/v1/io/write â†’ write files to PROD or Workspace
+- /api/v1/io/stream â†’ stream a file (HTTP Range / 206, chunked transfer)
+- /api/v1/io/upload â†’ streamed upload (PUT raw body or POST multipart),
+                       hashed on the fly and atomically renamed into place
 """
 
+import mimetypes
 import os
-from fastapi import APIRouter, Depends, HTTPException
+from email.utils import formatdate
+from pathlib import Path
+from typing import AsyncIterator, Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 
 from src.api.dependencies.security import get_license
 from src.system.config import ROOT_DIR, WORKSPACE_ROOT, logger
+from src.utils.async_io import run_io
+from src.utils.http_cache import etag_matches
+from src.utils.streaming_io import IO_CHUNK_SIZE, AtomicWriter, RangeNotSatisfiable, iter_file, parse_range
 
 
 router = APIRouter(tags=["io"])
 
+IO_MAX_UPLOAD = int(os.getenv("REALM_IO_MAX_UPLOAD", str(2 * 1024 ** 3)))
+
+
+# ==============================================================================
+# 0. PATH RESOLUTION
+# ==============================================================================
+
+def _clean_path(path: str) -> str:
+    # Strip absolute prefixes to avoid traversal
+    return (
+        path.replace("F:/agentic_workforce/", "")
+            .replace("F:/RealmWorkspaces/", "")
+            .lstrip("/\\")
+    )
+
+
+def _inside(target: Path, root: Path) -> bool:
+    return target.resolve().is_relative_to(root.resolve())
+
+
+def _resolve_read(path: str) -> Optional[Path]:
+    """PROD first, then Workspace; None unless it is an existing file inside one of them."""
+    clean_path = _clean_path(path)
+    for root in (ROOT_DIR, WORKSPACE_ROOT):
+        target = root / clean_path
+        if _inside(target, root) and target.is_file():
+            return target
+    return None
+
+
+def _resolve_write(path: str) -> Path:
+    clean_path = _clean_path(path)
+    target = ROOT_DIR / clean_path
+    if not clean_path or not _inside(target, ROOT_DIR):
+        raise HTTPException(status_code=400, detail=f"Path escapes the workforce root: {path}")
+    return target
+
 
 # ==============================================================================
 # 1. REQUEST MODELS
@@ -51,23 +100,11 @@ async def read_artifact(
     """
 
     try:
-        # Strip absolute prefixes to avoid traversal
-        clean_path = (
-            req.path.replace("F:/agentic_workforce/", "")
-                    .replace("F:/RealmWorkspaces/", "")
-                    .lstrip("/\\")
-        )
-
-        # Try PROD first
-        target = ROOT_DIR / clean_path
-
-        # Fallback to Workspace
-        if not target.exists():
-            target = WORKSPACE_ROOT / clean_path
+        target = await run_io(_resolve_read, req.path)
 
-        if target.exists() and target.is_file():
+        if target is not None:
             return {
-                "content": target.read_text(encoding="utf-8-sig", errors="replace"),
+                "content": await run_io(target.read_text, encoding="utf-8-sig", errors="replace"),
                 "type": target.suffix,
                 "path": req.path
             }
@@ -96,29 +133,148 @@ async def save_artifact(
     - F:/agentic_workforce
     - F:/RealmWorkspaces
 
-    Automatically creates parent directories.
+    Automatically creates parent directories. The file is replaced atomically.
     """
 
     try:
-        clean_path = (
-            req.path.replace("F:/agentic_workforce/", "")
-                    .replace("F:/RealmWorkspaces/", "")
-                    .lstrip("/\\")
-        )
-
-        target = ROOT_DIR / clean_path
+        target = _resolve_write(req.path)
 
-        # Ensure directory exists
-        os.makedirs(target.parent, exist_ok=True)
-
-        # Write file
-        target.write_text(req.content, encoding="utf-8-sig")
+        async with AtomicWriter(target) as writer:
+            await writer.write(req.content.encode("utf-8-sig"))
 
         return {"status": "SUCCESS"}
 
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"âŒ [IO_WRITE_FAULT]: {e}")
         raise HTTPException(
             status_code=500,
             detail=f"Physical Write Error: {str(e)}"
         )
+
+
+# ==============================================================================
+# 4. STREAM ARTIFACT (RANGE-CAPABLE)
+# ==============================================================================
+
+@router.get("/stream")
+async def stream_artifact(
+    request: Request,
+    path: str,
+    lic = Depends(get_license)
+):
+    """
+    Streams a file from PROD or Workspace in IO_CHUNK_SIZE pieces.
+
+    - No Range: 200 with chunked transfer, read to EOF at send time (growing logs included)
+    - Range: bytes=a-b | a- | -n: 206 with Content-Range (If-Range honoured)
+    - Out-of-bounds range: 416
+    - If-None-Match on the (mtime, size) ETag: 304
+    """
+
+    target = await run_io(_resolve_read, path)
+    if target is None:
+        raise HTTPException(status_code=404, detail=f"File {path} not located on physical disk.")
+
+    st = await run_io(target.stat)
+    etag = f'"{st.st_mtime_ns:x}-{st.st_size:x}"'
+    headers = {
+        "Accept-Ranges": "bytes",
+        "ETag": etag,
+        "Last-Modified": formatdate(st.st_mtime, usegmt=True),
+    }
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+
+    range_header = request.headers.get("range")
+    if_range = request.headers.get("if-range")
+    if range_header and if_range and if_range.strip() != etag:
+        range_header = None  # Client's copy is stale: send the whole file
+
+    try:
+        byte_range = parse_range(range_header, st.st_size)
+    except RangeNotSatisfiable:
+        return Response(status_code=416, headers={**headers, "Content-Range": f"bytes */{st.st_size}"})
+
+    media_type = mimetypes.guess_type(target.name)[0] or "application/octet-stream"
+    if byte_range is None:
+        return StreamingResponse(iter_file(target), media_type=media_type, headers=headers)
+
+    start, end = byte_range
+    headers["Content-Range"] = f"bytes {start}-{end}/{st.st_size}"
+    headers["Content-Length"] = str(end - start + 1)
+    return StreamingResponse(iter_file(target, start, end), status_code=206, media_type=media_type, headers=headers)
+
+
+# ==============================================================================
+# 5. STREAMED UPLOAD (ATOMIC)
+# ==============================================================================
+
+async def _store_upload(path: str, chunks: AsyncIterator[bytes], expected_sha256: Optional[str]) -> dict:
+    target = _resolve_write(path)
+    try:
+        async with AtomicWriter(target, max_bytes=IO_MAX_UPLOAD) as writer:
+            async for chunk in chunks:
+                await writer.write(chunk)
+            if expected_sha256 and writer.digest() != expected_sha256.strip().lower():
+                writer.abort()
+    except OverflowError as e:
+        raise HTTPException(status_code=413, detail=str(e))
+
+    if writer.sha256 is None:
+        raise HTTPException(status_code=422, detail=f"SHA-256 mismatch: received {writer.digest()}")
+    logger.info(f"ðŸ“¦ [IO_UPLOAD] {target} ({writer.size} bytes, sha256={writer.sha256[:12]})")
+    return {"status": "SUCCESS", "path": path, "size": writer.size, "sha256": writer.sha256}
+
+
+def _check_length(request: Request) -> None:
+    declared = request.headers.get("content-length")
+    if declared and declared.isdigit() and int(declared) > IO_MAX_UPLOAD:
+        raise HTTPException(status_code=413, detail=f"Upload exceeds {IO_MAX_UPLOAD} bytes")
+
+
+@router.put("/upload")
+async def upload_artifact(
+    request: Request,
+    path: str,
+    sha256: Optional[str] = None,
+    lic = Depends(get_license)
+):
+    """
+    Raw-body upload (Content-Length or chunked transfer) streamed to a temp file
+    beside the target, hashed on the way, then renamed into place.
+    Pass `sha256` (or X-Content-SHA256) to have the upload rejected (422) on mismatch.
+    """
+
+    _check_length(request)
+    return await _store_upload(path, request.stream(), sha256 or request.headers.get("x-content-sha256"))
+
+
+@router.post("/upload")
+async def upload_artifact_form(
+    request: Request,
+    path: Optional[str] = None,
+    sha256: Optional[str] = None,
+    lic = Depends(get_license)
+):
+    """
+    multipart/form-data upload: a `file` part plus `path` (form field or query).
+    The parser spools the part to disk; it is then copied chunk by chunk.
+    """
+
+    _check_length(request)
+    form = await request.form(max_files=1, max_fields=4)
+    try:
+        upload = form.get("file")
+        target_path = path or form.get("path")
+        if upload is None or isinstance(upload, str) or not target_path:
+            raise HTTPException(status_code=400, detail="Expected a `file` part and a `path`.")
+
+        async def chunks() -> AsyncIterator[bytes]:
+            while chunk := await upload.read(IO_CHUNK_SIZE):
+                yield chunk
+
+        return await _store_upload(str(target_path), chunks(), sha256 or form.get("sha256"))
+    finally:
+        await form.close()
@@ -5,19 +5,17 @@ PATH: F:/agentic_workforce/src/api/routes/mission_routes.py
 """
 
 from fastapi import APIRouter, Depends, HTTPException
-from langchain_core.messages import HumanMessage, AIMessage
+from langchain_core.messages import HumanMessage
 
 from src.api.dependencies.security import get_license
 from src.api.schemas.mission_schema import MissionRequest
 from src.system.connection_manager import manager
 from src.system.config import logger, log_contribution
 from src.system.state import get_initial_state, RealmForgeState
-from src.system.billing.usage_tracker import UsageTracker
+from src.system.llm_metering import llm_meter, metering_scope
 from src.utils.id_generator import generate_mission_id
-from src.system.arsenal.registry import (
-    prepare_vocal_response,
-    generate_neural_audio,
-)
+from src.system.vocal_pipeline import vocal_pipeline
+from src.system.arsenal.registry import prepare_vocal_response
 
 router = APIRouter(tags=["mission"])
 
@@ -26,6 +24,9 @@ async def mission(req: MissionRequest, lic = Depends(get_license)):
     """
     Ignites a mission, streams telemetry via WebSocket, and tracks energy usage.
     """
+    topics = {}
+    mission_id = None
+    genesis_engine = None
     try:
         # 1. Standardized Mission Identity
         mission_id = generate_mission_id()
@@ -41,68 +42,81 @@ async def mission(req: MissionRequest, lic = Depends(get_license)):
         state["vitals"]["active_sector"] = "Architect"
 
         processed_msg_hashes = set()
+        audio_seq = 0
+        config = {"configurable": {"thread_id": mission_id}}
+        # Topic tags: frames reach only this user's mission/user/silo subscribers
+        topics.update(mission_id=mission_id, user_id=lic.user_id)
+        manager.register_mission(mission_id, lic.user_id)
+        # The HTTP response only arrives at the end: push the id so the HUD can subscribe now
+        await manager.broadcast({"type": "mission_started", "mission_id": mission_id}, **topics)
+        # Late subscribers get the HUD view of the latest checkpoint, decoded only when one arrives
+        manager.track_state(mission_id, lambda: genesis_engine.get_state(config).values)
 
         await manager.broadcast({
             "type": "diagnostic",
             "text": f"ðŸš€ Strike {mission_id} Initialized for {lic.user_id}.",
             "agent": "ORCHESTRATOR",
-        })
-
-        # 4. Stream & Execute
-        async for output in genesis_engine.astream(state):
-            for node_name, node_state in output.items():
-                if node_name == "__end__":
-                    continue
-
-                agent = (node_state or {}).get("active_agent") or node_name.upper()
-                dept = (node_state or {}).get("active_department", "Architect")
-                msgs = (node_state or {}).get("messages", [])
-
-                # Telemetry Update
-                await manager.broadcast({
-                    "type": "node_update",
-                    "node": node_name.upper(),
-                    "agent": agent,
-                    "dept": dept,
-                    "handoffs": (node_state or {}).get("handoff_history", []),
-                })
-
-                # 5. Energy Tracking (Usage Tracker Suture)
-                if msgs:
-                    last_msg = msgs[-1]
-                    if isinstance(last_msg, AIMessage):
-                        await UsageTracker.track_llm_usage(
-                            response=last_msg,
-                            api_key=lic.key,
-                            mission_id=mission_id,
-                            agent_id=agent,
-                            silo=dept
-                        )
-
-                # 6. Audio Deduplication Logic
-                for msg in (msgs if isinstance(msgs, list) else [msgs]):
-                    if hasattr(msg, "content") and msg.content and not isinstance(msg, HumanMessage):
-                        m_hash = hash(msg.content)
-                        if m_hash in processed_msg_hashes: continue
-                        processed_msg_hashes.add(m_hash)
+        }, **topics)
+
+        # 4. Stream & Execute. Energy: LLMMeter bills every real LLM call of the mission to this key
+        with metering_scope(mission_id=mission_id, api_key=lic.key, user_id=lic.user_id):
+            async for output in genesis_engine.astream(state, config):
+                for node_name, node_state in output.items():
+                    if node_name == "__end__":
+                        continue
+
+                    agent = (node_state or {}).get("active_agent") or node_name.upper()
+                    dept = (node_state or {}).get("active_department", "Architect")
+                    msgs = (node_state or {}).get("messages", [])
+
+                    # Telemetry Update
+                    await manager.broadcast({
+                        "type": "node_update",
+                        "node": node_name.upper(),
+                        "agent": agent,
+                        "dept": dept,
+                        "handoffs": (node_state or {}).get("handoff_history", []),
+                    }, silo=dept, **topics)
+
+                    # 5. Audio Deduplication Logic
+                    for msg in (msgs if isinstance(msgs, list) else [msgs]):
+                        if hasattr(msg, "content") and msg.content and not isinstance(msg, HumanMessage):
+                            m_hash = hash(msg.content)
+                            if m_hash in processed_msg_hashes: continue
+                            processed_msg_hashes.add(m_hash)
                         
-                        if any(x in msg.content for x in ["[PLANNING]", "[STRATEGY]"]): continue
-
-                        vocal = prepare_vocal_response(msg.content)
-                        audio_payload = await generate_neural_audio(vocal)
+                            if any(x in msg.content for x in ["[PLANNING]", "[STRATEGY]"]): continue
+
+                            # Text frame first (HUD log), then the audio as binary frames
+                            audio_seq += 1
+                            await manager.broadcast({
+                                "type": "audio_chunk",
+                                "text": msg.content,
+                                "audio_seq": audio_seq,
+                                "mission_id": mission_id,
+                                "agent": agent,
+                                "dept": dept,
+                            }, silo=dept, **topics)
+                            # Synthesis runs in the vocal pool; graph progress never waits on TTS
+                            vocal_pipeline.submit(mission_id, audio_seq, prepare_vocal_response(msg.content), silo=dept, user_id=lic.user_id)
 
-                        await manager.broadcast({
-                            "type": "audio_chunk",
-                            "text": msg.content,
-                            "audio_base64": audio_payload,
-                            "agent": agent,
-                            "dept": dept,
-                        })
-
-        await manager.broadcast({"type": "mission_complete", "mission_id": mission_id})
+        await manager.broadcast({
+            "type": "mission_complete",
+            "mission_id": mission_id,
+            "usage": llm_meter.book.mission_usage(mission_id)["totals"],
+        }, **topics)
         return {"status": "SUCCESS", "mission_id": mission_id}
 
     except Exception as e:
         logger.error(f"ðŸ’¥ [MISSION_FAULT]: {e}")
-        await manager.broadcast({"type": "error", "message": str(e)})
+        await manager.broadcast({"type": "error", "message": str(e)}, **topics)
         raise HTTPException(status_code=500, detail=str(e))
+    finally:
+        # Checkpoints only live as long as their mission: keep its final HUD view, then drop the thread
+        if mission_id and genesis_engine is not None and genesis_engine.checkpointer:
+            try:
+                final = await genesis_engine.aget_state({"configurable": {"thread_id": mission_id}})
+                manager.track_state(mission_id, final.values)
+            except Exception as e:
+                logger.warning(f"[MISSION] Final checkpoint of {mission_id} unavailable: {e}")
+            genesis_engine.checkpointer.delete_thread(mission_id)
@@ -5,20 +5,31 @@ PATH: backend/server.py (or your entry point)
 """
 
 import os
-
+import asyncio
+import json
 import time
 import traceback
 import sys
+from datetime import datetime
 from fastapi import FastAPI, Request, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
 from contextlib import asynccontextmanager
 
 from src.system.config import STATIC_PATH, logger
-from src.api.dependencies.security import get_license
-from src.system.connection_manager import manager
+from src.api.dependencies.security import get_license, resolve_license
+from src.system.connection_manager import TOPIC_KEYS, manager
+from src.system.vocal_pipeline import vocal_pipeline
+from src.system.billing.credit_ledger import credit_ledger
+from src.system.billing.usage_tracker import UsageTracker
+from src.system.llm_metering import llm_meter
+from src.system import metrics
 from src.auth import gatekeeper
+from src.auth.db_pool import close_auth_db
+from src.utils import async_io
+from src.memory.integrity_sweeper import integrity_sweeper
+from src.system.arsenal.tool_catalog import warm_catalog
 
 # ==============================================================================
 # 1. GENESIS ENGINE LOADER
@@ -45,6 +56,12 @@ def get_brain():
 async def lifespan(app: FastAPI):
     get_brain()
     await gatekeeper.init_auth_db()
+    await credit_ledger.start()
+    llm_meter.add_sink(UsageTracker.track_llm_record)  # Metered LLM calls -> billing
+    llm_meter.add_sink(metrics.record_llm_call)  # ... and -> /metrics
+    await vocal_pipeline.start()
+    # Embedder load + tool embeddings in the background: the first plan never pays for them
+    catalog_warmup = asyncio.create_task(warm_catalog())
 
     cid = os.getenv("GITHUB_CLIENT_ID")
     ruri = os.getenv("GITHUB_REDIRECT_URI", "http://localhost:8000/api/v1/auth/github/callback")
@@ -59,6 +76,12 @@ async def lifespan(app: FastAPI):
 
     yield
     logger.info("🔌 [OFFLINE] Sovereign Node shutdown initiated.")
+    catalog_warmup.cancel()
+    await integrity_sweeper.cancel()
+    await vocal_pipeline.stop()
+    await credit_ledger.stop()
+    await close_auth_db()
+    async_io.shutdown(wait=False)
 
 # ==============================================================================
 # 3. FASTAPI APP INITIALIZATION
@@ -127,6 +150,7 @@ async def preflight_handler(request: Request, rest_of_path: str):
 from src.api.routes import (
     auth_routes, assistant_routes, mission_routes,
     io_routes, agent_routes, graph_routes, stt_routes,
+    integrity_routes,
 )
 
 app.include_router(auth_routes.router, prefix="/api/v1/auth")
@@ -136,16 +160,55 @@ app.include_router(io_routes.router, prefix="/api/v1/io")
 app.include_router(agent_routes.router, prefix="/api/v1")
 app.include_router(graph_routes.router, prefix="/api/v1")
 app.include_router(stt_routes.router, prefix="/api/v1")
+app.include_router(integrity_routes.router, prefix="/api/v1")
 
 @app.get("/health")
 def health():
     return {"status": "ONLINE", "timestamp": datetime.now().isoformat()}
 
+# Queue depths are sampled at scrape time rather than tracked on every frame
+metrics.registry.add_collector(metrics.collect_connection_stats(manager))
+metrics.registry.add_collector(metrics.collect_pipeline_stats(vocal_pipeline, credit_ledger))
+
+@app.get("/metrics")
+def prometheus_metrics():
+    """Prometheus text exposition (node/tool/LLM/memory/SQLite latencies, queue depths)."""
+    return Response(content=metrics.render_metrics(), media_type=metrics.CONTENT_TYPE)
+
 @app.websocket("/ws/telemetry")
 async def ws_endpoint(websocket: WebSocket):
-    await manager.connect(websocket)
+    """
+    Telemetry socket, authenticated with ?key=<license key> (or the X-API-Key
+    header). The socket starts subscribed to its license's user_id; more topics
+    via query string (?mission_id=..&silo=..) or messages such as
+    {"action": "subscribe", "mission_id": "MSN-..."} / {"action": "unsubscribe", ...}.
+    Only the license's own user_id and missions can be subscribed (master: any).
+    """
+    params = websocket.query_params
+    try:
+        lic = await resolve_license(params.get("key") or websocket.headers.get("x-api-key"))
+    except Exception as e:
+        logger.error(f"[WS] License lookup failed: {e}")
+        await websocket.close(code=1011)  # Server error: the client may retry
+        return
+    if not lic:
+        await websocket.close(code=1008)  # Policy violation: no valid license
+        return
+    owner = None if lic.key == "MASTER" else lic.user_id
+    await manager.connect(websocket, owner=owner, **{k: params.get(k) for k in TOPIC_KEYS if params.get(k)})
     try:
         while True:
-            await websocket.receive_text()
+            raw = await websocket.receive_text()
+            try:
+                msg = json.loads(raw)
+            except ValueError:
+                continue
+            if not isinstance(msg, dict):
+                continue
+            topics = {k: msg.get(k) for k in TOPIC_KEYS if msg.get(k)}
+            if msg.get("action") == "subscribe":
+                manager.subscribe(websocket, **topics)
+            elif msg.get("action") == "unsubscribe":
+                manager.unsubscribe(websocket, **topics)
     except WebSocketDisconnect:
         manager.disconnect(websocket)
\ No newline at end of file
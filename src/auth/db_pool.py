@@ -0,0 +1,177 @@
+"""
+REALM FORGE: AUTH DATABASE POOL v1.0
+PURPOSE: Shared aiosqlite connections for licenses.db (gatekeeper, ledger, usage tracking).
+         One dedicated writer connection (writes serialized in-process, so no
+         'database is locked' churn) plus a small pool of read-only connections.
+         PRAGMAs are applied once per connection; statement caches make repeated
+         SQL constants effectively prepared statements.
+PATH: F:/agentic_workforce/src/auth/db_pool.py
+"""
+
+import asyncio
+import logging
+import os
+from contextlib import asynccontextmanager
+from pathlib import Path
+from typing import Any, AsyncIterator, Iterable, List, Optional
+
+import aiosqlite
+
+from src.system.metrics import SQLITE_LATENCY
+
+# --- PHYSICAL PATH SOVEREIGNTY ---
+ROOT_DIR = Path("F:/agentic_workforce")
+BASE_PATH = ROOT_DIR / "data"
+DB_PATH = BASE_PATH / "security" / "licenses.db"
+
+AUTH_DB_READERS = int(os.getenv("REALM_AUTH_DB_READERS", "4"))
+AUTH_DB_BUSY_TIMEOUT_MS = int(os.getenv("REALM_AUTH_DB_BUSY_TIMEOUT_MS", "5000"))
+AUTH_DB_CACHED_STATEMENTS = 256
+
+logger = logging.getLogger("Gatekeeper")
+
+# Pre-bound histogram children (pool wait included: contention shows up here)
+_TIME_FETCHONE = SQLITE_LATENCY.labels("fetchone")
+_TIME_FETCHALL = SQLITE_LATENCY.labels("fetchall")
+_TIME_EXECUTE = SQLITE_LATENCY.labels("execute")
+_TIME_TRANSACTION = SQLITE_LATENCY.labels("transaction")
+
+
+async def _pragma(conn: aiosqlite.Connection, sql: str) -> None:
+    """Runs a PRAGMA and finalizes its cursor (a pending statement would hold the file lock)."""
+    async with conn.execute(sql) as cursor:
+        await cursor.fetchall()
+
+
+class AuthDBPool:
+    """Writer + reader connections over one SQLite file in WAL mode."""
+
+    def __init__(self, path: Path = DB_PATH, readers: int = AUTH_DB_READERS, busy_timeout_ms: int = AUTH_DB_BUSY_TIMEOUT_MS):
+        self.path = Path(path)
+        self.readers = max(1, readers)
+        self.busy_timeout_ms = busy_timeout_ms
+        self._writer: Optional[aiosqlite.Connection] = None
+        self._write_lock = asyncio.Lock()
+        self._read_pool: Optional[asyncio.Queue] = None
+        self._read_conns: List[aiosqlite.Connection] = []
+        self._start_lock = asyncio.Lock()
+
+    @property
+    def started(self) -> bool:
+        return self._writer is not None
+
+    async def _open(self, read_only: bool) -> aiosqlite.Connection:
+        connector = aiosqlite.connect(
+            self.path,
+            timeout=self.busy_timeout_ms / 1000,
+            cached_statements=AUTH_DB_CACHED_STATEMENTS,
+        )
+        # Pooled connections live for the whole process; their worker threads must not
+        # block interpreter exit when the pool is never closed (scripts, tests).
+        getattr(connector, "_thread", connector).daemon = True
+        conn = await connector
+        try:
+            await _pragma(conn, f"PRAGMA busy_timeout={int(self.busy_timeout_ms)}")
+            if not read_only:
+                await _pragma(conn, "PRAGMA journal_mode=WAL")  # Persistent; set before readers attach
+            await _pragma(conn, "PRAGMA synchronous=NORMAL")
+            await _pragma(conn, "PRAGMA temp_store=MEMORY")
+            if read_only:
+                await _pragma(conn, "PRAGMA query_only=ON")
+        except BaseException:
+            await conn.close()
+            raise
+        return conn
+
+    async def start(self) -> "AuthDBPool":
+        async with self._start_lock:
+            if self.started:
+                return self
+            os.makedirs(self.path.parent, exist_ok=True)
+            writer = await self._open(read_only=False)
+            try:
+                for _ in range(self.readers):
+                    self._read_conns.append(await self._open(read_only=True))
+            except BaseException:
+                for conn in [writer] + self._read_conns:
+                    await conn.close()
+                self._read_conns = []
+                raise
+            self._read_pool = asyncio.Queue()
+            for conn in self._read_conns:
+                self._read_pool.put_nowait(conn)
+            self._writer = writer
+            logger.info(f"[AUTH_DB] Pool online: 1 writer + {self.readers} readers ({self.path}).")
+        return self
+
+    async def close(self) -> None:
+        async with self._start_lock:
+            conns = ([self._writer] if self._writer is not None else []) + self._read_conns
+            self._writer, self._read_conns, self._read_pool = None, [], None
+            for conn in conns:
+                try:
+                    await conn.close()
+                except Exception as e:
+                    logger.warning(f"[AUTH_DB] Close failed: {e}")
+
+    # --- CONNECTION LEASES ---
+
+    @asynccontextmanager
+    async def reader(self) -> AsyncIterator[aiosqlite.Connection]:
+        if not self.started:
+            await self.start()
+        pool = self._read_pool
+        conn = await pool.get()
+        try:
+            yield conn
+        finally:
+            pool.put_nowait(conn)
+
+    @asynccontextmanager
+    async def writer(self) -> AsyncIterator[aiosqlite.Connection]:
+        """Exclusive writer lease; commits on success, rolls back on error."""
+        if not self.started:
+            await self.start()
+        with _TIME_TRANSACTION.time():
+            async with self._write_lock:
+                try:
+                    yield self._writer
+                    await self._writer.commit()
+                except BaseException:
+                    await self._writer.rollback()
+                    raise
+
+    # --- CONVENIENCE ---
+
+    async def fetchone(self, sql: str, params: Iterable[Any] = ()) -> Optional[tuple]:
+        with _TIME_FETCHONE.time():
+            async with self.reader() as db:
+                async with db.execute(sql, tuple(params)) as cursor:
+                    return await cursor.fetchone()
+
+    async def fetchall(self, sql: str, params: Iterable[Any] = ()) -> List[tuple]:
+        with _TIME_FETCHALL.time():
+            async with self.reader() as db:
+                async with db.execute(sql, tuple(params)) as cursor:
+                    return list(await cursor.fetchall())
+
+    async def execute(self, sql: str, params: Iterable[Any] = ()) -> int:
+        """Single write statement; returns the affected row count."""
+        with _TIME_EXECUTE.time():
+            async with self.writer() as db:
+                cursor = await db.execute(sql, tuple(params))
+                return cursor.rowcount
+
+
+auth_db = AuthDBPool()
+
+
+async def get_auth_db() -> AuthDBPool:
+    """The process-wide pool, started on first use."""
+    if not auth_db.started:
+        await auth_db.start()
+    return auth_db
+
+
+async def close_auth_db() -> None:
+    await auth_db.close()
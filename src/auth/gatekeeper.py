@@ -12,7 +12,6 @@ import uuid
 import secrets
 import logging
 import asyncio
-import aiosqlite
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Optional, List, Dict, Union, Any
@@ -21,12 +20,9 @@ from jose import JWTError, jwt
 from passlib.context import CryptContext
 
 # --- 0. PHYSICAL PATH SOVEREIGNTY ---
-ROOT_DIR = Path("F:/agentic_workforce")
-BASE_PATH = ROOT_DIR / "data"
-DB_PATH = BASE_PATH / "security" / "licenses.db"
-
-# Ensure directories exist physically
-os.makedirs(DB_PATH.parent, exist_ok=True)
+from src.auth.db_pool import ROOT_DIR, BASE_PATH, DB_PATH, get_auth_db
+from src.auth.license_cache import license_cache
+from src.auth.usage_rollups import ensure_usage_rollups, usage_by_silo
 
 logger = logging.getLogger("Gatekeeper")
 
@@ -74,11 +70,20 @@ class TokenData(BaseModel):
 # 3. ASYNC DATABASE OPERATIONS (BEDROCK)
 # ==============================================================================
 
+# Fixed SQL text so the pooled connections' statement caches reuse the prepared form
+SQL_INSERT_LICENSE = """INSERT INTO licenses (key, user_id, tier, credits, created_at, metadata)
+                        VALUES (?, ?, ?, ?, ?, ?)"""
+SQL_SELECT_LICENSE = """SELECT key, user_id, tier, credits, created_at, status, metadata
+                        FROM licenses WHERE key=?"""
+SQL_DEDUCT_CREDITS = "UPDATE licenses SET credits = credits - ? WHERE key = ? AND credits >= ?"
+SQL_SET_STATUS = "UPDATE licenses SET status = ? WHERE key = ?"
+SQL_INSERT_USAGE = """INSERT INTO usage_logs (key, agent_id, silo_id, mission_id, task_summary, cost, timestamp)
+                      VALUES (?, ?, ?, ?, ?, ?, ?)"""
+
 async def init_auth_db():
     """Initializes the security database with High-Concurrency (WAL) mode."""
-    async with aiosqlite.connect(DB_PATH) as db:
-        await db.execute("PRAGMA journal_mode=WAL")
-        
+    pool = await get_auth_db()  # WAL + PRAGMAs applied when the pool opens
+    async with pool.writer() as db:
         # Main License Table
         await db.execute('''CREATE TABLE IF NOT EXISTS licenses
                      (key text PRIMARY KEY, 
@@ -99,8 +104,9 @@ async def init_auth_db():
                       task_summary text,
                       cost integer,
                       timestamp real)''')
-        
-        await db.commit()
+
+        # (key, timestamp) index + trigger-maintained hourly/daily/total rollups
+        await ensure_usage_rollups(db)
     logger.info(f"ðŸ” [GATEKEEPER] Neural Security Lattice Active (Async WAL): {DB_PATH}")
 
 # ==============================================================================
@@ -130,11 +136,9 @@ async def generate_key(user_id: str, tier: str = "FREE", custom_metadata: Dict =
     meta_json = json.dumps(custom_metadata or {})
     
     try:
-        async with aiosqlite.connect(DB_PATH) as db:
-            await db.execute("""INSERT INTO licenses (key, user_id, tier, credits, created_at, metadata) 
-                         VALUES (?, ?, ?, ?, ?, ?)""", 
-                      (api_key, user_id, tier, initial_credits, time.time(), meta_json))
-            await db.commit()
+        pool = await get_auth_db()
+        await pool.execute(SQL_INSERT_LICENSE, (api_key, user_id, tier, initial_credits, time.time(), meta_json))
+        license_cache.invalidate(api_key)
         logger.info(f"[NEW] [KEY_GEN] New {tier} key issued for {user_id}")
         return api_key
     except Exception as e:
@@ -142,7 +146,18 @@ async def generate_key(user_id: str, tier: str = "FREE", custom_metadata: Dict =
         return None
 
 async def validate_key(api_key: str) -> Optional[License]:
-    """Validates key existence, status, and Master-Key bypass."""
+    """Validates key existence, status, and Master-Key bypass. None on any fault."""
+    try:
+        return await lookup_key(api_key)
+    except Exception as e:
+        logger.error(f"[ERROR] [SECURITY_FAULT]: {e}")
+        return None
+
+async def lookup_key(api_key: str) -> Optional[License]:
+    """
+    validate_key() without the safety net: None only for a definite answer
+    (unknown or inactive key); database faults propagate to the caller.
+    """
     
     # 1. Master Override (God Mode)
     if api_key == MASTER_KEY:
@@ -157,32 +172,37 @@ async def validate_key(api_key: str) -> Optional[License]:
         )
 
     # 2. Database Lookup
-    try:
-        async with aiosqlite.connect(DB_PATH) as db:
-            async with db.execute("""SELECT key, user_id, tier, credits, created_at, status, metadata 
-                                   FROM licenses WHERE key=?""", (api_key,)) as cursor:
-                row = await cursor.fetchone()
+    pool = await get_auth_db()
+    row = await pool.fetchone(SQL_SELECT_LICENSE, (api_key,))
+
+    if row:
+        try: meta_dict = json.loads(row[6])
+        except: meta_dict = {}
+
+        lic = License(
+            key=row[0], user_id=row[1], tier=row[2], 
+            credits=row[3], created_at=row[4], status=row[5],
+            metadata=meta_dict
+        )
         
-        if row:
-            try: meta_dict = json.loads(row[6])
-            except: meta_dict = {}
-
-            lic = License(
-                key=row[0], user_id=row[1], tier=row[2], 
-                credits=row[3], created_at=row[4], status=row[5],
-                metadata=meta_dict
-            )
-            
-            if lic.status != "ACTIVE":
-                logger.warning(f"ðŸš« [ACCESS_BLOCKED] Key {api_key[:12]}... is INACTIVE")
-                return None
-            return lic
-            
-    except Exception as e:
-        logger.error(f"[ERROR] [SECURITY_FAULT]: {e}")
+        if lic.status != "ACTIVE":
+            logger.warning(f"ðŸš« [ACCESS_BLOCKED] Key {api_key[:12]}... is INACTIVE")
+            return None
+        return lic
     
     return None
 
+async def set_key_status(api_key: str, status: str) -> bool:
+    """Activates/suspends a key; cached validations of it are dropped immediately."""
+    try:
+        pool = await get_auth_db()
+        updated = await pool.execute(SQL_SET_STATUS, (status, api_key)) > 0
+    except Exception as e:
+        logger.error(f"[ERROR] [STATUS_FAULT]: {e}")
+        return False
+    license_cache.invalidate(api_key)
+    return updated
+
 # ==============================================================================
 # 5. WORKFORCE COMPLIANCE & DEDUCTION
 # ==============================================================================
@@ -198,28 +218,29 @@ async def deduct_credit(api_key: str, cost: int = 1, mission_id: str = "MSN-UNK"
         return True
 
     try:
-        async with aiosqlite.connect(DB_PATH, timeout=20) as db:
-            # Atomic deduction
-            await db.execute("UPDATE licenses SET credits = credits - ? WHERE key = ? AND credits >= ?", 
-                      (cost, api_key, cost))
-            
-            # Check rowcount via secondary query or last_row_id logic
-            async with db.execute("SELECT changes()") as cursor:
-                changes = (await cursor.fetchone())[0]
-
-            if changes > 0:
-                await db.execute("""INSERT INTO usage_logs (key, agent_id, silo_id, mission_id, task_summary, cost, timestamp) 
-                             VALUES (?, ?, ?, ?, ?, ?, ?)""",
+        pool = await get_auth_db()
+        async with pool.writer() as db:
+            # Atomic deduction (single writer: no lock contention between requests)
+            cursor = await db.execute(SQL_DEDUCT_CREDITS, (cost, api_key, cost))
+            deducted = cursor.rowcount > 0
+
+            if deducted:
+                await db.execute(SQL_INSERT_USAGE,
                           (api_key, agent_id, silo_id, mission_id, task_context[:200], cost, time.time()))
-                await db.commit()
-                return True
+        if deducted:
+            license_cache.apply_credit_delta(api_key, -cost)  # Only once committed
+            # Late import: the ledger imports this module. Its cached balance is now stale
+            from src.system.billing.credit_ledger import credit_ledger
+            credit_ledger.forget(api_key)
+            return True
     except Exception as e:
         logger.error(f"[ERROR] [DEDUCTION_FAULT]: {e}")
         
     return False
 
-async def get_account_vitals(api_key: str) -> Dict[str, Any]:
-    """Retrieves account balance and workforce status for the HUD."""
+async def get_account_vitals(api_key: str, start: Optional[float] = None,
+                             end: Optional[float] = None) -> Dict[str, Any]:
+    """Retrieves account balance and workforce status for the HUD (usage over [start, end), default all-time)."""
     lic = await validate_key(api_key)
     if not lic:
         return {"status": "INVALID_LICENSE"}
@@ -227,10 +248,9 @@ async def get_account_vitals(api_key: str) -> Dict[str, Any]:
     # Calculate usage stats for Bento Grid telemetry
     usage_stats = {}
     try:
-        async with aiosqlite.connect(DB_PATH) as db:
-            async with db.execute("SELECT silo_id, SUM(cost) FROM usage_logs WHERE key=? GROUP BY silo_id", (api_key,)) as cursor:
-                rows = await cursor.fetchall()
-                usage_stats = {row[0]: row[1] for row in rows}
+        pool = await get_auth_db()
+        report = await usage_by_silo(pool, api_key, start, end)
+        usage_stats = {silo: entry["cost"] for silo, entry in report.items()}
     except: pass
 
     return {
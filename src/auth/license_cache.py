@@ -0,0 +1,107 @@
+"""
+REALM FORGE: LICENSE CACHE v1.0
+PURPOSE: Short-TTL in-process cache in front of gatekeeper.lookup_key for the
+         get_license dependency. Entries are keyed by sha256(api_key); invalid keys
+         are negatively cached in a capped LRU so key-spraying cannot grow memory.
+         Only definite answers are cached: a database fault raises before put().
+PATH: F:/agentic_workforce/src/auth/license_cache.py
+"""
+
+import hashlib
+import os
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Optional, Tuple
+
+LICENSE_CACHE_TTL = float(os.getenv("REALM_LICENSE_CACHE_TTL", "30"))
+LICENSE_NEGATIVE_TTL = float(os.getenv("REALM_LICENSE_NEGATIVE_TTL", "10"))
+LICENSE_CACHE_MAX = int(os.getenv("REALM_LICENSE_CACHE_MAX", "10000"))
+LICENSE_NEGATIVE_MAX = int(os.getenv("REALM_LICENSE_NEGATIVE_MAX", "1024"))
+
+MISS = object()  # Sentinel: not cached (None is a cached "invalid key")
+
+
+def key_digest(api_key: str) -> str:
+    return hashlib.sha256((api_key or "").encode("utf-8")).hexdigest()
+
+
+class LicenseCache:
+    """Positive + negative TTL caches (OrderedDict LRUs) of validated licenses."""
+
+    def __init__(
+        self,
+        ttl: float = LICENSE_CACHE_TTL,
+        negative_ttl: float = LICENSE_NEGATIVE_TTL,
+        max_entries: int = LICENSE_CACHE_MAX,
+        negative_max: int = LICENSE_NEGATIVE_MAX,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.max_entries = max_entries
+        self.negative_max = negative_max
+        self.clock = clock
+        self._valid: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self._invalid: "OrderedDict[str, float]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, api_key: str) -> Any:
+        """Cached License, None for a cached invalid key, or MISS."""
+        digest = key_digest(api_key)
+        now = self.clock()
+        entry = self._valid.get(digest)
+        if entry is not None:
+            if entry[0] > now:
+                self._valid.move_to_end(digest)
+                self.hits += 1
+                return entry[1]
+            del self._valid[digest]
+        expires = self._invalid.get(digest)
+        if expires is not None:
+            if expires > now:
+                self.hits += 1
+                return None
+            del self._invalid[digest]
+        self.misses += 1
+        return MISS
+
+    def put(self, api_key: str, license: Optional[Any]) -> None:
+        """Caches a License, or None for a key the database says is unknown or inactive."""
+        digest = key_digest(api_key)
+        now = self.clock()
+        if license is None:
+            self._valid.pop(digest, None)
+            self._invalid[digest] = now + self.negative_ttl
+            self._invalid.move_to_end(digest)
+            while len(self._invalid) > self.negative_max:
+                self._invalid.popitem(last=False)
+            return
+        self._invalid.pop(digest, None)
+        self._valid[digest] = (now + self.ttl, license)
+        self._valid.move_to_end(digest)
+        while len(self._valid) > self.max_entries:
+            self._valid.popitem(last=False)
+
+    def apply_credit_delta(self, api_key: str, delta: int) -> None:
+        """Keeps a cached balance in step with a committed deduction/top-up."""
+        digest = key_digest(api_key)
+        entry = self._valid.get(digest)
+        if entry is None:
+            return
+        expires, license = entry
+        copier = getattr(license, "model_copy", None) or license.copy
+        self._valid[digest] = (expires, copier(update={"credits": license.credits + delta}))
+
+    def invalidate(self, api_key: str) -> None:
+        """Drops both positive and negative entries (status change, new key, revocation)."""
+        digest = key_digest(api_key)
+        self._valid.pop(digest, None)
+        self._invalid.pop(digest, None)
+
+    def clear(self) -> None:
+        self._valid.clear()
+        self._invalid.clear()
+
+
+license_cache = LicenseCache()
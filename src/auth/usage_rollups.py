@@ -0,0 +1,159 @@
+"""
+REALM FORGE: USAGE ROLLUPS v1.0
+PURPOSE: Constant-time usage reporting over an unbounded usage_logs table.
+         - usage_logs is indexed on (key, timestamp).
+         - An AFTER INSERT trigger keeps hourly, daily and all-time rollups per
+           (key, silo) current inside the writer's own transaction.
+         - Time-range reports decompose [start, end) into whole days, whole hours
+           and at most two sub-hour edges read from the raw log through the index.
+PATH: F:/agentic_workforce/src/auth/usage_rollups.py
+"""
+
+import math
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+HOUR = 3600
+DAY = 86400
+
+GRANULARITIES = {"hour": ("usage_rollup_hourly", HOUR), "day": ("usage_rollup_daily", DAY)}
+
+USAGE_TRIGGER = "trg_usage_rollup"
+
+SQL_USAGE_INDEX = "CREATE INDEX IF NOT EXISTS idx_usage_key_ts ON usage_logs (key, timestamp)"
+
+SQL_ROLLUP_TABLES = [
+    """CREATE TABLE IF NOT EXISTS usage_rollup_hourly
+       (key text, bucket integer, silo_id text, cost integer, calls integer,
+        PRIMARY KEY (key, bucket, silo_id)) WITHOUT ROWID""",
+    """CREATE TABLE IF NOT EXISTS usage_rollup_daily
+       (key text, bucket integer, silo_id text, cost integer, calls integer,
+        PRIMARY KEY (key, bucket, silo_id)) WITHOUT ROWID""",
+    """CREATE TABLE IF NOT EXISTS usage_rollup_total
+       (key text, silo_id text, cost integer, calls integer,
+        PRIMARY KEY (key, silo_id)) WITHOUT ROWID""",
+]
+
+# Buckets are UTC epoch seconds truncated to the hour/day. NULL silos roll up as ''.
+SQL_ROLLUP_TRIGGER = f"""
+CREATE TRIGGER IF NOT EXISTS {USAGE_TRIGGER} AFTER INSERT ON usage_logs
+BEGIN
+    INSERT INTO usage_rollup_hourly (key, bucket, silo_id, cost, calls)
+    VALUES (NEW.key, CAST(NEW.timestamp / {HOUR} AS INTEGER) * {HOUR}, COALESCE(NEW.silo_id, ''), COALESCE(NEW.cost, 0), 1)
+    ON CONFLICT (key, bucket, silo_id) DO UPDATE SET cost = cost + excluded.cost, calls = calls + 1;
+
+    INSERT INTO usage_rollup_daily (key, bucket, silo_id, cost, calls)
+    VALUES (NEW.key, CAST(NEW.timestamp / {DAY} AS INTEGER) * {DAY}, COALESCE(NEW.silo_id, ''), COALESCE(NEW.cost, 0), 1)
+    ON CONFLICT (key, bucket, silo_id) DO UPDATE SET cost = cost + excluded.cost, calls = calls + 1;
+
+    INSERT INTO usage_rollup_total (key, silo_id, cost, calls)
+    VALUES (NEW.key, COALESCE(NEW.silo_id, ''), COALESCE(NEW.cost, 0), 1)
+    ON CONFLICT (key, silo_id) DO UPDATE SET cost = cost + excluded.cost, calls = calls + 1;
+END"""
+
+SQL_BACKFILL = [
+    "DELETE FROM usage_rollup_hourly",
+    "DELETE FROM usage_rollup_daily",
+    "DELETE FROM usage_rollup_total",
+    f"""INSERT INTO usage_rollup_hourly (key, bucket, silo_id, cost, calls)
+        SELECT key, CAST(timestamp / {HOUR} AS INTEGER) * {HOUR}, COALESCE(silo_id, ''), COALESCE(SUM(cost), 0), COUNT(*)
+        FROM usage_logs GROUP BY 1, 2, 3""",
+    f"""INSERT INTO usage_rollup_daily (key, bucket, silo_id, cost, calls)
+        SELECT key, CAST(timestamp / {DAY} AS INTEGER) * {DAY}, COALESCE(silo_id, ''), COALESCE(SUM(cost), 0), COUNT(*)
+        FROM usage_logs GROUP BY 1, 2, 3""",
+    """INSERT INTO usage_rollup_total (key, silo_id, cost, calls)
+       SELECT key, COALESCE(silo_id, ''), COALESCE(SUM(cost), 0), COUNT(*)
+       FROM usage_logs GROUP BY 1, 2""",
+]
+
+SQL_TOTAL_BY_SILO = "SELECT silo_id, cost, calls FROM usage_rollup_total WHERE key = ?"
+SQL_RAW_BY_SILO = """SELECT COALESCE(silo_id, ''), COALESCE(SUM(cost), 0), COUNT(*) FROM usage_logs
+                     WHERE key = ? AND timestamp >= ? AND timestamp < ? GROUP BY 1"""
+SQL_ROLLUP_BY_SILO = """SELECT silo_id, SUM(cost), SUM(calls) FROM {table}
+                        WHERE key = ? AND bucket >= ? AND bucket < ? GROUP BY silo_id"""
+SQL_ROLLUP_SERIES = """SELECT bucket, silo_id, cost, calls FROM {table}
+                       WHERE key = ? AND bucket >= ? AND bucket < ? ORDER BY bucket, silo_id"""
+
+
+async def ensure_usage_rollups(db: Any) -> None:
+    """Creates index, rollup tables and trigger; backfills once when the trigger is new."""
+    await db.execute(SQL_USAGE_INDEX)
+    async with db.execute("SELECT 1 FROM sqlite_master WHERE type = 'trigger' AND name = ?", (USAGE_TRIGGER,)) as cursor:
+        has_trigger = await cursor.fetchone() is not None
+    for ddl in SQL_ROLLUP_TABLES:
+        await db.execute(ddl)
+    if not has_trigger:
+        for sql in SQL_BACKFILL:
+            await db.execute(sql)
+        await db.execute(SQL_ROLLUP_TRIGGER)
+
+
+def _floor(ts: float, step: int) -> int:
+    return int(math.floor(ts / step)) * step
+
+
+def _ceil(ts: float, step: int) -> int:
+    return int(math.ceil(ts / step)) * step
+
+
+def usage_segments(start: float, end: float) -> List[Tuple[str, float, float]]:
+    """
+    Splits [start, end) into ("raw" | "hour" | "day", lo, hi) pieces:
+    at most 2 raw edges (< 1h each), 2 runs of hours (< 1 day each) and one run of days.
+    """
+    if end <= start:
+        return []
+    h0, h1 = _ceil(start, HOUR), _floor(end, HOUR)
+    if h0 >= h1:
+        return [("raw", start, end)]
+    segments = []
+    if start < h0:
+        segments.append(("raw", start, h0))
+    d0, d1 = _ceil(h0, DAY), _floor(h1, DAY)
+    if d0 < d1:
+        if h0 < d0:
+            segments.append(("hour", h0, d0))
+        segments.append(("day", d0, d1))
+        if d1 < h1:
+            segments.append(("hour", d1, h1))
+    else:
+        segments.append(("hour", h0, h1))
+    if h1 < end:
+        segments.append(("raw", h1, end))
+    return segments
+
+
+async def usage_by_silo(pool: Any, api_key: str, start: Optional[float] = None,
+                        end: Optional[float] = None) -> Dict[str, Dict[str, int]]:
+    """{silo: {"cost", "calls"}} for [start, end); all-time totals when no range is given."""
+    report: Dict[str, Dict[str, int]] = {}
+
+    def add(rows):
+        for silo, cost, calls in rows:
+            entry = report.setdefault(silo, {"cost": 0, "calls": 0})
+            entry["cost"] += cost or 0
+            entry["calls"] += calls or 0
+
+    if start is None and end is None:
+        add(await pool.fetchall(SQL_TOTAL_BY_SILO, (api_key,)))
+        return report
+
+    start = 0.0 if start is None else float(start)
+    end = time.time() + 1 if end is None else float(end)
+    for kind, lo, hi in usage_segments(start, end):
+        if kind == "raw":
+            add(await pool.fetchall(SQL_RAW_BY_SILO, (api_key, lo, hi)))
+        else:
+            table = GRANULARITIES[kind][0]
+            add(await pool.fetchall(SQL_ROLLUP_BY_SILO.format(table=table), (api_key, lo, hi)))
+    return report
+
+
+async def usage_series(pool: Any, api_key: str, start: float, end: float,
+                       granularity: str = "hour") -> List[Dict[str, Any]]:
+    """Per-bucket, per-silo usage rows for charts; buckets overlapping [start, end) are included."""
+    if granularity not in GRANULARITIES:
+        raise ValueError(f"granularity must be one of {sorted(GRANULARITIES)}")
+    table, step = GRANULARITIES[granularity]
+    rows = await pool.fetchall(SQL_ROLLUP_SERIES.format(table=table), (api_key, _floor(start, step), end))
+    return [{"bucket": b, "silo": s, "cost": c, "calls": n} for b, s, c, n in rows]
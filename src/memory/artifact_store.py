@@ -0,0 +1,377 @@
+"""
+REALM FORGE: ARTIFACT STORE v1.0
+PURPOSE: Content-addressed storage and cached SHA-256 hashing for IronClad validation.
+         - HashCache remembers the digest of every file it hashed, keyed by
+           (path, size, mtime_ns), in SQLite; an unchanged file costs one stat and one
+           indexed lookup instead of a full read.
+         - Misses are hashed with 1 MB buffers (mmap for large files, which lets
+           hashlib drop the GIL over the whole mapping) and, in batches, in parallel on
+           the shared async I/O pool under a concurrency cap.
+         - ArtifactStore keeps one copy per distinct content under objects/ab/cdef...;
+           storing identical content twice is a stat, not a copy. The store is capped
+           at REALM_ARTIFACT_STORE_CAP_BYTES: past it, the least recently stored or
+           re-validated objects are evicted (lattice hashes stay; only the copy goes).
+PATH: F:/agentic_workforce/src/memory/artifact_store.py
+"""
+
+import asyncio
+import hashlib
+import mmap
+import os
+import sqlite3
+import threading
+import time
+import uuid
+from pathlib import Path
+from typing import Awaitable, Callable, Dict, Iterable, List, Optional, Tuple, Union
+
+from src.system.config import DATA_ROOT, logger
+from src.utils.async_io import run_io
+
+ARTIFACT_INDEX_PATH = DATA_ROOT / "memory" / "artifact_index.db"
+ARTIFACT_OBJECTS_ROOT = DATA_ROOT / "artifacts" / "objects"
+HASH_CHUNK_SIZE = int(os.getenv("REALM_HASH_CHUNK_SIZE", str(1024 * 1024)))
+HASH_MMAP_MIN = int(os.getenv("REALM_HASH_MMAP_MIN", str(16 * 1024 * 1024)))
+HASH_CONCURRENCY = int(os.getenv("REALM_HASH_CONCURRENCY", "4"))
+ARTIFACT_STORE_MAX_BYTES = int(os.getenv("REALM_ARTIFACT_STORE_MAX_BYTES", str(256 * 1024 * 1024)))
+ARTIFACT_STORE_CAP_BYTES = int(os.getenv("REALM_ARTIFACT_STORE_CAP_BYTES", str(2 * 1024 * 1024 * 1024)))  # 0 = uncapped
+# Eviction frees down to this share of the cap, so a full store is not collected on every put
+_GC_LOW_WATER = 0.9
+_STALE_TMP_SECONDS = 3600
+# A file modified within this window of its hash may change again without moving its
+# mtime (coarse timestamp granularity), so its digest is not trusted for reuse
+_RACY_NS = 2_000_000_000
+
+PathLike = Union[str, Path]
+
+
+def sha256_file(path: PathLike, chunk_size: int = HASH_CHUNK_SIZE, mmap_min: int = HASH_MMAP_MIN) -> str:
+    """Hex SHA-256 of a file; large files are hashed straight from a memory map."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        if size >= mmap_min:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                digest.update(mm)
+            return digest.hexdigest()
+        buffer = bytearray(chunk_size)
+        view = memoryview(buffer)
+        while True:
+            n = f.readinto(buffer)
+            if not n:
+                break
+            digest.update(view[:n])
+    return digest.hexdigest()
+
+
+# ==============================================================================
+# 1. HASH CACHE
+# ==============================================================================
+
+_SCHEMA = (
+    """CREATE TABLE IF NOT EXISTS hashes (
+        path TEXT PRIMARY KEY,
+        size INTEGER NOT NULL,
+        mtime_ns INTEGER NOT NULL,
+        sha256 TEXT NOT NULL,
+        hashed_at REAL NOT NULL
+    )""",
+)
+
+
+class HashCache:
+    """Persistent (path, size, mtime_ns) -> SHA-256 map in front of sha256_file()."""
+
+    def __init__(self, path: Path = ARTIFACT_INDEX_PATH, concurrency: int = HASH_CONCURRENCY):
+        self.path = Path(path)
+        self.concurrency = max(1, concurrency)
+        self.hits = 0
+        self.misses = 0
+        self._local = threading.local()
+        self._schema_lock = threading.Lock()
+        self._schema_ready = False
+
+    def _conn(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.path, timeout=30, check_same_thread=False, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            with self._schema_lock:
+                if not self._schema_ready:
+                    for statement in _SCHEMA:
+                        conn.execute(statement)
+                    self._schema_ready = True
+            self._local.conn = conn
+        return conn
+
+    @staticmethod
+    def _key(path: PathLike) -> str:
+        return str(path).replace("\\", "/")
+
+    def lookup(self, path: PathLike, st: os.stat_result) -> Optional[str]:
+        """Cached digest if the file still has the size and mtime it was hashed at."""
+        row = self._conn().execute(
+            "SELECT sha256 FROM hashes WHERE path=? AND size=? AND mtime_ns=?",
+            (self._key(path), st.st_size, st.st_mtime_ns)).fetchone()
+        return row[0] if row else None
+
+    def store(self, rows: Iterable[Tuple[PathLike, os.stat_result, str]]) -> None:
+        now_ns = time.time_ns()
+        params = [(self._key(p), st.st_size, st.st_mtime_ns, digest, now_ns / 1e9)
+                  for p, st, digest in rows if now_ns - st.st_mtime_ns > _RACY_NS]
+        if not params:
+            return
+        try:
+            self._conn().executemany(
+                "INSERT OR REPLACE INTO hashes(path, size, mtime_ns, sha256, hashed_at) VALUES (?, ?, ?, ?, ?)",
+                params)
+        except sqlite3.Error as e:
+            logger.warning(f"[ARTIFACT_STORE] Hash cache write failed: {e}")
+
+    def forget(self, paths: Iterable[PathLike]) -> None:
+        self._conn().executemany("DELETE FROM hashes WHERE path=?", [(self._key(p),) for p in paths])
+
+    def _hash_uncached(self, path: PathLike, st: os.stat_result) -> str:
+        digest = sha256_file(path)
+        after = os.stat(path)
+        if (after.st_size, after.st_mtime_ns) == (st.st_size, st.st_mtime_ns):
+            self.store([(path, st, digest)])  # Not while it was being written to
+        return digest
+
+    def file_hash(self, path: PathLike) -> str:
+        """SHA-256 of `path`, re-read only when its size or mtime changed. Raises OSError."""
+        st = os.stat(path)
+        cached = self.lookup(path, st)
+        if cached is not None:
+            self.hits += 1
+            return cached
+        self.misses += 1
+        return self._hash_uncached(path, st)
+
+    def _probe(self, path: str) -> Tuple[Optional[os.stat_result], Optional[str]]:
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None, None
+        if not os.path.isfile(path):
+            return None, None
+        return st, self.lookup(path, st)
+
+    async def ahash_many(self, paths: Iterable[PathLike], concurrency: Optional[int] = None,
+                         throttle: Optional[Callable[[int], Awaitable[None]]] = None) -> Dict[str, Optional[str]]:
+        """
+        Digest per path (None for missing or unreadable files). Cache hits are resolved
+        in one pass on the I/O pool; the misses are hashed in parallel, at most
+        `concurrency` at a time. `throttle(size)` is awaited before each file is read,
+        so a caller can pace the bytes hashed per second.
+        """
+        unique = list(dict.fromkeys(str(p) for p in paths))
+        probes = await run_io(lambda: [self._probe(p) for p in unique])
+        results: Dict[str, Optional[str]] = {}
+        pending: List[Tuple[str, os.stat_result]] = []
+        for path, (st, cached) in zip(unique, probes):
+            results[path] = cached
+            if st is not None and cached is None:
+                pending.append((path, st))
+        self.hits += sum(cached is not None for _, cached in probes)
+        self.misses += len(pending)
+
+        gate = asyncio.Semaphore(concurrency or self.concurrency)
+
+        async def _one(path: str, st: os.stat_result) -> None:
+            async with gate:
+                if throttle is not None:
+                    await throttle(st.st_size)
+                try:
+                    results[path] = await run_io(self._hash_uncached, path, st)
+                except OSError as e:
+                    logger.warning(f"[ARTIFACT_STORE] Cannot hash {path}: {e}")
+
+        await asyncio.gather(*(_one(path, st) for path, st in pending))
+        return results
+
+
+# ==============================================================================
+# 2. CONTENT-ADDRESSED OBJECTS
+# ==============================================================================
+
+class ArtifactStore:
+    """One immutable copy per distinct content, addressed by its SHA-256."""
+
+    def __init__(self, root: Path = ARTIFACT_OBJECTS_ROOT, cache: Optional[HashCache] = None,
+                 max_bytes: int = ARTIFACT_STORE_MAX_BYTES, cap_bytes: int = ARTIFACT_STORE_CAP_BYTES):
+        self.root = Path(root)
+        self.cache = cache or hash_cache
+        self.max_bytes = max_bytes
+        self.cap_bytes = cap_bytes
+        self._usage: Optional[int] = None  # Bytes stored; measured on the first write
+        self._usage_lock = threading.Lock()
+
+    def object_path(self, digest: str) -> Path:
+        return self.root / digest[:2] / digest[2:]
+
+    def has(self, digest: str) -> bool:
+        return self.object_path(digest).is_file()
+
+    def _touch(self, digest: str) -> None:
+        """Marks an object as recently used, which keeps it out of the next eviction."""
+        try:
+            os.utime(self.object_path(digest))
+        except OSError:
+            pass
+
+    def _place(self, tmp: Path, digest: str) -> None:
+        target = self.object_path(digest)
+        if target.is_file():
+            self._touch(digest)
+            return  # Dedup: this content is already stored
+        target.parent.mkdir(parents=True, exist_ok=True)
+        os.replace(tmp, target)
+        self._account(target.stat().st_size)
+
+    # --- SIZE CAP ---
+
+    def _objects(self) -> List[Tuple[int, int, str]]:
+        """(mtime_ns, size, path) of every stored object."""
+        found: List[Tuple[int, int, str]] = []
+        try:
+            shards = [e.path for e in os.scandir(self.root) if e.is_dir(follow_symlinks=False)]
+        except OSError:
+            return found
+        for shard in shards:
+            try:
+                with os.scandir(shard) as entries:
+                    for entry in entries:
+                        try:
+                            st = entry.stat(follow_symlinks=False)
+                        except OSError:
+                            continue
+                        found.append((st.st_mtime_ns, st.st_size, entry.path))
+            except OSError:
+                continue
+        return found
+
+    def usage(self) -> int:
+        with self._usage_lock:
+            if self._usage is None:
+                self._usage = sum(size for _, size, _ in self._objects())
+            return self._usage
+
+    def _account(self, nbytes: int) -> None:
+        with self._usage_lock:
+            if self._usage is None:
+                self._usage = sum(size for _, size, _ in self._objects())  # Includes the new object
+            else:
+                self._usage += nbytes
+            over = bool(self.cap_bytes) and self._usage > self.cap_bytes
+        if over:
+            self.gc()
+
+    def gc(self, target_bytes: Optional[int] = None) -> Dict[str, int]:
+        """
+        Evicts least recently used objects until the store holds at most `target_bytes`
+        (default: 90% of the cap) and removes abandoned incoming files.
+        """
+        if target_bytes is None:
+            target_bytes = int(self.cap_bytes * _GC_LOW_WATER)
+        evicted = freed = 0
+        with self._usage_lock:
+            objects = sorted(self._objects())
+            usage = sum(size for _, size, _ in objects)
+            for _, size, path in objects:
+                if usage <= target_bytes:
+                    break
+                try:
+                    os.remove(path)
+                except OSError:
+                    continue
+                usage -= size
+                freed += size
+                evicted += 1
+            self._usage = usage
+        stale = time.time() - _STALE_TMP_SECONDS
+        for tmp in self.root.glob(".incoming.*.tmp"):
+            try:
+                if tmp.stat().st_mtime < stale:
+                    tmp.unlink()
+            except OSError:
+                continue
+        if evicted:
+            logger.info(f"[ARTIFACT_STORE] Evicted {evicted} objects ({freed} bytes); {usage} bytes stored")
+        return {"evicted": evicted, "freed_bytes": freed, "stored_bytes": usage}
+
+    def _tmp(self) -> Path:
+        self.root.mkdir(parents=True, exist_ok=True)
+        return self.root / f".incoming.{uuid.uuid4().hex}.tmp"
+
+    def put_bytes(self, data: bytes) -> str:
+        digest = hashlib.sha256(data).hexdigest()
+        if self.has(digest):
+            self._touch(digest)
+        else:
+            tmp = self._tmp()
+            try:
+                tmp.write_bytes(data)
+                self._place(tmp, digest)
+            finally:
+                tmp.unlink(missing_ok=True)
+        return digest
+
+    def put_file(self, path: PathLike, digest: Optional[str] = None) -> str:
+        """
+        Stores the current content of `path` and returns its digest. Known content is
+        not copied again; files over `max_bytes` are hashed but not copied.
+        """
+        digest = digest or self.cache.file_hash(path)
+        if self.has(digest):
+            self._touch(digest)
+            return digest
+        if os.path.getsize(path) > self.max_bytes:
+            return digest
+        tmp = self._tmp()
+        try:
+            # The copy is hashed as it is written, so an object is always filed under
+            # its own content even if the source changed after `digest` was taken
+            hasher = hashlib.sha256()
+            buffer = bytearray(HASH_CHUNK_SIZE)
+            view = memoryview(buffer)
+            with open(path, "rb") as src, open(tmp, "wb") as dst:
+                while True:
+                    n = src.readinto(buffer)
+                    if not n:
+                        break
+                    hasher.update(view[:n])
+                    dst.write(view[:n])
+            digest = hasher.hexdigest()
+            self._place(tmp, digest)
+        finally:
+            tmp.unlink(missing_ok=True)
+        return digest
+
+    def open(self, digest: str):
+        return open(self.object_path(digest), "rb")
+
+    async def aput_many(self, paths: Iterable[PathLike], concurrency: Optional[int] = None) -> Dict[str, Optional[str]]:
+        """Hashes (through the cache) and stores a batch; None for unreadable paths."""
+        digests = await self.cache.ahash_many(paths, concurrency)
+
+        def _store() -> None:
+            for path, digest in digests.items():
+                if digest is None:
+                    continue
+                if self.has(digest):
+                    self._touch(digest)
+                    continue
+                try:
+                    digests[path] = self.put_file(path, digest)
+                except OSError as e:
+                    logger.warning(f"[ARTIFACT_STORE] Cannot store {path}: {e}")
+
+        await run_io(_store)
+        return digests
+
+
+hash_cache = HashCache()
+artifact_store = ArtifactStore(cache=hash_cache)
@@ -10,7 +10,6 @@ import json
 import uuid
 import logging
 import asyncio
-import hashlib
 import networkx as nx
 import chromadb
 from datetime import datetime
@@ -18,6 +17,9 @@ from pathlib import Path
 from typing import List, Dict, Any, Optional, Union
 from chromadb.utils import embedding_functions
 
+from src.system.metrics import MEMORY_RECALL_LATENCY
+from src.memory.artifact_store import hash_cache
+
 # --- LOGGING SETUP ---
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger("MemoryKernel")
@@ -97,24 +99,49 @@ class MemoryManager:
     # ==============================================================================
 
     def calculate_file_hash(self, file_path: str) -> str:
-        """Calculates SHA-256 for IronClad validation."""
-        sha256_hash = hashlib.sha256()
+        """Calculates SHA-256 for IronClad validation (cached by path, size and mtime)."""
         try:
-            with open(file_path, "rb") as f:
-                for byte_block in iter(lambda: f.read(4096), b""):
-                    sha256_hash.update(byte_block)
-            return sha256_hash.hexdigest()
+            return hash_cache.file_hash(file_path)
         except Exception as e:
             logger.error(f"âš ï¸ [HASH_CALC_FAIL] {file_path}: {e}")
             return "HASH_ERROR"
 
+    async def hash_artifacts(self, file_paths: List[str]) -> Dict[str, str]:
+        """Batch hashing off the event loop; unchanged files are served from the hash cache."""
+        digests = await hash_cache.ahash_many(file_paths)
+        return {path: digest or "HASH_ERROR" for path, digest in digests.items()}
+
+    async def anchor_artifact_hashes(self, hashes: Dict[str, str]) -> int:
+        """
+        Records verified hashes on the ARTIFACT nodes. The lattice is only written
+        when a hash actually changed; returns the number of nodes updated.
+        """
+        timestamp = datetime.now().isoformat()
+        changed = 0
+        async with self.graph_lock:
+            for path, file_hash in hashes.items():
+                if file_hash == "HASH_ERROR":
+                    continue
+                if self.graph.has_node(path):
+                    attrs = self.graph.nodes[path]
+                    attrs["verified_at"] = timestamp
+                    if attrs.get("file_hash") == file_hash:
+                        continue
+                    attrs["file_hash"] = file_hash
+                else:
+                    self.graph.add_node(path, type="ARTIFACT", file_hash=file_hash, ts=timestamp, verified_at=timestamp)
+                changed += 1
+        if changed:
+            await self.save_graph()
+        return changed
+
     async def verify_artifact_integrity(self, file_path: str) -> bool:
         """Compares physical file hash against lattice-stored truth."""
         if not self.graph.has_node(file_path):
             return False
         
         stored_hash = self.graph.nodes[file_path].get('file_hash')
-        current_hash = self.calculate_file_hash(file_path)
+        current_hash = (await self.hash_artifacts([file_path]))[file_path]
         
         is_valid = stored_hash == current_hash
         if not is_valid:
@@ -130,7 +157,7 @@ class MemoryManager:
         Saves mission outcomes to Episodic Memory and Relational Lattice.
         """
         timestamp = datetime.now().isoformat()
-        file_hash = self.calculate_file_hash(artifact_path) if artifact_path and os.path.exists(artifact_path) else None
+        file_hash = (await self.hash_artifacts([artifact_path]))[artifact_path] if artifact_path and os.path.exists(artifact_path) else None
 
         try:
             doc_text = f"MISSION: {mission_id} | AGENT: {agent_id} | DEPT: {dept}\nACTION: {action}\nRESULT: {result[:4000]}"
@@ -187,6 +214,10 @@ class MemoryManager:
 
     async def recall(self, query: str, n_results: int = 5, filter_dept: Optional[str] = None) -> str:
         """Dual-Core Retrieval with Silo Filtering."""
+        with MEMORY_RECALL_LATENCY.time():
+            return self._recall(query, n_results, filter_dept)
+
+    def _recall(self, query: str, n_results: int, filter_dept: Optional[str]) -> str:
         context = []
         where_meta = {"dept": filter_dept} if filter_dept else None
 
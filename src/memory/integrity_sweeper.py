@@ -0,0 +1,223 @@
+"""
+REALM FORGE: INTEGRITY SWEEPER v1.0
+PURPOSE: Background audit of every ARTIFACT node in the relational lattice.
+         - Snapshots (path, anchored file_hash) for all ARTIFACT nodes, then hashes the
+           files in batches through the shared HashCache: files whose (size, mtime)
+           did not move since their last hash are never re-read.
+         - Cache misses are hashed in parallel under REALM_SWEEP_CONCURRENCY and paced
+           to REALM_SWEEP_MAX_MBPS, so a full audit does not starve mission I/O.
+         - Each node gets its verdict written back (integrity, integrity_checked_at,
+           observed_hash on drift); the lattice is saved once per sweep.
+         - One sweep runs at a time; progress and findings are readable while it runs.
+PATH: F:/agentic_workforce/src/memory/integrity_sweeper.py
+"""
+
+import asyncio
+import os
+import time
+import uuid
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+from src.memory.artifact_store import HashCache, hash_cache
+from src.system.config import logger
+
+SWEEP_CONCURRENCY = int(os.getenv("REALM_SWEEP_CONCURRENCY", "4"))
+SWEEP_MAX_MBPS = float(os.getenv("REALM_SWEEP_MAX_MBPS", "64"))  # 0 = unpaced
+SWEEP_BATCH_SIZE = int(os.getenv("REALM_SWEEP_BATCH_SIZE", "256"))
+SWEEP_MAX_FINDINGS = int(os.getenv("REALM_SWEEP_MAX_FINDINGS", "1000"))
+
+VERIFIED, DRIFT, MISSING, BASELINED = "VERIFIED", "DRIFT", "MISSING", "BASELINED"
+
+
+class _Pacer:
+    """Token bucket over bytes: awaiting it with a file size keeps reads under `rate`."""
+
+    def __init__(self, bytes_per_second: float):
+        self.rate = bytes_per_second
+        self._next = 0.0
+        self._lock = asyncio.Lock()
+
+    async def __call__(self, nbytes: int) -> None:
+        if self.rate <= 0:
+            return
+        async with self._lock:
+            now = time.monotonic()
+            start = max(self._next, now)
+            self._next = start + nbytes / self.rate
+        if start > now:
+            await asyncio.sleep(start - now)
+
+
+@dataclass
+class SweepProgress:
+    sweep_id: str
+    status: str = "running"  # running | completed | cancelled | failed
+    started_at: str = field(default_factory=lambda: datetime.now().isoformat())
+    finished_at: Optional[str] = None
+    total: int = 0
+    checked: int = 0
+    verified: int = 0
+    drifted: int = 0
+    missing: int = 0
+    baselined: int = 0
+    cache_hits: int = 0
+    bytes_hashed: int = 0
+    error: Optional[str] = None
+    findings: List[Dict[str, Any]] = field(default_factory=list)
+    findings_truncated: bool = False
+
+    def to_dict(self, findings_limit: Optional[int] = None) -> Dict[str, Any]:
+        data = asdict(self)
+        if findings_limit is not None:
+            data["findings"] = data["findings"][:findings_limit]
+        return data
+
+
+class IntegritySweeper:
+    """
+    Runs full-lattice integrity audits against a MemoryManager-like object (anything
+    with `graph`, `graph_lock` and `save_graph()`).
+    """
+
+    def __init__(self, memory: Any = None, cache: Optional[HashCache] = None,
+                 concurrency: int = SWEEP_CONCURRENCY, max_mbps: float = SWEEP_MAX_MBPS,
+                 batch_size: int = SWEEP_BATCH_SIZE, max_findings: int = SWEEP_MAX_FINDINGS):
+        self.memory = memory
+        self.cache = cache or hash_cache
+        self.concurrency = max(1, concurrency)
+        self.max_mbps = max_mbps
+        self.batch_size = max(1, batch_size)
+        self.max_findings = max_findings
+        self.progress: Optional[SweepProgress] = None
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def status(self, findings_limit: Optional[int] = None) -> Dict[str, Any]:
+        if self.progress is None:
+            return {"status": "idle"}
+        return self.progress.to_dict(findings_limit)
+
+    def start(self, memory: Any = None) -> Dict[str, Any]:
+        """Launches a sweep in the background; returns the running sweep if there is one."""
+        if memory is not None:
+            self.memory = memory
+        if self.memory is None:
+            raise RuntimeError("IntegritySweeper has no lattice to audit")
+        if not self.running:
+            self.progress = SweepProgress(sweep_id=uuid.uuid4().hex[:12])
+            self._task = asyncio.create_task(self._run(self.progress))
+        return self.status(findings_limit=0)
+
+    async def wait(self) -> Dict[str, Any]:
+        if self._task is not None:
+            await asyncio.shield(self._task)
+        return self.status()
+
+    async def cancel(self) -> Dict[str, Any]:
+        if self.running:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        return self.status(findings_limit=0)
+
+    # --- SWEEP ---
+
+    async def _snapshot(self) -> List[Tuple[str, Optional[str]]]:
+        async with self.memory.graph_lock:
+            return [(str(node), attrs.get("file_hash"))
+                    for node, attrs in self.memory.graph.nodes(data=True)
+                    if attrs.get("type") == "ARTIFACT"]
+
+    def _finding(self, progress: SweepProgress, entry: Dict[str, Any]) -> None:
+        if len(progress.findings) < self.max_findings:
+            progress.findings.append(entry)
+        else:
+            progress.findings_truncated = True
+
+    async def _record(self, verdicts: Dict[str, Tuple[str, Optional[str]]]) -> None:
+        """Writes this batch's verdicts onto the nodes that still exist."""
+        timestamp = datetime.now().isoformat()
+        async with self.memory.graph_lock:
+            graph = self.memory.graph
+            for path, (verdict, digest) in verdicts.items():
+                if not graph.has_node(path):
+                    continue  # Removed while the sweep was running
+                attrs = graph.nodes[path]
+                attrs["integrity"] = verdict
+                attrs["integrity_checked_at"] = timestamp
+                if verdict == DRIFT:
+                    attrs["observed_hash"] = digest
+                else:
+                    attrs.pop("observed_hash", None)
+                if verdict == BASELINED:
+                    attrs["file_hash"] = digest
+
+    async def _run(self, progress: SweepProgress) -> None:
+        started = time.perf_counter()
+        pace = _Pacer(self.max_mbps * 1024 * 1024)
+        reads = 0
+
+        async def throttle(nbytes: int) -> None:
+            nonlocal reads
+            reads += 1  # Only cache misses reach the throttle
+            progress.bytes_hashed += nbytes
+            await pace(nbytes)
+
+        try:
+            artifacts = await self._snapshot()
+            progress.total = len(artifacts)
+            logger.info(f"[INTEGRITY_SWEEP] {progress.sweep_id}: auditing {progress.total} artifacts")
+            for i in range(0, len(artifacts), self.batch_size):
+                batch = artifacts[i:i + self.batch_size]
+                reads = 0
+                digests = await self.cache.ahash_many([path for path, _ in batch], self.concurrency, throttle)
+                progress.cache_hits += max(0, sum(d is not None for d in digests.values()) - reads)
+
+                verdicts: Dict[str, Tuple[str, Optional[str]]] = {}
+                for path, expected in batch:
+                    observed = digests.get(path)
+                    if observed is None:
+                        verdict = MISSING
+                        progress.missing += 1
+                    elif not expected or expected == "HASH_ERROR":
+                        verdict = BASELINED
+                        progress.baselined += 1
+                    elif observed == expected:
+                        verdict = VERIFIED
+                        progress.verified += 1
+                    else:
+                        verdict = DRIFT
+                        progress.drifted += 1
+                    if verdict in (DRIFT, MISSING):
+                        self._finding(progress, {"path": path, "status": verdict,
+                                                 "expected": expected, "observed": observed})
+                    verdicts[path] = (verdict, observed)
+                await self._record(verdicts)
+                progress.checked += len(batch)
+            progress.status = "completed"
+        except asyncio.CancelledError:
+            progress.status = "cancelled"
+            raise
+        except Exception as e:
+            progress.status = "failed"
+            progress.error = str(e)
+            logger.error(f"[INTEGRITY_SWEEP] {progress.sweep_id} failed: {e}")
+        finally:
+            progress.finished_at = datetime.now().isoformat()
+            if progress.checked:
+                await self.memory.save_graph()
+            logger.info(
+                f"[INTEGRITY_SWEEP] {progress.sweep_id} {progress.status} in {time.perf_counter() - started:.1f}s: "
+                f"{progress.checked}/{progress.total} checked, {progress.drifted} drifted, "
+                f"{progress.missing} missing, {progress.cache_hits} cache hits"
+            )
+
+
+integrity_sweeper = IntegritySweeper()
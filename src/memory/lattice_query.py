@@ -0,0 +1,326 @@
+"""
+REALM FORGE: LATTICE QUERY v1.0
+PURPOSE: Viewport queries over the LatticeStore snapshot so the HUD never needs the whole graph.
+         - k-hop ego networks around a node, optionally restricted to node types
+           (AGENT / MISSION / ARTIFACT / KNOWLEDGE), capped at `limit` nodes.
+         - Cursor pagination over nodes (stable across versions: the cursor is the last id).
+         - Level of detail: Louvain communities collapsed into CLUSTER supernodes with
+           weighted inter-cluster links. Communities are computed once, then patched
+           from LatticeStore diffs (new nodes join their neighbours' community) until
+           the accumulated drift warrants a full recompute.
+PATH: F:/agentic_workforce/src/memory/lattice_query.py
+"""
+
+import asyncio
+import heapq
+import os
+import threading
+from bisect import bisect_right
+from collections import Counter, deque
+from dataclasses import dataclass, field
+from typing import Any, Dict, Hashable, Iterable, List, Optional, Sequence, Tuple
+
+import networkx as nx
+
+from src.memory.lattice_store import LatticeSnapshot, LatticeStore, LinkKey, _hashable
+from src.utils.pagination import decode_cursor, encode_cursor
+
+LOD_MIN_CLUSTER = int(os.getenv("REALM_LOD_MIN_CLUSTER", "8"))
+LOD_REBUILD_FRACTION = float(os.getenv("REALM_LOD_REBUILD_FRACTION", "0.2"))
+CLUSTER_PREFIX = "cluster:"
+
+
+def _sort_id(item: Tuple[str, Hashable]) -> str:
+    return item[0]
+
+
+def _page(ordered: Iterable[Tuple[str, Hashable]], limit: int) -> Tuple[List[Hashable], Optional[str]]:
+    keys: List[Hashable] = []
+    last = None
+    for sid, key in ordered:
+        if len(keys) == limit:
+            return keys, encode_cursor(last)
+        keys.append(key)
+        last = sid
+    return keys, None
+
+
+@dataclass(frozen=True)
+class _LatticeView:
+    """One immutable build: swapped in whole so lock-free queries never see a half-rebuilt index."""
+    snap: Optional[LatticeSnapshot] = None
+    neighbors: Dict[Hashable, Dict[Hashable, None]] = field(default_factory=dict)  # Undirected, insertion-ordered
+    out_links: Dict[Hashable, List[LinkKey]] = field(default_factory=dict)
+    by_id: Dict[str, Hashable] = field(default_factory=dict)
+    order: List[Tuple[str, Hashable]] = field(default_factory=list)
+    order_by_type: Dict[str, List[Tuple[str, Hashable]]] = field(default_factory=dict)
+
+    @property
+    def version(self) -> Optional[int]:
+        return self.snap.version if self.snap is not None else None
+
+    def type_of(self, key: Hashable) -> str:
+        return str(self.snap.nodes[key].get("type", "")).upper()
+
+    def links_within(self, keys: Iterable[Hashable]) -> List[Dict[str, Any]]:
+        members = set(keys)
+        links = self.snap.links
+        return [links[lk] for key in members for lk in self.out_links.get(key, ()) if lk[1] in members]
+
+
+class LatticeIndex:
+    """
+    Adjacency, type and ordering indexes for one LatticeStore snapshot, rebuilt
+    (off the event loop) whenever the store's version moves.
+    """
+
+    def __init__(self, store: LatticeStore, min_cluster: int = LOD_MIN_CLUSTER,
+                 rebuild_fraction: float = LOD_REBUILD_FRACTION):
+        self.store = store
+        self.min_cluster = min_cluster
+        self.rebuild_fraction = rebuild_fraction
+        self._view = _LatticeView()
+        self._lock = threading.Lock()
+
+        # Level of detail (lazy: computed on the first lod() call, then patched)
+        self._community: Dict[Hashable, int] = {}
+        self._lod_version: Optional[int] = None
+        self._lod_drift = 0
+        self._next_community = 0
+        self._lod_cache: Dict[Tuple[int, int], Dict[str, Any]] = {}
+
+    @property
+    def version(self) -> Optional[int]:
+        return self._view.version
+
+    # --- INDEXING ---
+
+    def refresh(self) -> "LatticeIndex":
+        snap = self.store.refresh()
+        if snap.version == self.version:
+            return self
+        with self._lock:
+            if snap.version != self.version:
+                self._build(snap)
+        return self
+
+    async def arefresh(self) -> "LatticeIndex":
+        snap = await self.store.arefresh()
+        if snap.version == self.version:
+            return self
+        return await asyncio.to_thread(self.refresh)
+
+    def _build(self, snap: LatticeSnapshot) -> None:
+        neighbors: Dict[Hashable, Dict[Hashable, None]] = {k: {} for k in snap.nodes}
+        out_links: Dict[Hashable, List[LinkKey]] = {}
+        for lk in snap.links:
+            source, target = lk[0], lk[1]
+            if source not in neighbors or target not in neighbors:
+                continue  # Dangling link: the HUD drops these too
+            neighbors[source][target] = None
+            neighbors[target][source] = None
+            out_links.setdefault(source, []).append(lk)
+
+        order = sorted(((str(k), k) for k in snap.nodes), key=_sort_id)
+        by_type: Dict[str, List[Tuple[str, Hashable]]] = {}
+        for sid, key in order:
+            by_type.setdefault(str(snap.nodes[key].get("type", "")).upper(), []).append((sid, key))
+
+        self._view = _LatticeView(
+            snap=snap,
+            neighbors=neighbors,
+            out_links=out_links,
+            by_id={sid: key for sid, key in order},
+            order=order,
+            order_by_type=by_type,
+        )
+
+    # --- EGO NETWORKS ---
+
+    def ego(self, node_id: str, hops: int = 1, types: Optional[Sequence[str]] = None, limit: int = 500) -> Optional[Dict[str, Any]]:
+        """
+        Nodes within `hops` of `node_id` (links followed in both directions), or None
+        if the node is unknown. With `types`, traversal only passes through nodes of
+        those types (the centre is always included). Breadth-first, so a `limit` cut
+        keeps the nearest nodes.
+        """
+        view = self._view
+        center = view.by_id.get(node_id)
+        if center is None:
+            return None
+        allowed = {t.upper() for t in types} if types else None
+        depth: Dict[Hashable, int] = {center: 0}
+        queue = deque([center])
+        truncated = False
+        while queue and not truncated:
+            key = queue.popleft()
+            if depth[key] == hops:
+                continue
+            for neighbor in view.neighbors[key]:
+                if neighbor in depth or (allowed is not None and view.type_of(neighbor) not in allowed):
+                    continue
+                if len(depth) >= limit:
+                    truncated = True
+                    break
+                depth[neighbor] = depth[key] + 1
+                queue.append(neighbor)
+
+        nodes = view.snap.nodes
+        return {
+            "version": view.version,
+            "center": node_id,
+            "hops": hops,
+            "truncated": truncated,
+            "nodes": [{**nodes[k], "hop": d} for k, d in depth.items()],
+            "links": view.links_within(depth),
+        }
+
+    # --- PAGINATION ---
+
+    @staticmethod
+    def _ordered(view: _LatticeView, types: Optional[Sequence[str]], after: Optional[str]) -> Iterable[Tuple[str, Hashable]]:
+        if types:
+            lists = [view.order_by_type.get(t.upper(), []) for t in dict.fromkeys(types)]
+        else:
+            lists = [view.order]
+        if after is not None:
+            lists = [lst[bisect_right(lst, after, key=_sort_id):] for lst in lists]
+        return lists[0] if len(lists) == 1 else heapq.merge(*lists, key=_sort_id)
+
+    def page(self, types: Optional[Sequence[str]] = None, cursor: Optional[str] = None, limit: int = 200) -> Dict[str, Any]:
+        """Nodes ordered by id, `limit` per page; pass `next_cursor` back to continue."""
+        after = decode_cursor(cursor)
+        view = self._view
+        keys, next_cursor = _page(self._ordered(view, types, after), limit)
+        nodes = view.snap.nodes
+        return {
+            "version": view.version,
+            "nodes": [nodes[k] for k in keys],
+            "links": view.links_within(keys),
+            "next_cursor": next_cursor,
+        }
+
+    # --- LEVEL OF DETAIL ---
+
+    def _sync_communities(self) -> None:
+        diff = self.store.diff_since(self._lod_version) if self._lod_version is not None else None
+        if diff is not None and diff["version"] != self.version:
+            diff = None  # Store moved past this index; resync on the next refresh
+        if diff is not None:
+            self._lod_drift += len(diff["added_nodes"]) + len(diff["removed_nodes"]) + len(diff["added_links"]) + len(diff["removed_links"])
+        if diff is None or self._lod_drift > self.rebuild_fraction * max(len(self._view.snap.nodes), 1):
+            self._detect_communities()
+            return
+        for key in diff["removed_nodes"]:
+            self._community.pop(key, None)
+        for node in diff["added_nodes"]:
+            key = _hashable(node.get("id"))
+            if key in self._community:
+                continue
+            votes = Counter(self._community[n] for n in self._view.neighbors.get(key, ()) if n in self._community)
+            if votes:
+                self._community[key] = votes.most_common(1)[0][0]
+            else:
+                self._community[key] = self._next_community
+                self._next_community += 1
+        self._lod_version = self.version
+
+    def _detect_communities(self) -> None:
+        graph = nx.Graph()
+        neighbors = self._view.neighbors
+        graph.add_nodes_from(neighbors)
+        graph.add_edges_from((k, n) for k, ns in neighbors.items() for n in ns)
+        communities = nx.community.louvain_communities(graph, seed=42) if graph.number_of_edges() else [{k} for k in graph]
+        communities.sort(key=len, reverse=True)
+        self._community = {key: cid for cid, members in enumerate(communities) for key in members}
+        self._next_community = len(communities)
+        self._lod_version, self._lod_drift = self.version, 0
+
+    def lod(self, min_cluster: Optional[int] = None, limit: int = 500) -> Dict[str, Any]:
+        """
+        The lattice with every community of at least `min_cluster` nodes collapsed into
+        a CLUSTER supernode; smaller communities stay as plain nodes. At most `limit`
+        groups are returned, largest first.
+        """
+        min_cluster = self.min_cluster if min_cluster is None else min_cluster
+        with self._lock:
+            if self._lod_version != self.version:
+                self._sync_communities()
+                self._lod_cache.clear()
+            cached = self._lod_cache.get((min_cluster, limit))
+            if cached is not None:
+                return cached
+            result = self._build_lod(min_cluster, limit)
+            self._lod_cache[(min_cluster, limit)] = result
+            return result
+
+    def _build_lod(self, min_cluster: int, limit: int) -> Dict[str, Any]:
+        view = self._view
+        nodes = view.snap.nodes
+        members: Dict[int, List[Hashable]] = {}
+        for key, cid in self._community.items():
+            members.setdefault(cid, []).append(key)
+
+        group: Dict[Hashable, str] = {}
+        groups: List[Tuple[int, str, Dict[str, Any]]] = []
+        for cid, keys in members.items():
+            if len(keys) >= min_cluster:
+                gid = f"{CLUSTER_PREFIX}{cid}"
+                anchor = max(keys, key=lambda k: len(view.neighbors[k]))
+                groups.append((len(keys), gid, {
+                    "id": gid,
+                    "type": "CLUSTER",
+                    "label": nodes[anchor].get("label") or str(anchor),
+                    "anchor": str(anchor),
+                    "size": len(keys),
+                    "types": dict(Counter(view.type_of(k) or "UNTYPED" for k in keys)),
+                }))
+                for key in keys:
+                    group[key] = gid
+            else:
+                for key in keys:
+                    group[key] = str(key)
+                    groups.append((1, str(key), nodes[key]))
+
+        groups.sort(key=lambda g: (-g[0], g[1]))
+        kept = {gid for _, gid, _ in groups[:limit]}
+        weights: Counter = Counter()
+        for key, lks in view.out_links.items():
+            source = group.get(key)
+            for lk in lks:
+                target = group.get(lk[1])
+                if source != target and source in kept and target in kept:
+                    weights[(source, target)] += 1
+
+        return {
+            "version": view.version,
+            "truncated": len(groups) > limit,
+            "nodes": [node for _, _, node in groups[:limit]],
+            "links": [{"source": s, "target": t, "weight": w} for (s, t), w in weights.items()],
+        }
+
+    def cluster(self, cluster_id: str, cursor: Optional[str] = None, limit: int = 200) -> Optional[Dict[str, Any]]:
+        """Drill-down: the members of one LOD supernode, paginated like page()."""
+        if not cluster_id.startswith(CLUSTER_PREFIX) or not cluster_id[len(CLUSTER_PREFIX):].isdigit():
+            return None
+        cid = int(cluster_id[len(CLUSTER_PREFIX):])
+        with self._lock:
+            if self._lod_version != self.version:
+                self._sync_communities()
+                self._lod_cache.clear()
+            view = self._view
+            ordered = sorted(((str(k), k) for k, c in self._community.items() if c == cid), key=_sort_id)
+        if not ordered:
+            return None
+        after = decode_cursor(cursor)
+        if after is not None:
+            ordered = ordered[bisect_right(ordered, after, key=_sort_id):]
+        keys, next_cursor = _page(ordered, limit)
+        nodes = view.snap.nodes
+        return {
+            "version": view.version,
+            "cluster": cluster_id,
+            "nodes": [nodes[k] for k in keys],
+            "links": view.links_within(keys),
+            "next_cursor": next_cursor,
+        }
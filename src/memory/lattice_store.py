@@ -0,0 +1,164 @@
+"""
+REALM FORGE: LATTICE STORE v1.0
+PURPOSE: Versioned in-memory view of a node-link lattice file (neural_graph.json) for the HUD.
+         - The file is re-parsed only when its (mtime, size) changes; every change that
+           alters nodes or links bumps a monotonic version.
+         - Each version remembers which node ids / link keys it touched, so a client at
+           version N gets a net diff (upserts + removals) instead of the whole graph.
+         - The full snapshot is serialized and gzip/brotli-compressed once per version.
+PATH: F:/agentic_workforce/src/memory/lattice_store.py
+"""
+
+import asyncio
+import json
+import os
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Hashable, Optional, Set, Tuple
+
+from src.utils.http_cache import compress, dumps
+
+LATTICE_HISTORY = int(os.getenv("REALM_LATTICE_HISTORY", "128"))
+
+LinkKey = Tuple[Hashable, Hashable, Hashable]
+
+
+def _hashable(value: Any) -> Hashable:
+    try:
+        hash(value)
+        return value
+    except TypeError:
+        return json.dumps(value, sort_keys=True, default=str)
+
+
+def _link_key(link: Dict[str, Any]) -> LinkKey:
+    return (_hashable(link.get("source")), _hashable(link.get("target")), _hashable(link.get("key")))
+
+
+@dataclass
+class LatticeSnapshot:
+    version: int
+    graph: Dict[str, Any]  # node-link envelope minus nodes/links (directed, multigraph, graph attrs)
+    nodes: Dict[Hashable, Dict[str, Any]]
+    links: Dict[LinkKey, Dict[str, Any]]
+    _encoded: Dict[Optional[str], bytes] = field(default_factory=dict, repr=False)
+
+    def payload(self) -> Dict[str, Any]:
+        return {**self.graph, "version": self.version, "full": True, "nodes": list(self.nodes.values()), "links": list(self.links.values())}
+
+    def encoded(self, encoding: Optional[str] = None) -> bytes:
+        """Full snapshot bytes, serialized/compressed once per (version, encoding)."""
+        body = self._encoded.get(encoding)
+        if body is None:
+            raw = self._encoded.get(None)
+            if raw is None:
+                raw = self._encoded[None] = dumps(self.payload())
+            body = self._encoded[encoding] = compress(raw, encoding)
+        return body
+
+
+class LatticeStore:
+    """Change-detecting, versioned cache of one lattice file."""
+
+    def __init__(self, path: Path, history: int = LATTICE_HISTORY):
+        self.path = Path(path)
+        # Versions start at the load time in ms so they keep increasing across restarts
+        self._base_version = int(time.time() * 1000)
+        self.snapshot: Optional[LatticeSnapshot] = None
+        self._stat: Optional[Tuple[int, int]] = None
+        self._history: "deque[Tuple[int, Set[Hashable], Set[LinkKey]]]" = deque(maxlen=history)
+        self._lock = threading.Lock()  # One parse at a time
+        # Guards snapshot + history together; only held for the swap, never across a parse
+        self._state_lock = threading.Lock()
+
+    @property
+    def version(self) -> int:
+        return self.snapshot.version if self.snapshot is not None else 0
+
+    # --- LOADING ---
+
+    def _file_stat(self) -> Optional[Tuple[int, int]]:
+        try:
+            st = os.stat(self.path)
+        except OSError:
+            return None
+        return (st.st_mtime_ns, st.st_size)
+
+    def refresh(self) -> LatticeSnapshot:
+        """Re-reads the file only if it changed on disk; returns the current snapshot."""
+        stat = self._file_stat()
+        if self.snapshot is not None and stat == self._stat:
+            return self.snapshot
+        with self._lock:
+            if self.snapshot is not None and stat == self._stat:
+                return self.snapshot
+            data: Dict[str, Any] = {}
+            if stat is not None:
+                with open(self.path, "r", encoding="utf-8-sig") as f:
+                    data = json.load(f)
+            self._apply(data)
+            self._stat = stat
+            return self.snapshot
+
+    async def arefresh(self) -> LatticeSnapshot:
+        """refresh() for request handlers: the unchanged case stays inline, parsing moves to a thread."""
+        if self.snapshot is not None and self._file_stat() == self._stat:
+            return self.snapshot
+        return await asyncio.to_thread(self.refresh)
+
+    def _apply(self, data: Dict[str, Any]) -> None:
+        nodes = {_hashable(n.get("id")): n for n in data.get("nodes", []) if isinstance(n, dict)}
+        links = {_link_key(l): l for l in data.get("links", data.get("edges", [])) if isinstance(l, dict)}
+        graph = {k: v for k, v in data.items() if k not in ("nodes", "links", "edges", "version")}
+
+        previous = self.snapshot
+        if previous is None:
+            with self._state_lock:
+                self.snapshot = LatticeSnapshot(self._base_version, graph, nodes, links)
+            return
+        touched_nodes = {k for k in previous.nodes.keys() | nodes.keys() if previous.nodes.get(k) != nodes.get(k)}
+        touched_links = {k for k in previous.links.keys() | links.keys() if previous.links.get(k) != links.get(k)}
+        if not touched_nodes and not touched_links and graph == previous.graph:
+            return  # Rewritten but identical: keep the version (and the client's ETag) valid
+        version = previous.version + 1
+        snapshot = LatticeSnapshot(version, graph, nodes, links)
+        with self._state_lock:
+            self._history.append((version, touched_nodes, touched_links))
+            self.snapshot = snapshot
+
+    # --- DIFFS ---
+
+    def diff_since(self, since: int) -> Optional[Dict[str, Any]]:
+        """
+        Net changes from version `since` to the current one, or None when `since`
+        is unknown (older than the retained history, or from the future).
+        """
+        # refresh() may be swapping in a new version from a worker thread
+        with self._state_lock:
+            snap = self.snapshot
+            history = list(self._history)
+        if snap is None or since > snap.version:
+            return None
+        if since == snap.version:
+            touched = []
+        else:
+            touched = [entry for entry in history if since < entry[0] <= snap.version]
+            if not touched or touched[0][0] != since + 1:
+                return None
+        node_ids: Set[Hashable] = set().union(*(t[1] for t in touched)) if touched else set()
+        link_keys: Set[LinkKey] = set().union(*(t[2] for t in touched)) if touched else set()
+        return {
+            "version": snap.version,
+            "since": since,
+            "full": False,
+            "added_nodes": [snap.nodes[k] for k in node_ids if k in snap.nodes],
+            "removed_nodes": [k for k in node_ids if k not in snap.nodes],
+            "added_links": [snap.links[k] for k in link_keys if k in snap.links],
+            "removed_links": [{"source": k[0], "target": k[1], "key": k[2]} for k in link_keys if k not in snap.links],
+        }
+
+    def etag(self, since: Optional[int] = None) -> str:
+        return f'"lattice-{self.version}"' if since is None else f'"lattice-{since}-{self.version}"'
@@ -0,0 +1,204 @@
+"""
+REALM FORGE: ROSTER INDEX v1.0
+PURPOSE: Shared in-memory index of the departmental agent lattice behind /api/v1/agents.
+         - department_lattice.json is re-parsed only when its (mtime, size) changes;
+           a real content change bumps `version` (which also keys the ETags).
+         - Department and status postings lists plus pre-lowered roles make a filtered
+           page a few list walks instead of a file parse.
+         - Serialized pages are kept in a small LRU per version, so repeat polls are a
+           dict hit (or a 304 at the route).
+PATH: F:/agentic_workforce/src/system/agents/roster_index.py
+"""
+
+import asyncio
+import json
+import os
+import threading
+import time
+import zlib
+from bisect import bisect_right
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from src.system.config import LATTICE_PATH
+from src.utils.http_cache import EncodedBody, dumps
+from src.utils.pagination import decode_cursor, encode_cursor
+
+ROSTER_FIELDS = ("name", "role", "department", "status", "path")
+ROSTER_PAGE_CACHE = int(os.getenv("REALM_ROSTER_PAGE_CACHE", "64"))
+
+
+def _norm_department(name: str) -> str:
+    return (name or "").strip().replace(" ", "_").lower()
+
+
+@dataclass(frozen=True)
+class _Roster:
+    """One immutable build: swapped in whole so a query never sees a half-rebuilt index."""
+    version: int = 0
+    entries: List[Dict[str, Any]] = field(default_factory=list)
+    keys: List[str] = field(default_factory=list)  # Sort keys, parallel to entries
+    roles: List[str] = field(default_factory=list)
+    by_department: Dict[str, List[int]] = field(default_factory=dict)
+    by_status: Dict[str, List[int]] = field(default_factory=dict)
+
+
+class RosterIndex:
+    """Change-detecting, versioned roster of every agent in one departmental lattice file."""
+
+    def __init__(self, path: Path = LATTICE_PATH, page_cache: int = ROSTER_PAGE_CACHE):
+        self.path = Path(path)
+        self.page_cache = page_cache
+        self._roster = _Roster()
+        self._next_version = int(time.time() * 1000)  # Keeps ETags unique across restarts
+        self._stat: Optional[Tuple[int, int]] = None
+        self._loaded = False
+        self._lock = threading.Lock()
+        self._pages: "OrderedDict[Tuple, Tuple[str, EncodedBody]]" = OrderedDict()
+
+    @property
+    def version(self) -> int:
+        return self._roster.version
+
+    @property
+    def entries(self) -> List[Dict[str, Any]]:
+        return self._roster.entries
+
+    # --- LOADING ---
+
+    def _file_stat(self) -> Optional[Tuple[int, int]]:
+        try:
+            st = os.stat(self.path)
+        except OSError:
+            return None
+        return (st.st_mtime_ns, st.st_size)
+
+    def refresh(self) -> "RosterIndex":
+        """Re-reads the lattice only if it changed on disk."""
+        stat = self._file_stat()
+        if self._loaded and stat == self._stat:
+            return self
+        with self._lock:
+            if self._loaded and stat == self._stat:
+                return self
+            lattice: Dict[str, Any] = {}
+            if stat is not None:
+                with open(self.path, "r", encoding="utf-8-sig") as f:
+                    lattice = json.load(f) or {}
+            self._build(lattice)
+            self._stat, self._loaded = stat, True
+        return self
+
+    async def arefresh(self) -> "RosterIndex":
+        """refresh() for request handlers: the unchanged case stays inline, parsing moves to a thread."""
+        if self._loaded and self._file_stat() == self._stat:
+            return self
+        return await asyncio.to_thread(self.refresh)
+
+    def _build(self, lattice: Dict[str, Any]) -> None:
+        rows = []
+        for department, data in lattice.items():
+            for position, agent in enumerate((data or {}).get("agents", []) or []):
+                agent = agent or {}
+                entry = {
+                    "name": agent.get("name"),
+                    "role": agent.get("role"),
+                    "department": department,
+                    "status": str(agent.get("status") or "ONLINE").upper(),
+                    "path": agent.get("path"),
+                }
+                key = "\x00".join((_norm_department(department), str(entry["name"] or "").lower(), f"{position:06d}"))
+                rows.append((key, entry))
+        rows.sort(key=lambda row: row[0])
+        entries = [entry for _, entry in rows]
+        if entries == self.entries and self._loaded:
+            return  # Touched but identical: keep the version (and client ETags) valid
+
+        by_department: Dict[str, List[int]] = {}
+        by_status: Dict[str, List[int]] = {}
+        for i, entry in enumerate(entries):
+            by_department.setdefault(_norm_department(entry["department"]), []).append(i)
+            by_status.setdefault(entry["status"], []).append(i)
+        self._roster = _Roster(
+            version=self._next_version,
+            entries=entries,
+            keys=[key for key, _ in rows],
+            roles=[str(e["role"] or "").lower() for e in entries],
+            by_department=by_department,
+            by_status=by_status,
+        )
+        self._next_version += 1
+        self._pages.clear()  # Keys carry the version; clearing just frees the memory early
+
+    # --- QUERIES ---
+
+    @staticmethod
+    def _candidates(roster: _Roster, department: Optional[str], status: Optional[str]) -> Sequence[int]:
+        postings: List[Sequence[int]] = []
+        if department:
+            postings.append(roster.by_department.get(_norm_department(department), []))
+        if status:
+            postings.append(roster.by_status.get(status.strip().upper(), []))
+        if not postings:
+            return range(len(roster.entries))
+        postings.sort(key=len)
+        if len(postings) == 1:
+            return postings[0]
+        other = set(postings[1])
+        return [i for i in postings[0] if i in other]
+
+    def query(self, department: Optional[str] = None, role: Optional[str] = None, status: Optional[str] = None,
+              cursor: Optional[str] = None, limit: Optional[int] = None,
+              fields: Optional[Sequence[str]] = None) -> Dict[str, Any]:
+        """
+        One page of the roster (sorted by department, then name). `role` is a
+        case-insensitive substring; `fields` projects each entry. Without `limit`
+        the whole matching roster is returned. ValueError on a bad cursor/field.
+        """
+        if fields:
+            unknown = [f for f in fields if f not in ROSTER_FIELDS]
+            if unknown:
+                raise ValueError(f"Unknown roster fields: {', '.join(unknown)}")
+        after = decode_cursor(cursor)
+        needle = role.strip().lower() if role else None
+
+        roster = self._roster
+        candidates = self._candidates(roster, department, status)
+        if needle:
+            candidates = [i for i in candidates if needle in roster.roles[i]]
+        start = bisect_right(candidates, after, key=roster.keys.__getitem__) if after is not None else 0
+        stop = len(candidates) if limit is None else min(start + limit, len(candidates))
+        page: Iterable[int] = candidates[start:stop]
+
+        entries = roster.entries
+        if fields:
+            rows = [{f: entries[i][f] for f in fields} for i in page]
+        else:
+            rows = [entries[i] for i in page]
+        return {
+            "version": roster.version,
+            "total": len(candidates),
+            "roster": rows,
+            "next_cursor": encode_cursor(roster.keys[candidates[stop - 1]]) if stop < len(candidates) else None,
+        }
+
+    def page(self, **params: Any) -> Tuple[str, EncodedBody]:
+        """(ETag, serialized body) for query(**params), memoized per version."""
+        key = (self.version,) + tuple(sorted((k, tuple(v) if isinstance(v, list) else v) for k, v in params.items()))
+        with self._lock:
+            cached = self._pages.get(key)
+            if cached is not None:
+                self._pages.move_to_end(key)
+                return cached
+        result = self.query(**params)
+        etag = f'"roster-{result["version"]}-{zlib.crc32(repr(key[1:]).encode()):08x}"'
+        cached = (etag, EncodedBody(dumps(result)))
+        with self._lock:
+            self._pages[key] = cached
+            while len(self._pages) > self.page_cache:
+                self._pages.popitem(last=False)
+        return cached
+
+roster_index = RosterIndex()
@@ -23,6 +23,7 @@ from src.system.arsenal.foundation import (
     sanitize_windows_path,
     tool,
 )
+from src.utils import async_io
 
 @tool('analyze_http_security_headers')
 async def analyze_http_security_headers(url: str):
@@ -106,9 +107,8 @@ We utilize the Realm Forge Sovereign Audit protocol for rapid patching.
 - Automated SAST scanning on every commit.
 """
         target = DATA_DIR / 'docs' / 'legal' / 'SECURITY.md'
-        os.makedirs(target.parent, exist_ok=True)
         # Atomic Write
-        target.write_text(content, encoding='utf-8')
+        await async_io.write_text(target, content, atomic=True)
         return f'💎 [GOVERNANCE]: Security Policy manifested at {target}'
     except Exception as e:
         return f'[ERROR]: {str(e)}'
@@ -220,7 +220,7 @@ async def write_csv_report(filename: str, data_json: str):
         os.makedirs(target.parent, exist_ok=True)
         
         # Atomic write
-        df.to_csv(target, index=False)
+        await async_io.run_io(df.to_csv, target, index=False)
         return f"✅ [CSV_SAVED]: Ledger committed to {target}"
     except Exception as e:
         return f"[ERROR] CSV Generation Failed: {str(e)}"
@@ -26,6 +26,7 @@ from src.system.arsenal.foundation import (  # type: ignore[import-untyped]
     tool,
     yf,
 )
+from src.utils import async_io
 
 @tool('convert_csv_to_markdown_table')
 async def convert_csv_to_markdown_table(file_path: str):
@@ -35,7 +36,7 @@ async def convert_csv_to_markdown_table(file_path: str):
         if not path.exists(): return "[ERROR]: File not found on physical disk."
         
         # OOM Protection: Only read the first 20 rows for UI display
-        df = pd.read_csv(path, nrows=20)
+        df = await async_io.run_io(pd.read_csv, path, nrows=20)
         return f"### [TABLE_PREVIEW]: {path.name}\n" + df.to_markdown(index=False)
     except Exception as e:
         return f'[ERROR] Markdown Conversion Failed: {str(e)}'
@@ -47,7 +48,7 @@ async def get_stock_history_csv(ticker: str, period: str='1mo'):
         # Validate ticker format
         ticker = ticker.upper().strip()
         stock = yf.Ticker(ticker)
-        hist = stock.history(period=period)
+        hist = await async_io.run_io(stock.history, period=period)
         
         if hist.empty:
             return f'[ERROR] No market data returned for {ticker}. Check symbol.'
@@ -57,10 +58,10 @@ async def get_stock_history_csv(ticker: str, period: str='1mo'):
         target_dir.mkdir(parents=True, exist_ok=True)
         
         path = target_dir / filename
-        hist.to_csv(path)
+        await async_io.run_io(hist.to_csv, path)
         
         logger.info(f"ðŸ“ˆ [MARKET_INGRESS]: {ticker} data committed to {path}")
-        return f'[SUCCESS] [DATA_SAVED]: {path} ({len(hist)} intervals ingested)'
+        return with_artifacts(f'[SUCCESS] [DATA_SAVED]: {path} ({len(hist)} intervals ingested)', path)
     except Exception as e:
         return f'[ERROR] Financial API Fault: {str(e)}'
 
@@ -73,11 +74,11 @@ async def industrial_data_ingress(individual_csv: str, business_csv: str):
         
         results = []
         if ind_p.exists():
-            df_ind = pd.read_csv(ind_p)
+            df_ind = await async_io.run_io(pd.read_csv, ind_p)
             results.append(f"Ind_Sector: {len(df_ind)} records | Columns: {list(df_ind.columns[:3])}...")
         
         if biz_p.exists():
-            df_biz = pd.read_csv(biz_p)
+            df_biz = await async_io.run_io(pd.read_csv, biz_p)
             results.append(f"Biz_Sector: {len(df_biz)} records | Columns: {list(df_biz.columns[:3])}...")
             
         return f"ðŸ’Ž [INGRESS_SUMMARY]:\n" + "\n".join(results)
@@ -172,7 +173,7 @@ async def csv_processor_read(file_path: str, rows: int = 10):
             return f"âŒ [CSV_IO_FAULT]: File {file_path} not located on disk."
 
         # Read only requested rows for performance
-        df = pd.read_csv(target, nrows=rows)
+        df = await async_io.run_io(pd.read_csv, target, nrows=rows)
         summary = {
             "file": target.name,
             "total_rows": "Scan pending...",
@@ -199,7 +200,7 @@ async def csv_processor_write(file_path: str, data_json: str):
         target.parent.mkdir(parents=True, exist_ok=True)
         
         # Atomic Write
-        df.to_csv(target, index=False)
+        await async_io.run_io(df.to_csv, target, index=False)
         logger.info(f"âœ… [LEDGER_COMMIT]: {target.name} synchronized.")
         return f"âœ… [CSV_WRITE_SUCCESS]: Ledger committed to {target.name}."
     except Exception as e:
@@ -29,6 +29,7 @@ from src.system.arsenal.foundation import (  # type: ignore[import-untyped]
     sanitize_windows_path,
     tool,
 )
+from src.utils import async_io
 import zipfile
 import subprocess
 
@@ -46,17 +47,20 @@ async def archive_workspace(client_name: str):
         zip_path = output_dir / f'{clean_name}_shuttle.zip'
         exclude_patterns = {'.git', 'node_modules', '__pycache__', '.env', '.next'}
 
-        with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
-            for root, dirs, files in os.walk(source_dir):
-                dirs[:] = [d for d in dirs if d not in exclude_patterns]
-                for file in files:
-                    file_path = Path(root) / file
-                    arcname = file_path.relative_to(source_dir)
-                    zipf.write(file_path, arcname)
+        def _pack():
+            with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
+                for root, dirs, files in os.walk(source_dir):
+                    dirs[:] = [d for d in dirs if d not in exclude_patterns]
+                    for file in files:
+                        file_path = Path(root) / file
+                        arcname = file_path.relative_to(source_dir)
+                        zipf.write(file_path, arcname)
+
+        await async_io.run_io(_pack)
 
         size_mb = zip_path.stat().st_size / (1024 * 1024)
         logger.info(f"📦 [VAULT_ARCHIVE]: {clean_name} packaged. Size: {size_mb:.2f}MB")
-        return f'[SUCCESS] [ARCHIVE_READY]: Deliverable Manifested at {zip_path}'
+        return with_artifacts(f'[SUCCESS] [ARCHIVE_READY]: Deliverable Manifested at {zip_path}', zip_path)
     except Exception as e:
         return f'[ERROR] Archive Fault: {str(e)}'
 
@@ -79,9 +83,9 @@ async def create_client_workspace(client_name: str, tech_stack: str='general'):
         if target_dir.exists(): return f"⚠️ [STATE_EXISTS]: Workspace '{clean_name}' is already registered."
         target_dir.mkdir(parents=True, exist_ok=True)
         for folder in ['src', 'public', 'docs', 'tests', 'config']: (target_dir / folder).mkdir(exist_ok=True)
-        subprocess.run(['git', 'init'], cwd=str(target_dir), capture_output=True)
-        (target_dir / ".gitignore").write_text("node_modules/\n.env\n__pycache__/\n*.log\ndist/\n", encoding='utf-8')
-        (target_dir / "README.md").write_text(f"# {client_name} Project\nGenerated by Realm Forge Sovereign Swarm.\n\nStack: {tech_stack}", encoding='utf-8')
+        await async_io.run_io(subprocess.run, ['git', 'init'], cwd=str(target_dir), capture_output=True)
+        await async_io.write_text(target_dir / ".gitignore", "node_modules/\n.env\n__pycache__/\n*.log\ndist/\n")
+        await async_io.write_text(target_dir / "README.md", f"# {client_name} Project\nGenerated by Realm Forge Sovereign Swarm.\n\nStack: {tech_stack}")
         logger.info(f"🏗️ [FACTORY]: Workspace Manifested: {clean_name}")
         return f'[SUCCESS] [FACTORY_SYNC]: Workspace created at {target_dir}. Ready for construction.'
     except Exception as e: return f'[ERROR] Factory Fault: {str(e)}'
@@ -116,7 +120,7 @@ async def read_from_workspace(client_name: str, relative_path: str):
         target = (WORKSPACE_ROOT / clean_client / relative_path.lstrip('\\/')).resolve()
         if not str(target).startswith(str(WORKSPACE_ROOT)): return "[SECURITY_ALERT]: Breakout blocked."
         if not target.exists(): return f'[ERROR]: {relative_path} missing.'
-        return target.read_text(encoding='utf-8', errors='replace')
+        return await async_io.read_text(target, errors='replace')
     except Exception as e: return f'[ERROR] Read Fault: {str(e)}'
 
 @tool('sync_repository')
@@ -131,7 +135,7 @@ async def sync_repository(commit_message: str='Swarm State Alignment'):
                     return f"❌ [GIT_FAULT] at '{' '.join(cmd)}': {res.stderr}"
             return "[SUCCESS] Repository synchronized."
         except Exception as e: return str(e)
-    return await asyncio.to_thread(_run_git)
+    return await async_io.run_io(_run_git)
 
 @tool('write_to_workspace')
 async def write_to_workspace(client_name: str, relative_path: str, content: str):
@@ -140,8 +144,7 @@ async def write_to_workspace(client_name: str, relative_path: str, content: str)
         clean_client = sanitize_windows_path(client_name)
         target = (WORKSPACE_ROOT / clean_client / relative_path.lstrip('\\/')).resolve()
         if not str(target).startswith(str(WORKSPACE_ROOT)): return "[SECURITY_ALERT]: Out-of-bounds blocked."
-        target.parent.mkdir(parents=True, exist_ok=True)
-        target.write_text(content, encoding='utf-8')
+        await async_io.write_text(target, content)
         return f'🚀 [BUILD]: Committed to {clean_client}/{relative_path}'
     except Exception as e: return f'[ERROR] Write Fault: {str(e)}'
 
@@ -153,7 +156,7 @@ async def zip_directory(dir_path: str, zip_name: str):
         dst = DATA_DIR / 'backups' / f'{zip_name}.zip'
         dst.parent.mkdir(parents=True, exist_ok=True)
         if not src.exists(): return '[ERROR] Source missing.'
-        shutil.make_archive(str(dst).replace('.zip', ''), 'zip', src)
+        await async_io.run_io(shutil.make_archive, str(dst).replace('.zip', ''), 'zip', src)
         return f'📦 [PACKAGE_COMPLETE]: {dst}'
     except Exception as e: return f'[ERROR]: {str(e)}'
 
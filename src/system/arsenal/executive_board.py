@@ -24,6 +24,7 @@ from src.system.arsenal.foundation import (  # type: ignore[import-untyped]
     sanitize_windows_path,
     tool,
 )
+from src.utils import async_io
 
 # --- INTERNAL COMMS HELPERS ---
 
@@ -103,11 +104,10 @@ async def mm_get_user_by_name(search_term: str):
     # 1. Check Local Phonebook First
     map_path = Path("data/memory/discord_lattice_map.json")
     if map_path.exists():
-        with open(map_path, 'r') as f:
-            lattice = json.load(f)
-            for uname, data in (lattice or {}).get("agents", {}).items():
-                if search_term.lower() in uname.lower() or search_term.lower() in (data or {}).get('functional_name', '').lower():
-                    return f"REAL_DATA_FOUND: username='{uname}' id='{data['channel_id']}'"
+        lattice = json.loads(await async_io.read_text(map_path))
+        for uname, data in (lattice or {}).get("agents", {}).items():
+            if search_term.lower() in uname.lower() or search_term.lower() in (data or {}).get('functional_name', '').lower():
+                return f"REAL_DATA_FOUND: username='{uname}' id='{data['channel_id']}'"
 
     # 2. Live API Search
     guild_id = os.getenv("DISCORD_GUILD_ID")
@@ -171,9 +171,8 @@ async def transmit_workforce_message(channel: str, message: str):
     map_path = Path("data/memory/discord_lattice_map.json")
     channel_id = None
     if map_path.exists():
-        with open(map_path, 'r') as f:
-            lattice = json.load(f)
-            channel_id = (lattice or {}).get("sectors", {}).get(channel.lower().replace("#", "").replace("_", "-"))
+        lattice = json.loads(await async_io.read_text(map_path))
+        channel_id = (lattice or {}).get("sectors", {}).get(channel.lower().replace("#", "").replace("_", "-"))
 
     if not channel_id:
         guild_id = os.getenv("DISCORD_GUILD_ID")
@@ -193,8 +192,7 @@ async def transmit_workforce_message(channel: str, message: str):
 async def get_sector_roster(department: str):
     """Personnel Sensor: Returns a Markdown table of specialists stationed in a specific department."""
     try:
-        with open(DATA_DIR / "roster.json", 'r', encoding='utf-8-sig') as f:
-            data = json.load(f)
+        data = json.loads(await async_io.read_text(DATA_DIR / "roster.json", encoding='utf-8-sig'))
         roster = (data or {}).get("roster", [])
         colleagues = [a for a in roster if department.lower() in (a or {}).get('dept', '').lower()]
         if not colleagues: return f"❌ No specialists located in {department}."
@@ -29,6 +29,7 @@ from src.system.arsenal.foundation import (  # type: ignore[import-untyped]
     sanitize_windows_path,
     tool,
 )
+from src.utils import async_io
 
 @tool('analyze_stock_technicals')
 async def analyze_stock_technicals(ticker: str):
@@ -179,7 +180,7 @@ async def generate_corporate_invoice(client_name: str, invoice_number: str, item
         
         c.save()
         logger.info(f"🧾 [BILLING]: Invoice manifested for {client_name}")
-        return f'[SUCCESS] [INVOICE_GENERATED]: {path}'
+        return with_artifacts(f'[SUCCESS] [INVOICE_GENERATED]: {path}', path)
     except Exception as e:
         return f'[ERROR] PDF Generation Fault: {str(e)}'
 
@@ -207,9 +208,8 @@ async def generate_project_budget(project_name: str, resources: List[Dict]):
         )
         
         path = DATA_DIR / 'finance' / 'budgets' / f'{sanitize_windows_path(project_name)}_budget.txt'
-        path.parent.mkdir(parents=True, exist_ok=True)
-        path.write_text(report, encoding='utf-8')
-        return f'[SUCCESS] [BUDGET_SAVED]: {path}'
+        await async_io.write_text(path, report)
+        return with_artifacts(f'[SUCCESS] [BUDGET_SAVED]: {path}', path)
     except Exception as e:
         return f'[ERROR] Calculation Fault: {str(e)}'
 
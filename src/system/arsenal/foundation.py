@@ -39,6 +39,8 @@ from reportlab.lib.pagesizes import letter
 from pptx import Presentation
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
+from src.utils import async_io  # Blocking disk/pandas work in async tools goes through this pool
+from src.system.artifact_extraction import with_artifacts  # Structured artifact reporting for tools
 
 # --- LOGGING SETUP ---
 logging.basicConfig(level=logging.INFO)
@@ -72,16 +74,23 @@ def prepare_vocal_response(text: str) -> str:
     text = re.sub('[*_#`\\-|>\\[\\]]', '', text)
     return ' '.join(text.split()).strip()[:10000]
 
+NEURAL_VOICE = 'en-US-ChristopherNeural'
+NEURAL_RATE = '+0%'
+NEURAL_PITCH = '-5Hz'
+
+async def stream_neural_audio(text: str, voice: str = NEURAL_VOICE, rate: str = NEURAL_RATE, pitch: str = NEURAL_PITCH):
+    """Yields raw MP3 chunks as edge_tts produces them (no buffering, no base64)."""
+    if not text: return
+    communicate = edge_tts.Communicate(text, voice, rate=rate, pitch=pitch)
+    async for chunk in communicate.stream():
+        if chunk['type'] == 'audio' and chunk['data']:
+            yield chunk['data']
+
 async def generate_neural_audio(text: str) -> str:
     if not text: return ''
-    VOICE = 'en-US-ChristopherNeural'
     try:
-        communicate = edge_tts.Communicate(text, VOICE, rate='+0%', pitch='-5Hz')
-        audio_bytes = b''
-        async for chunk in communicate.stream():
-            if chunk['type'] == 'audio':
-                audio_bytes += chunk['data']
-        return base64.b64encode(audio_bytes).decode('utf-8')
+        chunks = [chunk async for chunk in stream_neural_audio(text)]
+        return base64.b64encode(b''.join(chunks)).decode('utf-8')
     except:
         return ''
 
@@ -107,7 +116,7 @@ INTEL_CAPS = [
 
 DEPARTMENT_TOOL_MAP = {
     "Architect": ["create_client_workspace", "inject_new_capability", "self_evolve", "ask_human", "get_system_vitals", "get_env_info", "backup_memory_db"] + COMMS_CAPS + INTEL_CAPS,
-    "DevOps": ["run_terminal_command", "generate_dockerfile", "sync_repository", "zip_directory", "get_directory_tree", "list_files", "push_to_github", "check_port_availability", "parse_log_file"] + COMMS_CAPS + INTEL_CAPS,
+    "DevOps": ["run_terminal_command", "generate_dockerfile", "sync_repository", "zip_directory", "get_directory_tree", "list_files", "push_to_github", "check_port_availability", "parse_log_file", "analyze_log_file"] + COMMS_CAPS + INTEL_CAPS,
     "SOFTWARE_ENGINEERING": ["run_terminal_command", "validate_python_syntax", "scaffold_react_component", "scaffold_flask_api", "replace_text_in_file", "read_file", "write_file", "regex_replace_in_file", "minify_js_css", "extract_code_blocks"] + COMMS_CAPS + INTEL_CAPS,
     "FACILITY_MANAGEMENT": ["run_terminal_command", "get_system_vitals", "list_files", "get_directory_tree", "csv_processor_read", "csv_processor_write", "get_file_metadata"] + COMMS_CAPS,
     "CyberSecurity": ["scan_network_ports", "verify_ssl_certificate", "analyze_http_security_headers", "detect_pii_in_file", "scan_code_for_vulnerabilities", "ip_geolocation", "port_scan_local", "generate_strong_password", "detect_log_anomalies", "validate_jwt_structure", "analyze_contract_risk", "generate_security_policy"] + COMMS_CAPS,
@@ -144,7 +153,7 @@ async def read_file(file_path: str):
         if not target.exists(): 
             return f'[ERROR] File not found at {target}'
             
-        return target.read_text(encoding='utf-8', errors='replace')
+        return await async_io.read_text(target, errors='replace')
     except Exception as e: 
         return f'[ERROR] Physical Read Fault: {str(e)}'
 
@@ -156,12 +165,9 @@ async def write_file(file_path: str, content: str):
         if file_path.startswith('static/'): 
             target = STATIC_DIR / file_path.replace('static/', '')
         
-        os.makedirs(target.parent, exist_ok=True)
         # Atomic Write strategy: write to temp, then rename to prevent corruption
-        temp_path = target.with_suffix('.tmp')
-        temp_path.write_text(content, encoding='utf-8')
-        os.replace(temp_path, target)
-        return f'[SUCCESS] Physically committed to {target}'
+        await async_io.write_text(target, content, atomic=True)
+        return with_artifacts(f'[SUCCESS] Physically committed to {target}', target)
     except Exception as e: 
         return f'[ERROR] Physical Write Fault: {str(e)}'
     
@@ -169,7 +175,8 @@ async def write_file(file_path: str, content: str):
 async def update_knowledge_graph(subject: str, relation: str, target: str):
     """Neural Architect: Physically maps a relationship edge in the NetworkX graph. Enforces data persistence."""
     graph_path = DATA_DIR / 'memory' / 'neural_graph.json'
-    try:
+
+    def _add_edge():
         if graph_path.exists():
             with open(graph_path, 'r', encoding='utf-8-sig') as f:
                 G = nx.node_link_graph(json.load(f))
@@ -180,7 +187,9 @@ async def update_knowledge_graph(subject: str, relation: str, target: str):
         
         with open(graph_path, 'w', encoding='utf-8-sig') as f:
             json.dump(nx.node_link_data(G), f, indent=2)
-            
+
+    try:
+        await async_io.run_io(_add_edge)
         return f'[SUCCESS] [LATTICE_UPDATED]: {subject} --[{relation}]--> {target}'
     except Exception as e: return f'[ERROR] Graph Write Fault: {str(e)}'
 
@@ -35,6 +35,7 @@ import yaml
 import difflib
 from src.memory.engine import MemoryManager
 from src.system.arsenal.foundation import update_knowledge_graph
+from src.system.log_analytics import PatternSet, log_analyzer
 
 @tool('analyze_sentiment_advanced')
 async def analyze_sentiment_advanced(text: str):
@@ -519,10 +520,9 @@ async def detect_language_heuristic(code_snippet: str):
 async def detect_log_anomalies(log_file_path: str):
     """Sentinel Sensor: Parses logs for advanced attack signatures including SQLi, XSS, Path Traversal, and RCE patterns."""
     try:
-        content = await read_file(log_file_path)
-        if '[ERROR]' in content: return content
+        target = DATA_DIR / log_file_path.replace('data/', '').lstrip('/')
+        if not target.exists(): return f'[ERROR] File not found at {target}'
         
-        anomalies = []
         signatures = {
             '💉 SQL Injection': r"(UNION SELECT|information_schema|' OR 1=1)",
             '💉 XSS Attack': r"(<script>|alert\(|onerror=)",
@@ -531,9 +531,10 @@ async def detect_log_anomalies(log_file_path: str):
             '🔨 Brute Force': r"(401 Unauthorized|Login Failed)"
         }
 
-        for label, pattern in signatures.items():
-            if re.search(pattern, content, re.IGNORECASE):
-                anomalies.append(f"- {label}")
+        # Streams the file once (incrementally on later audits) instead of loading it whole
+        report = await log_analyzer.ascan(target, PatternSet(regexes=signatures))
+        anomalies = [f"- {label} ({count} hits)" for label, count in report['by_pattern'].items()]
+        anomalies += [f"- ⏱️ Burst at {a['minute']}: {a['matches']} hits (z={a['score']})" for a in report['anomalies']]
         
         if not anomalies:
             return '💎 [LOG_AUDIT]: No industrial attack signatures detected.'
@@ -30,6 +30,7 @@ from src.system.arsenal.foundation import (  # type: ignore[import-untyped]
     tool,
     read_file,
 )
+from src.utils import async_io
 import uuid
 
 @tool('analyze_contract_risk')
@@ -114,8 +115,7 @@ async def create_calendar_event_ics(summary: str, start_time: str, duration_hour
 
         filename = f"invite_{uid.hex[:6]}.ics"
         path = DATA_DIR / 'docs' / 'calendar' / filename
-        path.parent.mkdir(parents=True, exist_ok=True)
-        path.write_text('\n'.join(ics_content), encoding='utf-8')
+        await async_io.write_text(path, '\n'.join(ics_content))
         
         return f'[SUCCESS] [CALENDAR_EVENT]: Physical object manifested at {path}'
     except Exception as e:
@@ -154,10 +154,9 @@ ____________________             ____________________
 """
         filename = f'NDA_{sanitize_windows_path(party_b)}.md'
         path = DATA_DIR / 'docs' / 'legal' / filename
-        path.parent.mkdir(parents=True, exist_ok=True)
         
         # Atomic Write
-        path.write_text(content, encoding='utf-8')
+        await async_io.write_text(path, content, atomic=True)
         logger.info(f"⚖️ [CONTRACT]: Mutual NDA manifested for {party_b}.")
         return f'[SUCCESS] [LEGAL_ARTIFACT]: NDA physically committed to {path}'
     except Exception as e:
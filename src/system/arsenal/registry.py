@@ -8,6 +8,7 @@ STATUS: PRODUCTION READY — ZERO MAINTENANCE — AUTO-MAPPING
 import importlib
 import inspect
 import pkgutil
+import time
 from pathlib import Path
 from typing import Dict, List, Any, Callable, Optional
 
@@ -15,27 +16,34 @@ from src.system.arsenal.foundation import (
     tool,
     logger,
     generate_neural_audio,
+    stream_neural_audio,
     sanitize_windows_path,
     DATA_DIR,
     ROOT_DIR,
     STATIC_DIR,
     WORKSPACE_ROOT,
+    with_artifacts,
 )
+from src.system.metrics import is_tool_error, observe_tool
+from src.utils import async_io
 
 # Root folder for all silo modules
 ARSENAL_ROOT = Path(__file__).parent
 
+# Infrastructure modules that live beside the silos but expose no tools
+NON_SILO_MODULES = ("registry", "tool_catalog", "__pycache__")
+
 
 # ==============================================================================
 # 1. AUTO-DISCOVERY ENGINE
 # ==============================================================================
 
 def discover_tool_modules() -> List[str]:
-    """Finds all Python modules inside the arsenal folder except registry.py."""
+    """Finds all Python modules inside the arsenal folder except infrastructure modules."""
     modules = []
     for module in pkgutil.iter_modules([str(ARSENAL_ROOT)]):
         name = module.name
-        if name not in ("registry", "__pycache__"):
+        if name not in NON_SILO_MODULES:
             modules.append(name)
     return modules
 
@@ -99,11 +107,11 @@ DEPARTMENT_TOOL_MAP = build_department_map()
 
 def get_tools_for_dept(dept, *args, **kwargs):
     """
-    Fetches tools for a specific silo. 
+    Fetches tool names for a specific silo from the precompiled departmental catalog.
     Accepts extra arguments (*args, **kwargs) to prevent signature crashes.
     """
-    logger.info(f"🔍 [REGISTRY] Fetching tools for sector: {dept}")
-    
+    from src.system.arsenal.tool_catalog import catalog_for_department
+
     # Ensure dept is a string
     if not isinstance(dept, str):
         # If the brain passed a state object instead of a string, extract the dept
@@ -112,15 +120,7 @@ def get_tools_for_dept(dept, *args, **kwargs):
         else:
             dept = "Architect"
 
-    # Your existing tool filtering logic here...
-    # (Example fallback if the rest of your logic is missing)
-    all_tools = {
-        "Software_Engineering": ["code_editor", "terminal"],
-        "Cybersecurity": ["calculate_file_hash", "network_scan"],
-        "Architect": ["draft_strategy", "lattice_query"]
-    }
-    
-    return all_tools.get(dept, [])
+    return [entry.name for entry in catalog_for_department(dept)]
 
 
 def get_swarm_roster() -> List[Dict[str, Any]]:
@@ -138,17 +138,22 @@ def get_swarm_roster() -> List[Dict[str, Any]]:
 
 
 async def execute_tool(tool_name: str, **kwargs) -> Any:
-    """Unified execution interface for LangChain tools."""
+    """Unified execution interface for LangChain tools (timed per tool for /metrics)."""
     for t in ALL_TOOLS_LIST:
         # Check LangChain '.name' attribute
         if getattr(t, "name", getattr(t, "tool_name", "")) == tool_name:
+            started = time.perf_counter()
             try:
                 # LangChain tools use .ainvoke for async calls
                 if hasattr(t, "ainvoke"):
-                    return await t.ainvoke(kwargs)
-                return t.run(kwargs)
+                    result = await t.ainvoke(kwargs)
+                else:
+                    result = t.run(kwargs)
             except Exception as e:
+                observe_tool(tool_name, time.perf_counter() - started, ok=False)
                 return f"[ERROR] Execution failed for {tool_name}: {str(e)}"
+            observe_tool(tool_name, time.perf_counter() - started, ok=not is_tool_error(result))
+            return result
     return f"[ERROR] Tool '{tool_name}' not found."
 
 
@@ -170,28 +175,23 @@ async def read_file(path: str) -> str:
     target = DATA_DIR / path.replace("data/", "").lstrip("/")
     if not target.exists():
         return "[ERROR] File not found."
-    return target.read_text(encoding="utf-8", errors="ignore")
+    return await async_io.read_text(target, errors="ignore")
 
 
 async def write_file(path: str, content: str) -> str:
     """Writes a file to the data lattice."""
     target = DATA_DIR / path.replace("data/", "").lstrip("/")
-    target.parent.mkdir(parents=True, exist_ok=True)
-    target.write_text(content, encoding="utf-8")
-    return f"[SUCCESS] Wrote file to {target}"
+    await async_io.write_text(target, content)
+    return with_artifacts(f"[SUCCESS] Wrote file to {target}", target)
 
 
 def calculate_file_hash(path: str) -> str:
-    """SHA-256 hash for integrity checks."""
-    import hashlib
+    """SHA-256 hash for integrity checks (cached by path, size and mtime)."""
+    from src.memory.artifact_store import hash_cache
     target = DATA_DIR / path.replace("data/", "").lstrip("/")
     if not target.exists():
         return "[ERROR] File not found."
-    sha = hashlib.sha256()
-    with open(target, "rb") as f:
-        for block in iter(lambda: f.read(4096), b""):
-            sha.update(block)
-    return sha.hexdigest()
+    return hash_cache.file_hash(target)
 
 
 def get_file_metadata(path: str) -> Dict[str, Any]:
@@ -25,6 +25,8 @@ from src.system.arsenal.foundation import (  # type: ignore[import-untyped]
     sanitize_windows_path,
     tool,
 )
+from src.system.search_index import search_index
+from src.utils import async_io
 
 @tool('format_newsletter_html')
 async def format_newsletter_html(headline: str, articles_json: str):
@@ -57,8 +59,7 @@ async def format_newsletter_html(headline: str, articles_json: str):
         </html>
         '''
         path = DATA_DIR / 'marketing' / f"intel_report_{int(time.time())}.html"
-        os.makedirs(path.parent, exist_ok=True)
-        path.write_text(full_html, encoding='utf-8')
+        await async_io.write_text(path, full_html)
         return f'💎 [INTEL_REPORT_GENERATED]: Physically committed to {path}'
     except Exception as e:
         return f'[ERROR] HTML Generation Failed: {str(e)}'
@@ -171,28 +172,12 @@ async def web_search_news(query: str, max_results: int=5):
 
 @tool('lattice_scout_search')
 async def lattice_scout_search(pattern: str):
-    """Lattice Scout: Recursively searches the F:/agentic_workforce filesystem for specific objects matching a regex or glob pattern."""
-    import fnmatch
-    matches = []
-    # Physical anchoring to prevent directory drift
-    search_root = "F:/agentic_workforce"
-    
-    # Industrial exclusions
-    exclude = {'.git', 'node_modules', '__pycache__', 'chroma_db', 'forge_env'}
-    
+    """Lattice Scout: Searches the F:/agentic_workforce filesystem index for objects whose name matches a glob pattern."""
     try:
-        for root, dirnames, filenames in os.walk(search_root):
-            # Prune search tree for performance
-            dirnames[:] = [d for d in dirnames if d not in exclude]
-            
-            for filename in fnmatch.filter(filenames, pattern):
-                full_path = os.path.join(root, filename)
-                # Ignore files larger than 50MB during scout to prevent IO lag
-                if os.path.getsize(full_path) < 50 * 1024 * 1024:
-                    matches.append(full_path.replace("\\", "/"))
-            
-            if len(matches) > 50: break # Safety cap
-            
+        # Name lookup in the persistent search index (exclusions applied at indexing time);
+        # files larger than 50MB are skipped as before
+        found = await search_index.afind_files(pattern, max_size=50 * 1024 * 1024, limit=51) # Safety cap
+        matches = [path.replace("\\", "/") for path in found]
         if not matches:
             return f"🔍 [SCOUT]: Pattern '{pattern}' not located in the physical lattice."
         
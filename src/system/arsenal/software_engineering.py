@@ -3,7 +3,6 @@ import os
 import asyncio
 import ast
 import base64
-import hashlib
 import json
 import re
 import shutil
@@ -23,6 +22,10 @@ from src.system.arsenal.foundation import (  # type: ignore[import-untyped]
     sanitize_windows_path,
     tool,
 )  # explicit for static analysis
+from src.memory.artifact_store import hash_cache
+from src.system.log_analytics import PatternSet, format_report, log_analyzer
+from src.system.search_index import search_index
+from src.utils import async_io
 
 @tool('append_to_file')
 async def append_to_file(file_path: str, content: str):
@@ -31,10 +34,8 @@ async def append_to_file(file_path: str, content: str):
         target = DATA_DIR / file_path.replace('data/', '').lstrip('/')
         if ".." in str(target): return "[SECURITY_ALERT]: Path traversal blocked."
         
-        os.makedirs(target.parent, exist_ok=True)
-        async with asyncio.Lock(): # Thread-safe for multi-agent logging
-            with open(target, 'a', encoding='utf-8') as f:
-                f.write('\n' + content)
+        # One O_APPEND write per call, so concurrent agents never interleave mid-line
+        await async_io.append_text(target, '\n' + content)
         logger.info(f"ðŸ“ [IO_APPEND]: Success at {target}")
         return f'[SUCCESS] [APPENDED]: {target}'
     except Exception as e:
@@ -46,7 +47,7 @@ async def audit_python_dependencies(req_file: str='requirements.txt'):
     try:
         path = ROOT_DIR / req_file
         if not path.exists(): return '[ERROR] requirements.txt not found.'
-        content = path.read_text()
+        content = await async_io.read_text(path)
         vulnerabilities = []
         # Industrial Risk Database (Simulated)
         bad_libs = {
@@ -81,11 +82,7 @@ async def calculate_file_hash(file_path: str):
     try:
         target = DATA_DIR / file_path.replace('data/', '').lstrip('/')
         if not target.exists(): return '[ERROR] Physical file not located.'
-        sha256_hash = hashlib.sha256()
-        with open(target, 'rb') as f:
-            for byte_block in iter(lambda: f.read(8192), b''):
-                sha256_hash.update(byte_block)
-        return f'ðŸ”‘ [SHA256]: {sha256_hash.hexdigest()}'
+        return f'ðŸ”‘ [SHA256]: {await async_io.run_io(hash_cache.file_hash, target)}'
     except Exception as e: return f'[ERROR]: {str(e)}'
 
 @tool('copy_internal_file')
@@ -95,9 +92,8 @@ async def copy_internal_file(source_path: str, destination_path: str):
         src = DATA_DIR / source_path.replace('data/', '').lstrip('/')
         dst = DATA_DIR / destination_path.replace('data/', '').lstrip('/')
         if not src.exists(): return '[ERROR] Source missing.'
-        os.makedirs(dst.parent, exist_ok=True)
-        shutil.copy2(str(src), str(dst))
-        return f'[SUCCESS] Replicated to {dst}'
+        await async_io.copy_file(src, dst)
+        return with_artifacts(f'[SUCCESS] Replicated to {dst}', dst)
     except Exception as e: return f'[ERROR]: {str(e)}'
 
 @tool('create_qr_code')
@@ -108,7 +104,7 @@ async def create_qr_code(data: str, filename: str):
         img = qrcode.make(data)
         path = DATA_DIR / 'assets/images' / f'{sanitize_windows_path(filename)}.png'
         os.makedirs(path.parent, exist_ok=True)
-        img.save(path)
+        await async_io.run_io(img.save, path)
         return f'[SUCCESS] QR Manifested at {path}'
     except ImportError: return '[ERROR]: pip install qrcode[pil]'
 
@@ -118,8 +114,7 @@ async def delete_workspace_file(client_name: str, relative_path: str):
     try:
         target = WORKSPACE_ROOT / sanitize_windows_path(client_name) / relative_path.lstrip('/')
         if not target.exists(): return '[ERROR] File not present.'
-        if target.is_dir(): shutil.rmtree(target)
-        else: os.remove(target)
+        await async_io.remove(target)
         return f'ðŸ—‘ï¸ [PURGED]: {relative_path}'
     except Exception as e: return f'[ERROR]: {str(e)}'
 
@@ -148,8 +143,7 @@ async def download_file(url: str, save_path: str):
         async with httpx.AsyncClient(follow_redirects=True, timeout=30.0) as client:
             resp = await (client or {}).get(url)
             if resp.status_code == 200:
-                os.makedirs(target.parent, exist_ok=True)
-                target.write_bytes(resp.content)
+                await async_io.write_bytes(target, resp.content)
                 return f'[SUCCESS]: Ingested {len(resp.content)} bytes to {target}'
             return f'[HTTP_ERROR]: {resp.status_code}'
     except Exception as e: return f'[ERROR]: {str(e)}'
@@ -172,7 +166,7 @@ async def generate_dockerfile(tech_stack: str, port: int=8000):
     }
     content = (templates or {}).get(tech_stack.lower(), templates['python'])
     path = DATA_DIR / 'docs' / 'Dockerfile'
-    path.write_text(content, encoding='utf-8')
+    await async_io.write_text(path, content)
     return f'âœ… Dockerfile generated for {tech_stack} in data/docs/'
 
 @tool('generate_persona_profile')
@@ -200,16 +194,18 @@ async def get_file_metadata(file_path: str):
 
 @tool('grep_files')
 async def grep_files(pattern: str, directory: str='.'):
-    """Sector Search: Regex-based pattern discovery across the data directory."""
-    res = []
+    """Sector Search: Regex-based pattern discovery across the data directory (indexed; matching lines with context)."""
     target_dir = DATA_DIR / directory.replace('data/', '').lstrip('/')
-    for f in target_dir.rglob('*'):
-        if f.is_file() and f.stat().st_size < 1024 * 1024: # Limit to 1MB files to prevent hang
-            try:
-                if re.search(pattern, f.read_text(errors='ignore')):
-                    res.append(str(f.relative_to(DATA_DIR)))
-            except: continue
-    return f'### [PATTERN_MATCHES]:\n' + '\n'.join(res[:15])
+    try:
+        hits = await search_index.agrep(pattern, prefix=target_dir, context=1, max_files=15, max_matches=50)
+    except re.error as e: return f'[ERROR]: Invalid pattern: {str(e)}'
+    res = []
+    for hit in hits:
+        rel = Path(hit['path']).relative_to(DATA_DIR)
+        res += [f'  {line}' for line in hit['before']]
+        res.append(f"{rel}:{hit['line']}: {hit['text']}")
+        res += [f'  {line}' for line in hit['after']]
+    return f'### [PATTERN_MATCHES]:\n' + '\n'.join(res)
 
 @tool('hash_file_integrity')
 async def hash_file_integrity(file_path: str, algorithm: str='sha256'):
@@ -222,7 +218,7 @@ async def list_files(directory: str='.'):
     try:
         target = DATA_DIR / directory.replace('data/', '').lstrip('/')
         if not target.exists(): return '[ERROR] Directory missing.'
-        return '\n'.join(os.listdir(target))
+        return '\n'.join(await async_io.list_dir(target))
     except Exception as e: return f'[ERROR]: {str(e)}'
 
 @tool('list_workspace_files')
@@ -231,9 +227,7 @@ async def list_workspace_files(client_name: str):
     try:
         target = WORKSPACE_ROOT / sanitize_windows_path(client_name)
         if not target.exists(): return '[ERROR] Workspace not located.'
-        res = []
-        for root, _, files in os.walk(target):
-            for f in files: res.append(str(Path(root) / f).replace(str(target), ''))
+        res = [str(f).replace(str(target), '') for f in await async_io.walk_files(target)]
         return '\n'.join(res)
     except Exception as e: return f'[ERROR]: {str(e)}'
 
@@ -243,9 +237,13 @@ async def merge_csv_files(file1: str, file2: str, output_file: str):
     try:
         p1 = DATA_DIR / file1.replace('data/', '').lstrip('/')
         p2 = DATA_DIR / file2.replace('data/', '').lstrip('/')
-        df = pd.concat([pd.read_csv(p1), pd.read_csv(p2)])
         out = DATA_DIR / output_file.replace('data/', '').lstrip('/')
-        df.to_csv(out, index=False)
+
+        def _merge():
+            df = pd.concat([pd.read_csv(p1), pd.read_csv(p2)])
+            df.to_csv(out, index=False)
+            return df
+        df = await async_io.run_io(_merge)
         return f'[SUCCESS] {len(df)} rows consolidated into {output_file}'
     except Exception as e: return f'[ERROR]: {str(e)}'
 
@@ -255,19 +253,26 @@ async def move_internal_file(source_path: str, destination_path: str):
     try:
         src = DATA_DIR / source_path.replace('data/', '').lstrip('/')
         dst = DATA_DIR / destination_path.replace('data/', '').lstrip('/')
-        os.makedirs(dst.parent, exist_ok=True)
-        shutil.move(str(src), str(dst))
+        await async_io.move(src, dst)
         return f'[SUCCESS] Moved {source_path} -> {destination_path}'
     except Exception as e: return f'[ERROR]: {str(e)}'
 
+@tool('analyze_log_file')
+async def analyze_log_file(file_path: str, keywords: str='ERROR,CRITICAL,FATAL', regexes: str=''):
+    """Log Analyst: Error rate per minute, top message templates and anomalous minutes for a log (incremental, any size)."""
+    try:
+        target = DATA_DIR / file_path.replace('data/', '').lstrip('/')
+        patterns = PatternSet(keywords=[k.strip() for k in keywords.split(',')], regexes=[r for r in regexes.split('||') if r])
+        return format_report(await log_analyzer.ascan(target, patterns))
+    except Exception as e: return f'[ERROR]: {str(e)}'
+
 @tool('parse_log_file')
 async def parse_log_file(file_path: str, keyword: str='ERROR'):
-    """Industrial Filter: Extracts mission-critical events from raw system logs."""
+    """Industrial Filter: Extracts the latest mission-critical events from raw system logs."""
     try:
         target = DATA_DIR / file_path.replace('data/', '').lstrip('/')
-        lines = target.read_text(encoding='utf-8').splitlines()
-        matches = [l for l in lines if keyword.upper() in l.upper()]
-        return '\n'.join(matches[:50]) if matches else 'No matches found.'
+        report = await log_analyzer.ascan(target, PatternSet(keywords=[keyword]))
+        return '\n'.join(report['samples']) if report['matches'] else 'No matches found.'
     except Exception as e: return f'[ERROR]: {str(e)}'
 
 @tool('read_excel_file')
@@ -275,8 +280,7 @@ async def read_excel_file(file_path: str, sheet_name: str=0):
     """Financial Sensor: Ingests Excel workbooks and returns Markdown summary."""
     try:
         target = DATA_DIR / file_path.replace('data/', '').lstrip('/')
-        df = pd.read_excel(target, sheet_name=sheet_name)
-        return df.head(10).to_markdown()
+        return await async_io.run_io(lambda: pd.read_excel(target, sheet_name=sheet_name).head(10).to_markdown())
     except Exception as e: return f'[ERROR]: {str(e)}'
 
 @tool('read_file')
@@ -286,7 +290,7 @@ async def read_file(file_path: str):
         if file_path.startswith('static/'): target = STATIC_DIR / file_path.replace('static/', '')
         else: target = DATA_DIR / file_path.replace('data/', '').lstrip('/')
         if not target.exists(): return '[ERROR] File not found.'
-        return target.read_text(encoding='utf-8')
+        return await async_io.read_text(target)
     except Exception as e: return f'[ERROR]: {str(e)}'
 
 @tool('regex_replace_in_file')
@@ -314,8 +318,7 @@ async def scaffold_flask_api(app_name: str):
     """Senior Developer: Manifests a production Flask boilerplate in the projects sector."""
     content = "from flask import Flask, jsonify\napp = Flask(__name__)\n@app.route('/')\ndef root(): return jsonify({'status': 'NOMINAL'})\nif __name__ == '__main__': app.run(port=5000)"
     path = DATA_DIR / 'projects' / app_name / 'app.py'
-    os.makedirs(path.parent, exist_ok=True)
-    path.write_text(content, encoding='utf-8')
+    await async_io.write_text(path, content)
     return f'ðŸš€ Flask API scaffolded at {path}'
 
 @tool('scaffold_react_component')
@@ -323,8 +326,7 @@ async def scaffold_react_component(name: str):
     """Frontend Architect: Generates an industrial Bento-Style React component."""
     content = f"import React from 'react';\n\nexport const {name} = () => (\n  <div className='titan-card p-6 border-[#b5a642]/20 bg-black/40'>\n    <h2 className='text-[#b5a642] uppercase font-black'>{name} Chamber</h2>\n  </div>\n);"
     path = DATA_DIR / 'projects' / 'ui' / f'{name}.tsx'
-    os.makedirs(path.parent, exist_ok=True)
-    path.write_text(content, encoding='utf-8')
+    await async_io.write_text(path, content)
     return f'âœ¨ React Bento-Component manifested at {path}'
 
 @tool('scan_code_for_vulnerabilities')
@@ -352,7 +354,7 @@ async def unzip_file(zip_path: str, extract_to: str):
     try:
         src = DATA_DIR / zip_path.replace('data/', '').lstrip('/')
         dst = DATA_DIR / extract_to.replace('data/', '').lstrip('/')
-        shutil.unpack_archive(src, dst)
+        await async_io.run_io(shutil.unpack_archive, src, dst)
         return '[SUCCESS] Archive expanded.'
     except Exception as e: return f'[ERROR]: {str(e)}'
 
@@ -372,11 +374,8 @@ async def write_file(file_path: str, content: str):
         target = DATA_DIR / file_path.replace('data/', '').replace('static/', '').lstrip('/')
         if file_path.startswith('static/'): target = STATIC_DIR / file_path.replace('static/', '')
         
-        os.makedirs(target.parent, exist_ok=True)
         # Atomic Write strategy: write to temp, then rename
-        temp_path = target.with_suffix('.tmp')
-        temp_path.write_text(content, encoding='utf-8')
-        os.replace(temp_path, target)
+        await async_io.write_text(target, content, atomic=True)
         return f'[SUCCESS] Physically committed to {target}'
     except Exception as e: return f'[ERROR]: {str(e)}'
 
@@ -0,0 +1,266 @@
+"""
+REALM FORGE: DEPARTMENTAL TOOL CATALOG v1.0
+PURPOSE: Precompiled, token-budgeted tool catalogs for planner prompts.
+         One compact line per tool (name, argument schema, one-line purpose), generated
+         from the live registry and foundation.DEPARTMENT_TOOL_MAP, ranked against the
+         mission text via embeddings (lexical fallback when the embedder is offline).
+         The embedder (ONNX) runs on the async I/O pool via arender_catalog(), and
+         warm_catalog() loads it and embeds every tool entry at startup.
+PATH: F:/agentic_workforce/src/system/arsenal/tool_catalog.py
+"""
+
+import os
+import re
+import threading
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from src.system.arsenal.foundation import DEPARTMENT_TOOL_MAP, logger
+from src.system.arsenal.registry import ALL_TOOLS_LIST
+from src.utils.async_io import run_io
+from src.utils.token_counter import count_tokens
+
+# Canonical 13 silos -> foundation.DEPARTMENT_TOOL_MAP keys
+SILO_TOOL_ALIASES: Dict[str, str] = {
+    "Architect": "Architect",
+    "Data_Intelligence": "DataEngineering",
+    "Software_Engineering": "SOFTWARE_ENGINEERING",
+    "DevOps_Infrastructure": "DevOps",
+    "Cybersecurity": "CyberSecurity",
+    "Financial_Ops": "Finance",
+    "Legal_Compliance": "Legal",
+    "Research_Development": "R&D",
+    "Executive_Board": "Operations",
+    "Marketing_PR": "Creative",
+    "Human_Capital": "Operations",
+    "Quality_Assurance": "SOFTWARE_ENGINEERING",
+    "Facility_Management": "FACILITY_MANAGEMENT",
+}
+
+DEFAULT_CATALOG_TOKENS = int(os.getenv("REALM_TOOL_CATALOG_TOKENS", "900"))
+DEFAULT_TOP_K = int(os.getenv("REALM_TOOL_CATALOG_TOP_K", "12"))
+
+_PURPOSE_CHARS = 110
+_WORD_RE = re.compile(r"[a-z0-9]+")
+
+
+@dataclass(frozen=True)
+class CatalogEntry:
+    """Compact planner-facing description of one arsenal tool."""
+    name: str
+    purpose: str
+    args: Tuple[Tuple[str, str, Optional[str]], ...]  # (name, type, default)
+    line: str
+    tokens: int
+
+
+# ==============================================================================
+# 1. ENTRY COMPILATION
+# ==============================================================================
+
+def _one_line_purpose(description: str) -> str:
+    """First sentence of the docstring, minus the 'Codename:' persona prefix."""
+    text = " ".join((description or "").split())
+    head, sep, tail = text.partition(": ")
+    if sep and len(head) <= 40 and tail:
+        text = tail
+    sentence = re.split(r"(?<=[.!?])\s", text, maxsplit=1)[0]
+    if len(sentence) > _PURPOSE_CHARS:
+        sentence = sentence[: _PURPOSE_CHARS - 1].rstrip() + "…"
+    return sentence
+
+
+def _arg_schema(t: Any) -> Tuple[Tuple[str, str, Optional[str]], ...]:
+    """Extracts (name, type, default) triples from a LangChain tool's input schema."""
+    try:
+        props = getattr(t, "args", None) or {}
+    except Exception:
+        props = {}
+    schema = []
+    for arg_name, spec in props.items():
+        spec = spec or {}
+        arg_type = spec.get("type")
+        if not arg_type and spec.get("anyOf"):
+            arg_type = "|".join(str(o.get("type")) for o in spec["anyOf"] if o.get("type") and o.get("type") != "null")
+        default = repr(spec["default"]) if "default" in spec else None
+        schema.append((arg_name, arg_type or "any", default))
+    return tuple(schema)
+
+
+def compile_entry(t: Any) -> CatalogEntry:
+    name = getattr(t, "name", getattr(t, "tool_name", getattr(t, "__name__", "unknown")))
+    purpose = _one_line_purpose(getattr(t, "description", "") or getattr(t, "__doc__", ""))
+    args = _arg_schema(t)
+    sig = ", ".join(f"{a}:{typ}" + (f"={d}" if d is not None else "") for a, typ, d in args)
+    line = f"- {name}({sig}): {purpose}"
+    return CatalogEntry(name=name, purpose=purpose, args=args, line=line, tokens=count_tokens(line))
+
+
+@lru_cache(maxsize=1)
+def _all_entries() -> Dict[str, CatalogEntry]:
+    """Compiles every registered tool once per process."""
+    entries = {}
+    for t in ALL_TOOLS_LIST:
+        if not hasattr(t, "name"):
+            continue
+        entry = compile_entry(t)
+        entries.setdefault(entry.name, entry)
+    logger.info(f"[TOOL_CATALOG] Compiled {len(entries)} tool entries.")
+    return entries
+
+
+def resolve_department_key(dept: str) -> str:
+    """Maps a silo name (canonical or legacy) to a DEPARTMENT_TOOL_MAP key."""
+    if not dept:
+        return "Architect"
+    if dept in DEPARTMENT_TOOL_MAP:
+        return dept
+    if dept in SILO_TOOL_ALIASES:
+        return SILO_TOOL_ALIASES[dept]
+    norm = dept.strip().replace(" ", "_").upper()
+    for k in list(DEPARTMENT_TOOL_MAP.keys()) + list(SILO_TOOL_ALIASES.keys()):
+        if norm == k.upper().replace(" ", "_"):
+            return SILO_TOOL_ALIASES.get(k, k)
+    return "Architect"
+
+
+@lru_cache(maxsize=64)
+def catalog_for_department(dept: str) -> Tuple[CatalogEntry, ...]:
+    """Precomputed catalog for a silo (only tools that actually exist in the arsenal)."""
+    entries = _all_entries()
+    names = DEPARTMENT_TOOL_MAP.get(resolve_department_key(dept), DEPARTMENT_TOOL_MAP["Architect"])
+    seen, catalog = set(), []
+    for name in names:
+        if name in entries and name not in seen:
+            seen.add(name)
+            catalog.append(entries[name])
+    return tuple(catalog)
+
+
+# ==============================================================================
+# 2. RELEVANCE RANKING (EMBEDDINGS -> LEXICAL FALLBACK)
+# ==============================================================================
+
+class _ToolEmbedder:
+    """Embeds tool entries once and scores them against mission text."""
+
+    def __init__(self):
+        self._fn = None
+        self._disabled = False
+        self._vectors: Dict[str, Any] = {}
+        self._lock = threading.Lock()  # Planners score from several I/O pool threads
+
+    def _embedding_fn(self):
+        if self._fn is None and not self._disabled:
+            try:
+                from chromadb.utils import embedding_functions
+                self._fn = embedding_functions.DefaultEmbeddingFunction()
+            except Exception as e:
+                logger.warning(f"[TOOL_CATALOG] Embedder unavailable, using lexical ranking: {e}")
+                self._disabled = True
+        return self._fn
+
+    def scores(self, query: str, entries: Sequence[CatalogEntry]) -> Optional[List[float]]:
+        """Cosine similarity per entry, or None when only lexical ranking is available. Blocking."""
+        with self._lock:
+            return self._scores(query, entries)
+
+    def _scores(self, query: str, entries: Sequence[CatalogEntry]) -> Optional[List[float]]:
+        fn = self._embedding_fn()
+        if fn is None:
+            return None
+        try:
+            import numpy as np
+            missing = [e for e in entries if e.name not in self._vectors]
+            if missing:
+                for e, vec in zip(missing, fn([f"{e.name}: {e.purpose}" for e in missing])):
+                    v = np.asarray(vec, dtype=np.float32)
+                    self._vectors[e.name] = v / (np.linalg.norm(v) or 1.0)
+            q = np.asarray(fn([query])[0], dtype=np.float32)
+            q = q / (np.linalg.norm(q) or 1.0)
+            matrix = np.stack([self._vectors[e.name] for e in entries])
+            return (matrix @ q).tolist()
+        except Exception as e:
+            logger.warning(f"[TOOL_CATALOG] Embedding scoring failed, using lexical ranking: {e}")
+            self._disabled = True
+            return None
+
+
+_EMBEDDER = _ToolEmbedder()
+
+
+def _lexical_scores(query: str, entries: Sequence[CatalogEntry]) -> List[float]:
+    words = set(_WORD_RE.findall(query.lower()))
+    scores = []
+    for e in entries:
+        vocab = set(_WORD_RE.findall(f"{e.name.replace('_', ' ')} {e.purpose}".lower()))
+        scores.append(len(words & vocab) / (len(vocab) or 1))
+    return scores
+
+
+def rank_tools(query: str, entries: Sequence[CatalogEntry]) -> List[CatalogEntry]:
+    """Orders entries by relevance to the mission (stable for ties)."""
+    if not query or not entries:
+        return list(entries)
+    scores = _EMBEDDER.scores(query, entries) or _lexical_scores(query, entries)
+    order = sorted(range(len(entries)), key=lambda i: -scores[i])
+    return [entries[i] for i in order]
+
+
+# ==============================================================================
+# 3. PLANNER-FACING API
+# ==============================================================================
+
+def select_tools(
+    dept: str,
+    mission: str = "",
+    top_k: int = DEFAULT_TOP_K,
+    budget_tokens: int = DEFAULT_CATALOG_TOKENS,
+) -> List[CatalogEntry]:
+    """Top-k most relevant department tools, trimmed to the token budget."""
+    ranked = rank_tools(mission, catalog_for_department(dept))
+    if len(ranked) < top_k:
+        # Thin silo: borrow the most relevant tools from the wider arsenal
+        taken = {e.name for e in ranked}
+        extras = [e for e in _all_entries().values() if e.name not in taken]
+        ranked += rank_tools(mission, extras)[: top_k - len(ranked)]
+
+    selected, spent = [], 0
+    for entry in ranked[:top_k]:
+        if spent + entry.tokens > budget_tokens:
+            continue
+        selected.append(entry)
+        spent += entry.tokens
+    return selected
+
+
+def render_catalog(
+    dept: str,
+    mission: str = "",
+    top_k: int = DEFAULT_TOP_K,
+    budget_tokens: int = DEFAULT_CATALOG_TOKENS,
+) -> str:
+    """Prompt block: one '- name(arg:type=default): purpose' line per selected tool."""
+    return "\n".join(e.line for e in select_tools(dept, mission, top_k, budget_tokens))
+
+
+async def arender_catalog(
+    dept: str,
+    mission: str = "",
+    top_k: int = DEFAULT_TOP_K,
+    budget_tokens: int = DEFAULT_CATALOG_TOKENS,
+) -> str:
+    """render_catalog() on the I/O pool: ranking may run the ONNX embedder."""
+    return await run_io(render_catalog, dept, mission, top_k, budget_tokens)
+
+
+async def warm_catalog() -> None:
+    """Compiles every entry and embeds it (loading the embedder) ahead of the first plan."""
+    try:
+        entries = await run_io(_all_entries)
+        embedded = await run_io(_EMBEDDER.scores, "warmup", list(entries.values()))
+        mode = "embedding" if embedded is not None else "lexical"
+        logger.info(f"[TOOL_CATALOG] Warm: {len(entries)} entries, {mode} ranking.")
+    except Exception as e:
+        logger.warning(f"[TOOL_CATALOG] Warmup failed: {e}")
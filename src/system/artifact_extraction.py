@@ -0,0 +1,92 @@
+"""
+REALM FORGE: ARTIFACT EXTRACTION v1.0
+PURPOSE: The single place that decides which files a tool call produced or touched.
+         - Tools that know their outputs return with_artifacts(text, *paths): a str
+           (so every existing consumer keeps working) carrying a structured
+           `artifacts` tuple, which is used as-is with no scanning.
+         - Other results fall back to one precompiled drive-path scan over at most
+           REALM_ARTIFACT_SCAN_MAX_CHARS characters of the text; args are never
+           stringified, only values that are themselves paths count.
+         - Paths come out normalized (forward slashes, no trailing punctuation),
+           so the IronClad validator can take the registry as it is.
+PATH: F:/agentic_workforce/src/system/artifact_extraction.py
+"""
+
+import os
+import re
+from pathlib import PurePath
+from typing import Any, Dict, Iterable, List, Tuple, Union
+
+ARTIFACT_SCAN_MAX_CHARS = int(os.getenv("REALM_ARTIFACT_SCAN_MAX_CHARS", "16384"))
+
+# A drive-anchored path inside free text; stops at whitespace, quotes and closing brackets
+_DRIVE_PATH = re.compile(r"[Ff]:[/\\][^\s\"'^,)\]}<>|]+")
+# An argument value that is a path (not text that merely mentions one)
+_DRIVE_ARG = re.compile(r"[Ff]:[/\\][^\n\r]*")
+_TRAILING = ".:;!?"
+
+PathLike = Union[str, PurePath]
+
+
+def normalize_path(path: PathLike) -> str:
+    return str(path).replace("\\", "/")
+
+
+class ToolOutput(str):
+    """Tool result text that also carries the files the tool produced or touched."""
+
+    artifacts: Tuple[str, ...]
+
+    def __new__(cls, text: str, artifacts: Iterable[PathLike] = ()):
+        output = super().__new__(cls, text)
+        output.artifacts = tuple(normalize_path(a) for a in artifacts)
+        return output
+
+
+def with_artifacts(text: str, *paths: PathLike) -> ToolOutput:
+    """Returns `text` tagged with `paths`, so the executor need not scan it for them."""
+    return ToolOutput(text, paths)
+
+
+def scan_text(text: str, limit: int = ARTIFACT_SCAN_MAX_CHARS) -> List[str]:
+    """Drive paths mentioned in the first `limit` characters of `text`."""
+    head = text[:limit]
+    if ":/" not in head and ":\\" not in head:
+        return []  # Cheap C-level rejection of the common case
+    found = []
+    for match in _DRIVE_PATH.findall(head):
+        path = normalize_path(match.rstrip(_TRAILING))
+        if len(path) > 3:
+            found.append(path)
+    return found
+
+
+def sanitize_args(args: Dict[str, Any]) -> Tuple[Dict[str, Any], List[str]]:
+    """
+    Copy of `args` with path-valued arguments normalized, plus those paths. Free-text
+    values (file contents, prompts) are left byte-for-byte alone.
+    """
+    clean: Dict[str, Any] = {}
+    paths: List[str] = []
+    for key, value in (args or {}).items():
+        if isinstance(value, str) and _DRIVE_ARG.fullmatch(value):
+            value = normalize_path(value)
+            paths.append(value)
+        clean[key] = value
+    return clean, paths
+
+
+def extract_artifacts(result: Any, arg_paths: Iterable[str] = (), limit: int = ARTIFACT_SCAN_MAX_CHARS) -> List[str]:
+    """
+    Artifacts of one tool call, first-seen order, no duplicates. A ToolOutput is
+    authoritative; anything else is the path arguments plus a capped text scan.
+    """
+    structured = getattr(result, "artifacts", None)
+    if structured is not None:
+        return list(dict.fromkeys(structured))
+    found = list(arg_paths)
+    if isinstance(result, str):
+        found += scan_text(result, limit)
+    elif result is not None:
+        found += scan_text(str(result)[:limit], limit)
+    return list(dict.fromkeys(found))
@@ -0,0 +1,80 @@
+"""
+REALM FORGE: BINARY AUDIO FRAMES v1.0
+PURPOSE: Wire format for neural TTS streamed over /ws/telemetry as binary frames
+         (no base64, no JSON envelope). One utterance = one message sequence number;
+         its MP3 bytes arrive as numbered chunks, the last one flagged FINAL.
+
+FRAME LAYOUT (network byte order, 13-byte fixed header):
+    magic      2s   b"RA"
+    version    B    1
+    flags      B    bit0 = FINAL
+    msg_seq    I    utterance number within the mission
+    chunk_seq  I    chunk number within the utterance
+    id_len     B    length of the mission id that follows
+    mission_id      id_len bytes, ASCII
+    payload         MP3 bytes (may be empty on the FINAL frame)
+PATH: F:/agentic_workforce/src/system/audio_frames.py
+"""
+
+import struct
+from dataclasses import dataclass
+from typing import AsyncIterator
+
+AUDIO_MAGIC = b"RA"
+AUDIO_VERSION = 1
+FLAG_FINAL = 0x01
+
+_HEADER = struct.Struct("!2sBBIIB")
+
+# Chunks are coalesced up to this size after the first one, which is sent immediately
+# so playback-side buffering can start as early as possible.
+COALESCE_BYTES = 8192
+
+
+@dataclass(frozen=True)
+class AudioFrame:
+    mission_id: str
+    msg_seq: int
+    chunk_seq: int
+    final: bool
+    payload: bytes
+
+
+def pack_audio_frame(mission_id: str, msg_seq: int, chunk_seq: int, payload: bytes = b"", final: bool = False) -> bytes:
+    mission = (mission_id or "").encode("ascii", "replace")[:255]
+    header = _HEADER.pack(AUDIO_MAGIC, AUDIO_VERSION, FLAG_FINAL if final else 0, msg_seq, chunk_seq, len(mission))
+    return b"".join((header, mission, payload))
+
+
+def unpack_audio_frame(frame: bytes) -> AudioFrame:
+    magic, version, flags, msg_seq, chunk_seq, id_len = _HEADER.unpack_from(frame)
+    if magic != AUDIO_MAGIC or version != AUDIO_VERSION:
+        raise ValueError("Not a RealmForge audio frame.")
+    start = _HEADER.size + id_len
+    return AudioFrame(
+        mission_id=frame[_HEADER.size:start].decode("ascii"),
+        msg_seq=msg_seq,
+        chunk_seq=chunk_seq,
+        final=bool(flags & FLAG_FINAL),
+        payload=bytes(frame[start:]),
+    )
+
+
+async def audio_frames(
+    mission_id: str,
+    msg_seq: int,
+    chunks: AsyncIterator[bytes],
+    coalesce_bytes: int = COALESCE_BYTES,
+) -> AsyncIterator[bytes]:
+    """
+    Wraps a TTS chunk stream into packed frames. Pending bytes are kept as a chunk
+    list and joined once per frame, never concatenated incrementally.
+    """
+    pending, size, seq = [], 0, 0
+    async for chunk in chunks:
+        pending.append(chunk)
+        size += len(chunk)
+        if seq == 0 or size >= coalesce_bytes:
+            yield pack_audio_frame(mission_id, msg_seq, seq, b"".join(pending))
+            pending, size, seq = [], 0, seq + 1
+    yield pack_audio_frame(mission_id, msg_seq, seq, b"".join(pending), final=True)
@@ -0,0 +1,284 @@
+"""
+REALM FORGE: CREDIT LEDGER v1.0
+PURPOSE: Write-behind billing for the mission streaming loop.
+         - Charges reserve against an in-memory per-key balance and return at once.
+         - Every charge is appended to a sequenced JSONL journal before it is acknowledged.
+         - A background flusher applies journaled charges to licenses.db in one
+           transaction per batch (credits UPDATE + usage_logs INSERTs + applied_seq),
+           every FLUSH_INTERVAL_MS or FLUSH_ROWS charges, whichever comes first.
+         - On start the journal is replayed from the last applied_seq, so a crash
+           between charge and flush loses nothing and never bills twice.
+         - Applied lines are compacted away once the journal passes
+           JOURNAL_COMPACT_BYTES, even while new charges keep arriving.
+         - A flush never drives a balance below zero: credits spent outside the ledger
+           since the reservation (gatekeeper.deduct_credit) clamp the key to 0.
+PATH: F:/agentic_workforce/src/system/billing/credit_ledger.py
+"""
+
+import asyncio
+import json
+import os
+import time
+from collections import defaultdict
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from src.auth.db_pool import BASE_PATH, get_auth_db
+from src.auth.gatekeeper import SQL_INSERT_USAGE
+from src.auth.license_cache import license_cache
+from src.system.config import logger
+from src.utils.async_io import run_io
+
+JOURNAL_PATH = BASE_PATH / "security" / "credit_journal.jsonl"
+FLUSH_INTERVAL_MS = int(os.getenv("REALM_LEDGER_FLUSH_MS", "250"))
+FLUSH_ROWS = int(os.getenv("REALM_LEDGER_FLUSH_ROWS", "200"))
+JOURNAL_COMPACT_BYTES = int(os.getenv("REALM_LEDGER_COMPACT_KB", "1024")) * 1024
+
+SQL_CREATE_LEDGER_STATE = """CREATE TABLE IF NOT EXISTS ledger_state
+                             (id INTEGER PRIMARY KEY CHECK (id = 1), applied_seq INTEGER NOT NULL)"""
+SQL_SELECT_APPLIED_SEQ = "SELECT applied_seq FROM ledger_state WHERE id = 1"
+SQL_UPSERT_APPLIED_SEQ = """INSERT INTO ledger_state (id, applied_seq) VALUES (1, ?)
+                            ON CONFLICT(id) DO UPDATE SET applied_seq = excluded.applied_seq"""
+SQL_SELECT_CREDITS = "SELECT credits FROM licenses WHERE key = ?"
+SQL_APPLY_CHARGE = "UPDATE licenses SET credits = credits - ? WHERE key = ? AND credits >= ?"
+SQL_CLAMP_CHARGE = "UPDATE licenses SET credits = 0 WHERE key = ? AND credits < ?"
+
+
+@dataclass
+class Charge:
+    seq: int
+    key: str
+    agent_id: str
+    silo_id: str
+    mission_id: str
+    task_summary: str
+    cost: int
+    timestamp: float
+
+
+def _journal_line(charge: Charge) -> str:
+    return json.dumps(asdict(charge), separators=(",", ":")) + "\n"
+
+
+class CreditLedger:
+    """Per-key credit reservations with a journaled, batched write-behind to licenses.db."""
+
+    def __init__(
+        self,
+        journal_path: Path = JOURNAL_PATH,
+        flush_interval_ms: int = FLUSH_INTERVAL_MS,
+        flush_rows: int = FLUSH_ROWS,
+        compact_bytes: int = JOURNAL_COMPACT_BYTES,
+    ):
+        self.journal_path = Path(journal_path)
+        self.flush_interval = flush_interval_ms / 1000
+        self.flush_rows = flush_rows
+        self.compact_bytes = compact_bytes
+        self._balances: Dict[str, int] = {}
+        self._pending: List[Charge] = []
+        self._seq = 0
+        self._journal = None
+        self._wake: Optional[asyncio.Event] = None
+        self._flusher: Optional[asyncio.Task] = None
+        self._flush_lock: Optional[asyncio.Lock] = None
+        self._start_lock: Optional[asyncio.Lock] = None
+        self.flushed_rows = 0
+
+    @property
+    def started(self) -> bool:
+        return self._flusher is not None
+
+    # --- LIFECYCLE ---
+
+    async def start(self) -> "CreditLedger":
+        if self._start_lock is None:
+            self._start_lock = asyncio.Lock()
+        async with self._start_lock:
+            if self.started:
+                return self
+            pool = await get_auth_db()
+            async with pool.writer() as db:
+                await db.execute(SQL_CREATE_LEDGER_STATE)
+            row = await pool.fetchone(SQL_SELECT_APPLIED_SEQ)
+            applied_seq = row[0] if row else 0
+
+            replayed = self._replay(applied_seq)
+            self._seq = max([applied_seq] + [c.seq for c in replayed])
+            self._pending = replayed
+            self.journal_path.parent.mkdir(parents=True, exist_ok=True)
+            self._journal = open(self.journal_path, "a", encoding="utf-8")
+            if self._journal.tell() and not self._ends_with_newline():
+                self._journal.write("\n")  # Seal a torn tail so the next record parses
+            self._wake = asyncio.Event()
+            self._flush_lock = asyncio.Lock()
+            if replayed:
+                logger.warning(f"[LEDGER] Replaying {len(replayed)} unapplied charge(s) from journal.")
+                await self.flush()
+            self._flusher = asyncio.create_task(self._run())
+        return self
+
+    async def stop(self) -> None:
+        """Final flush; the journal is kept if anything could not be applied."""
+        if not self.started:
+            return
+        self._flusher.cancel()
+        await asyncio.gather(self._flusher, return_exceptions=True)
+        self._flusher = None
+        try:
+            await self.flush()
+        finally:
+            self._journal.close()
+            self._journal = None
+
+    def _replay(self, applied_seq: int) -> List[Charge]:
+        charges = []
+        try:
+            with open(self.journal_path, "r", encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        charge = Charge(**json.loads(line))
+                    except (ValueError, TypeError):
+                        continue  # Torn tail write from a crash; never acknowledged
+                    if charge.seq > applied_seq:
+                        charges.append(charge)
+        except FileNotFoundError:
+            pass
+        return charges
+
+    def _ends_with_newline(self) -> bool:
+        with open(self.journal_path, "rb") as f:
+            f.seek(-1, os.SEEK_END)
+            return f.read(1) == b"\n"
+
+    # --- HOT PATH ---
+
+    async def charge(self, api_key: str, cost: int, mission_id: str, agent_id: str,
+                     silo_id: str, task_context: str = "Mission") -> bool:
+        """
+        Reserves `cost` credits. Returns False (nothing recorded) if the key is unknown
+        or its balance is insufficient. One DB read per key per process, then memory only.
+        """
+        if not self.started:
+            await self.start()
+        balance = self._balances.get(api_key)
+        if balance is None:
+            pool = await get_auth_db()
+            row = await pool.fetchone(SQL_SELECT_CREDITS, (api_key,))
+            if row is None:
+                return False
+            unapplied = sum(c.cost for c in self._pending if c.key == api_key)
+            balance = self._balances.setdefault(api_key, row[0] - unapplied)
+        if balance < cost:
+            return False
+
+        self._seq += 1
+        charge = Charge(self._seq, api_key, agent_id, silo_id, mission_id, task_context[:200], cost, time.time())
+        # Acknowledged only once the OS has the journal line (survives a process crash)
+        self._journal.write(_journal_line(charge))
+        self._journal.flush()
+
+        self._balances[api_key] = balance - cost
+        self._pending.append(charge)
+        license_cache.apply_credit_delta(api_key, -cost)
+        if len(self._pending) >= self.flush_rows:
+            self._wake.set()
+        return True
+
+    def balance(self, api_key: str) -> Optional[int]:
+        return self._balances.get(api_key)
+
+    def forget(self, api_key: str) -> None:
+        """
+        Drops a cached balance; call it wherever credits change outside the ledger
+        (direct deductions, top-ups, edits). The next charge re-reads the key.
+        """
+        self._balances.pop(api_key, None)
+
+    # --- WRITE-BEHIND ---
+
+    async def _run(self) -> None:
+        while True:
+            # asyncio.wait (not wait_for): a stop() racing the row trigger must not hang
+            waiter = asyncio.ensure_future(self._wake.wait())
+            try:
+                await asyncio.wait((waiter,), timeout=self.flush_interval)
+            finally:
+                waiter.cancel()
+            self._wake.clear()
+            try:
+                await self.flush()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"[LEDGER] Flush failed, retrying next cycle: {e}")
+
+    async def flush(self) -> int:
+        """Applies every pending charge in one transaction; returns the number of rows applied."""
+        async with self._flush_lock:
+            batch = self._pending[:]
+            if not batch:
+                return 0
+            self._journal.flush()
+            await run_io(os.fsync, self._journal.fileno())
+
+            per_key: Dict[str, int] = defaultdict(int)
+            for c in batch:
+                per_key[c.key] += c.cost
+            pool = await get_auth_db()
+            overdrawn: List[str] = []
+            async with pool.writer() as db:
+                for key, cost in per_key.items():
+                    cursor = await db.execute(SQL_APPLY_CHARGE, (cost, key, cost))
+                    if cursor.rowcount == 0:
+                        await db.execute(SQL_CLAMP_CHARGE, (key, cost))
+                        overdrawn.append(key)
+                await db.executemany(SQL_INSERT_USAGE, [
+                    (c.key, c.agent_id, c.silo_id, c.mission_id, c.task_summary, c.cost, c.timestamp)
+                    for c in batch
+                ])
+                await db.execute(SQL_UPSERT_APPLIED_SEQ, (batch[-1].seq,))
+
+            del self._pending[:len(batch)]
+            self.flushed_rows += len(batch)
+            for key in overdrawn:
+                logger.warning(f"[LEDGER] Key {key[:12]}... was spent outside the ledger; balance clamped to 0.")
+                self.forget(key)
+                license_cache.invalidate(key)
+            if not self._pending:
+                # Everything journaled is applied (applied_seq guards replays); start a fresh journal
+                self._journal.truncate(0)
+            elif self._journal.tell() >= self.compact_bytes:
+                await self._compact()
+            return len(batch)
+
+    async def _compact(self) -> None:
+        """Rewrites the journal with only the unapplied charges (called under the flush lock)."""
+        tmp = self.journal_path.with_name(self.journal_path.name + ".compact")
+        kept = self._pending[:]
+
+        def write() -> None:
+            with open(tmp, "w", encoding="utf-8") as f:
+                f.writelines(_journal_line(c) for c in kept)
+                f.flush()
+                os.fsync(f.fileno())
+
+        await run_io(write)
+        # Back on the loop (no await until the swap): charges journaled meanwhile went
+        # to the old file, carry them over before it is replaced
+        with open(tmp, "a", encoding="utf-8") as f:
+            f.writelines(_journal_line(c) for c in self._pending[len(kept):])
+        self._journal.close()  # Windows cannot replace a file that is still open
+        os.replace(tmp, self.journal_path)
+        self._journal = open(self.journal_path, "a", encoding="utf-8")
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "pending": len(self._pending),
+            "flushed_rows": self.flushed_rows,
+            "seq": self._seq,
+            "cached_keys": len(self._balances),
+        }
+
+
+credit_ledger = CreditLedger()
@@ -4,9 +4,10 @@ PURPOSE: Persistent logging of mission costs and specialist compensation.
 PATH: F:/agentic_workforce/src/system/billing/ledger.py
 """
 
-import aiosqlite
 import time
-from src.auth.gatekeeper import DB_PATH
+from src.auth.db_pool import get_auth_db
+from src.auth.gatekeeper import SQL_INSERT_USAGE
+from src.auth.usage_rollups import usage_by_silo, usage_series
 from src.system.config import logger
 
 class IndustrialLedger:
@@ -14,26 +15,26 @@ class IndustrialLedger:
     async def log_mission_transaction(license_key: str, mission_id: str, agent_id: str, silo: str, cost: int):
         """Records a completed transaction to the usage_logs table."""
         try:
-            async with aiosqlite.connect(DB_PATH) as db:
-                await db.execute(
-                    """INSERT INTO usage_logs (key, agent_id, silo_id, mission_id, task_summary, cost, timestamp) 
-                       VALUES (?, ?, ?, ?, ?, ?, ?)""",
-                    (license_key, agent_id, silo, mission_id, "Completed Mission Execution", cost, time.time())
-                )
-                await db.commit()
+            pool = await get_auth_db()
+            await pool.execute(
+                SQL_INSERT_USAGE,
+                (license_key, agent_id, silo, mission_id, "Completed Mission Execution", cost, time.time())
+            )
             return True
         except Exception as e:
             logger.error(f"âŒ [LEDGER_FAULT] Failed to log mission {mission_id}: {e}")
             return False
 
     @staticmethod
-    async def get_silo_usage_report(license_key: str):
-        """Returns total energy consumption per silo for the UI."""
-        async with aiosqlite.connect(DB_PATH) as db:
-            async with db.execute(
-                "SELECT silo_id, SUM(cost) FROM usage_logs WHERE key=? GROUP BY silo_id", 
-                (license_key,)
-            ) as cursor:
-                rows = await cursor.fetchall()
-                return {row[0]: row[1] for row in rows}
+    async def get_silo_usage_report(license_key: str, start: float = None, end: float = None):
+        """Returns energy consumption per silo for the UI over [start, end) (default all-time), from the rollups."""
+        pool = await get_auth_db()
+        report = await usage_by_silo(pool, license_key, start, end)
+        return {silo: entry["cost"] for silo, entry in report.items()}
+
+    @staticmethod
+    async def get_usage_timeline(license_key: str, start: float, end: float, granularity: str = "hour"):
+        """Hourly or daily per-silo consumption buckets for charts."""
+        pool = await get_auth_db()
+        return await usage_series(pool, license_key, start, end, granularity)
 
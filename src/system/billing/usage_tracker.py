@@ -1,14 +1,31 @@
 ﻿"""
 REALM FORGE: USAGE TRACKER v1.0
-PURPOSE: Monitors token consumption and deducts credits via Gatekeeper.
+PURPOSE: Monitors token consumption and reserves credits via the write-behind CreditLedger.
 PATH: F:/agentic_workforce/src/system/billing/usage_tracker.py
 """
 import os
 from typing import Any
 from src.auth import gatekeeper
+from src.system.billing.credit_ledger import credit_ledger
 from src.system.config import logger
 
 class UsageTracker:
+    @staticmethod
+    async def track_llm_record(record: Any):
+        """
+        Billing sink for LLMMeter: charges the metered tokens of one real LLM call
+        to the key bound by metering_scope(api_key=...). Unscoped calls are not billed.
+        """
+        if not record.api_key or record.error:
+            return False
+        return await UsageTracker.track_llm_usage(
+            response={"usage": {"total_tokens": record.total_tokens}},
+            api_key=record.api_key,
+            mission_id=record.mission_id,
+            agent_id=record.node.upper(),
+            silo=record.silo,
+        )
+
     @staticmethod
     async def track_llm_usage(response: Any, api_key: str, mission_id: str, agent_id: str, silo: str):
         """
@@ -37,9 +54,9 @@ class UsageTracker:
         # Calculation: 1 credit per 1000 tokens (Standard Industrial Rate)
         cost = max(1, total_tokens // 1000)
 
-        # --- 3. EXECUTE DEDUCTION ---
+        # --- 3. EXECUTE DEDUCTION (in-memory reservation; journaled, flushed in batches) ---
         try:
-            success = await gatekeeper.deduct_credit(
+            success = await credit_ledger.charge(
                 api_key=api_key or "",
                 cost=cost,
                 mission_id=mission_id or "UNKNOWN_MSN",
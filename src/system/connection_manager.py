@@ -2,37 +2,372 @@
 WebSocket Connection Manager
 ----------------------------
 
-Tracks active WebSocket connections and broadcasts telemetry.
+Tracks active WebSocket connections and fans telemetry out to them.
+
+Frames tagged with topics (mission_id, user_id, silo) reach only the clients
+subscribed to one of them; untagged frames are system notices for everyone.
+A connection belongs to a license owner and starts subscribed to its own user_id
+topic; it may only add that user_id and missions that user owns. Silo
+subscriptions only deliver the owner's own frames. Owner-less connections
+(master key) may subscribe to anything. A late subscriber receives a compact
+snapshot of each matching mission's current state, including the HUD view of its
+latest graph checkpoint (state_codec.snapshot). Running missions register a loader
+for that checkpoint, so it is only decoded when a late subscriber arrives.
+
+Each connection owns a bounded send queue drained by its own sender task, so
+`broadcast` only serializes the frame once and enqueues it: mission coroutines
+never wait on WebSocket I/O. When a client's queue is full, the oldest
+diagnostic/node_update frame is dropped to make room; a client whose queue is
+full of frames that cannot be dropped (or whose send stalls) is disconnected.
 """
 
-from typing import List, Any
+import asyncio
+import json
+import os
+from collections import OrderedDict, deque
+from typing import Any, Callable, Deque, Dict, Iterable, List, Optional, Set, Tuple, Union
+
 from fastapi import WebSocket
 from src.system.config import logger
+from src.system.metrics import WS_DROPPED_FRAMES, WS_SLOW_DISCONNECTS
+from src.system.state_codec import snapshot
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional accelerator
+    orjson = None
+
+WS_QUEUE_SIZE = int(os.getenv("REALM_WS_QUEUE_SIZE", "256"))
+WS_SEND_TIMEOUT = float(os.getenv("REALM_WS_SEND_TIMEOUT", "5.0"))
+
+WS_SNAPSHOT_MISSIONS = int(os.getenv("REALM_WS_SNAPSHOT_MISSIONS", "256"))
+WS_MISSION_OWNERS = int(os.getenv("REALM_WS_MISSION_OWNERS", "4096"))
+WS_SNAPSHOT_MESSAGES = int(os.getenv("REALM_WS_SNAPSHOT_MESSAGES", "10"))
+
+# Superseded by the next frame of the same kind; safe to drop under backpressure
+DROPPABLE_TYPES = frozenset({"diagnostic", "node_update"})
+
+TOPIC_KEYS = ("mission_id", "user_id", "silo")
+
+Frame = Tuple[bool, Union[str, bytes]]  # (droppable, payload)
+Topic = Tuple[str, str]  # (topic key, value), e.g. ("mission_id", "MSN-1A2B")
+
+
+def encode_frame(message: Any) -> str:
+    """Serializes a telemetry message once for every recipient."""
+    if isinstance(message, (str, bytes)):
+        return message
+    if orjson is not None:
+        return orjson.dumps(message, default=str).decode("utf-8")
+    return json.dumps(message, separators=(",", ":"), ensure_ascii=False, default=str)
+
+
+class SlowConsumerError(Exception):
+    """Raised when a client's send queue is saturated with undroppable frames."""
+
+
+class ClientChannel:
+    """Bounded per-connection send queue plus the task that drains it."""
+
+    def __init__(self, websocket: WebSocket, maxsize: int = WS_QUEUE_SIZE, owner: Optional[str] = None):
+        self.websocket = websocket
+        self.owner = owner  # License user_id; None = unrestricted (master key)
+        self.maxsize = maxsize
+        self.frames: Deque[Frame] = deque()
+        self.dropped = 0
+        self.sent = 0
+        self.topics: Set[Topic] = set()
+        self._ready = asyncio.Event()
+        self.task: Optional[asyncio.Task] = None
+
+    def offer(self, frame: Frame) -> None:
+        """Enqueues without blocking; applies the drop-oldest policy when full."""
+        if len(self.frames) >= self.maxsize:
+            victim = next((i for i, (droppable, _) in enumerate(self.frames) if droppable), None)
+            if victim is not None:
+                del self.frames[victim]
+                self.dropped += 1
+                WS_DROPPED_FRAMES.inc()
+            elif frame[0]:
+                self.dropped += 1
+                WS_DROPPED_FRAMES.inc()
+                return
+            else:
+                raise SlowConsumerError(f"{len(self.frames)} undelivered frames")
+        self.frames.append(frame)
+        self._ready.set()
+
+    async def pump(self) -> None:
+        while True:
+            if not self.frames:
+                self._ready.clear()
+                await self._ready.wait()
+                continue
+            _, payload = self.frames.popleft()
+            if isinstance(payload, bytes):
+                await asyncio.wait_for(self.websocket.send_bytes(payload), WS_SEND_TIMEOUT)
+            else:
+                await asyncio.wait_for(self.websocket.send_text(payload), WS_SEND_TIMEOUT)
+            self.sent += 1
+
+
+def _topic_values(value: Any) -> List[str]:
+    """Accepts 'a,b', ['a', 'b'] or a single value."""
+    if value is None:
+        return []
+    if isinstance(value, str):
+        return [v.strip() for v in value.split(",") if v.strip()]
+    if isinstance(value, (list, tuple, set)):
+        return [str(v).strip() for v in value if str(v).strip()]
+    return [str(value)]
+
+
+def _frame_topics(message: Any, topics: Dict[str, Any]) -> List[Topic]:
+    """Explicit topic kwargs win; otherwise mission_id/user_id/silo fields of the frame."""
+    found = []
+    for key in TOPIC_KEYS:
+        value = topics.get(key)
+        if value is None and isinstance(message, dict):
+            value = message.get(key)
+        if value:
+            found.append((key, str(value)))
+    return found
 
 
 class ConnectionManager:
-    def __init__(self):
-        self.active_connections: List[WebSocket] = []
+    def __init__(self, queue_size: int = WS_QUEUE_SIZE, snapshot_missions: int = WS_SNAPSHOT_MISSIONS):
+        self.queue_size = queue_size
+        self.channels: Dict[WebSocket, ClientChannel] = {}
+        self.routes: Dict[Topic, Set[ClientChannel]] = {}
+        self.missions: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self.mission_owners: "OrderedDict[str, str]" = OrderedDict()
+        self.snapshot_missions = snapshot_missions
+        self.slow_disconnects = 0
+
+    @property
+    def active_connections(self) -> List[WebSocket]:
+        return list(self.channels)
 
-    async def connect(self, websocket: WebSocket):
+    async def connect(self, websocket: WebSocket, owner: Optional[str] = None, **topics: Any):
+        """Accepts the socket for `owner` (a license user_id), subscribed to that user's topic."""
         await websocket.accept()
-        self.active_connections.append(websocket)
-        logger.info(f"[WS] Client connected. Total: {len(self.active_connections)}")
+        channel = ClientChannel(websocket, self.queue_size, owner=owner)
+        channel.task = asyncio.create_task(self._run(channel))
+        self.channels[websocket] = channel
+        if owner is not None:
+            topics.setdefault("user_id", owner)
+        if topics:
+            self.subscribe(websocket, **topics)
+        logger.info(f"[WS] Client connected. Total: {len(self.channels)}")
 
     def disconnect(self, websocket: WebSocket):
-        if websocket in self.active_connections:
-            self.active_connections.remove(websocket)
-        logger.info(f"[WS] Client disconnected. Total: {len(self.active_connections)}")
+        channel = self.channels.pop(websocket, None)
+        if channel is not None:
+            self._unroute(channel, list(channel.topics))
+            if channel.task is not None and channel.task is not asyncio.current_task():
+                channel.task.cancel()
+        logger.info(f"[WS] Client disconnected. Total: {len(self.channels)}")
+
+    # --- TOPIC ROUTING ---
+
+    def register_mission(self, mission_id: str, user_id: str) -> None:
+        """Records who owns a mission; only that user may subscribe to it."""
+        if not mission_id or not user_id or mission_id in self.mission_owners:
+            return
+        self.mission_owners[mission_id] = user_id
+        while len(self.mission_owners) > WS_MISSION_OWNERS:
+            self.mission_owners.popitem(last=False)
+
+    def _allowed(self, channel: ClientChannel, topic: Topic) -> bool:
+        if channel.owner is None:
+            return True
+        key, value = topic
+        if key == "user_id":
+            return value == channel.owner
+        if key == "mission_id":
+            return self.mission_owners.get(value) == channel.owner
+        return True  # Silo: delivery is filtered to the owner's frames
+
+    def subscribe(self, websocket: WebSocket, **topics: Any) -> List[Topic]:
+        """
+        Adds the topic subscriptions this connection's owner is entitled to and sends
+        snapshots of the matching live missions. Refused topics are skipped.
+        """
+        channel = self.channels.get(websocket)
+        if channel is None:
+            return []
+        added = []
+        for key in TOPIC_KEYS:
+            for value in _topic_values(topics.get(key)):
+                topic = (key, value)
+                if topic in channel.topics:
+                    continue
+                if not self._allowed(channel, topic):
+                    logger.warning(f"[WS] Refused subscription to {key}={value} for {channel.owner}")
+                    continue
+                channel.topics.add(topic)
+                self.routes.setdefault(topic, set()).add(channel)
+                added.append(topic)
+        self._send_snapshots(channel, added)
+        return added
+
+    def unsubscribe(self, websocket: WebSocket, **topics: Any) -> List[Topic]:
+        """Drops subscriptions; a client left with none only receives system notices."""
+        channel = self.channels.get(websocket)
+        if channel is None:
+            return []
+        removed = [
+            (key, value) for key in TOPIC_KEYS for value in _topic_values(topics.get(key))
+            if (key, value) in channel.topics
+        ]
+        self._unroute(channel, removed)
+        return removed
+
+    def _unroute(self, channel: ClientChannel, topics: Iterable[Topic]):
+        for topic in topics:
+            channel.topics.discard(topic)
+            subscribers = self.routes.get(topic)
+            if subscribers is not None:
+                subscribers.discard(channel)
+                if not subscribers:
+                    del self.routes[topic]
+
+    def _recipients(self, topics: List[Topic]) -> Iterable[ClientChannel]:
+        if not topics:
+            return list(self.channels.values())  # System notice
+        targets: Set[ClientChannel] = set()
+        for topic in topics:
+            targets |= self.routes.get(topic, set())
+        user_id = dict(topics).get("user_id")
+        # Tenant isolation: restricted clients only ever see their owner's frames
+        return [c for c in targets if c.owner is None or c.owner == user_id]
+
+    # --- LATE-SUBSCRIBER SNAPSHOTS ---
+
+    def _observe(self, message: Any, topics: List[Topic]):
+        """Folds a mission frame into that mission's compact snapshot."""
+        tags = dict(topics)
+        mission_id = tags.get("mission_id")
+        if mission_id and tags.get("user_id"):
+            self.register_mission(mission_id, tags["user_id"])
+        if not mission_id or not isinstance(message, dict):
+            return
+        snap = self.missions.get(mission_id)
+        if snap is None:
+            snap = self.missions[mission_id] = {
+                "type": "snapshot", "mission_id": mission_id, "status": "RUNNING",
+                "diagnostics": deque(maxlen=20),
+            }
+            while len(self.missions) > self.snapshot_missions:
+                self.missions.popitem(last=False)
+        if tags.get("user_id"):
+            snap["user_id"] = tags["user_id"]
+        if tags.get("silo"):
+            snap["silo"] = tags["silo"]
+        kind = message.get("type")
+        if kind == "node_update":
+            snap.update({k: message.get(k) for k in ("node", "agent", "dept", "handoffs")})
+        elif kind == "diagnostic":
+            snap["diagnostics"].append(message.get("text"))
+        elif kind == "audio_chunk":
+            snap["last_message"] = message.get("text")
+        elif kind == "mission_complete":
+            snap["status"] = "COMPLETE"
+        elif kind == "error":
+            snap["status"] = "ERROR"
 
-    async def broadcast(self, message: Any):
-        dead = []
-        for connection in self.active_connections:
+    def track_state(self, mission_id: str, state: Union[Dict[str, Any], Callable[[], Dict[str, Any]]]) -> None:
+        """
+        Attaches a mission's graph state to its snapshot: either the state itself
+        (HUD view built now) or a loader for its latest checkpoint, which is only
+        called when a late subscriber needs the snapshot.
+        """
+        snap = self.missions.get(mission_id)
+        if snap is None or not state:
+            return
+        if callable(state):
+            snap["state_loader"] = state
+        else:
+            snap.pop("state_loader", None)
+            snap["state"] = snapshot(state, max_messages=WS_SNAPSHOT_MESSAGES)
+
+    def _snapshot_frame(self, snap: Dict[str, Any]) -> Dict[str, Any]:
+        frame = {k: v for k, v in snap.items() if k != "state_loader"}
+        frame["diagnostics"] = list(snap["diagnostics"])
+        loader = snap.get("state_loader")
+        if loader is not None:
+            try:
+                state = loader()
+                if state:
+                    frame["state"] = snapshot(state, max_messages=WS_SNAPSHOT_MESSAGES)
+            except Exception as e:
+                logger.warning(f"[WS] Checkpoint unavailable for snapshot of {snap['mission_id']}: {e!r}")
+        return frame
+
+    def _send_snapshots(self, channel: ClientChannel, topics: List[Topic]):
+        for snap in self.missions.values():
+            if channel.owner is not None and snap.get("user_id") != channel.owner:
+                continue
+            if any(snap.get(key) == value for key, value in topics):
+                self.publish(self._snapshot_frame(snap), recipients=[channel])
+
+    # --- FAN-OUT ---
+
+    async def _run(self, channel: ClientChannel):
+        try:
+            await channel.pump()
+        except asyncio.CancelledError:
+            pass
+        except Exception as e:
+            logger.warning(f"[WS] Sender stalled or failed, dropping client: {e!r}")
+            self.disconnect(channel.websocket)
+            await self._close(channel.websocket)
+
+    async def _close(self, websocket: WebSocket, code: int = 1013):
+        try:
+            await websocket.close(code=code)
+        except Exception:
+            pass
+
+    def _evict_slow(self, channel: ClientChannel, reason: Exception):
+        self.slow_disconnects += 1
+        WS_SLOW_DISCONNECTS.inc()
+        logger.warning(f"[WS] Slow consumer disconnected ({reason}).")
+        self.disconnect(channel.websocket)
+        asyncio.create_task(self._close(channel.websocket))
+
+    def publish(self, message: Any, recipients: Optional[Iterable[ClientChannel]] = None, **topics: Any) -> int:
+        """
+        Serializes once and enqueues for every recipient. Never awaits I/O.
+        Frames tagged with topics go to their (entitled) subscribers only.
+        """
+        if recipients is None:
+            frame_topics = _frame_topics(message, topics)
+            self._observe(message, frame_topics)
+            recipients = self._recipients(frame_topics)
+        payload = encode_frame(message)
+        droppable = isinstance(message, dict) and message.get("type") in DROPPABLE_TYPES
+        delivered = 0
+        for channel in list(recipients):
             try:
-                await connection.send_json(message)
-            except Exception:
-                dead.append(connection)
-        for d in dead:
-            self.disconnect(d)
+                channel.offer((droppable, payload))
+                delivered += 1
+            except SlowConsumerError as e:
+                self._evict_slow(channel, e)
+        return delivered
+
+    async def broadcast(self, message: Any, **topics: Any):
+        self.publish(message, **topics)
+
+    def stats(self) -> Dict[str, Any]:
+        """Queue depth / drop counters for diagnostics."""
+        return {
+            "clients": len(self.channels),
+            "topics": len(self.routes),
+            "queued": sum(len(c.frames) for c in self.channels.values()),
+            "dropped": sum(c.dropped for c in self.channels.values()),
+            "slow_disconnects": self.slow_disconnects,
+        }
 
 
 manager = ConnectionManager()
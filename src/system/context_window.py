@@ -0,0 +1,151 @@
+"""
+REALM FORGE: CONTEXT WINDOW v1.0
+PURPOSE: Token-budgeted rolling context for graph nodes. Strips HUD heartbeat/telemetry
+         messages and folds older turns into a compact rolling digest so planner
+         cost and latency stay bounded regardless of re-trace or handoff loop count.
+PATH: F:/agentic_workforce/src/system/context_window.py
+"""
+
+import os
+from typing import Any, List, Optional, Sequence
+
+from langchain_core.messages import BaseMessage, HumanMessage, SystemMessage
+
+from src.utils.token_counter import (
+    MESSAGE_OVERHEAD_TOKENS,
+    count_tokens,
+    message_text,
+    truncate_to_tokens,
+)
+
+# HUD-only chatter emitted by the nodes. Useful on the telemetry socket, noise to the LLM.
+TELEMETRY_MARKERS = ("[PLANNING]", "[STRATEGY]", "[PLAN_LOCKED]", "[ROUND_TABLE]")
+
+_ROLE_LABELS = {"human": "USER", "ai": "AGENT", "tool": "TOOL", "system": "SYSTEM"}
+
+
+def is_telemetry(message: Any) -> bool:
+    """True for heartbeat/telemetry messages that carry no planning signal."""
+    if isinstance(message, HumanMessage):
+        return False
+    text = message_text(message)
+    return any(marker in text for marker in TELEMETRY_MARKERS)
+
+
+def latest_directive(messages: Sequence[Any]) -> str:
+    """Returns the most recent human directive (the mission text), or ''."""
+    for message in reversed(messages):
+        if isinstance(message, HumanMessage):
+            return message_text(message)
+    return ""
+
+
+def _with_content(message: BaseMessage, text: str) -> BaseMessage:
+    """Copies a message with replaced content (pydantic v1/v2 compatible)."""
+    copier = getattr(message, "model_copy", None) or message.copy
+    return copier(update={"content": text})
+
+
+class ContextWindow:
+    """
+    Rolling, token-budgeted view over a mission's message history.
+
+    - The first human directive is always pinned.
+    - Telemetry messages are dropped.
+    - The newest turns are kept verbatim (each capped at max_message_tokens).
+    - Older turns are folded into a single digest message of at most digest_tokens.
+    """
+
+    def __init__(
+        self,
+        budget_tokens: int = 3000,
+        max_message_tokens: int = 600,
+        digest_tokens: int = 400,
+        digest_line_chars: int = 160,
+    ):
+        self.budget_tokens = budget_tokens
+        self.max_message_tokens = max_message_tokens
+        self.digest_tokens = digest_tokens
+        self.digest_line_chars = digest_line_chars
+
+    def compact(self, messages: Sequence[BaseMessage], reserved_tokens: int = 0) -> List[BaseMessage]:
+        """Builds the LLM-facing history within budget_tokens - reserved_tokens."""
+        relevant = [m for m in (messages or []) if not is_telemetry(m)]
+        if not relevant:
+            return []
+
+        # 1. Pin the mission directive (first human turn)
+        budget = self.budget_tokens - max(0, reserved_tokens)
+        directive = next((m for m in relevant if isinstance(m, HumanMessage)), None)
+        rest = [m for m in relevant if m is not directive]
+        pinned: Optional[BaseMessage] = None
+        if directive is not None:
+            pinned = self._cap(directive)
+            budget -= self._cost(pinned)
+
+        # 2. Fill the recent window from newest to oldest
+        window: List[BaseMessage] = []
+        window_budget = budget - self.digest_tokens
+        split = len(rest)
+        for idx in range(len(rest) - 1, -1, -1):
+            candidate = self._cap(rest[idx])
+            cost = self._cost(candidate)
+            if cost > window_budget:
+                break
+            window.append(candidate)
+            window_budget -= cost
+            split = idx
+        window.reverse()
+
+        # 3. Fold everything older than the window into the rolling digest
+        history: List[BaseMessage] = [pinned] if pinned is not None else []
+        digest = self.digest(rest[:split], budget_tokens=min(self.digest_tokens, max(0, budget)))
+        if digest is not None:
+            history.append(digest)
+        history.extend(window)
+        return history
+
+    def digest(self, older: Sequence[BaseMessage], budget_tokens: Optional[int] = None) -> Optional[SystemMessage]:
+        """Extractive one-line-per-turn summary of older turns, newest lines kept first."""
+        if not older:
+            return None
+        budget = self.digest_tokens if budget_tokens is None else budget_tokens
+        header = "ROLLING_DIGEST (earlier turns, condensed):"
+        remaining = budget - count_tokens(header) - MESSAGE_OVERHEAD_TOKENS
+        lines: List[str] = []
+        for message in reversed(older):
+            text = " ".join(message_text(message).split())
+            if not text:
+                continue
+            if len(text) > self.digest_line_chars:
+                text = text[: self.digest_line_chars] + "…"
+            line = f"- [{_ROLE_LABELS.get(getattr(message, 'type', ''), 'MSG')}] {text}"
+            cost = count_tokens(line)
+            if cost > remaining:
+                break
+            lines.append(line)
+            remaining -= cost
+        elided = len(older) - len(lines)
+        if elided:
+            lines.append(f"- ({elided} earlier turns elided)")
+        if not lines:
+            return None
+        lines.reverse()
+        return SystemMessage(content="\n".join([header] + lines))
+
+    def _cap(self, message: BaseMessage) -> BaseMessage:
+        text = message_text(message)
+        if count_tokens(text) <= self.max_message_tokens:
+            return message
+        return _with_content(message, truncate_to_tokens(text, self.max_message_tokens))
+
+    @staticmethod
+    def _cost(message: BaseMessage) -> int:
+        return count_tokens(message_text(message)) + MESSAGE_OVERHEAD_TOKENS
+
+
+# Shared planner window (tunable without a redeploy)
+planner_window = ContextWindow(
+    budget_tokens=int(os.getenv("REALM_PLANNER_CONTEXT_TOKENS", "3000")),
+    max_message_tokens=int(os.getenv("REALM_PLANNER_MESSAGE_TOKENS", "600")),
+)
@@ -0,0 +1,68 @@
+"""
+REALM FORGE: HANDOFF PROTOCOL v1.0
+PURPOSE: task_queue / state deltas for the executor's redundancy handoff.
+         - A failed tool marks its task FAILED, every other still-OPEN task of the
+           plan SKIPPED, and queues a single HANDOFF, all in one update: the
+           abandoned plan can never run alongside (or interleave with) the
+           fallback silo's plan.
+         - The HANDOFF itself either engages the speculative fallback plan
+           (straight back to the executor) or sends the fallback silo to the planner.
+PATH: F:/agentic_workforce/src/system/handoff_protocol.py
+"""
+
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+Task = Dict[str, Any]
+
+
+def cancel_remaining(remaining: Iterable[Task]) -> List[Task]:
+    """SKIPPED updates for the plan's tasks that will not run after a handoff."""
+    return [{"id": t["id"], "status": "SKIPPED"} for t in remaining if (t or {}).get("id")]
+
+
+def fail_and_handoff(task: Task, remaining: Iterable[Task], settled: List[Task]) -> List[Task]:
+    """task_queue delta for a failed tool call: FAILED + leftovers SKIPPED + one HANDOFF."""
+    return (
+        settled
+        + [{"id": (task or {}).get("id"), "status": "FAILED"}]
+        + cancel_remaining(remaining)
+        + [{"tool": "HANDOFF"}]
+    )
+
+
+def handoff_update(
+    state: Dict[str, Any],
+    task: Task,
+    remaining: Iterable[Task],
+    settled: List[Task],
+    specialist_for: Callable[[str], Optional[Dict[str, Any]]],
+) -> Dict[str, Any]:
+    """
+    State update for executing a HANDOFF task (messages excluded). next_node is
+    "executor" when the speculative fallback plan was engaged, "planner" otherwise.
+    """
+    state = state or {}
+    new_silo = state.get("fallback_department", "Architect")
+    handoff = {"from": state.get("active_department"), "to": new_silo}
+    closed = settled + [{"id": (task or {}).get("id"), "status": "DONE"}] + cancel_remaining(remaining)
+
+    # SPECULATIVE SWITCH: Fallback plan already drafted -> execute immediately
+    spec = state.get("speculative_plan") or {}
+    if spec.get("department") == new_silo and spec.get("task_queue"):
+        return {
+            "active_agent": spec.get("agent", "ForgeMaster"),
+            "active_department": new_silo,
+            "handoff_history": [handoff],
+            "task_queue": closed + [dict(t) for t in spec["task_queue"]],
+            "speculative_plan": {},
+            "next_node": "executor",
+        }
+
+    specialist = specialist_for(new_silo)
+    return {
+        "active_agent": specialist["name"] if specialist else "ForgeMaster",
+        "active_department": new_silo,
+        "handoff_history": [handoff],
+        "task_queue": closed,
+        "next_node": "planner",
+    }
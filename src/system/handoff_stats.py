@@ -0,0 +1,96 @@
+"""
+REALM FORGE: HANDOFF STATISTICS v1.0
+PURPOSE: Per-silo handoff rates derived from completed missions' handoff_history.
+         Drives speculative fallback planning for handoff-prone silos.
+PATH: F:/agentic_workforce/src/system/handoff_stats.py
+"""
+
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from src.system.config import DATA_ROOT, logger
+from src.utils.async_io import run_io
+
+HANDOFF_STATS_PATH = DATA_ROOT / "memory" / "handoff_stats.json"
+
+# Below this many recorded missions a silo's rate is considered noise.
+MIN_SAMPLES = int(os.getenv("REALM_HANDOFF_MIN_SAMPLES", "5"))
+SPECULATION_THRESHOLD = float(os.getenv("REALM_SPECULATIVE_HANDOFF_RATE", "0.3"))
+
+
+class HandoffStats:
+    """Persistent mission/handoff counters keyed on the mission's primary silo."""
+
+    def __init__(self, path: Path = HANDOFF_STATS_PATH, min_samples: int = MIN_SAMPLES):
+        self.path = Path(path)
+        self.min_samples = min_samples
+        self._lock = threading.Lock()
+        self._save_lock = threading.Lock()
+        self._stats: Dict[str, Dict[str, int]] = self._load()
+
+    def _load(self) -> Dict[str, Dict[str, int]]:
+        try:
+            if self.path.exists():
+                with open(self.path, "r", encoding="utf-8") as f:
+                    return json.load(f)
+        except Exception as e:
+            logger.warning(f"[HANDOFF_STATS] Unreadable stats file, starting fresh: {e}")
+        return {}
+
+    def _save(self) -> None:
+        with self._save_lock:  # Serializes writers; the newest counters always land last
+            with self._lock:
+                payload = json.dumps(self._stats)
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                tmp = self.path.with_suffix(".tmp")
+                with open(tmp, "w", encoding="utf-8") as f:
+                    f.write(payload)
+                os.replace(tmp, self.path)
+            except Exception as e:
+                logger.warning(f"[HANDOFF_STATS] Persist failed: {e}")
+
+    def _count(self, handoff_history: List[Dict[str, str]], final_silo: Optional[str]) -> bool:
+        history = [h for h in (handoff_history or []) if isinstance(h, dict) and h.get("from")]
+        primary = history[0]["from"] if history else final_silo
+        if not primary:
+            return False
+        with self._lock:
+            entry = self._stats.setdefault(primary, {"missions": 0, "handoffs": 0})
+            entry["missions"] += 1
+            if history:
+                entry["handoffs"] += 1
+        return True
+
+    def record_mission(self, handoff_history: List[Dict[str, str]], final_silo: Optional[str]) -> None:
+        """Counts one finished mission against its primary silo (handoff_history[0]['from'])."""
+        if self._count(handoff_history, final_silo):
+            self._save()
+
+    async def arecord_mission(self, handoff_history: List[Dict[str, str]], final_silo: Optional[str]) -> None:
+        """record_mission() for the event loop: the file write runs on the I/O pool."""
+        if self._count(handoff_history, final_silo):
+            await run_io(self._save)
+
+    def handoff_rate(self, silo: str) -> float:
+        entry = self._stats.get(silo) or {}
+        missions = entry.get("missions", 0)
+        if missions < self.min_samples:
+            return 0.0
+        return entry.get("handoffs", 0) / missions
+
+    def is_handoff_prone(self, silo: str, threshold: float = SPECULATION_THRESHOLD) -> bool:
+        return self.handoff_rate(silo) >= threshold
+
+    def snapshot(self) -> Dict[str, Dict[str, float]]:
+        """Rates for the HUD / diagnostics."""
+        return {
+            silo: {**counts, "rate": round(self.handoff_rate(silo), 3)}
+            for silo, counts in self._stats.items()
+        }
+
+
+handoff_stats = HandoffStats()
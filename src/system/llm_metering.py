@@ -0,0 +1,239 @@
+"""
+REALM FORGE: LLM METERING v1.0
+PURPOSE: Callback-based accounting for every call made through the shared LLM.
+         - LLMMeter (AsyncCallbackHandler) times each call and reads provider token
+           usage (tiktoken estimate when the provider reports none).
+         - Calls are tagged with mission/node/silo: node comes from LangGraph run
+           metadata, silo from {"metadata": {"silo": ...}} on the call, mission and
+           billing identity from metering_scope() (kept out of run metadata/traces).
+         - UsageBook aggregates per mission, node and silo in memory; sinks
+           (billing, metrics) receive each finished call record.
+PATH: F:/agentic_workforce/src/system/llm_metering.py
+"""
+
+import contextvars
+import inspect
+import os
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterator, List, Optional
+from uuid import UUID
+
+from langchain_core.callbacks import AsyncCallbackHandler
+from langchain_core.outputs import LLMResult
+
+from src.system.config import logger
+from src.utils.token_counter import count_message_tokens, count_tokens, message_text
+
+METER_MISSIONS = int(os.getenv("REALM_METER_MISSIONS", "256"))
+
+_SCOPE: contextvars.ContextVar[Dict[str, Any]] = contextvars.ContextVar("realm_metering_scope", default={})
+
+
+@contextmanager
+def metering_scope(**tags: Any) -> Iterator[None]:
+    """Tags every LLM call made in this context (and tasks spawned from it), e.g. mission_id/api_key."""
+    token = _SCOPE.set({**_SCOPE.get(), **{k: v for k, v in tags.items() if v is not None}})
+    try:
+        yield
+    finally:
+        _SCOPE.reset(token)
+
+
+@dataclass
+class LLMCallRecord:
+    mission_id: Optional[str]
+    node: str
+    silo: str
+    model: str
+    prompt_tokens: int
+    completion_tokens: int
+    latency_ms: float
+    timestamp: float
+    estimated: bool = False
+    error: bool = False
+    api_key: Optional[str] = None
+    user_id: Optional[str] = None
+
+    @property
+    def total_tokens(self) -> int:
+        return self.prompt_tokens + self.completion_tokens
+
+
+# ==============================================================================
+# 1. IN-MEMORY AGGREGATION
+# ==============================================================================
+
+def _bucket() -> Dict[str, Any]:
+    return {"calls": 0, "errors": 0, "prompt_tokens": 0, "completion_tokens": 0, "latency_ms": 0.0}
+
+
+def _add(bucket: Dict[str, Any], record: LLMCallRecord) -> None:
+    bucket["calls"] += 1
+    bucket["errors"] += int(record.error)
+    bucket["prompt_tokens"] += record.prompt_tokens
+    bucket["completion_tokens"] += record.completion_tokens
+    bucket["latency_ms"] += record.latency_ms
+
+
+class UsageBook:
+    """Process totals plus per-mission breakdowns (by node and silo) for the most recent missions."""
+
+    def __init__(self, max_missions: int = METER_MISSIONS):
+        self.max_missions = max_missions
+        self.totals = _bucket()
+        self.by_node: Dict[str, Dict[str, Any]] = {}
+        self.missions: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+
+    def add(self, record: LLMCallRecord) -> None:
+        _add(self.totals, record)
+        _add(self.by_node.setdefault(record.node, _bucket()), record)
+        if not record.mission_id:
+            return
+        mission = self.missions.get(record.mission_id)
+        if mission is None:
+            mission = self.missions[record.mission_id] = {"totals": _bucket(), "by_node": {}, "by_silo": {}}
+            while len(self.missions) > self.max_missions:
+                self.missions.popitem(last=False)
+        _add(mission["totals"], record)
+        _add(mission["by_node"].setdefault(record.node, _bucket()), record)
+        _add(mission["by_silo"].setdefault(record.silo, _bucket()), record)
+
+    def mission_usage(self, mission_id: str) -> Dict[str, Any]:
+        mission = self.missions.get(mission_id)
+        if mission is None:
+            return {"totals": _bucket(), "by_node": {}, "by_silo": {}}
+        return {
+            "totals": dict(mission["totals"]),
+            "by_node": {k: dict(v) for k, v in mission["by_node"].items()},
+            "by_silo": {k: dict(v) for k, v in mission["by_silo"].items()},
+        }
+
+
+# ==============================================================================
+# 2. CALLBACK HANDLER
+# ==============================================================================
+
+def _reported_usage(response: LLMResult) -> Optional[tuple]:
+    """(prompt, completion) from llm_output.token_usage (Groq/OpenAI) or message usage_metadata."""
+    output = response.llm_output or {}
+    usage = output.get("token_usage") or output.get("usage")
+    if isinstance(usage, dict) and usage:
+        prompt = usage.get("prompt_tokens", usage.get("input_tokens", 0)) or 0
+        completion = usage.get("completion_tokens", usage.get("output_tokens", 0)) or 0
+        return int(prompt), int(completion)
+    prompt = completion = 0
+    found = False
+    for generations in response.generations:
+        for generation in generations:
+            meta = getattr(getattr(generation, "message", None), "usage_metadata", None)
+            if meta:
+                found = True
+                prompt += meta.get("input_tokens", 0)
+                completion += meta.get("output_tokens", 0)
+    return (prompt, completion) if found else None
+
+
+def _generated_text(response: LLMResult) -> str:
+    return " ".join(
+        message_text(getattr(g, "message", None) or getattr(g, "text", ""))
+        for generations in response.generations for g in generations
+    )
+
+
+class LLMMeter(AsyncCallbackHandler):
+    """Attach once to the shared LLM (callbacks=[llm_meter]); records every call."""
+
+    run_inline = True  # Same task as the caller: metering_scope() is visible
+
+    def __init__(self, book: Optional[UsageBook] = None):
+        self.book = book or UsageBook()
+        self.sinks: List[Callable[[LLMCallRecord], Any]] = []
+        self._inflight: Dict[UUID, Dict[str, Any]] = {}
+
+    def add_sink(self, sink: Callable[[LLMCallRecord], Any]) -> None:
+        """Registers a sync or async consumer of finished call records (idempotent)."""
+        if sink not in self.sinks:
+            self.sinks.append(sink)
+
+    # --- CALLBACKS ---
+
+    def _begin(self, run_id: UUID, serialized: Optional[Dict[str, Any]], prompt: Any, metadata: Optional[Dict[str, Any]]) -> None:
+        metadata = metadata or {}
+        scope = _SCOPE.get()
+        kwargs = (serialized or {}).get("kwargs", {})
+        self._inflight[run_id] = {
+            "start": time.perf_counter(),
+            "prompt": prompt,
+            "mission_id": scope.get("mission_id") or metadata.get("mission_id"),
+            "node": metadata.get("node") or metadata.get("langgraph_node") or scope.get("node") or "unscoped",
+            "silo": metadata.get("silo") or scope.get("silo") or "Architect",
+            "model": kwargs.get("model_name") or kwargs.get("model") or "",
+            "api_key": scope.get("api_key"),
+            "user_id": scope.get("user_id"),
+        }
+
+    async def on_chat_model_start(self, serialized, messages, *, run_id, parent_run_id=None,
+                                  tags=None, metadata=None, **kwargs) -> None:
+        self._begin(run_id, serialized, messages, metadata)
+
+    async def on_llm_start(self, serialized, prompts, *, run_id, parent_run_id=None,
+                           tags=None, metadata=None, **kwargs) -> None:
+        self._begin(run_id, serialized, prompts, metadata)
+
+    async def on_llm_end(self, response: LLMResult, *, run_id, parent_run_id=None, **kwargs) -> None:
+        call = self._inflight.pop(run_id, None)
+        if call is None:
+            return
+        usage = _reported_usage(response)
+        estimated = usage is None
+        if estimated:
+            usage = (self._estimate_prompt(call["prompt"]), count_tokens(_generated_text(response)))
+        model = (response.llm_output or {}).get("model_name") or call["model"]
+        await self._finish(call, usage[0], usage[1], model, estimated=estimated, error=False)
+
+    async def on_llm_error(self, error: BaseException, *, run_id, parent_run_id=None, **kwargs) -> None:
+        call = self._inflight.pop(run_id, None)
+        if call is None:
+            return
+        await self._finish(call, 0, 0, call["model"], estimated=False, error=True)
+
+    # --- RECORDING ---
+
+    @staticmethod
+    def _estimate_prompt(prompt: Any) -> int:
+        batches = prompt if isinstance(prompt, list) else [prompt]
+        total = 0
+        for batch in batches:
+            total += count_message_tokens(batch) if isinstance(batch, list) else count_tokens(str(batch))
+        return total
+
+    async def _finish(self, call: Dict[str, Any], prompt_tokens: int, completion_tokens: int,
+                      model: str, estimated: bool, error: bool) -> None:
+        record = LLMCallRecord(
+            mission_id=call["mission_id"],
+            node=call["node"],
+            silo=call["silo"],
+            model=model,
+            prompt_tokens=prompt_tokens,
+            completion_tokens=completion_tokens,
+            latency_ms=(time.perf_counter() - call["start"]) * 1000,
+            timestamp=time.time(),
+            estimated=estimated,
+            error=error,
+            api_key=call["api_key"],
+            user_id=call["user_id"],
+        )
+        self.book.add(record)
+        for sink in self.sinks:
+            try:
+                result = sink(record)
+                if inspect.isawaitable(result):
+                    await result
+            except Exception as e:
+                logger.warning(f"[METER] Sink {getattr(sink, '__qualname__', sink)} failed: {e}")
+
+
+llm_meter = LLMMeter()
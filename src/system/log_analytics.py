@@ -0,0 +1,496 @@
+"""
+REALM FORGE: LOG ANALYTICS ENGINE v1.0
+PURPOSE: Constant-memory, incremental analysis of (multi-GB) text logs for the arsenal
+         log tools (parse_log_file, analyze_log_file, detect_log_anomalies).
+         - Files are memory-mapped and scanned in newline-aligned chunks; keywords and
+           regexes are compiled into one alternation that rejects non-matching text
+           at C speed, so only hit lines reach Python.
+         - Windowed statistics: events / matches per minute (error rate), top message
+           templates (Drain-style clustering of masked tokens) and anomaly scores for
+           each minute against an EWMA baseline of the minutes before it.
+         - Per (file, pattern set) the byte offset and accumulated statistics persist
+           in data/memory/log_index.json; a rescan only reads bytes appended since.
+           Rotation / truncation (inode change, shrink, different head) resets the state.
+         - follow(): tail mode that yields newly matched lines as the file grows.
+         Only newline-terminated lines advance the persisted offset. A one-shot scan
+         still reports a trailing partial line (the file's last line when it has no
+         final newline); follow() waits for the writer to finish it.
+PATH: F:/agentic_workforce/src/system/log_analytics.py
+"""
+
+import asyncio
+import hashlib
+import json
+import math
+import mmap
+import os
+import re
+import threading
+import time
+from collections import Counter, deque
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, AsyncIterator, Callable, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple, Union
+
+from src.system.config import DATA_ROOT, logger
+from src.utils.async_io import run_io
+
+LOG_INDEX_PATH = DATA_ROOT / "memory" / "log_index.json"
+LOG_SCAN_CHUNK = int(os.getenv("REALM_LOG_SCAN_CHUNK", str(4 * 1024 * 1024)))
+LOG_WINDOW_MINUTES = int(os.getenv("REALM_LOG_WINDOW_MINUTES", "1440"))
+LOG_MAX_TEMPLATES = int(os.getenv("REALM_LOG_MAX_TEMPLATES", "256"))
+LOG_INDEX_MAX_FILES = int(os.getenv("REALM_LOG_INDEX_MAX_FILES", "128"))
+LOG_ANOMALY_Z = float(os.getenv("REALM_LOG_ANOMALY_Z", "3.0"))
+LOG_BASELINE_ALPHA = 0.1  # EWMA weight of the newest minute in the baseline
+LOG_BASELINE_WARMUP = 5  # Minutes of history before a minute can be scored
+LOG_SAMPLE_LINES = 50
+LOG_SAMPLE_CHARS = 500
+_HEAD_BYTES = 1024  # Fingerprint of the file start, to spot rotation to a same-size file
+
+# Leading ISO-ish timestamp ("2024-05-01 13:37:00,123", "[2024-05-01T13:37:00Z] ...")
+_TS_MINUTES = re.compile(rb"^\W{0,3}(\d{4}-\d\d-\d\d[T ]\d\d:\d\d)", re.M)
+_TS_AFTER_NL = re.compile(rb"\n\W{0,3}(\d{4}-\d\d-\d\d[T ]\d\d:\d\d)")  # ~2x faster than ^ + re.M
+_TS_PREFIX = re.compile(r"^\W{0,3}\d{4}-\d\d-\d\d[T ]\d\d:\d\d(?::\d\d)?(?:[.,]\d+)?(?:Z|[+-]\d\d:?\d\d)?\]?\s*")
+
+_MASKS = (
+    (re.compile(r"\b[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}\b"), "<UUID>"),
+    (re.compile(r"\b\d{1,3}(?:\.\d{1,3}){3}(?::\d+)?\b"), "<IP>"),
+    (re.compile(r"\b0x[0-9a-fA-F]+\b|\b[0-9a-fA-F]{16,}\b"), "<HEX>"),
+    (re.compile(r"\"[^\"]*\"|'[^']*'"), "<STR>"),
+    (re.compile(r"(?<![\w<])[-+]?\d+(?:\.\d+)?(?:ms|s|kb|mb|gb|%)?\b", re.I), "<NUM>"),
+)
+_WILDCARD = "<*>"
+
+
+# ==============================================================================
+# 1. PATTERNS
+# ==============================================================================
+
+class PatternSet:
+    """
+    Keywords (literal, case-insensitive by default) plus labelled regexes, compiled
+    into one bytes alternation for scanning and per-pattern regexes for labelling.
+    A keyword-only, case-insensitive set is matched case-sensitively against a
+    lowered copy of each chunk (`fold`), which is far faster than re.IGNORECASE.
+    """
+
+    def __init__(self, keywords: Iterable[str] = (), regexes: Optional[Union[Mapping[str, str], Sequence[str]]] = None,
+                 ignore_case: bool = True):
+        entries: List[Tuple[str, str]] = [(k, re.escape(k)) for k in keywords if k]
+        literal_only = bool(entries) and not regexes
+        if isinstance(regexes, Mapping):
+            entries += [(label, rx) for label, rx in regexes.items() if rx]
+        elif regexes:
+            entries += [(rx, rx) for rx in regexes if rx]
+        if not entries:
+            raise ValueError("PatternSet needs at least one keyword or regex")
+
+        flags = re.IGNORECASE if ignore_case else 0
+        self.labels = [label for label, _ in entries]
+        self.sources = [rx for _, rx in entries]
+        self._compiled = [re.compile(rx, flags) for rx in self.sources]  # Validates each pattern
+        self.fold = ignore_case and literal_only and all(label.isascii() for label in self.labels)
+        if self.fold:
+            self.combined = re.compile("|".join(re.escape(label.lower()) for label in self.labels).encode("ascii"))
+        else:
+            # Chunks hold many lines: ^ and $ must anchor at each line, as labels_for() does
+            self.combined = re.compile("|".join(f"(?:{rx})" for rx in self.sources).encode("utf-8"),
+                                       flags | re.MULTILINE)
+        # Offset indexes built with a different prefilter must not be reused
+        self.signature = hashlib.sha1(json.dumps([self.labels, self.sources, self.combined.flags]).encode("utf-8")).hexdigest()[:16]
+
+    def labels_for(self, line: str) -> List[str]:
+        return [label for label, rx in zip(self.labels, self._compiled) if rx.search(line)]
+
+
+# ==============================================================================
+# 2. TEMPLATE CLUSTERING
+# ==============================================================================
+
+def _tokens(message: str) -> List[str]:
+    for rx, mask in _MASKS:
+        message = rx.sub(mask, message)
+    return message.split()
+
+
+class TemplateMiner:
+    """
+    Drain-style online clustering: messages are masked (numbers, IPs, ids...) and
+    grouped by (token count, first token); within a group a message joins the most
+    similar template (share of equal tokens >= `similarity`), differing positions
+    becoming <*>. At most `max_templates` are kept; the rarest is evicted first.
+    """
+
+    def __init__(self, max_templates: int = LOG_MAX_TEMPLATES, similarity: float = 0.5):
+        self.max_templates = max_templates
+        self.similarity = similarity
+        self._groups: Dict[Tuple[int, str], List[Dict[str, Any]]] = {}
+        self._size = 0
+
+    def add(self, message: str) -> str:
+        tokens = _tokens(message)
+        if not tokens:
+            return ""
+        group = self._groups.setdefault((len(tokens), tokens[0]), [])
+        best, best_score = None, -1.0
+        for cluster in group:
+            same = sum(1 for a, b in zip(cluster["tokens"], tokens) if a == b or a == _WILDCARD)
+            score = same / len(tokens)
+            if score > best_score:
+                best, best_score = cluster, score
+        if best is not None and best_score >= self.similarity:
+            best["tokens"] = [a if a == b else _WILDCARD for a, b in zip(best["tokens"], tokens)]
+            best["count"] += 1
+            return " ".join(best["tokens"])
+        if self._size >= self.max_templates:
+            self._evict()
+            group = self._groups.setdefault((len(tokens), tokens[0]), [])  # Eviction may drop an emptied group
+        group.append({"tokens": tokens, "count": 1, "sample": message[:LOG_SAMPLE_CHARS]})
+        self._size += 1
+        return " ".join(tokens)
+
+    def _evict(self) -> None:
+        key, rarest = min(
+            ((key, cluster) for key, group in self._groups.items() for cluster in group),
+            key=lambda item: item[1]["count"],
+        )
+        self._groups[key].remove(rarest)
+        if not self._groups[key]:
+            del self._groups[key]
+        self._size -= 1
+
+    def top(self, n: int = 10) -> List[Dict[str, Any]]:
+        clusters = sorted((c for group in self._groups.values() for c in group), key=lambda c: -c["count"])
+        return [{"template": " ".join(c["tokens"]), "count": c["count"], "sample": c["sample"]} for c in clusters[:n]]
+
+    def to_state(self) -> List[Dict[str, Any]]:
+        return [c for group in self._groups.values() for c in group]
+
+    @classmethod
+    def from_state(cls, clusters: Iterable[Dict[str, Any]], **kwargs: Any) -> "TemplateMiner":
+        miner = cls(**kwargs)
+        for c in clusters:
+            tokens = list(c["tokens"])
+            miner._groups.setdefault((len(tokens), tokens[0]), []).append(
+                {"tokens": tokens, "count": int(c["count"]), "sample": c.get("sample", "")})
+            miner._size += 1
+        return miner
+
+
+# ==============================================================================
+# 3. SCAN STATE
+# ==============================================================================
+
+@dataclass
+class LogScanState:
+    """Everything needed to resume a scan of one file for one PatternSet."""
+    path: str
+    signature: str
+    dev: int = 0
+    inode: int = 0
+    head: str = ""
+    offset: int = 0
+    lines: int = 0
+    matches: int = 0
+    by_pattern: Dict[str, int] = field(default_factory=dict)
+    minutes: Dict[str, List[int]] = field(default_factory=dict)  # minute -> [events, matches]
+    samples: deque = field(default_factory=lambda: deque(maxlen=LOG_SAMPLE_LINES))
+    templates: TemplateMiner = field(default_factory=TemplateMiner)
+    updated_at: float = 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "path": self.path, "signature": self.signature, "dev": self.dev, "inode": self.inode,
+            "head": self.head, "offset": self.offset, "lines": self.lines, "matches": self.matches,
+            "by_pattern": self.by_pattern, "minutes": self.minutes, "samples": list(self.samples),
+            "templates": self.templates.to_state(), "updated_at": self.updated_at,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "LogScanState":
+        return cls(
+            path=data["path"], signature=data["signature"], dev=data.get("dev", 0), inode=data.get("inode", 0),
+            head=data.get("head", ""), offset=data.get("offset", 0), lines=data.get("lines", 0),
+            matches=data.get("matches", 0), by_pattern=dict(data.get("by_pattern", {})),
+            minutes={k: list(v) for k, v in data.get("minutes", {}).items()},
+            samples=deque(data.get("samples", []), maxlen=LOG_SAMPLE_LINES),
+            templates=TemplateMiner.from_state(data.get("templates", [])),
+            updated_at=data.get("updated_at", 0.0),
+        )
+
+
+def _head_digest(f, length: int) -> str:
+    f.seek(0)
+    return hashlib.sha1(f.read(min(length, _HEAD_BYTES))).hexdigest()
+
+
+def _minute_key(raw: bytes) -> str:
+    return raw.decode("ascii").replace("T", " ")
+
+
+def score_minutes(minutes: Mapping[str, Sequence[int]], alpha: float = LOG_BASELINE_ALPHA,
+                  warmup: int = LOG_BASELINE_WARMUP) -> List[Dict[str, Any]]:
+    """
+    Per minute (oldest first): events, matches, rate and a z-score of `matches`
+    against the EWMA mean/variance of the preceding minutes (None during warmup).
+    """
+    scored = []
+    mean = var = 0.0
+    for i, minute in enumerate(sorted(minutes)):
+        events, matches = minutes[minute]
+        score = None
+        if i >= warmup:
+            score = round((matches - mean) / max(math.sqrt(var), 1.0), 2)
+        if i == 0:
+            mean = float(matches)
+        else:
+            delta = matches - mean
+            mean += alpha * delta
+            var = (1 - alpha) * (var + alpha * delta * delta)
+        scored.append({
+            "minute": minute, "events": events, "matches": matches,
+            "rate": round(matches / events, 4) if events else None, "score": score,
+        })
+    return scored
+
+
+# ==============================================================================
+# 4. ANALYZER
+# ==============================================================================
+
+class LogAnalyzer:
+    """Scans logs incrementally and keeps their offsets and statistics in a JSON index."""
+
+    def __init__(self, index_path: Path = LOG_INDEX_PATH, chunk_size: int = LOG_SCAN_CHUNK,
+                 window_minutes: int = LOG_WINDOW_MINUTES, max_files: int = LOG_INDEX_MAX_FILES):
+        self.index_path = Path(index_path)
+        self.chunk_size = chunk_size
+        self.window_minutes = window_minutes
+        self.max_files = max_files
+        self._lock = threading.Lock()  # Guards the index dict and file
+        self._scan_locks: Dict[str, threading.Lock] = {}  # One scan per (file, patterns) at a time
+        self._index: Optional[Dict[str, Dict[str, Any]]] = None
+
+    # --- INDEX PERSISTENCE ---
+
+    def _load_index(self) -> Dict[str, Dict[str, Any]]:
+        if self._index is None:
+            self._index = {}
+            try:
+                if self.index_path.exists():
+                    with open(self.index_path, "r", encoding="utf-8") as f:
+                        self._index = json.load(f)
+            except Exception as e:
+                logger.warning(f"[LOG_ANALYTICS] Unreadable offset index, starting fresh: {e}")
+        return self._index
+
+    def _save_index(self) -> None:
+        index = self._load_index()
+        if len(index) > self.max_files:
+            for key in sorted(index, key=lambda k: index[k].get("updated_at", 0))[:len(index) - self.max_files]:
+                del index[key]
+        try:
+            self.index_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.index_path.with_suffix(".tmp")
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(index, f)
+            os.replace(tmp, self.index_path)
+        except Exception as e:
+            logger.warning(f"[LOG_ANALYTICS] Persist failed: {e}")
+
+    @staticmethod
+    def _key(path: Path, patterns: PatternSet) -> str:
+        return f"{path}|{patterns.signature}"
+
+    # --- SCANNING ---
+
+    def scan(self, path: Union[str, Path], patterns: PatternSet, incremental: bool = True,
+             on_match: Optional[Callable[[str, List[str]], None]] = None,
+             include_tail: bool = True) -> Dict[str, Any]:
+        """
+        Brings the statistics of `path` up to date and returns report(). With
+        incremental=False the persisted state is discarded and the file re-read.
+        `on_match(line, labels)` sees every newly matched line. With include_tail the
+        unterminated last line is counted in this report only: it is not persisted,
+        so it is scanned again (once) when its newline arrives.
+        """
+        path = Path(path).resolve()
+        key = self._key(path, patterns)
+        with self._lock:
+            scan_lock = self._scan_locks.setdefault(key, threading.Lock())
+        with scan_lock:
+            with self._lock:
+                stored = self._load_index().get(key) if incremental else None
+            state = LogScanState.from_dict(stored) if stored else LogScanState(path=str(path), signature=patterns.signature)
+            scanned = self._scan_file(path, patterns, state, on_match)
+            self._prune(state)
+            state.updated_at = time.time()
+            with self._lock:
+                self._load_index()[key] = state.to_dict()
+                self._save_index()
+            if include_tail:
+                state = LogScanState.from_dict(state.to_dict())  # Report-only copy
+                scanned += self._scan_tail(path, patterns, state, on_match)
+        return self.report(state, bytes_scanned=scanned)
+
+    async def ascan(self, path: Union[str, Path], patterns: PatternSet, incremental: bool = True) -> Dict[str, Any]:
+        return await run_io(self.scan, path, patterns, incremental)
+
+    def _scan_file(self, path: Path, patterns: PatternSet, state: LogScanState,
+                   on_match: Optional[Callable[[str, List[str]], None]]) -> int:
+        with open(path, "rb") as f:
+            st = os.fstat(f.fileno())
+            size = st.st_size
+            rotated = (state.dev, state.inode) != (st.st_dev, st.st_ino) or size < state.offset
+            if not rotated and state.offset and _head_digest(f, state.offset) != state.head:
+                rotated = True
+            if rotated and (state.offset or state.inode):
+                logger.info(f"[LOG_ANALYTICS] {path.name} rotated or truncated; rescanning from 0")
+                state.__dict__.update(LogScanState(path=state.path, signature=state.signature).__dict__)
+            state.dev, state.inode = st.st_dev, st.st_ino
+            if size == state.offset or size == 0:
+                return 0
+
+            start = state.offset
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                pos = start
+                while pos < size:
+                    end = min(pos + self.chunk_size, size)
+                    nl = mm.rfind(b"\n", pos, end)
+                    if nl == -1:
+                        nl = mm.find(b"\n", end, size)  # One line longer than a chunk
+                        if nl == -1:
+                            break  # Unterminated tail: the writer is mid-line
+                    end = nl + 1
+                    self._scan_chunk(mm[pos:end], patterns, state, on_match)
+                    pos = end
+            state.offset = pos
+            if start < _HEAD_BYTES:
+                state.head = _head_digest(f, pos)
+            return pos - start
+
+    def _scan_tail(self, path: Path, patterns: PatternSet, state: LogScanState,
+                   on_match: Optional[Callable[[str, List[str]], None]]) -> int:
+        """Scans the bytes after state.offset (the unterminated last line) into `state`."""
+        with open(path, "rb") as f:
+            f.seek(state.offset)
+            tail = f.read()
+        if not tail:
+            return 0
+        self._scan_chunk(tail, patterns, state, on_match)
+        if not tail.endswith(b"\n"):
+            state.lines += 1
+        return len(tail)
+
+    @staticmethod
+    def _scan_chunk(chunk: bytes, patterns: PatternSet, state: LogScanState,
+                    on_match: Optional[Callable[[str, List[str]], None]]) -> None:
+        state.lines += chunk.count(b"\n")
+        minutes = state.minutes
+        stamps = Counter(_TS_AFTER_NL.findall(chunk))  # Chunks start on a line boundary:
+        first = _TS_MINUTES.match(chunk)               # the first line has no preceding \n
+        if first:
+            stamps[first.group(1)] += 1
+        for minute, count in stamps.items():
+            bucket = minutes.setdefault(_minute_key(minute), [0, 0])
+            bucket[0] += count
+
+        # bytes.lower() only folds ASCII, so offsets in `haystack` are offsets in `chunk`
+        haystack = chunk.lower() if patterns.fold else chunk
+        search = patterns.combined.search
+        pos = 0
+        while True:
+            m = search(haystack, pos)
+            if m is None:
+                break
+            start = chunk.rfind(b"\n", 0, m.start()) + 1
+            end = chunk.find(b"\n", m.start())
+            if end == -1:
+                end = len(chunk)
+            raw = chunk[start:end]
+            pos = end + 1
+
+            line = raw.decode("utf-8", "replace").rstrip("\r")
+            labels = patterns.labels_for(line) or patterns.labels[:1]
+            state.matches += 1
+            for label in labels:
+                state.by_pattern[label] = state.by_pattern.get(label, 0) + 1
+            ts = _TS_MINUTES.match(raw)
+            if ts:
+                minutes.setdefault(_minute_key(ts.group(1)), [0, 0])[1] += 1
+            state.templates.add(_TS_PREFIX.sub("", line, count=1))
+            state.samples.append(line[:LOG_SAMPLE_CHARS])
+            if on_match is not None:
+                on_match(line, labels)
+
+    def _prune(self, state: LogScanState) -> None:
+        excess = len(state.minutes) - self.window_minutes
+        if excess > 0:
+            for minute in sorted(state.minutes)[:excess]:
+                del state.minutes[minute]
+
+    # --- REPORTING ---
+
+    @staticmethod
+    def report(state: LogScanState, bytes_scanned: int = 0, minutes: int = 60,
+               templates: int = 10, z_threshold: float = LOG_ANOMALY_Z) -> Dict[str, Any]:
+        scored = score_minutes(state.minutes)
+        anomalies = sorted((m for m in scored if m["score"] is not None and m["score"] >= z_threshold),
+                           key=lambda m: -m["score"])
+        return {
+            "path": state.path,
+            "offset": state.offset,
+            "bytes_scanned": bytes_scanned,
+            "lines": state.lines,
+            "matches": state.matches,
+            "by_pattern": dict(state.by_pattern),
+            "per_minute": scored[-minutes:],
+            "top_templates": state.templates.top(templates),
+            "anomalies": anomalies[:10],
+            "samples": list(state.samples),
+        }
+
+    # --- TAIL / FOLLOW ---
+
+    async def follow(self, path: Union[str, Path], patterns: PatternSet, poll_interval: float = 1.0,
+                     max_polls: Optional[int] = None) -> AsyncIterator[List[Dict[str, Any]]]:
+        """
+        Tails `path` from its persisted offset, yielding a batch of newly matched lines
+        ({"line", "labels"}) whenever the file grows. Stops after `max_polls` polls
+        (forever when None) or when the consumer stops iterating.
+        """
+        polls = 0
+        while max_polls is None or polls < max_polls:
+            batch: List[Dict[str, Any]] = []
+            await run_io(self.scan, path, patterns, True,
+                         lambda line, labels: batch.append({"line": line, "labels": labels}), False)
+            if batch:
+                yield batch
+            polls += 1
+            if max_polls is None or polls < max_polls:
+                await asyncio.sleep(poll_interval)
+
+
+def format_report(report: Dict[str, Any], minutes: int = 10) -> str:
+    """Markdown summary of a LogAnalyzer report for the HUD / agents."""
+    lines = [
+        f"### [LOG_ANALYTICS]: {Path(report['path']).name}",
+        f"- Lines: {report['lines']} | Matches: {report['matches']} | New bytes scanned: {report['bytes_scanned']}",
+    ]
+    if report["by_pattern"]:
+        lines.append("- By pattern: " + ", ".join(f"{k}={v}" for k, v in report["by_pattern"].items()))
+    recent = [m for m in report["per_minute"] if m["matches"]][-minutes:]
+    if recent:
+        lines.append("\n#### Error rate per minute")
+        lines += [f"- {m['minute']}: {m['matches']}/{m['events']}" + (f" ({m['rate']:.1%})" if m["rate"] is not None else "")
+                  for m in recent]
+    if report["top_templates"]:
+        lines.append("\n#### Top templates")
+        lines += [f"- {t['count']}x `{t['template']}`" for t in report["top_templates"]]
+    if report["anomalies"]:
+        lines.append("\n#### Anomalies (vs rolling baseline)")
+        lines += [f"- {a['minute']}: {a['matches']} matches (z={a['score']})" for a in report["anomalies"]]
+    return "\n".join(lines)
+
+
+log_analyzer = LogAnalyzer()
@@ -0,0 +1,317 @@
+"""
+REALM FORGE: METRICS v1.0
+PURPOSE: In-process Prometheus metrics (text exposition format 0.0.4), no client library.
+         - Counter / Gauge / Histogram with labelled children cached per label tuple:
+           the hot path is a dict lookup, a bisect and two float adds.
+         - Scrape-time collectors refresh gauges that mirror live structures
+           (WebSocket queues, TTS pool, billing ledger) instead of tracking every change.
+         - Served by GET /metrics in src/app.py.
+PATH: F:/agentic_workforce/src/system/metrics.py
+"""
+
+import functools
+import re
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Sequence, Tuple
+
+# Seconds: sub-millisecond SQLite reads up to multi-second LLM calls
+DEFAULT_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+TOKEN_BUCKETS = (64, 256, 512, 1024, 2048, 4096, 8192, 16384, 32768)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def _escape(value: Any) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[Any], extra: str = "") -> str:
+    parts = [f'{n}="{_escape(v)}"' for n, v in zip(names, values)]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+
+# ==============================================================================
+# 1. METRIC TYPES
+# ==============================================================================
+
+class _Metric:
+    type_name = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._children: Dict[Tuple[str, ...], Any] = {}
+        if not self.labelnames:
+            self._default = self.labels()
+
+    def labels(self, *values: Any) -> Any:
+        key = tuple(str(v) for v in values)
+        child = self._children.get(key)
+        if child is None:
+            if len(key) != len(self.labelnames):
+                raise ValueError(f"{self.name} expects labels {self.labelnames}, got {key}")
+            child = self._children[key] = self._new_child()
+        return child
+
+    def _new_child(self) -> Any:
+        raise NotImplementedError
+
+    def clear(self) -> None:
+        self._children.clear()
+        if not self.labelnames:
+            self._default = self.labels()
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.type_name}"]
+        for key, child in list(self._children.items()):
+            lines.extend(self._render_child(key, child))
+        return lines
+
+    def _render_child(self, key: Tuple[str, ...], child: Any) -> List[str]:
+        return [f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(child.value)}"]
+
+
+class _Value:
+    __slots__ = ("value",)
+
+    def __init__(self):
+        self.value = 0.0
+
+    def inc(self, amount: float = 1.0) -> None:
+        self.value += amount
+
+    def dec(self, amount: float = 1.0) -> None:
+        self.value -= amount
+
+    def set(self, value: float) -> None:
+        self.value = value
+
+
+class Counter(_Metric):
+    type_name = "counter"
+
+    def _new_child(self) -> _Value:
+        return _Value()
+
+    def inc(self, amount: float = 1.0) -> None:
+        self._default.inc(amount)
+
+
+class Gauge(_Metric):
+    type_name = "gauge"
+
+    def _new_child(self) -> _Value:
+        return _Value()
+
+    def set(self, value: float) -> None:
+        self._default.set(value)
+
+    def inc(self, amount: float = 1.0) -> None:
+        self._default.inc(amount)
+
+
+class _HistogramChild:
+    __slots__ = ("bounds", "counts", "sum", "count")
+
+    def __init__(self, bounds: Tuple[float, ...]):
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)  # Last slot: +Inf
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    @contextmanager
+    def time(self) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start)
+
+
+class Histogram(_Metric):
+    type_name = "histogram"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = (), buckets: Sequence[float] = DEFAULT_BUCKETS):
+        self.bounds = tuple(sorted(float(b) for b in buckets))
+        super().__init__(name, documentation, labelnames)
+
+    def _new_child(self) -> _HistogramChild:
+        return _HistogramChild(self.bounds)
+
+    def observe(self, value: float) -> None:
+        self._default.observe(value)
+
+    def time(self):
+        return self._default.time()
+
+    def _render_child(self, key: Tuple[str, ...], child: _HistogramChild) -> List[str]:
+        lines, cumulative = [], 0
+        for bound, count in zip(self.bounds + (float("inf"),), child.counts):
+            cumulative += count
+            le = f'le="{_format_value(bound)}"'
+            lines.append(f"{self.name}_bucket{_format_labels(self.labelnames, key, le)} {cumulative}")
+        labels = _format_labels(self.labelnames, key)
+        lines.append(f"{self.name}_sum{labels} {_format_value(child.sum)}")
+        lines.append(f"{self.name}_count{labels} {child.count}")
+        return lines
+
+
+# ==============================================================================
+# 2. REGISTRY
+# ==============================================================================
+
+class MetricsRegistry:
+    def __init__(self):
+        self._metrics: Dict[str, _Metric] = {}
+        self._collectors: List[Callable[[], None]] = []
+
+    def register(self, metric: _Metric) -> _Metric:
+        if metric.name in self._metrics:
+            raise ValueError(f"Duplicate metric: {metric.name}")
+        self._metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self.register(Counter(name, documentation, labelnames))
+
+    def gauge(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Gauge:
+        return self.register(Gauge(name, documentation, labelnames))
+
+    def histogram(self, name: str, documentation: str, labelnames: Sequence[str] = (), buckets: Sequence[float] = DEFAULT_BUCKETS) -> Histogram:
+        return self.register(Histogram(name, documentation, labelnames, buckets))
+
+    def add_collector(self, collector: Callable[[], None]) -> None:
+        """Runs `collector` before every scrape (idempotent registration)."""
+        if collector not in self._collectors:
+            self._collectors.append(collector)
+
+    def render(self) -> str:
+        for collector in self._collectors:
+            try:
+                collector()
+            except Exception:
+                pass  # A broken collector must not take the whole scrape down
+        lines: List[str] = []
+        for metric in self._metrics.values():
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+registry = MetricsRegistry()
+
+# ==============================================================================
+# 3. REALM FORGE METRICS
+# ==============================================================================
+
+NODE_LATENCY = registry.histogram("realm_node_latency_seconds", "LangGraph brain node execution time.", ["node"])
+NODE_ERRORS = registry.counter("realm_node_errors_total", "LangGraph brain nodes that raised.", ["node"])
+
+TOOL_LATENCY = registry.histogram("realm_tool_latency_seconds", "Arsenal tool execution time.", ["tool"])
+TOOL_CALLS = registry.counter("realm_tool_calls_total", "Arsenal tool executions by outcome (ok|error).", ["tool", "outcome"])
+
+LLM_LATENCY = registry.histogram("realm_llm_latency_seconds", "LLM call latency.", ["node", "model"])
+LLM_TOKENS = registry.counter("realm_llm_tokens_total", "LLM tokens by kind (prompt|completion).", ["node", "kind"])
+LLM_CALL_TOKENS = registry.histogram("realm_llm_call_tokens", "Total tokens per LLM call.", ["node"], buckets=TOKEN_BUCKETS)
+LLM_ERRORS = registry.counter("realm_llm_errors_total", "Failed LLM calls.", ["node"])
+
+MEMORY_RECALL_LATENCY = registry.histogram("realm_memory_recall_seconds", "MemoryManager.recall latency.")
+
+SQLITE_LATENCY = registry.histogram("realm_sqlite_op_seconds", "licenses.db operation time (incl. pool wait).", ["op"])
+
+WS_CLIENTS = registry.gauge("realm_ws_clients", "Connected telemetry WebSocket clients.")
+WS_QUEUED_FRAMES = registry.gauge("realm_ws_queued_frames", "Frames waiting in per-client send queues.")
+WS_MAX_QUEUE_DEPTH = registry.gauge("realm_ws_max_queue_depth", "Deepest per-client send queue.")
+WS_DROPPED_FRAMES = registry.counter("realm_ws_dropped_frames_total", "Droppable frames shed for slow clients.")
+WS_SLOW_DISCONNECTS = registry.counter("realm_ws_slow_disconnects_total", "Clients disconnected as slow consumers.")
+
+TTS_QUEUED = registry.gauge("realm_tts_queued_jobs", "Utterances waiting for a synthesis worker.")
+LEDGER_PENDING = registry.gauge("realm_ledger_pending_charges", "Journaled credit charges not yet flushed to licenses.db.")
+
+
+# ==============================================================================
+# 4. INSTRUMENTATION HELPERS
+# ==============================================================================
+
+def timed_node(name: str, fn: Callable[..., Any]) -> Callable[..., Any]:
+    """Wraps an async LangGraph node so its latency (and failures) are recorded under `name`."""
+    latency = NODE_LATENCY.labels(name)
+
+    @functools.wraps(fn)
+    async def node(state, *args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return await fn(state, *args, **kwargs)
+        except BaseException:
+            NODE_ERRORS.labels(name).inc()
+            raise
+        finally:
+            latency.observe(time.perf_counter() - start)
+
+    return node
+
+
+# Failure markers at the head of a tool result: "[ERROR] ...", "[HTTP_ERROR]", "❌ [NET_FAULT]",
+# "[SEARCH_THROTTLED]"... Only the head counts, so results that merely quote an error don't
+_TOOL_ERROR = re.compile(
+    r"\[[A-Z_]*(?:ERROR|FAULT|FAIL|FAILED|THROTTLED|NOT_FOUND|OFFLINE)[A-Z_]*\]|\u274c|Throttled|None found"
+)
+_TOOL_ERROR_HEAD_CHARS = 120
+
+
+def is_tool_error(result: Any) -> bool:
+    """The one tool-failure rule: the executor's handoff trigger and realm_tool_calls_total."""
+    return bool(_TOOL_ERROR.search(str(result).lstrip()[:_TOOL_ERROR_HEAD_CHARS]))
+
+
+def observe_tool(tool: str, seconds: float, ok: bool) -> None:
+    TOOL_LATENCY.labels(tool).observe(seconds)
+    TOOL_CALLS.labels(tool, "ok" if ok else "error").inc()
+
+
+def record_llm_call(record: Any) -> None:
+    """LLMMeter sink (see src/system/llm_metering.py)."""
+    node = record.node
+    LLM_LATENCY.labels(node, record.model or "unknown").observe(record.latency_ms / 1000)
+    if record.error:
+        LLM_ERRORS.labels(node).inc()
+        return
+    LLM_TOKENS.labels(node, "prompt").inc(record.prompt_tokens)
+    LLM_TOKENS.labels(node, "completion").inc(record.completion_tokens)
+    LLM_CALL_TOKENS.labels(node).observe(record.prompt_tokens + record.completion_tokens)
+
+
+def collect_connection_stats(manager: Any) -> Callable[[], None]:
+    """Scrape-time collector for a ConnectionManager's queue depths."""
+    def collect() -> None:
+        stats = manager.stats()
+        WS_CLIENTS.set(stats["clients"])
+        WS_QUEUED_FRAMES.set(stats["queued"])
+        WS_MAX_QUEUE_DEPTH.set(max((len(c.frames) for c in list(manager.channels.values())), default=0))
+    return collect
+
+
+def collect_pipeline_stats(vocal_pipeline: Any, credit_ledger: Any) -> Callable[[], None]:
+    def collect() -> None:
+        TTS_QUEUED.set(vocal_pipeline.stats()["queued"])
+        LEDGER_PENDING.set(credit_ledger.stats()["pending"])
+    return collect
+
+
+def render_metrics() -> str:
+    return registry.render()
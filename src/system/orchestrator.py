@@ -18,6 +18,7 @@ from typing import List, Dict, Any, Optional
 from realm_core import app as brain_graph, get_industrial_specialist, extract_json, get_llm
 from src.system.state import get_initial_state, RealmForgeState
 from src.memory.engine import MemoryManager
+from src.system.llm_metering import metering_scope
 from langchain_core.messages import HumanMessage, AIMessage, SystemMessage
 
 # --- PHYSICAL ANCHOR ---
@@ -62,7 +63,7 @@ class MissionOrchestrator:
         }}
         """
         try:
-            res = await self.llm.ainvoke([SystemMessage(content=prompt)])
+            res = await self.llm.ainvoke([SystemMessage(content=prompt)], config={"metadata": {"node": "orchestrator"}})
             # AUTO-HEAL: Ensure result is never None
             strategy = extract_json(res.content)
             if strategy is None:
@@ -86,8 +87,9 @@ class MissionOrchestrator:
         state["messages"].append(HumanMessage(content=directive))
         state["metadata"]["user_id"] = user_id
 
-        # 2. Draft Strategy
-        strategy = await self.draft_mission_strategy(directive)
+        # 2. Draft Strategy (metered against this mission)
+        with metering_scope(mission_id=state["mission_id"], user_id=user_id):
+            strategy = await self.draft_mission_strategy(directive)
         # Defensive check: if strategy Drafter failed, use an empty dict to avoid NoneType
         strategy = strategy or {}
         state["mission_strategy"] = strategy
@@ -98,8 +100,15 @@ class MissionOrchestrator:
             f"🚀 [ORCHESTRATOR] Strike {state['mission_id']} Initiated: {title}"
         )
 
-        # 3. Execute through Sovereign Brain (LangGraph)
-        final_state = await brain_graph.ainvoke(state)
+        # 3. Execute through Sovereign Brain (LangGraph): one checkpoint thread per mission
+        config = {"configurable": {"thread_id": state["mission_id"]}}
+        try:
+            with metering_scope(mission_id=state["mission_id"], user_id=user_id):
+                final_state = await brain_graph.ainvoke(state, config)
+        finally:
+            # Checkpoints only live as long as their mission
+            if brain_graph.checkpointer:
+                brain_graph.checkpointer.delete_thread(state["mission_id"])
 
         # 4. Final Audit - Guarded against missing strategy keys
         steps_count = len((strategy or {}).get('steps', []))
@@ -150,7 +159,11 @@ class MissionOrchestrator:
             Provide your expert industrial input for this mission. 
             Be concise, technical, and focus on your sector's contribution.
             """
-            res = await self.llm.ainvoke([SystemMessage(content=prompt)])
+            with metering_scope(mission_id=mission_id):
+                res = await self.llm.ainvoke(
+                    [SystemMessage(content=prompt)],
+                    config={"metadata": {"node": "round_table", "silo": (p or {}).get('department', 'Architect')}},
+                )
             contribution = f"[{p_name} - {p_role}]: {res.content}"
             meeting_transcript.append(contribution)
 
@@ -0,0 +1,442 @@
+"""
+REALM FORGE: CONTENT SEARCH INDEX v1.0
+PURPOSE: Persistent trigram index over the project tree (data/ included) and the client
+         workspaces, backing grep_files and lattice_scout_search.
+         - The content-addressed artifact objects are left out: every one of them is a
+           copy of a file that is already indexed under its real path.
+         - SQLite FTS5 with the trigram tokenizer holds every text file's content;
+           a files table holds path, name, mtime_ns and size for every file.
+         - refresh() re-stats the roots at most every REALM_SEARCH_REFRESH_SECONDS and
+           re-reads only files whose (mtime_ns, size) changed; vanished files are dropped.
+           Files written through src.utils.async_io are marked dirty and re-read by the
+           next query even inside that window.
+         - grep(): the literal substrings a regex cannot match without are turned into
+           an FTS5 query, so only candidate files are regex-scanned (from the index,
+           not the disk). Results are line-level, with context lines.
+         - find_files(): glob over file names straight from the files table.
+         WAL mode: queries run on per-thread read connections while a refresh writes.
+PATH: F:/agentic_workforce/src/system/search_index.py
+"""
+
+import fnmatch
+import os
+import re
+import sqlite3
+import stat
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Set, Tuple, Union
+
+try:
+    import re._parser as sre_parse  # Python 3.11+
+    from re._constants import BRANCH, LITERAL, MAX_REPEAT, MIN_REPEAT, SUBPATTERN
+except ImportError:  # pragma: no cover - Python 3.10
+    import sre_parse
+    from sre_constants import BRANCH, LITERAL, MAX_REPEAT, MIN_REPEAT, SUBPATTERN
+
+from src.memory.artifact_store import ARTIFACT_OBJECTS_ROOT
+from src.system.config import DATA_ROOT, ROOT_DIR, WORKSPACE_ROOT, logger
+from src.utils.async_io import on_write, run_io
+
+SEARCH_INDEX_PATH = DATA_ROOT / "memory" / "search_index.db"
+SEARCH_ROOTS = (ROOT_DIR, WORKSPACE_ROOT)
+SEARCH_REFRESH_SECONDS = float(os.getenv("REALM_SEARCH_REFRESH_SECONDS", "30"))
+SEARCH_MAX_FILE_BYTES = int(os.getenv("REALM_SEARCH_MAX_FILE_BYTES", str(1024 * 1024)))
+SEARCH_EXCLUDE_DIRS = frozenset({".git", "node_modules", "__pycache__", "chroma_db", "forge_env", ".next", ".venv", "venv"})
+SEARCH_EXCLUDE_PATHS = (ARTIFACT_OBJECTS_ROOT,)  # Skipped by full path (names are too generic)
+_BATCH = 500  # Files per write transaction during refresh
+_BINARY_PROBE = 8192
+
+
+# ==============================================================================
+# 1. REGEX -> TRIGRAM PREFILTER
+# ==============================================================================
+
+def _required(parsed) -> Optional[List[List[str]]]:
+    """
+    Disjunctive normal form of the literals a parsed pattern requires:
+    [[a, b], [c]] means (a AND b) OR c. None means "no usable prefilter".
+    """
+    runs: List[str] = []
+    current: List[str] = []
+    alternatives: Optional[List[List[str]]] = None
+
+    def flush() -> None:
+        if current:
+            runs.append("".join(current))
+            current.clear()
+
+    for op, arg in parsed:
+        if op is LITERAL:
+            current.append(chr(arg))
+            continue
+        flush()
+        if op is SUBPATTERN:
+            inner = _required(arg[-1])
+        elif op is BRANCH:
+            branches = [_required(branch) for branch in arg[1]]
+            inner = None if any(b is None for b in branches) else [conj for b in branches for conj in b]
+        elif op in (MAX_REPEAT, MIN_REPEAT) and arg[0] >= 1:
+            inner = _required(arg[2])  # The body occurs at least once
+        else:
+            continue  # ANY, IN, AT, NOT_LITERAL, optional repeats...: no literal guaranteed
+        if inner is None:
+            continue
+        if len(inner) == 1:
+            runs.extend(inner[0])
+        elif alternatives is None:
+            alternatives = inner  # Keep the first alternation only: bounded query size
+    flush()
+
+    base = [run for run in runs if len(run) >= 3]
+    if alternatives is not None:
+        combos = [base + alt for alt in alternatives]
+        if all(combos):
+            return combos
+    return [base] if base else None
+
+
+def trigram_query(pattern: str, flags: int = 0) -> Optional[str]:
+    """FTS5 MATCH expression that every file matching `pattern` satisfies (None: scan all)."""
+    try:
+        parsed = sre_parse.parse(pattern, flags)
+    except re.error:
+        return None
+    dnf = _required(parsed)
+    if not dnf:
+        return None
+
+    def phrase(text: str) -> str:
+        return '"' + text.replace('"', '""') + '"'
+
+    terms = []
+    for conj in dnf:
+        literals = [lit for lit in conj if len(lit) >= 3]
+        if not literals:
+            return None  # One branch without literals can match anything
+        terms.append("(" + " AND ".join(phrase(lit) for lit in dict.fromkeys(literals)) + ")")
+    return " OR ".join(terms)
+
+
+# ==============================================================================
+# 2. INDEX
+# ==============================================================================
+
+_SCHEMA = (
+    """CREATE TABLE IF NOT EXISTS files (
+        id INTEGER PRIMARY KEY,
+        path TEXT NOT NULL UNIQUE,
+        name TEXT NOT NULL,
+        mtime_ns INTEGER NOT NULL,
+        size INTEGER NOT NULL,
+        indexed INTEGER NOT NULL
+    )""",
+    "CREATE INDEX IF NOT EXISTS idx_files_name ON files(name)",
+    "CREATE VIRTUAL TABLE IF NOT EXISTS content USING fts5(body, tokenize='trigram', columnsize=0)",
+)
+
+
+def _norm(path: Union[str, Path]) -> str:
+    return os.path.normcase(os.path.abspath(path))
+
+
+class SearchIndex:
+    """Incrementally maintained trigram index over a set of directory roots."""
+
+    def __init__(self, path: Path = SEARCH_INDEX_PATH, roots: Sequence[Path] = SEARCH_ROOTS,
+                 refresh_seconds: float = SEARCH_REFRESH_SECONDS, max_file_bytes: int = SEARCH_MAX_FILE_BYTES,
+                 exclude: Sequence[Path] = SEARCH_EXCLUDE_PATHS):
+        self.path = Path(path)
+        roots = [Path(r) for r in dict.fromkeys(roots)]
+        # A root nested in another would be walked twice
+        self.roots = [r for r in roots if not any(o != r and r.is_relative_to(o) for o in roots)]
+        self.refresh_seconds = refresh_seconds
+        self.max_file_bytes = max_file_bytes
+        self.exclude = frozenset(_norm(p) for p in exclude)
+        self._write_lock = threading.RLock()  # refresh() may re-read dirty files while holding it
+        self._local = threading.local()
+        self._refreshed_at = 0.0
+        self._schema_ready = False
+        self._dirty: Set[str] = set()
+        self._dirty_lock = threading.Lock()
+
+    # --- CONNECTIONS ---
+
+    def _connect(self) -> sqlite3.Connection:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        # Autocommit: refresh() issues its own BEGIN/COMMIT per batch
+        conn = sqlite3.connect(self.path, timeout=30, check_same_thread=False, isolation_level=None)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        if not self._schema_ready:
+            for statement in _SCHEMA:
+                conn.execute(statement)
+            self._schema_ready = True
+        return conn
+
+    def _reader(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = self._local.conn = self._connect()
+        return conn
+
+    # --- MAINTENANCE ---
+
+    def _walk(self) -> Iterator[Tuple[str, str, int, int]]:
+        """(path, name, mtime_ns, size) for every file under the roots."""
+        index_files = {str(self.path), str(self.path) + "-wal", str(self.path) + "-shm"}
+        for root in self.roots:
+            if not root.is_dir():
+                continue
+            stack = [str(root)]
+            while stack:
+                try:
+                    with os.scandir(stack.pop()) as entries:
+                        for entry in entries:
+                            try:
+                                if entry.is_dir(follow_symlinks=False):
+                                    if entry.name not in SEARCH_EXCLUDE_DIRS and _norm(entry.path) not in self.exclude:
+                                        stack.append(entry.path)
+                                elif entry.is_file(follow_symlinks=False) and entry.path not in index_files:
+                                    st = entry.stat(follow_symlinks=False)
+                                    yield entry.path, entry.name, st.st_mtime_ns, st.st_size
+                            except OSError:
+                                continue
+                except OSError:
+                    continue
+
+    def _read_text(self, path: str, size: int) -> Optional[str]:
+        if size > self.max_file_bytes:
+            return None
+        try:
+            with open(path, "rb") as f:
+                data = f.read(self.max_file_bytes + 1)
+        except OSError:
+            return None
+        if len(data) > self.max_file_bytes or b"\x00" in data[:_BINARY_PROBE]:
+            return None
+        return data.decode("utf-8-sig", errors="replace")
+
+    def _store(self, conn: sqlite3.Connection, fid: Optional[int], path: str, name: str,
+               mtime_ns: int, size: int) -> None:
+        """Inserts (fid None) or replaces one file's row and content."""
+        body = self._read_text(path, size)
+        if fid is None:
+            fid = conn.execute(
+                "INSERT INTO files(path, name, mtime_ns, size, indexed) VALUES (?, ?, ?, ?, ?)",
+                (path, name, mtime_ns, size, body is not None)).lastrowid
+        else:
+            conn.execute("UPDATE files SET mtime_ns=?, size=?, indexed=? WHERE id=?",
+                         (mtime_ns, size, body is not None, fid))
+            conn.execute("DELETE FROM content WHERE rowid=?", (fid,))
+        if body is not None:
+            conn.execute("INSERT INTO content(rowid, body) VALUES (?, ?)", (fid, body))
+
+    def _drop(self, conn: sqlite3.Connection, fid: int) -> None:
+        conn.execute("DELETE FROM files WHERE id=?", (fid,))
+        conn.execute("DELETE FROM content WHERE rowid=?", (fid,))
+
+    def _indexed_path(self, path: Union[str, Path]) -> Optional[str]:
+        """`path` as the walk would spell it, or None if it is outside the roots or excluded."""
+        candidates = [Path(path)]
+        if not candidates[0].is_absolute():
+            candidates.append(candidates[0].absolute())
+        for candidate in candidates:
+            if any(candidate.is_relative_to(r) for r in self.roots):
+                norm = _norm(candidate)
+                if any(norm == e or norm.startswith(e + os.sep) for e in self.exclude):
+                    return None
+                return str(candidate)
+        return None
+
+    def mark_dirty(self, paths: Iterable[Union[str, Path]]) -> None:
+        """Files (or trees) changed on disk: the next query re-reads them, throttle or not."""
+        keys = [k for k in (self._indexed_path(p) for p in paths) if k is not None]
+        if keys:
+            with self._dirty_lock:
+                self._dirty.update(keys)
+
+    def _refresh_dirty(self) -> Dict[str, int]:
+        stats = {"scanned": 0, "indexed": 0, "removed": 0}
+        with self._dirty_lock:
+            dirty, self._dirty = self._dirty, set()
+        if not dirty:
+            return stats
+        with self._write_lock:
+            conn = self._connect()
+            try:
+                conn.execute("BEGIN")
+                for path in sorted(dirty):
+                    stats["scanned"] += 1
+                    row = conn.execute("SELECT id FROM files WHERE path=?", (path,)).fetchone()
+                    try:
+                        st = os.stat(path)
+                    except OSError:
+                        st = None
+                    if st is not None and stat.S_ISREG(st.st_mode):
+                        self._store(conn, row[0] if row else None, path, os.path.basename(path),
+                                    st.st_mtime_ns, st.st_size)
+                        stats["indexed"] += 1
+                        continue
+                    if st is not None:
+                        self._refreshed_at = 0.0  # A directory moved in: only a full walk finds its files
+                        continue
+                    gone = [row] if row else []
+                    gone += conn.execute("SELECT id FROM files WHERE path >= ? AND path < ?",
+                                         (path + os.sep, path + chr(ord(os.sep) + 1))).fetchall()
+                    for (fid,) in gone:  # A removed file, or every file of a removed tree
+                        self._drop(conn, fid)
+                    stats["removed"] += len(gone)
+                conn.execute("COMMIT")
+            except BaseException:
+                if conn.in_transaction:
+                    conn.execute("ROLLBACK")
+                with self._dirty_lock:
+                    self._dirty |= dirty  # Retried by the next query
+                raise
+            finally:
+                conn.close()
+        return stats
+
+    def refresh(self, force: bool = False) -> Dict[str, int]:
+        """
+        Brings the index in line with the disk: (re)indexes new or changed files and
+        drops vanished ones. Within `refresh_seconds` of the last pass only the files
+        marked dirty are re-read.
+        """
+        if not force and time.monotonic() - self._refreshed_at < self.refresh_seconds:
+            stats = self._refresh_dirty()
+            if self._refreshed_at:
+                return stats  # Else a directory moved in: fall through to the full walk
+        stats = {"scanned": 0, "indexed": 0, "removed": 0}
+        with self._write_lock:
+            if not force and time.monotonic() - self._refreshed_at < self.refresh_seconds:
+                return self._refresh_dirty()
+            with self._dirty_lock:
+                self._dirty.clear()  # The walk below re-stats everything
+            started = time.perf_counter()
+            conn = self._connect()
+            try:
+                known = {path: (fid, mtime, size) for fid, path, mtime, size in
+                         conn.execute("SELECT id, path, mtime_ns, size FROM files")}
+                pending = 0
+                conn.execute("BEGIN")
+                for path, name, mtime_ns, size in self._walk():
+                    stats["scanned"] += 1
+                    previous = known.pop(path, None)
+                    if previous is not None and previous[1:] == (mtime_ns, size):
+                        continue
+                    self._store(conn, previous[0] if previous else None, path, name, mtime_ns, size)
+                    stats["indexed"] += 1
+                    pending += 1
+                    if pending >= _BATCH:
+                        conn.execute("COMMIT")
+                        conn.execute("BEGIN")
+                        pending = 0
+                for fid, _, _ in known.values():  # Not seen on disk any more
+                    self._drop(conn, fid)
+                stats["removed"] = len(known)
+                conn.execute("COMMIT")
+            except BaseException:
+                if conn.in_transaction:
+                    conn.execute("ROLLBACK")
+                raise
+            finally:
+                conn.close()
+            self._refreshed_at = time.monotonic()
+        if stats["indexed"] or stats["removed"]:
+            logger.info(f"[SEARCH_INDEX] Refreshed in {time.perf_counter() - started:.2f}s: {stats}")
+        return stats
+
+    # --- QUERIES ---
+
+    @staticmethod
+    def _scope(prefix: Optional[Union[str, Path]]) -> Tuple[str, List[Any]]:
+        if prefix is None:
+            return "", []
+        base = str(Path(prefix))
+        # Range over the UNIQUE(path) index: everything starting with base + separator
+        return " AND (f.path = ? OR (f.path >= ? AND f.path < ?))", [base, base + os.sep, base + chr(ord(os.sep) + 1)]
+
+    def grep(self, pattern: str, prefix: Optional[Union[str, Path]] = None, ignore_case: bool = False,
+             context: int = 0, max_files: int = 50, max_matches: int = 200) -> List[Dict[str, Any]]:
+        """
+        Line-level regex matches across indexed files (optionally under `prefix`):
+        [{"path", "line", "text", "before", "after"}], ordered by path then line.
+        re.error propagates for an invalid pattern.
+        """
+        flags = re.IGNORECASE if ignore_case else 0
+        rx = re.compile(pattern, flags | re.MULTILINE)  # Line-oriented, like grep: ^/$ per line
+        self.refresh()
+        where, params = self._scope(prefix)
+        fts = trigram_query(pattern, flags)
+        if fts is not None:
+            sql = ("SELECT f.path, c.body FROM content c JOIN files f ON f.id = c.rowid "
+                   f"WHERE content MATCH ?{where} ORDER BY f.path")
+            params = [fts] + params
+        else:
+            sql = f"SELECT f.path, c.body FROM content c JOIN files f ON f.id = c.rowid WHERE 1{where} ORDER BY f.path"
+
+        results: List[Dict[str, Any]] = []
+        files = 0
+        for path, body in self._reader().execute(sql, params):
+            hits = _line_matches(rx, body, context)
+            if not hits:
+                continue  # Trigram candidates are a superset
+            files += 1
+            for hit in hits:
+                hit["path"] = path
+                results.append(hit)
+                if len(results) >= max_matches:
+                    return results
+            if files >= max_files:
+                break
+        return results
+
+    def find_files(self, pattern: str, prefix: Optional[Union[str, Path]] = None,
+                   max_size: Optional[int] = None, limit: int = 50) -> List[str]:
+        """Paths whose file name matches the glob `pattern` (case-insensitive)."""
+        self.refresh()
+        where, params = self._scope(prefix)
+        sql = f"SELECT f.path, f.name, f.size FROM files f WHERE 1{where} ORDER BY f.path"
+        matcher = re.compile(fnmatch.translate(pattern), re.IGNORECASE).match
+        found = []
+        for path, name, size in self._reader().execute(sql, params):
+            if matcher(name) and (max_size is None or size < max_size):
+                found.append(path)
+                if len(found) >= limit:
+                    break
+        return found
+
+    async def agrep(self, pattern: str, **kwargs: Any) -> List[Dict[str, Any]]:
+        return await run_io(lambda: self.grep(pattern, **kwargs))
+
+    async def afind_files(self, pattern: str, **kwargs: Any) -> List[str]:
+        return await run_io(lambda: self.find_files(pattern, **kwargs))
+
+
+def _line_matches(rx: "re.Pattern[str]", body: str, context: int) -> List[Dict[str, Any]]:
+    hits = []
+    line_no, counted_to, last_line_start = 1, 0, -1
+    lines: Optional[List[str]] = None
+    for m in rx.finditer(body):
+        start = body.rfind("\n", 0, m.start()) + 1
+        if start == last_line_start:
+            continue  # One hit per line
+        line_no += body.count("\n", counted_to, start)
+        counted_to, last_line_start = start, start
+        end = body.find("\n", m.start())
+        hit = {"line": line_no, "text": body[start:end if end != -1 else len(body)].rstrip("\r")}
+        if context:
+            if lines is None:
+                lines = body.splitlines()
+            i = line_no - 1
+            hit["before"] = lines[max(0, i - context):i]
+            hit["after"] = lines[i + 1:i + 1 + context]
+        hits.append(hit)
+    return hits
+
+
+search_index = SearchIndex()
+on_write(search_index.mark_dirty)  # write_file / append_to_file / copy_internal_file...
@@ -5,37 +5,178 @@ STATUS: PRODUCTION READY - IDEMPOTENCY LOCKS - BENTO-GRID TELEMETRY
 PATH: F:/agentic_workforce/src/system/state.py
 """
 
+import heapq
 import operator
 import uuid
+from collections import OrderedDict, deque
+from collections.abc import Sequence
 from datetime import datetime
-from typing import Annotated, List, Dict, Any, TypedDict, Union, Optional, Set
+from types import MappingProxyType
+from typing import Annotated, List, Dict, Any, Iterable, Iterator, TypedDict, Union, Optional, Set
 from langchain_core.messages import BaseMessage
 
+HANDOFF_HISTORY_LIMIT = 15   # Expanded to 15 for multi-agent meetings
+DIAGNOSTIC_BUFFER_LIMIT = 100  # Expanded buffer for high-speed industrial logs
+
 # ==============================================================================
-# 0. REDUCER LOGIC (KINETIC STATE SYNCHRONIZATION)
+# 0. INCREMENTAL STATE STRUCTURES (O(delta) MERGES)
 # ==============================================================================
+# LangGraph hands each reducer the channel's current value and stores whatever it
+# returns. TaskQueue and ArtifactSet are updated in place, so a merge costs O(delta)
+# instead of rebuilding/re-sorting the whole collection. In-place merges MUST stay
+# idempotent: conditional edges preview a node's writes on a channel copy that shares
+# the same value object, so every write can reach the reducer twice.
+
+def _task_sort_key(task: Dict[str, Any]) -> tuple:
+    """OPEN first, then priority, then id (the historical merge_tasks ordering)."""
+    task = task or {}
+    return (task.get('status', 'OPEN') != 'OPEN', task.get('priority', 'MEDIUM'), task.get('id', ''))
+
+
+class TaskQueue(Sequence):
+    """
+    Mission backlog: id-indexed OrderedDict + lazy-deletion heap on (status, priority, id).
+    Merges are O(delta log n); the sorted list view is materialized only when read.
+    """
+
+    __slots__ = ("_tasks", "_heap", "_versions", "_counter", "_view")
+
+    def __init__(self, tasks: Optional[Iterable[Dict[str, Any]]] = None):
+        self._tasks: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._heap: List[tuple] = []
+        self._versions: Dict[str, int] = {}
+        self._counter = 0
+        self._view: Optional[List[Dict[str, Any]]] = None
+        if tasks:
+            self.merge(tasks)
+
+    def merge(self, new: Iterable[Dict[str, Any]]) -> "TaskQueue":
+        """Upserts tasks by id (partial dicts such as status updates are merged)."""
+        for t in new:
+            if not isinstance(t, dict): continue
+            tid = t.get('id') or f"task_{uuid.uuid4().hex[:6]}"
+            t['id'] = tid  # Stamped on the write itself so a replayed write upserts, not duplicates
+            current = self._tasks.get(tid)
+            merged = {**current, **t} if current is not None else t
+            self._tasks[tid] = merged
+            self._counter += 1
+            self._versions[tid] = self._counter
+            heapq.heappush(self._heap, (_task_sort_key(merged), self._counter, tid))
+            self._view = None
+        if len(self._heap) > 2 * len(self._tasks) + 32:
+            self._compact()
+        return self
+
+    def _compact(self) -> None:
+        """Drops superseded heap entries once they outnumber the live ones."""
+        self._heap = [e for e in self._heap if self._versions.get(e[2]) == e[1]]
+        heapq.heapify(self._heap)
+
+    def _prune(self) -> None:
+        while self._heap and self._versions.get(self._heap[0][2]) != self._heap[0][1]:
+            heapq.heappop(self._heap)
+
+    def next_open(self) -> Optional[Dict[str, Any]]:
+        """Highest-priority OPEN task without materializing the sorted view."""
+        self._prune()
+        if not self._heap:
+            return None
+        task = self._tasks[self._heap[0][2]]
+        return task if task.get('status', 'OPEN') == 'OPEN' else None
+
+    def get(self, tid: str, default: Any = None) -> Any:
+        return self._tasks.get(tid, default)
+
+    def _sorted(self) -> List[Dict[str, Any]]:
+        if self._view is None:
+            self._view = sorted(self._tasks.values(), key=_task_sort_key)
+        return self._view
+
+    def __getitem__(self, index):
+        return self._sorted()[index]
+
+    def __len__(self) -> int:
+        return len(self._tasks)
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        return iter(self._sorted())
+
+    def __contains__(self, item: Any) -> bool:
+        if isinstance(item, str):
+            return item in self._tasks
+        return item in self._sorted()
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, (TaskQueue, list)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"TaskQueue({self._sorted()!r})"
+
+
+class ArtifactSet(Sequence):
+    """Insertion-ordered set of artifact paths/hashes (dict keys, O(1) membership)."""
+
+    __slots__ = ("_items", "_view")
+
+    def __init__(self, items: Optional[Iterable[str]] = None):
+        self._items: Dict[str, None] = dict.fromkeys(items or ())
+        self._view: Optional[List[str]] = None
 
-def merge_tasks(existing: List[Dict], new: List[Dict]) -> List[Dict]:
+    def update(self, items: Iterable[str]) -> "ArtifactSet":
+        before = len(self._items)
+        for item in items:
+            self._items[item] = None
+        if len(self._items) != before:
+            self._view = None
+        return self
+
+    def _list(self) -> List[str]:
+        if self._view is None:
+            self._view = list(self._items)
+        return self._view
+
+    def __getitem__(self, index):
+        return self._list()[index]
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._items)
+
+    def __contains__(self, item: Any) -> bool:
+        return item in self._items
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, (ArtifactSet, list)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"ArtifactSet({list(self._items)!r})"
+
+
+def _ring(existing: Any, new: Iterable[Any], limit: int) -> deque:
+    """
+    Fresh bounded deque (O(limit), independent of mission length). Appends are not
+    idempotent, so ring buffers are never mutated in place (see note above).
+    """
+    ring = deque(existing or (), maxlen=limit)
+    ring.extend(new)
+    return ring
+
+# ==============================================================================
+# 0.1 REDUCER LOGIC (KINETIC STATE SYNCHRONIZATION)
+# ==============================================================================
+
+def merge_tasks(existing: List[Dict], new: List[Dict]) -> TaskQueue:
     """Sovereign Task Merger: Ensures the mission backlog is unique and sorted."""
-    if not isinstance(existing, list): existing = []
-    if not isinstance(new, list): new = []
-    
-    task_map = {(t or {}).get('id'): t for t in existing if (t or {}).get('id')}
-    
-    for t in new:
-        if not isinstance(t, dict): continue
-        tid = (t or {}).get('id') or f"task_{uuid.uuid4().hex[:6]}"
-        t['id'] = tid
-        
-        if tid in task_map:
-            task_map[tid] = {**task_map[tid], **t} # Update existing
-        else:
-            task_map[tid] = t # Append new
-
-    return sorted(
-        list(task_map.values()), 
-        key=lambda x: ((x or {}).get('status', 'OPEN') != 'OPEN', (x or {}).get('priority', 'MEDIUM'), (x or {}).get('id', ''))
-    )
+    queue = existing if isinstance(existing, TaskQueue) else TaskQueue(existing if isinstance(existing, list) else None)
+    if isinstance(new, (list, TaskQueue)) and new is not queue:
+        queue.merge(new)
+    return queue
 
 def merge_vitals(existing: Dict, new: Dict) -> Dict:
     """Telemetry Merger: Updates real-time HUD vitals without losing historical keys."""
@@ -43,18 +184,16 @@ def merge_vitals(existing: Dict, new: Dict) -> Dict:
     if not new: return existing
     return {**existing, **new}
 
-def track_handoffs(existing: List[Dict], new: List[Dict]) -> List[Dict]:
+def track_handoffs(existing: List[Dict], new: List[Dict]) -> deque:
     """Spatial Handoff Reducer: Records the flow of data between the 13 industrial silos."""
-    if not existing: existing = []
-    if not new: return existing
+    if not new: return existing if isinstance(existing, deque) else _ring(existing, (), HANDOFF_HISTORY_LIMIT)
     clean_new = [h for h in new if isinstance(h, dict) and "from" in h and "to" in h]
-    return (existing + clean_new)[-15:] # Expanded to 15 for multi-agent meetings
+    return _ring(existing, clean_new, HANDOFF_HISTORY_LIMIT)
 
-def buffer_diagnostics(existing: List[str], new: List[str]) -> List[str]:
+def buffer_diagnostics(existing: List[str], new: List[str]) -> deque:
     """Diagnostic Stream Reducer: Manages the Caffeine-Neon terminal buffer."""
-    if not existing: existing = []
-    if not new: return existing
-    return (existing + new)[-100:] # Expanded buffer for high-speed industrial logs
+    if not new: return existing if isinstance(existing, deque) else _ring(existing, (), DIAGNOSTIC_BUFFER_LIMIT)
+    return _ring(existing, new, DIAGNOSTIC_BUFFER_LIMIT)
 
 def merge_genesis_protocol(existing: Dict[str, bool], new: Dict[str, bool]) -> Dict[str, bool]:
     """Genesis-100 Tracker: Monitors initialization of the 13 core silos."""
@@ -62,9 +201,12 @@ def merge_genesis_protocol(existing: Dict[str, bool], new: Dict[str, bool]) -> D
     if not new: return existing
     return {**existing, **new}
 
-def deduplicate_artifacts(existing: List[str], new: List[str]) -> List[str]:
-    """Ensures file paths/hashes in the IronClad registry are unique."""
-    return list(set((existing or []) + (new or [])))
+def deduplicate_artifacts(existing: List[str], new: List[str]) -> ArtifactSet:
+    """Ensures file paths/hashes in the IronClad registry are unique (first-seen order)."""
+    artifacts = existing if isinstance(existing, ArtifactSet) else ArtifactSet(existing)
+    if new and new is not artifacts:
+        artifacts.update(new)
+    return artifacts
 
 # ==============================================================================
 # 1. STATE DEFINITION (THE TITAN-INDUSTRIAL SCHEMA)
@@ -96,6 +238,7 @@ class RealmForgeState(TypedDict):
     # --- 4. TASK MANAGEMENT ---
     task_queue: Annotated[List[Dict[str, Any]], merge_tasks] 
     genesis_tasks: Annotated[Dict[str, bool], merge_genesis_protocol] 
+    speculative_plan: Dict[str, Any] # Pre-drafted fallback plan {department, agent, task_queue}
     
     # --- 5. DATA LATTICE & ARTIFACTS ---
     memory_context: str
@@ -114,6 +257,30 @@ class RealmForgeState(TypedDict):
 # 2. INITIALIZATION (THE CLEAN SLATE)
 # ==============================================================================
 
+# Static per-mission defaults: one read-only instance shared by every mission
+# (reducers always return fresh dicts, so nothing writes through these).
+DEFAULT_SILO_DISTRIBUTION = MappingProxyType({
+    "Architect": 86, "Data_Intelligence": 86, "Software_Engineering": 86,
+    "DevOps_Infrastructure": 86, "Cybersecurity": 86, "Financial_Ops": 86,
+    "Legal_Compliance": 86, "Research_Development": 86, "Executive_Board": 86,
+    "Marketing_PR": 86, "Human_Capital": 86, "Quality_Assurance": 86,
+    "Facility_Management": 81
+})
+
+DEFAULT_GENESIS_TASKS = MappingProxyType({
+    "silo_alignment_verification": True,
+    "workforce_audit_init": True,
+    "arsenal_180_verification": True,
+    "lattice_node_ingestion": True,
+    "discord_webhook_sync": True
+})
+
+STATIC_METADATA = MappingProxyType({
+    "version": "20.0.0",
+    "ui_theme": "Caffeine-Neon",
+    "root_anchor": "F:/agentic_workforce"
+})
+
 def get_initial_state() -> RealmForgeState:
     """
     Titan Factory: Initializes the swarm in production mode.
@@ -136,13 +303,8 @@ def get_initial_state() -> RealmForgeState:
         "meeting_participants": ["ForgeMaster"],
         "handoff_history": [],
         "task_queue": [],
-        "genesis_tasks": {
-            "silo_alignment_verification": True,
-            "workforce_audit_init": True,
-            "arsenal_180_verification": True,
-            "lattice_node_ingestion": True,
-            "discord_webhook_sync": True
-        },
+        "speculative_plan": {},
+        "genesis_tasks": DEFAULT_GENESIS_TASKS,
         "memory_context": "Neural uplink stable. F:/ drive pressurized. Awaiting directive.",
         "artifacts": [],
         "tool_results": {},
@@ -152,21 +314,13 @@ def get_initial_state() -> RealmForgeState:
             "latency": 0.0, 
             "lattice_nodes": 13472,
             "active_sector": "Architect",
-            "silo_distribution": {
-                "Architect": 86, "Data_Intelligence": 86, "Software_Engineering": 86,
-                "DevOps_Infrastructure": 86, "Cybersecurity": 86, "Financial_Ops": 86,
-                "Legal_Compliance": 86, "Research_Development": 86, "Executive_Board": 86,
-                "Marketing_PR": 86, "Human_Capital": 86, "Quality_Assurance": 86,
-                "Facility_Management": 81
-            }
+            "silo_distribution": DEFAULT_SILO_DISTRIBUTION
         },
         "diagnostic_stream": [f"[{datetime.now().strftime('%H:%M:%S')}] RE-PRESSURIZATION COMPLETE. LATTICE READY."],
         "mission_locks": set(),
         "metadata": {
             "session_id": str(uuid.uuid4()),
             "start_time": datetime.now().isoformat(),
-            "version": "20.0.0",
-            "ui_theme": "Caffeine-Neon",
-            "root_anchor": "F:/agentic_workforce"
+            **STATIC_METADATA
         }
     }
@@ -0,0 +1,317 @@
+"""
+REALM FORGE: STATE CODEC v1.0
+PURPOSE: Compact binary encoding of RealmForgeState for checkpoints, job persistence
+         and HUD snapshots.
+         - Static defaults (silo distribution, genesis flags, static metadata) are
+           written as references and decoded back to the shared read-only instances.
+         - Message role/content is interned into a per-payload string table, so the
+           repeated telemetry lines of long missions are stored once.
+         - msgpack when installed, orjson next, stdlib json as the last resort.
+PATH: F:/agentic_workforce/src/system/state_codec.py
+"""
+
+import json
+import sys
+from collections import deque
+from types import MappingProxyType
+from typing import Any, Dict, List, Optional, Tuple
+
+from langchain_core.messages import (
+    AIMessage,
+    BaseMessage,
+    HumanMessage,
+    SystemMessage,
+    ToolMessage,
+    message_to_dict,
+    messages_from_dict,
+)
+
+from src.system.state import (
+    DEFAULT_GENESIS_TASKS,
+    DEFAULT_SILO_DISTRIBUTION,
+    STATIC_METADATA,
+    ArtifactSet,
+    TaskQueue,
+)
+
+try:
+    import msgpack
+except ImportError:  # pragma: no cover - optional accelerator
+    msgpack = None
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional accelerator
+    orjson = None
+
+CODEC_VERSION = 1
+
+# Shared instances that are encoded by name instead of by value
+STATIC_REFS: Dict[str, MappingProxyType] = {
+    "silo_distribution": DEFAULT_SILO_DISTRIBUTION,
+    "genesis_tasks": DEFAULT_GENESIS_TASKS,
+}
+
+_MESSAGE_TYPES = {
+    "human": HumanMessage,
+    "ai": AIMessage,
+    "tool": ToolMessage,
+    "system": SystemMessage,
+}
+
+# Short decoded contents are sys.intern'ed so identical telemetry lines share memory
+# across every mission loaded in the process.
+_INTERN_MAX_CHARS = 512
+
+# Frame tags (first byte of every encoded payload)
+_TAG_MSGPACK, _TAG_ORJSON, _TAG_JSON = b"M", b"O", b"J"
+
+_MISSING = object()
+
+
+# ==============================================================================
+# 1. PACKING (STATE -> PLAIN, INTERNED STRUCTURE)
+# ==============================================================================
+
+class _StringTable:
+    """Append-only string table: each distinct string is stored once, referenced by index."""
+
+    def __init__(self):
+        self.strings: List[str] = []
+        self._index: Dict[str, int] = {}
+
+    def ref(self, value: str) -> int:
+        idx = self._index.get(value)
+        if idx is None:
+            idx = self._index[value] = len(self.strings)
+            self.strings.append(value)
+        return idx
+
+
+def _message_extras(message: BaseMessage) -> Dict[str, Any]:
+    """Non-default message fields (ids, tool calls, usage...) minus type/content."""
+    dump = getattr(message, "model_dump", None) or message.dict
+    extras = dump(exclude_defaults=True)
+    extras.pop("content", None)
+    extras.pop("type", None)
+    return extras
+
+
+def _pack_message(message: BaseMessage, table: _StringTable) -> Dict[str, Any]:
+    role = getattr(message, "type", "")
+    if role not in _MESSAGE_TYPES:
+        return {"~msg": message_to_dict(message)}
+    content = message.content
+    packed: List[Any] = [table.ref(role)]
+    packed.append(table.ref(content) if isinstance(content, str) else _pack(content, table))
+    extras = _message_extras(message)
+    if extras:
+        packed.append(_pack(extras, table))
+    return {"~m": packed}
+
+
+def _pack(obj: Any, table: _StringTable) -> Any:
+    """Recursively converts state values into msgpack/JSON-safe primitives."""
+    if obj is None or isinstance(obj, (bool, int, float, str)):
+        return obj
+    if isinstance(obj, BaseMessage):
+        return _pack_message(obj, table)
+    if isinstance(obj, TaskQueue):
+        return {"~tq": [_pack(t, table) for t in obj]}
+    if isinstance(obj, ArtifactSet):
+        return {"~as": list(obj)}
+    if isinstance(obj, deque):
+        return {"~dq": [obj.maxlen, [_pack(v, table) for v in obj]]}
+    if isinstance(obj, (set, frozenset)):
+        return {"~set": [_pack(v, table) for v in sorted(obj, key=str)]}
+    if isinstance(obj, (dict, MappingProxyType)):
+        for name, ref in STATIC_REFS.items():
+            if obj is ref or (len(obj) == len(ref) and obj == ref):
+                return {"~ref": name}
+        return {str(k): _pack(v, table) for k, v in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_pack(v, table) for v in obj]
+    if isinstance(obj, bytes):
+        return {"~b": obj.hex()}
+    return str(obj)
+
+
+def pack_state(state: Dict[str, Any]) -> Dict[str, Any]:
+    """RealmForgeState -> compact plain dict ({v, strings, state})."""
+    table = _StringTable()
+    body = {}
+    for key, value in (state or {}).items():
+        if key == "metadata" and isinstance(value, dict):
+            # Static metadata is restored from STATIC_METADATA on unpack
+            value = {k: v for k, v in value.items() if STATIC_METADATA.get(k, _MISSING) != v}
+        body[key] = _pack(value, table)
+    return {"v": CODEC_VERSION, "strings": table.strings, "state": body}
+
+
+# ==============================================================================
+# 2. UNPACKING (PLAIN STRUCTURE -> LIVE STATE)
+# ==============================================================================
+
+def _text(strings: List[str], idx: int) -> str:
+    value = strings[idx]
+    return sys.intern(value) if len(value) <= _INTERN_MAX_CHARS else value
+
+
+def _unpack_message(packed: List[Any], strings: List[str]) -> BaseMessage:
+    role = strings[packed[0]]
+    content = _text(strings, packed[1]) if isinstance(packed[1], int) else _unpack(packed[1], strings)
+    extras = _unpack(packed[2], strings) if len(packed) > 2 else {}
+    return _MESSAGE_TYPES[role](content=content, **extras)
+
+
+def _unpack(obj: Any, strings: List[str]) -> Any:
+    if isinstance(obj, list):
+        return [_unpack(v, strings) for v in obj]
+    if not isinstance(obj, dict):
+        return obj
+    if len(obj) == 1:
+        tag, payload = next(iter(obj.items()))
+        if tag == "~m":
+            return _unpack_message(payload, strings)
+        if tag == "~msg":
+            return messages_from_dict([payload])[0]
+        if tag == "~tq":
+            return TaskQueue(_unpack(payload, strings))
+        if tag == "~as":
+            return ArtifactSet(payload)
+        if tag == "~dq":
+            return deque(_unpack(payload[1], strings), maxlen=payload[0])
+        if tag == "~set":
+            return set(_unpack(payload, strings))
+        if tag == "~ref":
+            return STATIC_REFS[payload]
+        if tag == "~b":
+            return bytes.fromhex(payload)
+    return {k: _unpack(v, strings) for k, v in obj.items()}
+
+
+def unpack_state(packed: Dict[str, Any]) -> Dict[str, Any]:
+    """Inverse of pack_state."""
+    version = packed.get("v")
+    if version != CODEC_VERSION:
+        raise ValueError(f"Unsupported state codec version: {version}")
+    strings = packed.get("strings") or []
+    state = {k: _unpack(v, strings) for k, v in (packed.get("state") or {}).items()}
+    if isinstance(state.get("metadata"), dict):
+        state["metadata"] = {**STATIC_METADATA, **state["metadata"]}
+    return state
+
+
+# ==============================================================================
+# 3. WIRE FORMAT (MSGPACK -> ORJSON -> JSON)
+# ==============================================================================
+
+def _default_backend() -> bytes:
+    if msgpack is not None:
+        return _TAG_MSGPACK
+    if orjson is not None:
+        return _TAG_ORJSON
+    return _TAG_JSON
+
+
+def dumps(obj: Any, backend: Optional[bytes] = None) -> bytes:
+    """Serializes an already-packed (primitive) structure with a one-byte backend tag."""
+    tag = backend or _default_backend()
+    if tag == _TAG_MSGPACK:
+        return tag + msgpack.packb(obj, use_bin_type=True)
+    if tag == _TAG_ORJSON:
+        return tag + orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+    return tag + json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+def loads(blob: bytes) -> Any:
+    tag, payload = blob[:1], blob[1:]
+    if tag == _TAG_MSGPACK:
+        if msgpack is None:
+            raise RuntimeError("State payload was written with msgpack, which is not installed.")
+        return msgpack.unpackb(payload, raw=False, strict_map_key=False)
+    if tag == _TAG_ORJSON:
+        return orjson.loads(payload) if orjson is not None else json.loads(payload)
+    if tag == _TAG_JSON:
+        return json.loads(payload)
+    raise ValueError(f"Unknown state payload tag: {tag!r}")
+
+
+def encode_state(state: Dict[str, Any], backend: Optional[bytes] = None) -> bytes:
+    """RealmForgeState -> bytes (checkpoints / job persistence)."""
+    return dumps(pack_state(state), backend)
+
+
+def decode_state(blob: bytes) -> Dict[str, Any]:
+    """bytes -> RealmForgeState with TaskQueue/ArtifactSet/deque/set and shared defaults restored."""
+    return unpack_state(loads(blob))
+
+
+# ==============================================================================
+# 4. HUD SNAPSHOTS & CHECKPOINTER SERDE
+# ==============================================================================
+
+def snapshot(state: Dict[str, Any], max_messages: int = 20, max_chars: int = 2000) -> Dict[str, Any]:
+    """
+    JSON-safe HUD view of a mission: newest messages only, long contents clipped,
+    static defaults left out (the HUD ships with them).
+    """
+    state = state or {}
+    messages = list(state.get("messages") or [])[-max_messages:]
+    view = {}
+    for key, value in state.items():
+        if key == "messages":
+            continue
+        if key == "genesis_tasks" and value == DEFAULT_GENESIS_TASKS:
+            continue
+        if key == "vitals" and isinstance(value, (dict, MappingProxyType)):
+            value = {k: v for k, v in value.items() if not (k == "silo_distribution" and v == DEFAULT_SILO_DISTRIBUTION)}
+        view[key] = _pack(value, _StringTable())
+    view["messages"] = [
+        {"role": getattr(m, "type", "unknown"), "content": str(getattr(m, "content", m))[:max_chars]}
+        for m in messages
+    ]
+    return view
+
+
+class StateSerde:
+    """
+    LangGraph SerializerProtocol adapter, e.g. MemorySaver(serde=StateSerde()).
+    Channel values the codec understands (including the read-only static defaults,
+    which msgpack cannot take) are stored compactly; anything else (checkpoint
+    envelopes, pending sends, ...) goes to the stock JsonPlusSerializer.
+    """
+
+    TYPE = "realmforge"
+
+    def __init__(self, fallback: Any = None):
+        if fallback is None:
+            from langgraph.checkpoint.serde.jsonplus import JsonPlusSerializer
+            fallback = JsonPlusSerializer()
+        self.fallback = fallback
+
+    @staticmethod
+    def _holds_static(obj: Any) -> bool:
+        """True when a read-only default (genesis_tasks, vitals.silo_distribution) is inside."""
+        if isinstance(obj, MappingProxyType):
+            return True
+        if isinstance(obj, dict):
+            return any(StateSerde._holds_static(v) for v in obj.values())
+        return False
+
+    @classmethod
+    def _is_state_value(cls, obj: Any) -> bool:
+        if isinstance(obj, (TaskQueue, ArtifactSet, deque)) or cls._holds_static(obj):
+            return True
+        return isinstance(obj, list) and bool(obj) and all(isinstance(m, BaseMessage) for m in obj)
+
+    def dumps_typed(self, obj: Any) -> Tuple[str, bytes]:
+        if self._is_state_value(obj):
+            return self.TYPE, encode_state({"value": obj})
+        return self.fallback.dumps_typed(obj)
+
+    def loads_typed(self, data: Tuple[str, bytes]) -> Any:
+        type_, payload = data
+        if type_ == self.TYPE:
+            return decode_state(payload)["value"]
+        return self.fallback.loads_typed(data)
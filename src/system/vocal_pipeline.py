@@ -0,0 +1,254 @@
+"""
+REALM FORGE: VOCAL PIPELINE v1.0
+PURPOSE: Neural TTS off the mission's critical path.
+         - Content-addressed audio cache (memory LRU + disk), keyed on
+           sha256(voice|rate|pitch|normalized text): stock phrases synthesize once.
+         - Bounded worker pool fed by a bounded job queue; mission streaming only
+           enqueues. Utterances of one mission are still delivered in order.
+PATH: F:/agentic_workforce/src/system/vocal_pipeline.py
+"""
+
+import asyncio
+import hashlib
+import os
+import unicodedata
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Tuple
+
+from src.system.audio_frames import audio_frames, pack_audio_frame
+from src.system.config import DATA_ROOT, logger
+from src.system.connection_manager import manager
+from src.utils.async_io import run_io
+
+TTS_CACHE_DIR = DATA_ROOT / "audio" / "tts_cache"
+TTS_CACHE_MEMORY_BYTES = int(os.getenv("REALM_TTS_CACHE_MB", "32")) * 1024 * 1024
+# Only short utterances are cached: stock phrases repeat, long LLM prose rarely does
+TTS_CACHE_MAX_CHARS = int(os.getenv("REALM_TTS_CACHE_MAX_CHARS", "400"))
+TTS_WORKERS = int(os.getenv("REALM_TTS_WORKERS", "3"))
+TTS_QUEUE_SIZE = int(os.getenv("REALM_TTS_QUEUE_SIZE", "64"))
+
+Synthesizer = Callable[..., AsyncIterator[bytes]]
+
+
+def normalize_utterance(text: str) -> str:
+    return " ".join(unicodedata.normalize("NFKC", text or "").split())
+
+
+def tts_cache_key(text: str, voice: str, rate: str, pitch: str) -> str:
+    raw = f"{voice}|{rate}|{pitch}|{normalize_utterance(text)}"
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+def _default_synthesizer() -> Tuple[Synthesizer, Dict[str, str]]:
+    from src.system.arsenal.foundation import NEURAL_PITCH, NEURAL_RATE, NEURAL_VOICE, stream_neural_audio
+    return stream_neural_audio, {"voice": NEURAL_VOICE, "rate": NEURAL_RATE, "pitch": NEURAL_PITCH}
+
+
+# ==============================================================================
+# 1. CONTENT-ADDRESSED AUDIO CACHE
+# ==============================================================================
+
+class TTSCache:
+    """
+    Byte-bounded in-memory LRU in front of an on-disk mp3 store (data/audio/tts_cache/ab/abcd....mp3).
+    Memory hits stay on the loop; disk reads and writes run on the shared I/O pool.
+    """
+
+    def __init__(self, root: Path = TTS_CACHE_DIR, memory_bytes: int = TTS_CACHE_MEMORY_BYTES):
+        self.root = Path(root)
+        self.memory_bytes = memory_bytes
+        self._lru: "OrderedDict[str, bytes]" = OrderedDict()
+        self._size = 0
+        self.hits = 0
+        self.misses = 0
+
+    def _path(self, key: str) -> Path:
+        return self.root / key[:2] / f"{key}.mp3"
+
+    async def get(self, key: str) -> Optional[bytes]:
+        audio = self._lru.get(key)
+        if audio is not None:
+            self._lru.move_to_end(key)
+            self.hits += 1
+            return audio
+        audio = await run_io(self._read, key)
+        if audio is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._remember(key, audio)
+        return audio
+
+    async def put(self, key: str, audio: bytes) -> None:
+        if not audio:
+            return
+        self._remember(key, audio)
+        await run_io(self._write, key, audio)
+
+    def _read(self, key: str) -> Optional[bytes]:
+        try:
+            return self._path(key).read_bytes()
+        except OSError:
+            return None
+
+    def _write(self, key: str, audio: bytes) -> None:
+        path = self._path(key)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_suffix(".tmp")
+            tmp.write_bytes(audio)
+            os.replace(tmp, path)
+        except OSError as e:
+            logger.warning(f"[VOCAL] Cache write failed for {key[:12]}: {e}")
+
+    def _remember(self, key: str, audio: bytes) -> None:
+        if len(audio) > self.memory_bytes:
+            return
+        previous = self._lru.pop(key, None)
+        if previous is not None:
+            self._size -= len(previous)
+        self._lru[key] = audio
+        self._size += len(audio)
+        while self._size > self.memory_bytes:
+            _, evicted = self._lru.popitem(last=False)
+            self._size -= len(evicted)
+
+
+# ==============================================================================
+# 2. SYNTHESIS WORKER POOL
+# ==============================================================================
+
+@dataclass
+class VocalJob:
+    mission_id: str
+    audio_seq: int
+    text: str
+    topics: Dict[str, Any] = field(default_factory=dict)
+
+
+class VocalPipeline:
+    """Bounded pool of synthesis workers publishing binary audio frames."""
+
+    def __init__(
+        self,
+        cache: Optional[TTSCache] = None,
+        synthesizer: Optional[Synthesizer] = None,
+        voice: Optional[Dict[str, str]] = None,
+        workers: int = TTS_WORKERS,
+        queue_size: int = TTS_QUEUE_SIZE,
+        cache_max_chars: int = TTS_CACHE_MAX_CHARS,
+    ):
+        self.cache = cache or TTSCache()
+        self._synthesizer = synthesizer
+        self._voice = voice
+        self.workers = workers
+        self.queue_size = queue_size
+        self.cache_max_chars = cache_max_chars
+        self._queue: Optional[asyncio.Queue] = None
+        self._tasks: List[asyncio.Task] = []
+        # Per-mission FIFO locks keep a mission's utterances in order across workers
+        self._mission_locks: Dict[str, Tuple[asyncio.Lock, int]] = {}
+        self.dropped = 0
+
+    def _synth(self) -> Tuple[Synthesizer, Dict[str, str]]:
+        if self._synthesizer is None:
+            self._synthesizer, default_voice = _default_synthesizer()
+            self._voice = self._voice or default_voice
+        return self._synthesizer, self._voice or {}
+
+    # --- LIFECYCLE ---
+
+    def _spawn(self) -> None:
+        self._queue = asyncio.Queue(maxsize=self.queue_size)
+        self._tasks = [asyncio.create_task(self._worker(i)) for i in range(self.workers)]
+        logger.info(f"[VOCAL] Synthesis pool online ({self.workers} workers).")
+
+    async def start(self) -> None:
+        if not self._tasks:
+            self._spawn()
+
+    async def stop(self) -> None:
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        self._queue = None
+
+    def submit(self, mission_id: str, audio_seq: int, text: str, **topics: Any) -> bool:
+        """Enqueues an utterance without waiting. Returns False if the pool is saturated."""
+        if not self._tasks:
+            self._spawn()  # Lazy start outside the app lifespan (needs a running loop)
+        try:
+            self._queue.put_nowait(VocalJob(mission_id, audio_seq, text, topics))
+            return True
+        except asyncio.QueueFull:
+            self.dropped += 1
+            logger.warning(f"[VOCAL] Synthesis queue full, skipping {mission_id}#{audio_seq}.")
+            return False
+
+    async def drain(self) -> None:
+        """Waits until every queued utterance has been published."""
+        if self._queue is not None:
+            await self._queue.join()
+
+    # --- AUDIO ---
+
+    async def audio_stream(self, text: str) -> AsyncIterator[bytes]:
+        """Cached bytes in one chunk, or live synthesis chunks (stored on completion)."""
+        synth, voice = self._synth()
+        cacheable = len(text) <= self.cache_max_chars
+        key = tts_cache_key(text, voice.get("voice", ""), voice.get("rate", ""), voice.get("pitch", "")) if cacheable else None
+        if key is not None:
+            cached = await self.cache.get(key)
+            if cached is not None:
+                yield cached
+                return
+        chunks = []
+        async for chunk in synth(text, **voice):
+            chunks.append(chunk)
+            yield chunk
+        if key is not None:
+            await self.cache.put(key, b"".join(chunks))
+
+    async def _publish(self, job: VocalJob) -> None:
+        topics = {**job.topics, "mission_id": job.mission_id}
+        try:
+            async for frame in audio_frames(job.mission_id, job.audio_seq, self.audio_stream(job.text)):
+                manager.publish(frame, **topics)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.warning(f"[VOCAL] Synthesis failed for {job.mission_id}#{job.audio_seq}: {e}")
+            # Close the utterance so clients do not wait on it
+            manager.publish(pack_audio_frame(job.mission_id, job.audio_seq, 2**32 - 1, final=True), **topics)
+
+    async def _worker(self, idx: int) -> None:
+        queue = self._queue
+        while True:
+            job = await queue.get()
+            lock, users = self._mission_locks.get(job.mission_id, (asyncio.Lock(), 0))
+            self._mission_locks[job.mission_id] = (lock, users + 1)
+            try:
+                async with lock:
+                    await self._publish(job)
+            finally:
+                lock, users = self._mission_locks[job.mission_id]
+                if users <= 1:
+                    del self._mission_locks[job.mission_id]
+                else:
+                    self._mission_locks[job.mission_id] = (lock, users - 1)
+                queue.task_done()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "workers": len(self._tasks),
+            "queued": self._queue.qsize() if self._queue is not None else 0,
+            "dropped": self.dropped,
+            "cache_hits": self.cache.hits,
+            "cache_misses": self.cache.misses,
+        }
+
+
+vocal_pipeline = VocalPipeline()
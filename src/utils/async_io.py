@@ -0,0 +1,192 @@
+"""
+REALM FORGE: ASYNC FILE I/O v1.0
+PURPOSE: One bounded worker pool for blocking disk and pandas work done by async code
+         (arsenal tools, artifact routes), so a large file never stalls the event loop
+         that drives missions and WebSocket telemetry.
+         - run_io(fn, *args) runs any blocking callable on the pool (context vars kept).
+         - Thin wrappers for the common file operations; atomic writes go through a
+           temp file beside the target and os.replace().
+         - REALM_IO_WORKERS bounds the pool; excess work queues instead of spawning
+           threads.
+         - on_write(listener): the write/append/copy/move/remove wrappers report the
+           paths they changed (the search index re-reads them on its next query).
+         tests/test_async_io_lint.py rejects new blocking calls inside async arsenal tools.
+PATH: F:/agentic_workforce/src/utils/async_io.py
+"""
+
+import asyncio
+import contextvars
+import functools
+import os
+import shutil
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, List, Optional, TypeVar, Union
+
+IO_WORKERS = int(os.getenv("REALM_IO_WORKERS", "8"))
+
+T = TypeVar("T")
+PathLike = Union[str, Path]
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+_write_listeners: List[Callable[[List[Path]], None]] = []
+
+
+def _pool() -> ThreadPoolExecutor:
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(max_workers=IO_WORKERS, thread_name_prefix="realm-io")
+    return _executor
+
+
+async def run_io(fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """Runs a blocking callable on the shared I/O pool and awaits its result."""
+    loop = asyncio.get_running_loop()
+    call = functools.partial(contextvars.copy_context().run, fn, *args, **kwargs)
+    return await loop.run_in_executor(_pool(), call)
+
+
+def on_write(listener: Callable[[List[Path]], None]) -> None:
+    """Registers `listener(paths)`, called after each async write helper changed `paths`."""
+    if listener not in _write_listeners:
+        _write_listeners.append(listener)
+
+
+def _changed(*paths: Path) -> None:
+    for listener in list(_write_listeners):
+        try:
+            listener(list(paths))
+        except Exception:
+            pass  # Bookkeeping must never fail a write that already happened
+
+
+def shutdown(wait: bool = True) -> None:
+    """Stops the pool (app shutdown); the next run_io() starts a fresh one."""
+    global _executor
+    with _executor_lock:
+        executor, _executor = _executor, None
+    if executor is not None:
+        executor.shutdown(wait=wait)
+
+
+# ==============================================================================
+# 1. BLOCKING PRIMITIVES (run on the pool)
+# ==============================================================================
+
+def _write_text_sync(path: Path, content: str, encoding: str, atomic: bool) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    if not atomic:
+        path.write_text(content, encoding=encoding)
+        return
+    fd, temp_path = tempfile.mkstemp(prefix=f".{path.name}.", suffix=".tmp", dir=path.parent)
+    try:
+        with os.fdopen(fd, "w", encoding=encoding, newline="") as f:
+            f.write(content)
+        os.replace(temp_path, path)
+    except BaseException:
+        try:
+            os.remove(temp_path)
+        except FileNotFoundError:
+            pass
+        raise
+
+
+def _append_text_sync(path: Path, content: str, encoding: str) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "a", encoding=encoding) as f:
+        f.write(content)
+
+
+def _write_bytes_sync(path: Path, data: bytes) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(data)
+
+
+def _copy_sync(src: Path, dst: Path) -> None:
+    dst.parent.mkdir(parents=True, exist_ok=True)
+    shutil.copy2(str(src), str(dst))
+
+
+def _move_sync(src: Path, dst: Path) -> None:
+    dst.parent.mkdir(parents=True, exist_ok=True)
+    shutil.move(str(src), str(dst))
+
+
+def _remove_sync(path: Path) -> None:
+    if path.is_dir():
+        shutil.rmtree(path)
+    else:
+        os.remove(path)
+
+
+def _walk_files_sync(root: Path, max_size: Optional[int]) -> List[Path]:
+    files = []
+    for dirpath, _, names in os.walk(root):
+        for name in names:
+            path = Path(dirpath) / name
+            if max_size is not None:
+                try:
+                    if path.stat().st_size >= max_size:
+                        continue
+                except OSError:
+                    continue
+            files.append(path)
+    return files
+
+
+# ==============================================================================
+# 2. ASYNC FILE API
+# ==============================================================================
+
+async def read_text(path: PathLike, encoding: str = "utf-8", errors: Optional[str] = None) -> str:
+    return await run_io(Path(path).read_text, encoding=encoding, errors=errors)
+
+
+async def read_bytes(path: PathLike) -> bytes:
+    return await run_io(Path(path).read_bytes)
+
+
+async def write_text(path: PathLike, content: str, encoding: str = "utf-8", atomic: bool = False) -> None:
+    """Writes `content`, creating parent directories; atomic=True replaces via a temp file."""
+    await run_io(_write_text_sync, Path(path), content, encoding, atomic)
+    _changed(Path(path))
+
+
+async def write_bytes(path: PathLike, data: bytes) -> None:
+    await run_io(_write_bytes_sync, Path(path), data)
+    _changed(Path(path))
+
+
+async def append_text(path: PathLike, content: str, encoding: str = "utf-8") -> None:
+    await run_io(_append_text_sync, Path(path), content, encoding)
+    _changed(Path(path))
+
+
+async def copy_file(src: PathLike, dst: PathLike) -> None:
+    await run_io(_copy_sync, Path(src), Path(dst))
+    _changed(Path(dst))
+
+
+async def move(src: PathLike, dst: PathLike) -> None:
+    await run_io(_move_sync, Path(src), Path(dst))
+    _changed(Path(src), Path(dst))
+
+
+async def remove(path: PathLike) -> None:
+    """Deletes a file, or a directory tree."""
+    await run_io(_remove_sync, Path(path))
+    _changed(Path(path))
+
+
+async def list_dir(path: PathLike) -> List[str]:
+    return await run_io(os.listdir, path)
+
+
+async def walk_files(root: PathLike, max_size: Optional[int] = None) -> List[Path]:
+    """Every file under `root` (optionally only those smaller than `max_size` bytes)."""
+    return await run_io(_walk_files_sync, Path(root), max_size)
@@ -0,0 +1,113 @@
+"""
+REALM FORGE: HTTP CACHE HELPERS v1.0
+PURPOSE: Conditional (ETag / If-None-Match) and compressed JSON responses for read-heavy
+         HUD endpoints (lattice graph, viewport queries, agent roster).
+         - Bodies are serialized with orjson when available.
+         - br (if the brotli module is installed) or gzip per Accept-Encoding;
+           bodies under MIN_COMPRESS_BYTES are sent as-is.
+PATH: F:/agentic_workforce/src/utils/http_cache.py
+"""
+
+import gzip
+import json
+from typing import Any, Callable, Dict, Optional
+
+from fastapi import Request, Response
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional accelerator
+    orjson = None
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - optional codec
+    brotli = None
+
+GZIP_LEVEL = 6
+BROTLI_QUALITY = 5
+# Smaller bodies (304s, empty diffs, single pages) are not worth a compression frame
+MIN_COMPRESS_BYTES = 1024
+
+
+def dumps(payload: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(payload, default=str, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(payload, separators=(",", ":"), ensure_ascii=False, default=str).encode("utf-8")
+
+
+def negotiate_encoding(accept_encoding: Optional[str]) -> Optional[str]:
+    """Picks br > gzip from an Accept-Encoding header (q=0 entries are refused)."""
+    offered = {}
+    for part in (accept_encoding or "").lower().split(","):
+        name, _, params = part.strip().partition(";")
+        q = 1.0
+        if params.strip().startswith("q="):
+            try:
+                q = float(params.strip()[2:])
+            except ValueError:
+                q = 0.0
+        if name:
+            offered[name] = q
+    if brotli is not None and offered.get("br", 0) > 0:
+        return "br"
+    if offered.get("gzip", 0) > 0:
+        return "gzip"
+    return None
+
+
+def compress(body: bytes, encoding: Optional[str]) -> bytes:
+    if encoding == "br":
+        return brotli.compress(body, quality=BROTLI_QUALITY)
+    if encoding == "gzip":
+        return gzip.compress(body, compresslevel=GZIP_LEVEL, mtime=0)
+    return body
+
+
+class EncodedBody:
+    """A serialized JSON body that compresses itself at most once per encoding."""
+
+    __slots__ = ("_encoded",)
+
+    def __init__(self, raw: bytes):
+        self._encoded: Dict[Optional[str], bytes] = {None: raw}
+
+    def encoded(self, encoding: Optional[str] = None) -> bytes:
+        body = self._encoded.get(encoding)
+        if body is None:
+            body = self._encoded[encoding] = compress(self._encoded[None], encoding)
+        return body
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    return any(tag.strip().removeprefix("W/") == etag for tag in if_none_match.split(","))
+
+
+def conditional_response(request: Request, etag: str, raw: Optional[bytes] = None,
+                         encoded: Optional[Callable[[Optional[str]], bytes]] = None) -> Response:
+    """
+    304 when the client already holds `etag`, otherwise the JSON body: either `raw`
+    bytes (compressed per request) or an `encoded(encoding)` callable that serves
+    pre-compressed bytes from the caller's own cache.
+    """
+    headers = {"ETag": etag, "Cache-Control": "no-cache", "Vary": "Accept-Encoding"}
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+
+    encoding = negotiate_encoding(request.headers.get("accept-encoding"))
+    if encoded is not None:
+        if encoding and len(encoded(None)) >= MIN_COMPRESS_BYTES:
+            body = encoded(encoding)
+            headers["Content-Encoding"] = encoding
+        else:
+            body = encoded(None)
+    elif encoding and len(raw) >= MIN_COMPRESS_BYTES:
+        body = compress(raw, encoding)
+        headers["Content-Encoding"] = encoding
+    else:
+        body = raw
+    return Response(content=body, media_type="application/json", headers=headers)
@@ -0,0 +1,24 @@
+"""
+REALM FORGE: CURSOR PAGINATION v1.0
+PURPOSE: Opaque keyset cursors shared by paginated endpoints (lattice nodes, agent roster).
+         A cursor is the sort key of the last item served, so pages stay stable
+         while the underlying index is rebuilt between requests.
+PATH: F:/agentic_workforce/src/utils/pagination.py
+"""
+
+import base64
+from typing import Optional
+
+
+def encode_cursor(sort_key: str) -> str:
+    return base64.urlsafe_b64encode(sort_key.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: Optional[str]) -> Optional[str]:
+    """The sort key inside `cursor` (None for the first page); ValueError if malformed."""
+    if not cursor:
+        return None
+    try:
+        return base64.b64decode(cursor + "=" * (-len(cursor) % 4), altchars=b"-_", validate=True).decode("utf-8")
+    except (ValueError, UnicodeDecodeError):
+        raise ValueError("Malformed cursor")
@@ -0,0 +1,165 @@
+"""
+REALM FORGE: STREAMING FILE I/O v1.0
+PURPOSE: Bounded-memory file transfer primitives for artifact endpoints.
+         - parse_range(): single HTTP byte range (RFC 9110) against a known size.
+         - iter_file(): async chunk iterator over [start, end] of a file.
+         - AtomicWriter: streams chunks into a temp file beside the target while
+           hashing (sha256), then fsyncs and os.replace()s it into place, so readers
+           never observe a half-written artifact.
+         Blocking calls run on the shared async_io pool; memory per transfer is one chunk.
+PATH: F:/agentic_workforce/src/utils/streaming_io.py
+"""
+
+import hashlib
+import os
+import tempfile
+from pathlib import Path
+from typing import AsyncIterator, Optional, Tuple
+
+from src.utils.async_io import run_io
+
+IO_CHUNK_SIZE = int(os.getenv("REALM_IO_CHUNK_SIZE", str(256 * 1024)))
+
+
+class RangeNotSatisfiable(ValueError):
+    """The Range header is well-formed but selects no byte of the file (HTTP 416)."""
+
+
+def parse_range(header: Optional[str], size: int) -> Optional[Tuple[int, int]]:
+    """
+    (start, end) inclusive for a single `bytes=` range, or None when the header is
+    absent, malformed or asks for several ranges (the full body is served instead,
+    which RFC 9110 permits). Raises RangeNotSatisfiable for out-of-bounds ranges.
+    """
+    if not header:
+        return None
+    unit, _, spec = header.partition("=")
+    if unit.strip().lower() != "bytes" or "," in spec:
+        return None
+    first, sep, last = spec.strip().partition("-")
+    if not sep:
+        return None
+    try:
+        start = int(first) if first else None
+        end = int(last) if last else None
+    except ValueError:
+        return None
+    if start is None:
+        if end is None:
+            return None
+        if end <= 0 or size == 0:  # bytes=-N: the last N bytes
+            raise RangeNotSatisfiable(header)
+        return max(size - end, 0), size - 1
+    if end is None:
+        end = size - 1
+    if start >= size:
+        raise RangeNotSatisfiable(header)
+    if end < start:
+        return None
+    return start, min(end, size - 1)
+
+
+def _read_at(f, offset: int, length: int) -> bytes:
+    f.seek(offset)
+    return f.read(length)
+
+
+async def iter_file(path: Path, start: int = 0, end: Optional[int] = None,
+                    chunk_size: int = IO_CHUNK_SIZE) -> AsyncIterator[bytes]:
+    """
+    Yields bytes [start, end] (inclusive) one chunk at a time. With end=None it reads
+    until a short read, so bytes appended while streaming (growing logs) are sent too.
+    """
+    f = await run_io(open, path, "rb")
+    try:
+        offset = start
+        while end is None or offset <= end:
+            size = chunk_size if end is None else min(chunk_size, end - offset + 1)
+            chunk = await run_io(_read_at, f, offset, size)
+            if chunk:
+                offset += len(chunk)
+                yield chunk
+            if len(chunk) < size:
+                break  # EOF (or the file shrank underneath us)
+    finally:
+        await run_io(f.close)
+
+
+def _write_hashed(f, hasher, chunk: bytes) -> None:
+    f.write(chunk)
+    hasher.update(chunk)
+
+
+def _commit(f, temp_path: str, target: Path) -> None:
+    try:
+        f.flush()
+        os.fsync(f.fileno())
+    finally:
+        f.close()
+    try:
+        os.replace(temp_path, target)
+    except OSError:
+        os.remove(temp_path)
+        raise
+
+
+def _discard(f, temp_path: str) -> None:
+    try:
+        f.close()
+    finally:
+        try:
+            os.remove(temp_path)
+        except FileNotFoundError:
+            pass
+
+
+class AtomicWriter:
+    """
+    async with AtomicWriter(target) as w:
+        await w.write(chunk)          # repeatedly
+    -> target replaced on clean exit; temp file removed on error or abort().
+    """
+
+    def __init__(self, target: Path, max_bytes: Optional[int] = None):
+        self.target = Path(target)
+        self.max_bytes = max_bytes
+        self.size = 0
+        self.sha256: Optional[str] = None
+        self._hasher = hashlib.sha256()
+        self._file = None
+        self._temp_path: Optional[str] = None
+        self._aborted = False
+
+    def _open(self) -> None:
+        self.target.parent.mkdir(parents=True, exist_ok=True)
+        # Same directory as the target so os.replace() stays a same-filesystem rename
+        fd, self._temp_path = tempfile.mkstemp(prefix=f".{self.target.name}.", suffix=".part", dir=self.target.parent)
+        os.chmod(self._temp_path, 0o644)  # mkstemp is owner-only; artifacts are shared files
+        self._file = os.fdopen(fd, "wb")
+
+    async def __aenter__(self) -> "AtomicWriter":
+        await run_io(self._open)
+        return self
+
+    async def write(self, chunk: bytes) -> None:
+        if not chunk:
+            return
+        self.size += len(chunk)
+        if self.max_bytes is not None and self.size > self.max_bytes:
+            raise OverflowError(f"Upload exceeds {self.max_bytes} bytes")
+        await run_io(_write_hashed, self._file, self._hasher, chunk)
+
+    def digest(self) -> str:
+        """sha256 of everything written so far."""
+        return self._hasher.hexdigest()
+
+    def abort(self) -> None:
+        """Discard the upload on exit instead of renaming it into place."""
+        self._aborted = True
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        if exc_type is None and not self._aborted:
+            self.sha256 = self.digest()
+            await run_io(_commit, self._file, self._temp_path, self.target)
+        else:
+            await run_io(_discard, self._file, self._temp_path)
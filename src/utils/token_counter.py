@@ -0,0 +1,72 @@
+"""
+REALM FORGE: TOKEN COUNTER v1.0
+PURPOSE: Fast token estimates for prompt budgeting across the Sovereign Brain.
+PATH: F:/agentic_workforce/src/utils/token_counter.py
+"""
+
+from functools import lru_cache
+from typing import Any, Iterable
+
+# Per-message framing overhead (role markers, separators) used by chat templates.
+MESSAGE_OVERHEAD_TOKENS = 4
+
+_ENCODER: Any = None
+_ENCODER_LOADED = False
+
+
+def _get_encoder():
+    """Lazily loads the tiktoken encoder. Falls back to heuristics when offline."""
+    global _ENCODER, _ENCODER_LOADED
+    if not _ENCODER_LOADED:
+        _ENCODER_LOADED = True
+        try:
+            import tiktoken
+            _ENCODER = tiktoken.get_encoding("cl100k_base")
+        except Exception:
+            _ENCODER = None
+    return _ENCODER
+
+
+@lru_cache(maxsize=4096)
+def count_tokens(text: str) -> int:
+    """Returns the token count for a string (cached for repeated prompt fragments)."""
+    if not text:
+        return 0
+    encoder = _get_encoder()
+    if encoder is not None:
+        return len(encoder.encode(text, disallowed_special=()))
+    # Heuristic: ~4 characters per token for English/code mixes
+    return max(1, len(text) // 4)
+
+
+def message_text(message: Any) -> str:
+    """Extracts plain text from a LangChain message (string or multi-part content)."""
+    content = getattr(message, "content", message)
+    if isinstance(content, str):
+        return content
+    if isinstance(content, list):
+        parts = []
+        for part in content:
+            if isinstance(part, dict):
+                parts.append(str(part.get("text", "")))
+            else:
+                parts.append(str(part))
+        return " ".join(parts)
+    return str(content or "")
+
+
+def count_message_tokens(messages: Iterable[Any]) -> int:
+    """Returns the approximate prompt cost of a message list."""
+    return sum(count_tokens(message_text(m)) + MESSAGE_OVERHEAD_TOKENS for m in messages)
+
+
+def truncate_to_tokens(text: str, max_tokens: int, suffix: str = " …[truncated]") -> str:
+    """Trims text so it fits within max_tokens (keeps the head of the text)."""
+    if max_tokens <= 0:
+        return ""
+    if count_tokens(text) <= max_tokens:
+        return text
+    encoder = _get_encoder()
+    if encoder is not None:
+        return encoder.decode(encoder.encode(text, disallowed_special=())[:max_tokens]) + suffix
+    return text[: max_tokens * 4] + suffix
@@ -0,0 +1,39 @@
+"""
+REALM FORGE: ARTIFACT EXTRACTION TEST v1.0
+PURPOSE: Verifies structured artifact reporting, the capped fallback scan and
+         path-only argument sanitization used by the executor.
+PATH: F:/agentic_workforce/tests/test_artifact_extraction.py
+"""
+
+from pathlib import PureWindowsPath
+
+from src.system.artifact_extraction import extract_artifacts, sanitize_args, scan_text, with_artifacts
+
+
+def test_structured_output_is_a_string_and_skips_the_scan():
+    out = with_artifacts("[SUCCESS] Wrote F:/agentic_workforce/data/ignored.txt", PureWindowsPath(r"F:\agentic_workforce\data\report.md"))
+    assert isinstance(out, str) and "Wrote" in out and out.upper().startswith("[SUCCESS]")
+    assert out.artifacts == ("F:/agentic_workforce/data/report.md",)
+    # The tool's own list is authoritative: no arg paths, no text scan
+    assert extract_artifacts(out, ["F:/agentic_workforce/data/src.txt"]) == ["F:/agentic_workforce/data/report.md"]
+    assert str(out) == "[SUCCESS] Wrote F:/agentic_workforce/data/ignored.txt"
+
+
+def test_fallback_scan_and_argument_sanitization():
+    text = (
+        "Saved to F:/agentic_workforce/data/a.csv. Copy at f:\\RealmWorkspaces\\acme\\b.txt, "
+        "see (F:/agentic_workforce/data/c.json) and {'p': 'F:/agentic_workforce/data/d.py'} F:/ "
+    )
+    assert scan_text(text) == [
+        "F:/agentic_workforce/data/a.csv", "f:/RealmWorkspaces/acme/b.txt",
+        "F:/agentic_workforce/data/c.json", "F:/agentic_workforce/data/d.py",
+    ]
+    assert scan_text("x" * 100 + " F:/late/file.txt", limit=100) == []
+    assert scan_text("no drive paths here") == []
+
+    content = "print('F:\\\\agentic_workforce')\nprint(1)"
+    args, paths = sanitize_args({"file_path": r"F:\agentic_workforce\data\out.py", "content": content, "n": 3})
+    assert args == {"file_path": "F:/agentic_workforce/data/out.py", "content": content, "n": 3}
+    assert paths == ["F:/agentic_workforce/data/out.py"]
+    assert extract_artifacts("Done: F:/agentic_workforce/data/out.py", paths) == ["F:/agentic_workforce/data/out.py"]
+    assert extract_artifacts({"rows": 3}) == []
@@ -0,0 +1,92 @@
+"""
+REALM FORGE: ARTIFACT STORE TEST v1.0
+PURPOSE: Verifies the (path, size, mtime) hash cache, parallel batch hashing and
+         content-addressed dedup used by IronClad validation.
+PATH: F:/agentic_workforce/tests/test_artifact_store.py
+"""
+
+import hashlib
+import os
+
+import pytest
+
+from src.memory.artifact_store import ArtifactStore, HashCache, sha256_file
+
+
+def _age(path, seconds=60):
+    """Backdates mtime past the racy window so the digest may be cached."""
+    st = os.stat(path)
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns - seconds * 1_000_000_000))
+
+
+def test_hash_cache_skips_unchanged_files(tmp_path):
+    big = tmp_path / "big.bin"
+    big.write_bytes(os.urandom(3 * 1024 * 1024 + 7))
+    expected = hashlib.sha256(big.read_bytes()).hexdigest()
+    assert sha256_file(big, chunk_size=1024 * 1024) == expected
+    assert sha256_file(big, mmap_min=1) == expected
+
+    _age(big)
+    cache = HashCache(path=tmp_path / "index.db")
+    assert cache.file_hash(big) == expected and (cache.hits, cache.misses) == (0, 1)
+    # A fresh instance reads the persisted digest instead of the file
+    reopened = HashCache(path=tmp_path / "index.db")
+    assert reopened.file_hash(big) == expected and (reopened.hits, reopened.misses) == (1, 0)
+
+    # Same size, new mtime: rehashed
+    data = bytearray(big.read_bytes())
+    data[0] ^= 0xFF
+    big.write_bytes(bytes(data))
+    assert reopened.file_hash(big) == hashlib.sha256(bytes(data)).hexdigest()
+    assert reopened.misses == 1
+    # Just written: not trusted for reuse until it is out of the racy window
+    assert reopened.file_hash(big) and reopened.misses == 2
+
+
+@pytest.mark.asyncio
+async def test_batch_hashing_and_content_addressed_dedup(tmp_path):
+    cache = HashCache(path=tmp_path / "index.db", concurrency=2)
+    store = ArtifactStore(root=tmp_path / "objects", cache=cache, max_bytes=1024)
+    files = []
+    for i in range(6):
+        f = tmp_path / f"a{i}.txt"
+        f.write_text("same" if i % 2 else f"unique {i}", encoding="utf-8")
+        _age(f)
+        files.append(str(f))
+    huge = tmp_path / "huge.txt"
+    huge.write_bytes(b"x" * 2048)
+    missing = str(tmp_path / "gone.txt")
+
+    digests = await store.aput_many(files + [str(huge), missing, files[0]])
+    assert list(digests) == files + [str(huge), missing]
+    assert digests[missing] is None
+    assert digests[files[1]] == digests[files[3]] == hashlib.sha256(b"same").hexdigest()
+    assert cache.misses == 7  # The duplicate path is hashed once
+    # 3 unique + 1 shared object; the oversized file is hashed but not copied
+    objects = sorted(p for p in (tmp_path / "objects").rglob("*") if p.is_file())
+    assert len(objects) == 4 and not store.has(digests[str(huge)])
+    with store.open(digests[files[1]]) as f:
+        assert f.read() == b"same"
+
+    # Second validation pass: every aged file is a cache hit, nothing is re-read
+    again = await store.aput_many(files)
+    assert again == {f: digests[f] for f in files} and cache.hits == 6
+    assert store.put_bytes(b"same") == digests[files[1]]
+    assert len([p for p in (tmp_path / "objects").rglob("*") if p.is_file()]) == 4
+
+
+def test_store_cap_evicts_least_recently_used(tmp_path):
+    store = ArtifactStore(root=tmp_path / "objects", cache=HashCache(path=tmp_path / "index.db"), cap_bytes=3000)
+    digests = []
+    for i in range(3):
+        digests.append(store.put_bytes(bytes([i]) * 1000))
+        _age(store.object_path(digests[-1]), seconds=60 - i)  # Stored in order 0, 1, 2
+    stale_tmp = store.root / ".incoming.dead.tmp"
+    stale_tmp.write_bytes(b"partial")
+    _age(stale_tmp, seconds=7200)
+
+    assert store.put_bytes(bytes([0]) * 1000) == digests[0]  # Reuse refreshes object 0
+    fresh = store.put_bytes(b"\xff" * 1000)  # 4000 > cap: evict down to 2700
+
+    assert [store.has(d) for d in digests] == [True, False, False] and store.has(fresh)
+    assert store.usage() == 2000 and not stale_tmp.exists()
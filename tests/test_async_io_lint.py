@@ -0,0 +1,117 @@
+"""
+REALM FORGE: ASYNC I/O LINT TEST v1.0
+PURPOSE: Fails when an async arsenal tool does blocking file, pandas or process work on
+         the event loop instead of routing it through src/utils/async_io.
+         Cheap metadata calls (exists/stat/mkdir) are tolerated; anything that reads,
+         writes, copies or walks content is not. Nested sync helpers and lambdas are
+         skipped because they are what gets handed to run_io().
+PATH: F:/agentic_workforce/tests/test_async_io_lint.py
+"""
+
+import ast
+import asyncio
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from src.utils import async_io
+
+ARSENAL_DIR = Path(__file__).resolve().parents[1] / "src" / "system" / "arsenal"
+
+BLOCKING_NAMES = {"open"}
+BLOCKING_ATTRS = {
+    "read_text", "write_text", "read_bytes", "write_bytes", "rglob", "glob", "iterdir",
+    "to_csv", "to_excel", "to_json", "to_parquet", "unpack_archive", "make_archive",
+}
+BLOCKING_CALLS = {
+    ("os", "walk"), ("os", "listdir"), ("os", "scandir"), ("time", "sleep"),
+    ("subprocess", "run"), ("subprocess", "check_output"), ("subprocess", "call"), ("subprocess", "Popen"),
+}
+BLOCKING_MODULES = {"shutil", "requests"}
+
+
+def _blocking_call(call: ast.Call):
+    f = call.func
+    if isinstance(f, ast.Name):
+        return f.id if f.id in BLOCKING_NAMES else None
+    if not isinstance(f, ast.Attribute):
+        return None
+    if f.attr in BLOCKING_ATTRS:
+        return f.attr
+    if isinstance(f.value, ast.Name):
+        owner = f.value.id
+        if (owner, f.attr) in BLOCKING_CALLS or owner in BLOCKING_MODULES:
+            return f"{owner}.{f.attr}"
+        if owner == "pd" and f.attr.startswith("read_"):
+            return f"pd.{f.attr}"
+    return None
+
+
+def blocking_calls(tree: ast.AST):
+    """(async function, line, call) for every blocking call made directly in an async body."""
+    found = []
+    for fn in ast.walk(tree):
+        if not isinstance(fn, ast.AsyncFunctionDef):
+            continue
+        stack = list(ast.iter_child_nodes(fn))
+        while stack:
+            node = stack.pop()
+            if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.Lambda, ast.ClassDef)):
+                continue
+            if isinstance(node, ast.Await) and isinstance(node.value, ast.Call):
+                stack.extend(ast.iter_child_nodes(node.value))  # Awaited calls are coroutines
+                continue
+            if isinstance(node, ast.Call):
+                name = _blocking_call(node)
+                if name:
+                    found.append((fn.name, node.lineno, name))
+            stack.extend(ast.iter_child_nodes(node))
+    return found
+
+
+def test_detector_flags_direct_calls_only():
+    tree = ast.parse(
+        "async def bad(p):\n"
+        "    data = open(p).read()\n"
+        "    df = pd.read_csv(p)\n"
+        "    df.to_csv(p)\n"
+        "async def good(p):\n"
+        "    def _sync():\n"
+        "        return Path(p).read_text()\n"
+        "    frame = pd.DataFrame([])\n"
+        "    await async_io.write_text(p, '')\n"
+        "    return await run_io(_sync), await run_io(lambda: shutil.copy(p, p))\n"
+    )
+    assert sorted(name for _, _, name in blocking_calls(tree)) == ["open", "pd.read_csv", "to_csv"]
+
+
+def test_arsenal_tools_do_not_block_the_event_loop():
+    offenders = []
+    for path in sorted(ARSENAL_DIR.glob("*.py")):
+        try:
+            tree = ast.parse(path.read_text(encoding="utf-8-sig"))
+        except SyntaxError:
+            continue  # Unimportable anyway; nothing of it can run on the loop
+        offenders += [f"{path.name}:{line} {fn}() calls {name}" for fn, line, name in blocking_calls(tree)]
+    assert not offenders, "Route these through src.utils.async_io:\n" + "\n".join(offenders)
+
+
+@pytest.mark.asyncio
+async def test_run_io_keeps_the_loop_responsive():
+    started = time.perf_counter()
+    ticks = 0
+
+    async def ticker():
+        nonlocal ticks
+        while time.perf_counter() - started < 0.2:
+            ticks += 1
+            await asyncio.sleep(0.01)
+
+    workers = await asyncio.gather(
+        *(async_io.run_io(lambda: (time.sleep(0.05), threading.current_thread().name)[1]) for _ in range(4)),
+        ticker(),
+    )
+    assert ticks >= 10
+    assert all(name.startswith("realm-io") for name in workers[:4])
@@ -0,0 +1,30 @@
+"""
+REALM FORGE: AUDIO FRAME TEST v1.0
+PURPOSE: Verifies the binary TTS frame header and chunk coalescing.
+PATH: F:/agentic_workforce/tests/test_audio_frames.py
+"""
+
+import pytest
+
+from src.system.audio_frames import audio_frames, pack_audio_frame, unpack_audio_frame
+
+
+def test_frame_header_round_trip():
+    frame = unpack_audio_frame(pack_audio_frame("MSN-1A2B3C4D", 7, 3, b"\xff\xfbmp3", final=True))
+
+    assert (frame.mission_id, frame.msg_seq, frame.chunk_seq, frame.final) == ("MSN-1A2B3C4D", 7, 3, True)
+    assert frame.payload == b"\xff\xfbmp3"
+
+
+@pytest.mark.asyncio
+async def test_first_chunk_is_immediate_then_coalesced():
+    async def tts():
+        for _ in range(10):
+            yield b"x" * 1000
+
+    frames = [unpack_audio_frame(f) async for f in audio_frames("MSN-1", 1, tts(), coalesce_bytes=4000)]
+
+    assert [len(f.payload) for f in frames] == [1000, 4000, 4000, 1000]
+    assert [f.chunk_seq for f in frames] == [0, 1, 2, 3]
+    assert [f.final for f in frames] == [False, False, False, True]
+    assert b"".join(f.payload for f in frames) == b"x" * 10000
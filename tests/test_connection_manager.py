@@ -0,0 +1,159 @@
+"""
+REALM FORGE: CONNECTION MANAGER TEST v1.0
+PURPOSE: Verifies broadcast never waits on slow WebSocket clients.
+PATH: F:/agentic_workforce/tests/test_connection_manager.py
+"""
+
+import asyncio
+import json
+import time
+
+import pytest
+from langchain_core.messages import AIMessage
+
+from src.system import metrics
+from src.system.connection_manager import ConnectionManager
+
+
+class FakeSocket:
+    def __init__(self, delay: float = 0.0, block: bool = False):
+        self.delay = delay
+        self.block = block
+        self.frames = []
+        self.closed = None
+
+    async def accept(self):
+        pass
+
+    async def send_text(self, text):
+        if self.block:
+            await asyncio.Event().wait()
+        await asyncio.sleep(self.delay)
+        self.frames.append(json.loads(text))
+
+    async def send_bytes(self, data):
+        self.frames.append(data)
+
+    async def close(self, code=1000):
+        self.closed = code
+
+
+@pytest.mark.asyncio
+async def test_broadcast_does_not_wait_on_slow_clients():
+    manager = ConnectionManager(queue_size=64)
+    fast, slow = FakeSocket(), FakeSocket(delay=0.2)
+    await manager.connect(fast)
+    await manager.connect(slow)
+
+    started = time.perf_counter()
+    for i in range(10):
+        await manager.broadcast({"type": "audio_chunk", "seq": i})
+    assert time.perf_counter() - started < 0.05
+
+    await asyncio.sleep(0.05)
+    assert [f["seq"] for f in fast.frames] == list(range(10))
+    assert len(slow.frames) < 10
+    manager.disconnect(fast)
+    manager.disconnect(slow)
+
+
+@pytest.mark.asyncio
+async def test_full_queue_drops_oldest_telemetry_then_evicts():
+    manager = ConnectionManager(queue_size=4)
+    dropped_before = metrics.WS_DROPPED_FRAMES._default.value
+    slow_before = metrics.WS_SLOW_DISCONNECTS._default.value
+    stuck = FakeSocket(block=True)
+    await manager.connect(stuck, owner="alice")
+    await asyncio.sleep(0)  # Sender picks up the first frame and blocks on it
+
+    await manager.broadcast({"type": "mission_complete", "mission_id": "M0"}, user_id="alice")
+    for i in range(10):
+        await manager.broadcast({"type": "diagnostic", "text": f"line {i}"})
+    channel = manager.channels[stuck]
+    assert channel.dropped >= 6
+    assert [json.loads(p)["text"] for _, p in channel.frames if b"diagnostic" in p.encode()][-1] == "line 9"
+
+    for i in range(5):
+        await manager.broadcast({"type": "mission_complete", "mission_id": f"M{i + 1}"}, user_id="alice")
+    await asyncio.sleep(0)
+    assert stuck not in manager.channels
+    assert manager.stats()["slow_disconnects"] == 1
+    # Counted when it happens, so evicted clients' drops are not lost from /metrics
+    assert metrics.WS_DROPPED_FRAMES._default.value - dropped_before == channel.dropped
+    assert metrics.WS_SLOW_DISCONNECTS._default.value - slow_before == 1
+    assert stuck.closed == 1013
+
+
+@pytest.mark.asyncio
+async def test_topic_frames_reach_only_entitled_subscribers():
+    manager = ConnectionManager()
+    idle, alice, ops, root = FakeSocket(), FakeSocket(), FakeSocket(), FakeSocket()
+    await manager.connect(idle, owner="carol")
+    await manager.connect(alice, owner="alice")
+    await manager.connect(ops, owner="alice", silo="Cybersecurity")
+    await manager.connect(root, silo="Cybersecurity")  # Master key: no owner
+
+    await manager.broadcast({"type": "node_update", "node": "PLANNER"}, mission_id="M1", user_id="bob", silo="Cybersecurity")
+    await manager.broadcast({"type": "node_update", "node": "EXECUTOR"}, mission_id="M2", user_id="alice", silo="Cybersecurity")
+    await manager.broadcast({"type": "diagnostic", "text": "kernel"})
+    await asyncio.sleep(0.01)
+
+    # No firehose: other tenants' frames never reach a client, silo or not
+    assert [f.get("node", f.get("text")) for f in idle.frames] == ["kernel"]
+    assert [f.get("node", f.get("text")) for f in alice.frames] == ["EXECUTOR", "kernel"]
+    assert [f.get("node", f.get("text")) for f in ops.frames] == ["EXECUTOR", "kernel"]
+    assert [f.get("node", f.get("text")) for f in root.frames] == ["PLANNER", "EXECUTOR", "kernel"]
+
+    # Subscriptions are limited to the owner's user_id and missions
+    assert manager.subscribe(idle, user_id="bob", mission_id="M1") == []
+    assert manager.subscribe(alice, mission_id=["M1", "M2"]) == [("mission_id", "M2")]
+    assert manager.subscribe(root, mission_id="M1") == [("mission_id", "M1")]
+    manager.unsubscribe(ops, silo="Cybersecurity", user_id="alice")
+    assert manager.channels[ops].topics == set()
+
+
+@pytest.mark.asyncio
+async def test_late_subscriber_gets_mission_snapshot():
+    manager = ConnectionManager()
+    await manager.broadcast({"type": "diagnostic", "text": "Strike M1 initialized"}, mission_id="M1", user_id="alice")
+    await manager.broadcast({"type": "node_update", "node": "EXECUTOR", "agent": "Sentinel", "dept": "Cybersecurity", "handoffs": []},
+                            mission_id="M1", user_id="alice", silo="Cybersecurity")
+
+    manager.track_state("M1", {"active_agent": "Sentinel", "messages": [AIMessage(content="x" * 5000)]})
+
+    late, other = FakeSocket(), FakeSocket()
+    await manager.connect(late, owner="alice")
+    await manager.connect(other, owner="bob", silo="Cybersecurity")
+    manager.subscribe(late, mission_id="M1")
+    await asyncio.sleep(0.01)
+    assert other.frames == []  # Same silo, other tenant: no snapshot either
+
+    snap = late.frames[0]
+    assert snap["type"] == "snapshot" and snap["mission_id"] == "M1"
+    assert snap["node"] == "EXECUTOR" and snap["status"] == "RUNNING"
+    assert snap["diagnostics"] == ["Strike M1 initialized"]
+    assert snap["state"]["active_agent"] == "Sentinel"
+    assert snap["state"]["messages"] == [{"role": "ai", "content": "x" * 2000}]
+
+
+@pytest.mark.asyncio
+async def test_checkpoint_loader_runs_only_for_late_subscribers():
+    manager = ConnectionManager()
+    await manager.broadcast({"type": "mission_started", "mission_id": "M1"}, mission_id="M1", user_id="alice")
+    loads = []
+
+    def loader():
+        loads.append(1)
+        return {"active_agent": "Sentinel", "messages": [AIMessage(content="scan done")]}
+
+    manager.track_state("M1", loader)
+    for _ in range(3):
+        await manager.broadcast({"type": "node_update", "node": "EXECUTOR"}, mission_id="M1", user_id="alice")
+    assert loads == []
+
+    late = FakeSocket()
+    await manager.connect(late, owner="alice", mission_id="M1")
+    await asyncio.sleep(0.01)
+    snap = [f for f in late.frames if f["type"] == "snapshot"][0]
+    assert loads == [1] and "state_loader" not in snap
+    assert snap["state"]["messages"] == [{"role": "ai", "content": "scan done"}]
@@ -0,0 +1,45 @@
+"""
+REALM FORGE: CONTEXT WINDOW TEST v1.0
+PURPOSE: Verifies planner history stays within budget across long re-trace loops.
+PATH: F:/agentic_workforce/tests/test_context_window.py
+"""
+
+from langchain_core.messages import AIMessage, HumanMessage, ToolMessage
+
+from src.system.context_window import ContextWindow, latest_directive
+from src.utils.token_counter import count_message_tokens
+
+
+def _long_history(turns: int):
+    messages = [HumanMessage(content="Audit the cybersecurity logs in F:/agentic_workforce/data/logs")]
+    for i in range(turns):
+        messages.append(AIMessage(content="⚙️ [PLANNING]: Analyzing neural lattice and drafting maneuvers..."))
+        messages.append(AIMessage(content=f"📋 [PLAN_LOCKED]: Orchestrating kinetic strike with {i} tasks."))
+        messages.append(ToolMessage(tool_call_id=f"call-{i}", content=f"scan result {i} " * 80))
+        messages.append(AIMessage(content=f"🚨 [AUDIT_FAIL]: Placeholder detected on pass {i}."))
+    return messages
+
+
+def test_window_is_bounded_regardless_of_loop_count():
+    window = ContextWindow(budget_tokens=800, max_message_tokens=200, digest_tokens=150)
+    short = window.compact(_long_history(3))
+    long = window.compact(_long_history(60))
+
+    assert count_message_tokens(long) <= 800
+    assert count_message_tokens(short) <= 800
+    # Directive stays pinned at the head
+    assert isinstance(long[0], HumanMessage)
+    assert "cybersecurity logs" in long[0].content
+
+
+def test_telemetry_is_stripped_and_older_turns_digested():
+    window = ContextWindow(budget_tokens=800, max_message_tokens=200, digest_tokens=150)
+    history = window.compact(_long_history(20))
+
+    assert not any("[PLANNING]" in m.content or "[PLAN_LOCKED]" in m.content for m in history)
+    assert history[1].content.startswith("ROLLING_DIGEST")
+    assert "[AUDIT_FAIL]" in history[-1].content
+
+
+def test_latest_directive_skips_telemetry_tail():
+    assert latest_directive(_long_history(2)).startswith("Audit the cybersecurity logs")
@@ -0,0 +1,122 @@
+"""
+REALM FORGE: CREDIT LEDGER TEST v1.0
+PURPOSE: Verifies immediate reservations, batched write-behind and crash replay of the journal.
+PATH: F:/agentic_workforce/tests/test_credit_ledger.py
+"""
+
+import asyncio
+import json
+
+import pytest
+import pytest_asyncio
+
+from src.auth import db_pool, gatekeeper
+from src.system.billing import credit_ledger as credit_ledger_module
+from src.system.billing.credit_ledger import CreditLedger
+
+
+@pytest_asyncio.fixture
+async def pool(tmp_path, monkeypatch):
+    pool = db_pool.AuthDBPool(tmp_path / "licenses.db", readers=1)
+    monkeypatch.setattr(db_pool, "auth_db", pool)
+    await gatekeeper.init_auth_db()
+    yield pool
+    await pool.close()
+
+
+async def _db_state(pool, key):
+    credits = (await pool.fetchone("SELECT credits FROM licenses WHERE key=?", (key,)))[0]
+    rows = (await pool.fetchone("SELECT COUNT(*), COALESCE(SUM(cost), 0) FROM usage_logs WHERE key=?", (key,)))
+    return credits, rows[0], rows[1]
+
+
+@pytest.mark.asyncio
+async def test_charges_reserve_immediately_and_flush_in_batches(pool, tmp_path):
+    key = await gatekeeper.generate_key("LEDGER_USER", tier="FREE")
+    start = (await gatekeeper.validate_key(key)).credits
+    ledger = await CreditLedger(tmp_path / "journal.jsonl", flush_interval_ms=60_000, flush_rows=1000).start()
+
+    for i in range(30):
+        assert await ledger.charge(key, 2, f"MSN-{i}", "AGENT", "Cybersecurity")
+    assert ledger.balance(key) == start - 60
+    assert await _db_state(pool, key) == (start, 0, 0)  # Nothing written yet
+
+    assert not await ledger.charge(key, start, "MSN-X", "AGENT", "Cybersecurity")  # Insufficient
+    assert await ledger.flush() == 30
+    assert await _db_state(pool, key) == (start - 60, 30, 60)
+    assert (tmp_path / "journal.jsonl").stat().st_size == 0
+    await ledger.stop()
+
+
+@pytest.mark.asyncio
+async def test_crash_replay_applies_each_charge_once(pool, tmp_path):
+    key = await gatekeeper.generate_key("CRASH_USER", tier="FREE")
+    start = (await gatekeeper.validate_key(key)).credits
+    journal = tmp_path / "journal.jsonl"
+
+    crashed = await CreditLedger(journal, flush_interval_ms=60_000).start()
+    for i in range(5):
+        await crashed.charge(key, 1, f"MSN-{i}", "AGENT", "Finance")
+    await crashed.flush()
+    for i in range(5, 8):
+        await crashed.charge(key, 1, f"MSN-{i}", "AGENT", "Finance")
+    crashed._flusher.cancel()  # Process dies: 3 charges journaled but unapplied
+    crashed._journal.close()
+    with open(journal, "a", encoding="utf-8") as f:
+        f.write('{"seq": 99, "key": "torn')  # Partial line from the crash
+
+    ledger = await CreditLedger(journal, flush_interval_ms=60_000).start()
+    assert await _db_state(pool, key) == (start - 8, 8, 8)
+    assert await ledger.charge(key, 1, "MSN-8", "AGENT", "Finance")
+    assert ledger.stats()["seq"] == 9
+    await ledger.stop()
+    assert await _db_state(pool, key) == (start - 9, 9, 9)
+
+
+@pytest.mark.asyncio
+async def test_direct_deductions_resync_and_flush_never_goes_negative(pool, tmp_path, monkeypatch):
+    key = await gatekeeper.generate_key("SHARED_USER", tier="FREE")
+    start = (await gatekeeper.validate_key(key)).credits
+    ledger = await CreditLedger(tmp_path / "journal.jsonl", flush_interval_ms=60_000).start()
+    monkeypatch.setattr(credit_ledger_module, "credit_ledger", ledger)
+
+    assert await ledger.charge(key, 10, "MSN-1", "AGENT", "Finance")
+    assert await gatekeeper.deduct_credit(key, 20, "MSN-2")  # Bypasses the ledger
+    assert ledger.balance(key) is None  # Forgotten: the next charge re-reads the key
+    assert await ledger.charge(key, 5, "MSN-3", "AGENT", "Finance")
+    assert ledger.balance(key) == start - 35
+
+    # Reserved while credits were still there, then spent elsewhere before the flush
+    assert await ledger.charge(key, start - 40, "MSN-4", "AGENT", "Finance")
+    assert await gatekeeper.deduct_credit(key, start - 40, "MSN-5")
+    assert await ledger.flush() == 3
+    credits, rows, _ = await _db_state(pool, key)
+    assert credits == 0 and rows == 5  # Usage of every charge is still recorded
+    await ledger.stop()
+
+
+@pytest.mark.asyncio
+async def test_journal_is_compacted_while_charges_keep_arriving(pool, tmp_path):
+    key = await gatekeeper.generate_key("STREAM_USER", tier="FREE")
+    start = (await gatekeeper.validate_key(key)).credits
+    journal = tmp_path / "journal.jsonl"
+    ledger = await CreditLedger(journal, flush_interval_ms=60_000, compact_bytes=1).start()
+
+    for i in range(20):
+        await ledger.charge(key, 1, f"MSN-{i}", "AGENT", "Finance")
+
+    async def streaming():  # Lands while the flush is awaiting fsync / the database
+        for i in range(20, 30):
+            await ledger.charge(key, 1, f"MSN-{i}", "AGENT", "Finance")
+
+    flushed, _ = await asyncio.gather(ledger.flush(), streaming())
+    assert flushed == 20 and ledger.stats()["pending"] == 10
+    seqs = [json.loads(line)["seq"] for line in journal.read_text(encoding="utf-8").splitlines()]
+    assert seqs == list(range(21, 31))  # Applied lines dropped, unflushed ones kept
+
+    await ledger.charge(key, 1, "MSN-30", "AGENT", "Finance")  # Written to the new journal
+    ledger._flusher.cancel()  # Crash: the replay still sees every unapplied charge
+    ledger._journal.close()
+    restarted = await CreditLedger(journal, flush_interval_ms=60_000).start()
+    assert await _db_state(pool, key) == (start - 31, 31, 31)
+    await restarted.stop()
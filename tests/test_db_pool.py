@@ -0,0 +1,58 @@
+"""
+REALM FORGE: AUTH DB POOL TEST v1.0
+PURPOSE: Verifies pooled licenses.db access under concurrent auth/billing load.
+PATH: F:/agentic_workforce/tests/test_db_pool.py
+"""
+
+import asyncio
+
+import pytest
+import pytest_asyncio
+
+from src.auth import db_pool, gatekeeper
+
+
+@pytest_asyncio.fixture
+async def pool(tmp_path, monkeypatch):
+    pool = db_pool.AuthDBPool(tmp_path / "licenses.db", readers=2)
+    monkeypatch.setattr(db_pool, "auth_db", pool)
+    await gatekeeper.init_auth_db()
+    yield pool
+    await pool.close()
+
+
+@pytest.mark.asyncio
+async def test_pragmas_applied_once_per_connection(pool):
+    assert (await pool.fetchone("PRAGMA journal_mode"))[0] == "wal"
+    assert (await pool.fetchone("PRAGMA synchronous"))[0] == 1  # NORMAL
+    assert (await pool.fetchone("PRAGMA busy_timeout"))[0] == pool.busy_timeout_ms
+
+    with pytest.raises(Exception):
+        async with pool.reader() as db:
+            await db.execute("DELETE FROM licenses")
+
+
+@pytest.mark.asyncio
+async def test_concurrent_deductions_are_exact(pool):
+    key = await gatekeeper.generate_key("POOL_USER", tier="FREE")
+
+    results = await asyncio.gather(*[
+        gatekeeper.deduct_credit(key, cost=1, mission_id=f"MSN-{i}", silo_id="Cybersecurity") for i in range(120)
+    ])
+    vitals = await gatekeeper.get_account_vitals(key)
+
+    assert results.count(True) == 100
+    assert vitals["balance"] == 0
+    assert vitals["silo_consumption"] == {"Cybersecurity": 100}
+
+
+@pytest.mark.asyncio
+async def test_failed_write_rolls_back(pool):
+    key = await gatekeeper.generate_key("ROLLBACK_USER", tier="FREE")
+
+    with pytest.raises(RuntimeError):
+        async with pool.writer() as db:
+            await db.execute(gatekeeper.SQL_DEDUCT_CREDITS, (50, key, 50))
+            raise RuntimeError("boom")
+
+    assert (await gatekeeper.validate_key(key)).credits == 100
@@ -0,0 +1,88 @@
+"""
+REALM FORGE: HANDOFF TEST v1.0
+PURPOSE: Verifies the redundancy handoff: leftover-task cancellation on failure, the
+         speculative and re-plan switches, and the per-silo handoff statistics.
+PATH: F:/agentic_workforce/tests/test_handoff.py
+"""
+
+import json
+
+import pytest
+
+from src.system.handoff_protocol import fail_and_handoff, handoff_update
+from src.system.handoff_stats import HandoffStats
+from src.system.state import merge_tasks
+
+
+def _open(queue):
+    return [t.get("tool") for t in queue if t.get("status", "OPEN") == "OPEN"]
+
+
+def _plan():
+    return merge_tasks([], [
+        {"id": "t1", "tool": "read_file", "priority": "1"},
+        {"id": "t2", "tool": "grep_files", "priority": "2"},
+        {"id": "t3", "tool": "write_file", "priority": "3"},
+    ])
+
+
+def test_failure_cancels_the_rest_of_the_plan_and_handoff_replans():
+    queue = _plan()
+    tasks = list(queue)
+    # t1 ran, t2 failed: t3 must not survive next to the fallback silo's plan
+    delta = fail_and_handoff(tasks[1], tasks[2:], [{"id": "t1", "status": "DONE"}])
+    queue = merge_tasks(queue, delta)
+    assert {t["id"]: t.get("status") for t in queue if t["id"] in ("t1", "t2", "t3")} == {
+        "t1": "DONE", "t2": "FAILED", "t3": "SKIPPED",
+    }
+    assert _open(queue) == ["HANDOFF"]
+
+    state = {"active_department": "Data", "fallback_department": "Architect", "task_queue": queue}
+    handoff = queue.next_open()
+    update = handoff_update(state, handoff, [], [], lambda silo: {"name": f"{silo}Lead"})
+    assert update["next_node"] == "planner" and update["active_agent"] == "ArchitectLead"
+    assert update["handoff_history"] == [{"from": "Data", "to": "Architect"}]
+    assert _open(merge_tasks(queue, update["task_queue"])) == []
+
+
+def test_speculative_handoff_runs_only_the_fallback_plan():
+    queue = merge_tasks(_plan(), [{"id": "h1", "tool": "HANDOFF", "priority": "0"}])
+    tasks = list(queue)
+    assert tasks[0]["id"] == "h1"  # Sorted ahead of the leftovers it abandons
+    state = {
+        "active_department": "Data",
+        "fallback_department": "Legal",
+        "speculative_plan": {"department": "Legal", "agent": "Counsel", "task_queue": [
+            {"id": "s1", "tool": "draft_contract"},
+        ]},
+    }
+    update = handoff_update(state, tasks[0], tasks[1:], [], lambda silo: None)
+    assert (update["next_node"], update["active_agent"], update["speculative_plan"]) == ("executor", "Counsel", {})
+    queue = merge_tasks(queue, update["task_queue"])
+    assert _open(queue) == ["draft_contract"]
+    assert {t["id"]: t["status"] for t in queue if t["id"] != "s1"} == {
+        "h1": "DONE", "t1": "SKIPPED", "t2": "SKIPPED", "t3": "SKIPPED",
+    }
+
+    # A draft for another silo is ignored: the fallback silo re-plans
+    state["speculative_plan"]["department"] = "Finance"
+    assert handoff_update(state, tasks[0], [], [], lambda silo: None)["next_node"] == "planner"
+
+
+@pytest.mark.asyncio
+async def test_handoff_stats_record_rates_and_persist(tmp_path):
+    path = tmp_path / "handoff_stats.json"
+    stats = HandoffStats(path=path, min_samples=4)
+    for i in range(4):
+        history = [{"from": "Data", "to": "Architect"}] if i % 2 else []
+        await stats.arecord_mission(history, "Architect" if history else "Data")
+    await stats.arecord_mission([], None)  # No silo: not counted
+
+    assert stats.handoff_rate("Data") == 0.5 and stats.is_handoff_prone("Data", threshold=0.3)
+    assert stats.handoff_rate("Architect") == 0.0  # Final silo of a handed-off mission is not charged
+    assert json.loads(path.read_text(encoding="utf-8")) == {"Data": {"missions": 4, "handoffs": 2}}
+
+    reloaded = HandoffStats(path=path, min_samples=5)
+    assert reloaded.handoff_rate("Data") == 0.0  # Below min_samples: treated as noise
+    reloaded.record_mission([], "Data")
+    assert reloaded.snapshot() == {"Data": {"missions": 5, "handoffs": 2, "rate": 0.4}}
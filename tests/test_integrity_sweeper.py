@@ -0,0 +1,95 @@
+"""
+REALM FORGE: INTEGRITY SWEEPER TEST v1.0
+PURPOSE: Verifies full-lattice artifact audits: drift / missing / baseline verdicts
+         written back to the nodes, cache-served reruns, pacing and cancellation.
+PATH: F:/agentic_workforce/tests/test_integrity_sweeper.py
+"""
+
+import asyncio
+import hashlib
+import os
+import time
+
+import networkx as nx
+import pytest
+
+from src.memory.artifact_store import HashCache
+from src.memory.integrity_sweeper import IntegritySweeper, _Pacer
+
+
+class _Lattice:
+    def __init__(self):
+        self.graph = nx.DiGraph()
+        self.graph_lock = asyncio.Lock()
+        self.saves = 0
+
+    async def save_graph(self):
+        async with self.graph_lock:
+            self.saves += 1
+
+
+def _artifact(tmp_path, name, content):
+    path = tmp_path / name
+    path.write_bytes(content)
+    st = os.stat(path)
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns - 60_000_000_000))  # Outside the racy window
+    return str(path), hashlib.sha256(content).hexdigest()
+
+
+@pytest.mark.asyncio
+async def test_sweep_records_verdicts_and_reuses_the_hash_cache(tmp_path):
+    lattice = _Lattice()
+    good = [_artifact(tmp_path, f"ok{i}.txt", f"artifact {i}".encode()) for i in range(5)]
+    for path, digest in good:
+        lattice.graph.add_node(path, type="ARTIFACT", file_hash=digest)
+    drifted, _ = _artifact(tmp_path, "drift.txt", b"edited")
+    lattice.graph.add_node(drifted, type="ARTIFACT", file_hash="0" * 64)
+    fresh, fresh_digest = _artifact(tmp_path, "fresh.txt", b"never anchored")
+    lattice.graph.add_node(fresh, type="ARTIFACT")
+    gone = str(tmp_path / "gone.txt")
+    lattice.graph.add_node(gone, type="ARTIFACT", file_hash="1" * 64)
+    lattice.graph.add_node("agent-7", type="AGENT")
+
+    sweeper = IntegritySweeper(cache=HashCache(path=tmp_path / "index.db"), batch_size=3, max_mbps=0)
+    assert sweeper.status() == {"status": "idle"}
+    sweeper.start(lattice)
+    report = await sweeper.wait()
+
+    assert report["status"] == "completed" and report["total"] == report["checked"] == 8
+    assert (report["verified"], report["drifted"], report["missing"], report["baselined"]) == (5, 1, 1, 1)
+    assert report["cache_hits"] == 0 and lattice.saves == 1
+    assert sorted((f["path"], f["status"]) for f in report["findings"]) == [(drifted, "DRIFT"), (gone, "MISSING")]
+    nodes = lattice.graph.nodes
+    assert nodes[drifted]["integrity"] == "DRIFT" and nodes[drifted]["file_hash"] == "0" * 64
+    assert nodes[drifted]["observed_hash"] == hashlib.sha256(b"edited").hexdigest()
+    assert nodes[fresh]["file_hash"] == fresh_digest and nodes[fresh]["integrity"] == "BASELINED"
+    assert "integrity" not in nodes["agent-7"]
+
+    # Second audit: nothing changed on disk, so nothing is re-read
+    sweeper.start()
+    again = await sweeper.wait()
+    assert again["cache_hits"] == 7 and again["bytes_hashed"] == 0
+    assert again["baselined"] == 0 and again["verified"] == 6
+    assert sweeper.status(findings_limit=1)["findings"] == again["findings"][:1]
+
+
+@pytest.mark.asyncio
+async def test_pacing_and_cancellation(tmp_path):
+    pace = _Pacer(bytes_per_second=1000)
+    started = time.monotonic()
+    await asyncio.gather(*(pace(50) for _ in range(4)))
+    assert time.monotonic() - started >= 0.14  # 200 bytes at 1000 B/s, first read free
+
+    lattice = _Lattice()
+    for i in range(20):
+        path, digest = _artifact(tmp_path, f"a{i}.bin", os.urandom(1000))
+        lattice.graph.add_node(path, type="ARTIFACT", file_hash=digest)
+    # ~1 KB/s: the sweep cannot finish before it is cancelled
+    sweeper = IntegritySweeper(lattice, cache=HashCache(path=tmp_path / "index.db"),
+                               concurrency=1, batch_size=2, max_mbps=1 / 1024)
+    first = sweeper.start()
+    assert sweeper.start()["sweep_id"] == first["sweep_id"]  # One sweep at a time
+    await asyncio.sleep(1.2)
+    status = await sweeper.cancel()
+    assert status["status"] == "cancelled" and 0 < status["checked"] < 20
+    assert not sweeper.running and lattice.saves == 1
@@ -0,0 +1,82 @@
+"""
+REALM FORGE: LATTICE QUERY TEST v1.0
+PURPOSE: Verifies ego networks, cursor pagination and incremental level-of-detail clustering.
+PATH: F:/agentic_workforce/tests/test_lattice_query.py
+"""
+
+import json
+import os
+
+from src.memory.lattice_query import LatticeIndex
+from src.memory.lattice_store import LatticeStore
+
+
+def _write(path, nodes, links, tick):
+    path.write_text(json.dumps({"nodes": nodes, "links": links}), encoding="utf-8")
+    os.utime(path, ns=(tick * 10**9, tick * 10**9))
+
+
+def _two_cliques():
+    nodes, links = [], []
+    for c, kind in ((0, "AGENT"), (1, "MISSION")):
+        ids = [f"{kind[0]}{i}" for i in range(8)]
+        nodes += [{"id": n, "type": kind} for n in ids]
+        links += [{"source": a, "target": b} for i, a in enumerate(ids) for b in ids[i + 1:]]
+    links.append({"source": "A0", "target": "M0"})
+    return nodes, links
+
+
+def test_ego_and_pagination(tmp_path):
+    path = tmp_path / "neural_graph.json"
+    nodes = [{"id": "hub", "type": "AGENT"}, {"id": "m1", "type": "MISSION"},
+             {"id": "art", "type": "ARTIFACT"}, {"id": "kb", "type": "KNOWLEDGE"}]
+    links = [{"source": "hub", "target": "m1"}, {"source": "m1", "target": "art"}, {"source": "kb", "target": "art"}]
+    _write(path, nodes, links, 1)
+    index = LatticeIndex(LatticeStore(path)).refresh()
+
+    one = index.ego("hub", hops=1)
+    assert {n["id"]: n["hop"] for n in one["nodes"]} == {"hub": 0, "m1": 1}
+    assert one["links"] == [{"source": "hub", "target": "m1"}]
+    assert {n["id"] for n in index.ego("hub", hops=3)["nodes"]} == {"hub", "m1", "art", "kb"}
+    # Incoming links count too; type filters stop traversal at other types
+    assert {n["id"] for n in index.ego("art", hops=2, types=["knowledge"])["nodes"]} == {"art", "kb"}
+    assert index.ego("hub", hops=3, limit=2)["truncated"] is True
+    assert index.ego("ghost") is None
+
+    first = index.page(limit=3)
+    assert [n["id"] for n in first["nodes"]] == ["art", "hub", "kb"]
+    rest = index.page(cursor=first["next_cursor"], limit=3)
+    assert [n["id"] for n in rest["nodes"]] == ["m1"] and rest["next_cursor"] is None
+    typed = index.page(types=["MISSION", "AGENT"], limit=10)
+    assert [n["id"] for n in typed["nodes"]] == ["hub", "m1"]
+    assert typed["links"] == [{"source": "hub", "target": "m1"}]
+
+
+def test_lod_collapses_communities_and_patches_incrementally(tmp_path):
+    path = tmp_path / "neural_graph.json"
+    nodes, links = _two_cliques()
+    nodes.append({"id": "loner", "type": "KNOWLEDGE"})
+    _write(path, nodes, links, 1)
+    index = LatticeIndex(LatticeStore(path), min_cluster=4, rebuild_fraction=0.5).refresh()
+
+    lod = index.lod()
+    clusters = [n for n in lod["nodes"] if n["type"] == "CLUSTER"]
+    assert sorted(c["size"] for c in clusters) == [8, 8]
+    assert {tuple(c["types"]) for c in clusters} == {("AGENT",), ("MISSION",)}
+    assert any(n["id"] == "loner" for n in lod["nodes"])
+    assert [link["weight"] for link in lod["links"]] == [1]
+
+    agents = next(c for c in clusters if "AGENT" in c["types"])
+    page = index.cluster(agents["id"], limit=5)
+    assert len(page["nodes"]) == 5 and page["next_cursor"]
+    assert index.cluster("cluster:999") is None
+
+    # A new agent wired into the agent clique joins it without a recompute
+    nodes.append({"id": "A8", "type": "AGENT"})
+    links += [{"source": "A8", "target": "A1"}, {"source": "A8", "target": "A2"}]
+    _write(path, nodes, links, 2)
+    index.refresh()
+    patched = index.lod()
+    assert patched["version"] == index.version
+    assert index._lod_drift == 3
+    assert next(n for n in patched["nodes"] if n["id"] == agents["id"])["size"] == 9
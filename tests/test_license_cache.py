@@ -0,0 +1,100 @@
+"""
+REALM FORGE: LICENSE CACHE TEST v1.0
+PURPOSE: Verifies TTL expiry, capped negative caching and invalidation on credit/status changes.
+PATH: F:/agentic_workforce/tests/test_license_cache.py
+"""
+
+import pytest
+import pytest_asyncio
+
+from src.api.dependencies import security
+from src.auth import db_pool, gatekeeper
+from src.auth.license_cache import MISS, LicenseCache, license_cache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_ttl_and_negative_cap():
+    clock = FakeClock()
+    cache = LicenseCache(ttl=30, negative_ttl=5, negative_max=3, clock=clock)
+    lic = gatekeeper.License(key="sk-a", user_id="U", tier="FREE", credits=10, created_at=0.0)
+
+    assert cache.get("sk-a") is MISS
+    cache.put("sk-a", lic)
+    assert cache.get("sk-a") is lic
+    clock.now += 31
+    assert cache.get("sk-a") is MISS
+
+    for i in range(10):  # Key spraying: bounded negative cache
+        cache.put(f"sk-bad-{i}", None)
+    assert len(cache._invalid) == 3
+    assert cache.get("sk-bad-9") is None
+    assert cache.get("sk-bad-0") is MISS
+    clock.now += 6
+    assert cache.get("sk-bad-9") is MISS
+
+
+@pytest_asyncio.fixture
+async def pool(tmp_path, monkeypatch):
+    pool = db_pool.AuthDBPool(tmp_path / "licenses.db", readers=1)
+    monkeypatch.setattr(db_pool, "auth_db", pool)
+    await gatekeeper.init_auth_db()
+    license_cache.clear()
+    yield pool
+    license_cache.clear()
+    await pool.close()
+
+
+@pytest.mark.asyncio
+async def test_get_license_served_from_cache(pool, monkeypatch):
+    key = await gatekeeper.generate_key("CACHE_USER", tier="FREE")
+    calls = []
+    real_lookup = gatekeeper.lookup_key
+
+    async def counting_lookup(api_key):
+        calls.append(api_key)
+        return await real_lookup(api_key)
+
+    monkeypatch.setattr(gatekeeper, "lookup_key", counting_lookup)
+
+    first = await security.get_license(key)
+    for _ in range(5):
+        assert (await security.get_license(key)).user_id == "CACHE_USER"
+    assert len(calls) == 1
+
+    assert await gatekeeper.deduct_credit(key, cost=7)
+    assert (await security.get_license(key)).credits == first.credits - 7
+    assert len(calls) == 1
+
+    assert await gatekeeper.set_key_status(key, "SUSPENDED")
+    with pytest.raises(security.HTTPException):
+        await security.get_license(key)
+    with pytest.raises(security.HTTPException):
+        await security.get_license(key)  # Negatively cached
+    assert len(calls) == 2
+
+
+
+@pytest.mark.asyncio
+async def test_database_faults_are_not_negatively_cached(pool, monkeypatch):
+    key = await gatekeeper.generate_key("OUTAGE_USER", tier="FREE")
+    real_lookup = gatekeeper.lookup_key
+
+    async def broken_lookup(api_key):
+        raise RuntimeError("database is locked")
+
+    monkeypatch.setattr(gatekeeper, "lookup_key", broken_lookup)
+    with pytest.raises(security.HTTPException) as fault:
+        await security.get_license(key)
+    assert fault.value.status_code == 503
+    assert license_cache.get(key) is MISS
+    assert await gatekeeper.validate_key(key) is None  # The tolerant wrapper still answers
+
+    monkeypatch.setattr(gatekeeper, "lookup_key", real_lookup)
+    assert (await security.get_license(key)).user_id == "OUTAGE_USER"
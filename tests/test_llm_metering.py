@@ -0,0 +1,70 @@
+"""
+REALM FORGE: LLM METERING TEST v1.0
+PURPOSE: Verifies token/latency records, mission/node/silo tagging and sink export of LLMMeter.
+PATH: F:/agentic_workforce/tests/test_llm_metering.py
+"""
+
+from typing import TypedDict
+
+import pytest
+from langchain_core.language_models.fake_chat_models import FakeListChatModel, GenericFakeChatModel
+from langchain_core.messages import AIMessage, HumanMessage
+from langgraph.graph import END, StateGraph
+
+from src.system.llm_metering import LLMMeter, metering_scope
+
+
+@pytest.mark.asyncio
+async def test_records_reported_usage_with_scope_and_silo():
+    meter = LLMMeter()
+    billed = []
+
+    async def billing_sink(record):
+        billed.append(record)
+
+    meter.add_sink(billing_sink)
+    reply = AIMessage(content="plan", usage_metadata={"input_tokens": 1200, "output_tokens": 300, "total_tokens": 1500})
+    llm = GenericFakeChatModel(messages=iter([reply]), callbacks=[meter])
+
+    with metering_scope(mission_id="MSN-1", api_key="rf_pro_x"):
+        await llm.ainvoke([HumanMessage(content="go")], config={"metadata": {"node": "planner", "silo": "Cybersecurity"}})
+
+    (record,) = billed
+    assert (record.prompt_tokens, record.completion_tokens, record.estimated) == (1200, 300, False)
+    assert (record.mission_id, record.node, record.silo, record.api_key) == ("MSN-1", "planner", "Cybersecurity", "rf_pro_x")
+    assert record.latency_ms >= 0
+    usage = meter.book.mission_usage("MSN-1")
+    assert usage["totals"]["prompt_tokens"] == 1200
+    assert usage["by_silo"]["Cybersecurity"]["calls"] == 1
+
+
+@pytest.mark.asyncio
+async def test_graph_nodes_are_tagged_and_unreported_usage_estimated():
+    meter = LLMMeter()
+    llm = FakeListChatModel(responses=["route to planner", "drafted"], callbacks=[meter])
+
+    class S(TypedDict):
+        text: str
+
+    async def supervisor(state):
+        return {"text": (await llm.ainvoke(state["text"])).content}
+
+    async def planner(state):
+        return {"text": (await llm.ainvoke(state["text"])).content}
+
+    graph = StateGraph(S)
+    graph.add_node("supervisor", supervisor)
+    graph.add_node("planner", planner)
+    graph.set_entry_point("supervisor")
+    graph.add_edge("supervisor", "planner")
+    graph.add_edge("planner", END)
+
+    with metering_scope(mission_id="MSN-2"):
+        await graph.compile().ainvoke({"text": "build a firewall audit"})
+
+    usage = meter.book.mission_usage("MSN-2")
+    assert set(usage["by_node"]) == {"supervisor", "planner"}
+    assert usage["totals"]["calls"] == 2
+    assert usage["totals"]["prompt_tokens"] > 0 and usage["totals"]["completion_tokens"] > 0
+    assert meter.book.mission_usage("MSN-unknown")["totals"]["calls"] == 0
+    assert not meter._inflight
@@ -0,0 +1,98 @@
+"""
+REALM FORGE: LOG ANALYTICS TEST v1.0
+PURPOSE: Verifies windowed statistics, template clustering, anomaly scoring and
+         incremental (offset-indexed) rescans of the streaming log engine.
+PATH: F:/agentic_workforce/tests/test_log_analytics.py
+"""
+
+import pytest
+
+from src.system.log_analytics import LogAnalyzer, PatternSet
+
+
+def _write_minutes(path, minutes, errors_at, mode="w"):
+    with open(path, mode, encoding="utf-8") as f:
+        for minute in minutes:
+            for second in range(20):
+                level = "ERROR" if second < errors_at(minute) else "INFO"
+                f.write(f"2024-05-01 10:{minute:02d}:{second:02d},5{second} {level} job {minute * 100 + second} took {second}ms\n")
+
+
+def test_windowed_stats_templates_and_anomalies(tmp_path):
+    log = tmp_path / "app.log"
+    _write_minutes(log, range(12), lambda m: 10 if m == 9 else 1)
+    analyzer = LogAnalyzer(index_path=tmp_path / "index.json", chunk_size=512)
+
+    report = analyzer.scan(log, PatternSet(keywords=["error"], regexes={"slow": r"took 1\dms"}))
+    assert report["lines"] == 240
+    assert report["by_pattern"] == {"error": 21, "slow": 120}
+    minute9 = next(m for m in report["per_minute"] if m["minute"] == "2024-05-01 10:09")
+    assert (minute9["events"], minute9["matches"], minute9["rate"]) == (20, 20, 1.0)
+    assert [a["minute"] for a in report["anomalies"]] == ["2024-05-01 10:09"]
+    assert report["top_templates"][0] == {
+        "template": "INFO job <NUM> took <NUM>", "count": 120, "sample": "INFO job 10 took 10ms",
+    }
+    assert len(report["samples"]) == 50 and report["samples"][-1].endswith("took 19ms")
+
+    # Case folding for keyword-only sets must agree with re.IGNORECASE
+    folded = analyzer.scan(log, PatternSet(keywords=["Error"]))
+    assert PatternSet(keywords=["Error"]).fold and folded["matches"] == 21
+    with pytest.raises(ValueError):
+        PatternSet()
+
+
+@pytest.mark.asyncio
+async def test_incremental_rescans_rotation_and_follow(tmp_path):
+    log = tmp_path / "svc.log"
+    _write_minutes(log, range(3), lambda m: 2)
+    patterns = PatternSet(keywords=["ERROR"])
+    analyzer = LogAnalyzer(index_path=tmp_path / "index.json")
+
+    first = analyzer.scan(log, patterns)
+    assert first["matches"] == 6 and first["bytes_scanned"] == log.stat().st_size
+
+    # New bytes only; the unterminated tail is reported but the offset stops before it
+    with open(log, "a", encoding="utf-8") as f:
+        f.write("2024-05-01 10:03:00 ERROR late\n2024-05-01 10:03:01 ERROR half")
+    # A fresh analyzer resumes from the persisted offset index
+    resumed = LogAnalyzer(index_path=tmp_path / "index.json")
+    second = await resumed.ascan(log, patterns)
+    assert second["matches"] == 8 and second["bytes_scanned"] == log.stat().st_size - first["offset"]
+    assert second["offset"] == first["offset"] + len("2024-05-01 10:03:00 ERROR late\n")
+    assert LogAnalyzer(index_path=tmp_path / "index.json").scan(log, patterns)["matches"] == 8  # Not counted twice
+
+    batches = []
+    with open(log, "a", encoding="utf-8") as f:
+        f.write("\n")
+    async for batch in resumed.follow(log, patterns, poll_interval=0, max_polls=2):
+        batches.append([hit["line"] for hit in batch])
+    assert batches == [["2024-05-01 10:03:01 ERROR half"]]
+    assert resumed.scan(log, patterns)["matches"] == 8
+
+    # Truncation (log rotation in place) resets the state instead of double counting
+    log.write_text("2024-05-02 00:00:00 ERROR fresh\n", encoding="utf-8")
+    rotated = resumed.scan(log, patterns)
+    assert rotated["matches"] == 1 and rotated["lines"] == 1
+    assert [m["minute"] for m in rotated["per_minute"]] == ["2024-05-02 00:00"]
+
+
+def test_one_shot_scan_reads_unterminated_last_line(tmp_path):
+    log = tmp_path / "app.log"
+    log.write_bytes(b"INFO ok\nERROR boom")
+    analyzer = LogAnalyzer(index_path=tmp_path / "index.json")
+
+    report = analyzer.scan(log, PatternSet(keywords=["ERROR"]))
+    assert report["matches"] == 1 and report["lines"] == 2
+    assert report["samples"] == ["ERROR boom"] and report["offset"] == len(b"INFO ok\n")
+
+
+def test_anchored_regexes_match_every_line_of_a_chunk(tmp_path):
+    log = tmp_path / "app.log"
+    log.write_text("".join(
+        f"2024-05-01 13:{i // 10:02d}:00 {'ERROR' if i % 2 else 'INFO'} boom {i}\n" for i in range(200)
+    ), encoding="utf-8")
+    analyzer = LogAnalyzer(index_path=tmp_path / "index.json", chunk_size=1024)
+
+    report = analyzer.scan(log, PatternSet(regexes={"tail": r"ERROR boom \d+$", "head": r"^2024-05-01 13:0\d:00 ERROR"}))
+    assert report["by_pattern"] == {"tail": 100, "head": 50}
+    assert report["matches"] == 100
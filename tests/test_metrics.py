@@ -0,0 +1,82 @@
+"""
+REALM FORGE: METRICS TEST v1.0
+PURPOSE: Verifies Prometheus text exposition and the node/LLM/queue instrumentation helpers.
+PATH: F:/agentic_workforce/tests/test_metrics.py
+"""
+
+import pytest
+
+from src.system import metrics
+from src.system.llm_metering import LLMCallRecord
+
+
+def test_histogram_and_counter_exposition():
+    registry = metrics.MetricsRegistry()
+    latency = registry.histogram("t_latency_seconds", "Test latency.", ["op"], buckets=(0.1, 1.0))
+    calls = registry.counter("t_calls_total", "Test calls.", ["op", "outcome"])
+    for value in (0.05, 0.1, 0.5, 3.0):
+        latency.labels("read").observe(value)
+    calls.labels("read", "ok").inc(3)
+    calls.labels('we"ird', "error").inc()
+
+    text = registry.render()
+    assert "# TYPE t_latency_seconds histogram" in text
+    assert 't_latency_seconds_bucket{op="read",le="0.1"} 2' in text  # le is inclusive
+    assert 't_latency_seconds_bucket{op="read",le="1"} 3' in text
+    assert 't_latency_seconds_bucket{op="read",le="+Inf"} 4' in text
+    assert 't_latency_seconds_count{op="read"} 4' in text
+    assert 't_latency_seconds_sum{op="read"} 3.65' in text
+    assert 't_calls_total{op="read",outcome="ok"} 3' in text
+    assert 't_calls_total{op="we\\"ird",outcome="error"} 1' in text
+    with pytest.raises(ValueError):
+        calls.labels("only_one")
+
+
+@pytest.mark.asyncio
+async def test_timed_node_and_llm_sink_feed_the_global_registry():
+    async def flaky(state):
+        if state.get("boom"):
+            raise RuntimeError("node fault")
+        return {"ok": True}
+
+    node = metrics.timed_node("test_node", flaky)
+    assert await node({}) == {"ok": True}
+    with pytest.raises(RuntimeError):
+        await node({"boom": True})
+
+    metrics.record_llm_call(LLMCallRecord(
+        mission_id="MSN-1", node="test_node", silo="Finance", model="m",
+        prompt_tokens=900, completion_tokens=100, latency_ms=250.0, timestamp=0.0,
+    ))
+
+    text = metrics.render_metrics()
+    assert 'realm_node_latency_seconds_count{node="test_node"} 2' in text
+    assert 'realm_node_errors_total{node="test_node"} 1' in text
+    assert 'realm_llm_tokens_total{node="test_node",kind="prompt"} 900' in text
+    assert 'realm_llm_latency_seconds_bucket{node="test_node",model="m",le="0.25"} 1' in text
+
+
+def test_scrape_time_collectors():
+    class FakeChannel:
+        def __init__(self, depth):
+            self.frames = [None] * depth
+
+    class FakeManager:
+        channels = {"a": FakeChannel(3), "b": FakeChannel(7)}
+
+        def stats(self):
+            return {"clients": 2, "queued": 10, "dropped": 4, "slow_disconnects": 1}
+
+    metrics.registry.add_collector(metrics.collect_connection_stats(FakeManager()))
+    text = metrics.render_metrics()
+    assert "realm_ws_queued_frames 10" in text
+    assert "realm_ws_max_queue_depth 7" in text
+
+
+
+def test_one_tool_error_rule():
+    for failed in ("[ERROR]: disk full", "  [HTTP_ERROR]: 503", "\u274c [NET_FAULT]", "\u26a0\ufe0f [SEARCH_THROTTLED]",
+                   "[HEAL_FAILED]: Syntax error", "Throttled by upstream", "None found in sector"):
+        assert metrics.is_tool_error(failed), failed
+    for ok in ("Wrote 12 lines", "grep: 3 hits\nsrc/a.py:1: raise ValueError('Error')", "x" * 200 + " [ERROR]"):
+        assert not metrics.is_tool_error(ok), ok
@@ -0,0 +1,73 @@
+"""
+REALM FORGE: ROSTER INDEX TEST v1.0
+PURPOSE: Verifies roster filtering, cursor pagination, projection and version-keyed page caching.
+PATH: F:/agentic_workforce/tests/test_roster_index.py
+"""
+
+import json
+import os
+
+import pytest
+
+from src.system.agents.roster_index import RosterIndex
+
+
+def _write(path, lattice, tick):
+    path.write_text(json.dumps(lattice), encoding="utf-8")
+    os.utime(path, ns=(tick * 10**9, tick * 10**9))
+
+
+LATTICE = {
+    "Cybersecurity": {"agents": [
+        {"name": "Vex", "role": "Threat Hunter", "path": "a/vex.yaml"},
+        {"name": "Ada", "role": "Lead Security Engineer", "path": "a/ada.yaml", "status": "busy"},
+        {"name": "Kai", "role": "Security Engineer", "path": "a/kai.yaml"},
+    ]},
+    "Financial_Ops": {"agents": [{"name": "Mo", "role": "Auditor", "path": "f/mo.yaml"}]},
+    "Empty": None,
+}
+
+
+def test_filters_pagination_and_projection(tmp_path):
+    path = tmp_path / "department_lattice.json"
+    _write(path, LATTICE, 1)
+    index = RosterIndex(path).refresh()
+
+    everything = index.query()
+    assert [a["name"] for a in everything["roster"]] == ["Ada", "Kai", "Vex", "Mo"]
+    assert everything["total"] == 4 and everything["next_cursor"] is None
+
+    first = index.query(department="cybersecurity", role="ENGINEER", limit=1, fields=["name"])
+    assert first["roster"] == [{"name": "Ada"}] and first["total"] == 2
+    second = index.query(department="cybersecurity", role="ENGINEER", limit=1, fields=["name"], cursor=first["next_cursor"])
+    assert second["roster"] == [{"name": "Kai"}] and second["next_cursor"] is None
+
+    assert [a["name"] for a in index.query(status="busy")["roster"]] == ["Ada"]
+    assert [a["name"] for a in index.query(department="Cybersecurity", status="online")["roster"]] == ["Kai", "Vex"]
+    assert index.query(department="Legal")["roster"] == []
+    with pytest.raises(ValueError):
+        index.query(fields=["name", "salary"])
+    with pytest.raises(ValueError):
+        index.query(cursor="!!")
+
+
+def test_version_keys_pages_and_etags(tmp_path):
+    path = tmp_path / "department_lattice.json"
+    _write(path, LATTICE, 1)
+    index = RosterIndex(path).refresh()
+    v1 = index.version
+
+    etag, body = index.page(role="auditor")
+    assert index.page(role="auditor")[1] is body  # Memoized per version
+    assert json.loads(body.encoded())["roster"][0]["name"] == "Mo"
+
+    _write(path, LATTICE, 2)
+    assert index.refresh().version == v1  # Rewritten but identical
+
+    changed = {**LATTICE, "Financial_Ops": {"agents": [{"name": "Mo", "role": "Chief Auditor"}]}}
+    _write(path, changed, 3)
+    index.refresh()
+    assert index.version > v1
+    new_etag, new_body = index.page(role="auditor")
+    assert new_etag != etag
+    assert json.loads(new_body.encoded())["roster"][0]["role"] == "Chief Auditor"
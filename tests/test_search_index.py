@@ -0,0 +1,85 @@
+"""
+REALM FORGE: SEARCH INDEX TEST v1.0
+PURPOSE: Verifies the regex -> trigram prefilter and incremental, line-level indexed search.
+PATH: F:/agentic_workforce/tests/test_search_index.py
+"""
+
+import os
+import re
+
+import pytest
+
+from src.system.search_index import SearchIndex, trigram_query
+
+
+def test_trigram_query_keeps_only_required_literals():
+    assert trigram_query(r"def (\w+)_handler\(") == '("def " AND "_handler(")'
+    assert trigram_query(r"(hello|world)\d+xyz") == '("xyz" AND "hello") OR ("xyz" AND "world")'
+    assert trigram_query(r"(?:alpha|be)gamma") == '("gamma")'
+    assert trigram_query(r'say "hi!"') == '("say ""hi!""")'
+    # Nothing every match must contain (or too short for a trigram): scan everything
+    for pattern in (r"ab", r"\d+", r"(abc)?", r"foo|\w+", r"[unclosed"):
+        assert trigram_query(pattern) is None
+
+
+@pytest.mark.asyncio
+async def test_incremental_index_and_line_matches(tmp_path):
+    data, workspaces = tmp_path / "data", tmp_path / "workspaces"
+    (data / "api").mkdir(parents=True)
+    (data / "node_modules").mkdir()
+    (workspaces / "acme").mkdir(parents=True)
+    (data / "api" / "routes.py").write_text("import os\ndef user_handler(req):\n    return req\n", encoding="utf-8")
+    (data / "node_modules" / "lib.js").write_text("function user_handler() {}\n", encoding="utf-8")
+    (workspaces / "acme" / "app.py").write_text("# TODO\ndef order_handler(req):\n    pass\n", encoding="utf-8")
+    (data / "blob.bin").write_bytes(b"\x00def binary_handler(")
+    # Content-addressed copy of routes.py: must not show up as a second hit
+    (data / "artifacts" / "objects" / "ab").mkdir(parents=True)
+    (data / "artifacts" / "objects" / "ab" / "cdef").write_text("def user_handler(req):\n", encoding="utf-8")
+
+    index = SearchIndex(path=data / "index.db", roots=[data, workspaces, data / "api"], refresh_seconds=3600,
+                        exclude=[data / "artifacts" / "objects"])
+    assert index.refresh(force=True) == {"scanned": 3, "indexed": 3, "removed": 0}
+
+    hits = await index.agrep(r"def (\w+)_handler\(", context=1)
+    assert [(os.path.basename(h["path"]), h["line"], h["text"]) for h in hits] == [
+        ("routes.py", 2, "def user_handler(req):"),
+        ("app.py", 2, "def order_handler(req):"),
+    ]
+    api_hit = next(h for h in hits if h["path"].endswith("routes.py"))
+    assert (api_hit["before"], api_hit["after"]) == (["import os"], ["    return req"])
+    assert [h["text"] for h in index.grep("handler", prefix=workspaces)] == ["def order_handler(req):"]
+    assert [h["line"] for h in index.grep(r"^\s+\w+", ignore_case=True, prefix=data)] == [3]
+    assert index.find_files("*.BIN") == [str(data / "blob.bin")]
+    with pytest.raises(re.error):
+        index.grep("[unclosed")
+
+    # Only the changed file is re-read; vanished files leave the index
+    (workspaces / "acme" / "app.py").write_text("def invoice_handler(req):\n    pass\n", encoding="utf-8")
+    (data / "api" / "routes.py").unlink()
+    assert index.refresh() == {"scanned": 0, "indexed": 0, "removed": 0}  # Throttled
+    assert index.refresh(force=True) == {"scanned": 2, "indexed": 1, "removed": 1}
+    assert [h["text"] for h in index.grep(r"_handler\(")] == ["def invoice_handler(req):"]
+
+
+@pytest.mark.asyncio
+async def test_async_io_writes_are_visible_inside_the_refresh_window(tmp_path, monkeypatch):
+    from src.utils import async_io
+
+    root, outside = tmp_path / "data", tmp_path / "elsewhere"
+    (root / "logs").mkdir(parents=True)
+    outside.mkdir()
+    index = SearchIndex(path=tmp_path / "index.db", roots=[root], refresh_seconds=3600, exclude=[])
+    monkeypatch.setattr(async_io, "_write_listeners", [])
+    async_io.on_write(index.mark_dirty)
+    index.refresh(force=True)
+
+    await async_io.write_text(root / "report.md", "status: GREEN\n", atomic=True)
+    await async_io.append_text(root / "logs" / "run.log", "deploy GREEN\n")
+    await async_io.copy_file(root / "report.md", root / "copy.md")
+    assert sorted(os.path.basename(h["path"]) for h in await index.agrep("GREEN")) == ["copy.md", "report.md", "run.log"]
+
+    await async_io.remove(root / "logs")
+    (outside / "bundle").mkdir()
+    (outside / "bundle" / "notes.txt").write_text("GREEN light\n", encoding="utf-8")
+    await async_io.move(outside / "bundle", root / "bundle")  # A whole tree: needs a walk
+    assert sorted(os.path.basename(h["path"]) for h in index.grep("GREEN")) == ["copy.md", "notes.txt", "report.md"]
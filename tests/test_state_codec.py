@@ -0,0 +1,147 @@
+"""
+REALM FORGE: STATE CODEC TEST v1.0
+PURPOSE: Round-trips RealmForgeState through every codec backend.
+PATH: F:/agentic_workforce/tests/test_state_codec.py
+"""
+
+import json
+from collections import deque
+
+import pytest
+from langchain_core.messages import AIMessage, HumanMessage, SystemMessage, ToolMessage
+
+from src.system import state_codec
+from src.system.state import (
+    DEFAULT_SILO_DISTRIBUTION,
+    ArtifactSet,
+    TaskQueue,
+    buffer_diagnostics,
+    deduplicate_artifacts,
+    get_initial_state,
+    merge_tasks,
+    track_handoffs,
+)
+
+
+def _mission_state(turns: int = 3):
+    state = get_initial_state()
+    messages = [HumanMessage(content="Audit the cybersecurity logs")]
+    for i in range(turns):
+        messages.append(AIMessage(content="⚙️ [PLANNING]: Analyzing neural lattice and drafting maneuvers..."))
+        messages.append(AIMessage(content="", tool_calls=[{"name": "grep_files", "args": {"q": str(i)}, "id": f"call-{i}"}]))
+        messages.append(ToolMessage(tool_call_id=f"call-{i}", content=f"scan result {i}"))
+    messages.append(SystemMessage(content="ROLLING_DIGEST"))
+    state["messages"] = messages
+    state["task_queue"] = merge_tasks([], [{"id": "t1", "tool": "scan", "args": {"path": "F:/x"}}, {"id": "t2", "status": "DONE"}])
+    state["artifacts"] = deduplicate_artifacts([], ["F:/a.txt", "F:/b.txt"])
+    state["handoff_history"] = track_handoffs([], [{"from": "Architect", "to": "Cybersecurity"}])
+    state["diagnostic_stream"] = buffer_diagnostics(state["diagnostic_stream"], ["line"])
+    state["mission_locks"] = {"lock-a", "lock-b"}
+    state["metadata"]["user_id"] = "user-1"
+    return state
+
+
+@pytest.mark.parametrize("backend", [b"M", b"O", b"J"])
+def test_round_trip_restores_state_types(backend):
+    if backend == b"M" and state_codec.msgpack is None:
+        pytest.skip("msgpack not installed")
+    if backend == b"O" and state_codec.orjson is None:
+        pytest.skip("orjson not installed")
+    state = _mission_state()
+    restored = state_codec.decode_state(state_codec.encode_state(state, backend=backend))
+
+    assert restored["messages"] == state["messages"]
+    assert restored["messages"][2].tool_calls[0]["id"] == "call-0"
+    assert isinstance(restored["task_queue"], TaskQueue) and restored["task_queue"] == state["task_queue"]
+    assert isinstance(restored["artifacts"], ArtifactSet) and list(restored["artifacts"]) == ["F:/a.txt", "F:/b.txt"]
+    assert isinstance(restored["diagnostic_stream"], deque) and restored["diagnostic_stream"].maxlen == 100
+    assert restored["mission_locks"] == {"lock-a", "lock-b"}
+    assert restored["metadata"] == state["metadata"]
+    assert restored["vitals"] == state["vitals"]
+
+
+def test_static_defaults_are_referenced_not_copied():
+    state = _mission_state()
+    packed = state_codec.pack_state(state)
+    restored = state_codec.unpack_state(packed)
+
+    assert packed["state"]["vitals"]["silo_distribution"] == {"~ref": "silo_distribution"}
+    assert "version" not in packed["state"]["metadata"]
+    assert restored["vitals"]["silo_distribution"] is DEFAULT_SILO_DISTRIBUTION
+
+
+def test_repeated_messages_are_interned_and_payload_is_compact():
+    state = _mission_state(turns=200)
+    packed = state_codec.pack_state(state)
+    naive = json.dumps([{"type": m.type, "content": m.content} for m in state["messages"]])
+
+    assert packed["strings"].count("⚙️ [PLANNING]: Analyzing neural lattice and drafting maneuvers...") == 1
+    assert len(state_codec.encode_state(state)) < len(naive)
+
+
+def test_snapshot_is_json_safe():
+    view = state_codec.snapshot(_mission_state(turns=50), max_messages=5)
+
+    assert len(view["messages"]) == 5
+    assert "silo_distribution" not in view["vitals"]
+    json.dumps(view)
+
+
+@pytest.mark.asyncio
+async def test_checkpointer_round_trips_through_state_serde():
+    from typing import Annotated, TypedDict
+
+    from langgraph.checkpoint.memory import MemorySaver
+    from langgraph.graph import END, StateGraph
+
+    class MiniState(TypedDict):
+        messages: list
+        task_queue: Annotated[list, merge_tasks]
+
+    def node(state):
+        return {"messages": state["messages"] + [AIMessage(content="done")],
+                "task_queue": [{"id": "t1", "status": "DONE"}]}
+
+    builder = StateGraph(MiniState)
+    builder.add_node("node", node)
+    builder.set_entry_point("node")
+    builder.add_edge("node", END)
+    checkpointer = MemorySaver(serde=state_codec.StateSerde())
+    graph = builder.compile(checkpointer=checkpointer)
+    config = {"configurable": {"thread_id": "M1"}}
+
+    await graph.ainvoke({"messages": [HumanMessage(content="go")], "task_queue": [{"id": "t1", "tool": "scan"}]}, config)
+    values = (await graph.aget_state(config)).values
+
+    assert [m.content for m in values["messages"]] == ["go", "done"]
+    assert isinstance(values["task_queue"], TaskQueue) and values["task_queue"].get("t1")["status"] == "DONE"
+    blobs = [v for v in checkpointer.blobs.values() if v[0] == state_codec.StateSerde.TYPE]
+    assert blobs, "messages and task queue should be stored by the state codec"
+
+
+@pytest.mark.asyncio
+async def test_checkpointer_stores_the_real_initial_state():
+    from langgraph.checkpoint.memory import MemorySaver
+    from langgraph.graph import END, StateGraph
+
+    from src.system.state import DEFAULT_GENESIS_TASKS, RealmForgeState
+
+    def node(state):
+        return {"messages": [AIMessage(content="done")], "vitals": {"cpu": 12.5}}
+
+    builder = StateGraph(RealmForgeState)
+    builder.add_node("node", node)
+    builder.set_entry_point("node")
+    builder.add_edge("node", END)
+    graph = builder.compile(checkpointer=MemorySaver(serde=state_codec.StateSerde()))
+    state = get_initial_state()
+    state["messages"] = [HumanMessage(content="go")]
+    config = {"configurable": {"thread_id": state["mission_id"]}}
+
+    await graph.ainvoke(state, config)
+    values = (await graph.aget_state(config)).values
+
+    assert [m.content for m in values["messages"]] == ["go", "done"]
+    assert values["vitals"]["cpu"] == 12.5
+    assert values["vitals"]["silo_distribution"] == DEFAULT_SILO_DISTRIBUTION
+    assert values["genesis_tasks"] == DEFAULT_GENESIS_TASKS
@@ -0,0 +1,78 @@
+"""
+REALM FORGE: STATE REDUCER TEST v1.0
+PURPOSE: Verifies the incremental reducers keep the legacy merge semantics.
+PATH: F:/agentic_workforce/tests/test_state_reducers.py
+"""
+
+from collections import deque
+
+from src.system.state import (
+    ArtifactSet,
+    TaskQueue,
+    buffer_diagnostics,
+    deduplicate_artifacts,
+    merge_tasks,
+    track_handoffs,
+)
+
+
+def test_merge_tasks_upserts_by_id_and_keeps_open_first():
+    queue = merge_tasks([], [
+        {"id": "b", "tool": "scan", "priority": "HIGH"},
+        {"id": "a", "tool": "hash", "priority": "HIGH"},
+        {"id": "c", "tool": "grep", "priority": "LOW"},
+    ])
+    queue = merge_tasks(queue, [{"id": "a", "status": "DONE"}])
+
+    assert isinstance(queue, TaskQueue)
+    assert [t["id"] for t in queue] == ["b", "c", "a"]
+    assert queue.get("a") == {"id": "a", "tool": "hash", "priority": "HIGH", "status": "DONE"}
+    assert queue.next_open()["id"] == "b"
+
+    queue = merge_tasks(queue, [{"id": "b", "status": "DONE"}, {"id": "c", "status": "FAILED"}])
+    assert queue.next_open() is None
+    assert len(queue) == 3
+
+
+def test_merge_tasks_is_incremental_on_the_same_queue():
+    queue = merge_tasks([], [{"id": f"t{i:05d}", "tool": "scan"} for i in range(5000)])
+    same = merge_tasks(queue, [{"id": "t00042", "status": "DONE"}])
+
+    assert same is queue
+    assert same[-1]["id"] == "t00042"
+    assert len(queue._heap) <= 2 * len(queue) + 32
+
+
+def test_artifacts_are_unique_and_ordered():
+    artifacts = deduplicate_artifacts(["F:/a.txt"], ["F:/b.txt", "F:/a.txt"])
+    artifacts = deduplicate_artifacts(artifacts, ["F:/c.txt", "F:/b.txt"])
+
+    assert isinstance(artifacts, ArtifactSet)
+    assert list(artifacts) == ["F:/a.txt", "F:/b.txt", "F:/c.txt"]
+    assert "F:/c.txt" in artifacts
+
+
+def test_ring_buffers_are_bounded():
+    stream = buffer_diagnostics(["boot"], [f"line {i}" for i in range(250)])
+    history = []
+    for i in range(40):
+        history = track_handoffs(history, [{"from": f"S{i}", "to": f"S{i + 1}"}, {"junk": True}])
+
+    assert isinstance(stream, deque) and len(stream) == 100
+    assert stream[-1] == "line 249"
+    assert len(history) == 15
+    assert history[0] == {"from": "S25", "to": "S26"}
+
+
+def test_replayed_writes_are_idempotent():
+    # Conditional edges preview a node's writes on a channel copy sharing the same value
+    write = [{"tool": "HANDOFF"}]
+    queue = merge_tasks(merge_tasks([], [{"id": "a", "tool": "scan"}]), write)
+    queue = merge_tasks(queue, write)
+    history = track_handoffs([], [])
+    handoff = [{"from": "Architect", "to": "Cybersecurity"}]
+    preview = track_handoffs(history, handoff)
+    committed = track_handoffs(history, handoff)
+
+    assert len(queue) == 2
+    assert list(preview) == list(committed) == handoff
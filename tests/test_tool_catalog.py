@@ -0,0 +1,77 @@
+"""
+REALM FORGE: TOOL CATALOG TEST v1.0
+PURPOSE: Verifies embedding ranking, the lexical fallback and off-loop rendering.
+PATH: F:/agentic_workforce/tests/test_tool_catalog.py
+"""
+
+import threading
+
+import pytest
+
+from src.system.arsenal import tool_catalog
+from src.system.arsenal.tool_catalog import CatalogEntry, _ToolEmbedder, rank_tools
+
+VOCAB = ["port", "scan", "network", "invoice", "tax", "ledger", "docker", "image"]
+
+
+def _entry(name, purpose):
+    line = f"- {name}(): {purpose}"
+    return CatalogEntry(name=name, purpose=purpose, args=(), line=line, tokens=len(line.split()))
+
+
+def _bag_of_words(texts):
+    return [[float(word in text.lower()) for word in VOCAB] for text in texts]
+
+
+ENTRIES = [
+    _entry("generate_invoice", "Bills a client with tax lines in the ledger."),
+    _entry("build_docker_image", "Builds a docker image."),
+    _entry("scan_ports", "Runs a port scan over the network."),
+]
+
+
+def _embedder(fn):
+    embedder = _ToolEmbedder()
+    embedder._fn = fn
+    return embedder
+
+
+def test_embedding_ranking_orders_by_similarity(monkeypatch):
+    calls = []
+
+    def fn(texts):
+        calls.append(list(texts))
+        return _bag_of_words(texts)
+
+    monkeypatch.setattr(tool_catalog, "_EMBEDDER", _embedder(fn))
+    ranked = rank_tools("audit the network for an open port", ENTRIES)
+    assert [e.name for e in ranked][0] == "scan_ports"
+
+    # Entry vectors are embedded once; later missions only embed the query
+    rank_tools("tax ledger reconciliation", ENTRIES)
+    assert [len(c) for c in calls] == [3, 1, 1]
+
+
+def test_embedder_failure_falls_back_to_lexical(monkeypatch):
+    def broken(texts):
+        raise RuntimeError("onnx runtime missing")
+
+    embedder = _embedder(broken)
+    monkeypatch.setattr(tool_catalog, "_EMBEDDER", embedder)
+
+    ranked = rank_tools("build a docker image", ENTRIES)
+    assert ranked[0].name == "build_docker_image"
+    assert embedder._disabled and embedder.scores("docker", ENTRIES) is None
+
+
+@pytest.mark.asyncio
+async def test_arender_catalog_runs_off_the_event_loop(monkeypatch):
+    threads = []
+
+    def render(dept, mission, top_k, budget_tokens):
+        threads.append(threading.current_thread())
+        return f"{dept}:{mission}"
+
+    monkeypatch.setattr(tool_catalog, "render_catalog", render)
+    assert await tool_catalog.arender_catalog("DevOps", "ship it") == "DevOps:ship it"
+    assert threads and threads[0] is not threading.main_thread()
@@ -0,0 +1,78 @@
+"""
+REALM FORGE: USAGE ROLLUPS TEST v1.0
+PURPOSE: Verifies that rollup-served usage reports match raw usage_logs sums, and the one-time backfill.
+PATH: F:/agentic_workforce/tests/test_usage_rollups.py
+"""
+
+import random
+
+import pytest
+import pytest_asyncio
+
+from src.auth import db_pool, gatekeeper
+from src.auth.gatekeeper import SQL_INSERT_USAGE
+from src.auth.usage_rollups import DAY, HOUR, USAGE_TRIGGER, usage_by_silo, usage_segments
+
+T0 = 1_700_000_000.0
+SILOS = ["Cybersecurity", "Finance", "Architect"]
+
+
+@pytest_asyncio.fixture
+async def pool(tmp_path, monkeypatch):
+    pool = db_pool.AuthDBPool(tmp_path / "licenses.db", readers=1)
+    monkeypatch.setattr(db_pool, "auth_db", pool)
+    await gatekeeper.init_auth_db()
+    yield pool
+    await pool.close()
+
+
+async def _log_usage(pool, key, n, seed=7):
+    rng = random.Random(seed)
+    async with pool.writer() as db:
+        await db.executemany(SQL_INSERT_USAGE, [
+            (key, "AGENT", rng.choice(SILOS), "MSN", "x", rng.randint(1, 5), T0 + rng.uniform(0, 9 * DAY))
+            for _ in range(n)
+        ])
+
+
+async def _raw(pool, key, start, end):
+    rows = await pool.fetchall(
+        "SELECT silo_id, SUM(cost), COUNT(*) FROM usage_logs WHERE key=? AND timestamp>=? AND timestamp<? GROUP BY silo_id",
+        (key, start, end))
+    return {s: {"cost": c, "calls": n} for s, c, n in rows}
+
+
+def test_segments_tile_the_range():
+    start, end = T0 + 1234.5, T0 + 3 * DAY + 7 * HOUR + 99
+    segments = usage_segments(start, end)
+    assert segments[0] == ("raw", start, segments[0][2]) and segments[-1][2] == end
+    assert all(a[2] == b[1] for a, b in zip(segments, segments[1:]))
+    assert [kind for kind, _, _ in segments] == ["raw", "hour", "day", "hour", "raw"]
+
+
+@pytest.mark.asyncio
+async def test_ranged_reports_match_raw_logs(pool):
+    await _log_usage(pool, "rf_pro_a", 2000)
+    rng = random.Random(3)
+    for _ in range(25):
+        start = T0 + rng.uniform(-DAY, 8 * DAY)
+        end = start + rng.choice([rng.uniform(0, HOUR), rng.uniform(0, DAY), rng.uniform(0, 5 * DAY)])
+        assert await usage_by_silo(pool, "rf_pro_a", start, end) == await _raw(pool, "rf_pro_a", start, end)
+    assert await usage_by_silo(pool, "rf_pro_a") == await _raw(pool, "rf_pro_a", 0, T0 + 100 * DAY)
+
+    plan = await pool.fetchall("EXPLAIN QUERY PLAN SELECT SUM(cost) FROM usage_logs WHERE key=? AND timestamp>=?", ("k", 0))
+    assert any("idx_usage_key_ts" in str(row) for row in plan)
+
+
+@pytest.mark.asyncio
+async def test_existing_logs_are_backfilled_once(pool):
+    async with pool.writer() as db:
+        await db.execute(f"DROP TRIGGER {USAGE_TRIGGER}")  # Simulate a pre-rollup database
+    await _log_usage(pool, "rf_pro_b", 300, seed=11)
+    assert await usage_by_silo(pool, "rf_pro_b") == {}
+
+    await gatekeeper.init_auth_db()
+    await gatekeeper.init_auth_db()
+    expected = await _raw(pool, "rf_pro_b", 0, T0 + 100 * DAY)
+    assert await usage_by_silo(pool, "rf_pro_b") == expected
+    assert await usage_by_silo(pool, "rf_pro_b", T0 - DAY, T0 + 100 * DAY) == expected
@@ -0,0 +1,59 @@
+"""
+REALM FORGE: VOCAL PIPELINE TEST v1.0
+PURPOSE: Verifies TTS caching and ordered, non-blocking synthesis.
+PATH: F:/agentic_workforce/tests/test_vocal_pipeline.py
+"""
+
+import asyncio
+
+import pytest
+
+from src.system.audio_frames import unpack_audio_frame
+from src.system.connection_manager import manager
+from src.system.vocal_pipeline import TTSCache, VocalPipeline, tts_cache_key
+
+
+class FakeTTS:
+    def __init__(self, delay: float = 0.0):
+        self.calls = []
+        self.delay = delay
+
+    async def __call__(self, text, voice="", rate="", pitch=""):
+        self.calls.append(text)
+        for word in text.split():
+            await asyncio.sleep(self.delay)
+            yield word.encode()
+
+
+def test_cache_key_normalizes_whitespace_and_includes_voice():
+    assert tts_cache_key("Integrity  nominal. ", "v", "+0%", "-5Hz") == tts_cache_key("Integrity nominal.", "v", "+0%", "-5Hz")
+    assert tts_cache_key("Integrity nominal.", "v", "+0%", "-5Hz") != tts_cache_key("Integrity nominal.", "w", "+0%", "-5Hz")
+
+
+@pytest.mark.asyncio
+async def test_stock_phrases_synthesize_once(tmp_path):
+    tts = FakeTTS()
+    pipeline = VocalPipeline(cache=TTSCache(tmp_path), synthesizer=tts, voice={"voice": "v"})
+
+    first = b"".join([c async for c in pipeline.audio_stream("INTEGRITY NOMINAL all green")])
+    second = b"".join([c async for c in pipeline.audio_stream("INTEGRITY  NOMINAL all green")])
+    cold = VocalPipeline(cache=TTSCache(tmp_path), synthesizer=tts, voice={"voice": "v"})
+    third = b"".join([c async for c in cold.audio_stream("INTEGRITY NOMINAL all green")])
+
+    assert first == second == third == b"INTEGRITYNOMINALallgreen"
+    assert len(tts.calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_submit_never_blocks_and_keeps_mission_order(tmp_path, monkeypatch):
+    published = []
+    monkeypatch.setattr(manager, "publish", lambda frame, **topics: published.append(unpack_audio_frame(frame)))
+    pipeline = VocalPipeline(cache=TTSCache(tmp_path), synthesizer=FakeTTS(delay=0.01), voice={}, workers=3)
+
+    for seq in range(1, 5):
+        assert pipeline.submit("MSN-1", seq, f"utterance {seq} " + "word " * (5 - seq))
+    await asyncio.wait_for(pipeline.drain(), timeout=2)
+    await pipeline.stop()
+
+    finals = [f.msg_seq for f in published if f.final]
+    assert finals == [1, 2, 3, 4]